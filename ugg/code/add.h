@@ -7,8 +7,26 @@ class Add_aa_a : public Ugen_outa {
   public:
     Add_aa_a(Ugen *a, Ugen *b);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
 };
 
+extern "C" Ugen *Add_aa_a_create(Ugen *a, Ugen *b);
+
+class Add_aa_a_inplace : public Ugen_outa {
+    Ugen *a;
+    Ugen *b;
+
+  public:
+    Add_aa_a_inplace(Ugen *a, Ugen *b);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+    Ugen *get_inplace_input();
+};
+
+extern "C" Ugen *Add_aa_a_inplace_create(Ugen *a, Ugen *b);
+
 class Add_ab_a : public Ugen_outa {
     Ugen *a;
     Ugen *b;
@@ -17,8 +35,27 @@ class Add_ab_a : public Ugen_outa {
   public:
     Add_ab_a(Ugen *a, Ugen *b);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+};
+
+extern "C" Ugen *Add_ab_a_create(Ugen *a, Ugen *b);
+
+class Add_ab_a_inplace : public Ugen_outa {
+    Ugen *a;
+    Ugen *b;
+    sample b_arate;
+
+  public:
+    Add_ab_a_inplace(Ugen *a, Ugen *b);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+    Ugen *get_inplace_input();
 };
 
+extern "C" Ugen *Add_ab_a_inplace_create(Ugen *a, Ugen *b);
+
 class Add_bb_b : public Ugen_outb {
     Ugen *a;
     Ugen *b;
@@ -26,5 +63,9 @@ class Add_bb_b : public Ugen_outb {
   public:
     Add_bb_b(Ugen *a, Ugen *b);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
 };
 
+extern "C" Ugen *Add_bb_b_create(Ugen *a, Ugen *b);
+
@@ -0,0 +1,62 @@
+/* add kernels: plain C, generated automatically, do not edit */
+
+#ifndef ADD_KERNELS_H
+#define ADD_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    int unused;  /* C structs cannot be empty */
+} Add_aa_a_state;
+
+static inline void Add_aa_a_init(Add_aa_a_state *s)
+{
+    (void) s;
+}
+
+static inline void Add_aa_a_process(Add_aa_a_state *s, const sample *UGG_RESTRICT a_samps, const sample *UGG_RESTRICT b_samps, sample *UGG_RESTRICT out)
+{
+    (void) s;
+    for (int i = 0; i < BL; i++) {
+        out[i] = (a_samps[i] + b_samps[i]);
+    }
+}
+
+typedef struct {
+    sample b_arate;
+} Add_ab_a_state;
+
+static inline void Add_ab_a_init(Add_ab_a_state *s)
+{
+    sample b_arate;
+    b_arate = 0;
+    s->b_arate = b_arate;
+}
+
+static inline void Add_ab_a_process(Add_ab_a_state *s, const sample *UGG_RESTRICT a_samps, sample b, sample *UGG_RESTRICT out)
+{
+    sample b_arate = s->b_arate;
+    sample b_step = (b - b_arate) * BL_RECIP;
+    for (int i = 0; i < BL; i++) {
+        out[i] = (a_samps[i] + b_arate);
+            b_arate += b_step;
+    }
+    s->b_arate = b_arate;
+}
+
+typedef struct {
+    int unused;  /* C structs cannot be empty */
+} Add_bb_b_state;
+
+static inline void Add_bb_b_init(Add_bb_b_state *s)
+{
+    (void) s;
+}
+
+static inline void Add_bb_b_process(Add_bb_b_state *s, sample a, sample b, sample *UGG_RESTRICT out)
+{
+    (void) s;
+    *out = (a + b);
+}
+
+#endif
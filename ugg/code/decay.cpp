@@ -6,9 +6,7 @@
 Decay_cc_a::Decay_cc_a(sample amp, sample time)
 {
     block_count = 0;
-    this->amp = amp;
-    this->time = time;
-    dursamples = fmax(1, (time * AR));
+    sample dursamples = fmax(1, (time * AR));
     decay = (amp / dursamples);
     state = amp;
 }
@@ -16,12 +14,34 @@ Decay_cc_a::Decay_cc_a(sample amp, sample time)
 void Decay_cc_a::run(long block_num)
 {
     block_count = block_num;
+    Decay_cc_a::compute();
+}
+
+void Decay_cc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
     for (int i = 0; i < BL; i++) {
         outs[i] = state;
         sample state_next = fmax((state - decay), 0);
         state = state_next;
     }
 }
+
+int Decay_cc_a::get_inputs(Ugen **inputs)
+{
+    (void) inputs;
+    return 0;
+}
 void Decay_cc_a::set_amp(sample amp) {
     state = amp;
 }
+
+extern "C" Ugen *Decay_cc_a_create(sample amp, sample time)
+{
+    return new Decay_cc_a(amp, time);
+}
+
+extern "C" void Decay_cc_a_set_amp(Ugen *ugen, sample amp)
+{
+    ((Decay_cc_a *) ugen)->set_amp(amp);
+}
@@ -1,15 +1,17 @@
 // decay declarations
 
 class Decay_cc_a : public Ugen_outa {
-    sample amp;
-    sample time;
-    sample dursamples;
     sample decay;
     sample state;
 
   public:
     Decay_cc_a(sample amp, sample time);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
     void set_amp(sample amp);
 };
 
+extern "C" Ugen *Decay_cc_a_create(sample amp, sample time);
+extern "C" void Decay_cc_a_set_amp(Ugen *ugen, sample amp);
+
@@ -0,0 +1,41 @@
+/* decay kernels: plain C, generated automatically, do not edit */
+
+#ifndef DECAY_KERNELS_H
+#define DECAY_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    sample decay;
+    sample state;
+} Decay_cc_a_state;
+
+static inline void Decay_cc_a_init(Decay_cc_a_state *s, sample amp, sample time)
+{
+    sample decay;
+    sample state;
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+    s->decay = decay;
+    s->state = state;
+}
+
+static inline void Decay_cc_a_process(Decay_cc_a_state *s, sample *UGG_RESTRICT out)
+{
+    sample decay = s->decay;
+    sample state = s->state;
+    for (int i = 0; i < BL; i++) {
+        out[i] = state;
+        sample state_next = fmax((state - decay), 0);
+        state = state_next;
+    }
+    s->state = state;
+}
+
+static inline void Decay_cc_a_set_amp(Decay_cc_a_state *s, sample amp)
+{
+    s->state = amp;
+}
+
+#endif
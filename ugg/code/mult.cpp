@@ -19,6 +19,55 @@ void Mult_aa_a::run(long block_num)
         b->run(block_num);
     }
     block_count = block_num;
+    Mult_aa_a::compute();
+}
+
+void Mult_aa_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    sample *a_samps = a->get_outs();
+    sample *b_samps = b->get_outs();
+    for (int i = 0; i < BL; i++) {
+        outs[i] = (a_samps[i] * b_samps[i]);
+    }
+}
+
+int Mult_aa_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = a;
+        inputs[1] = b;
+    }
+    return 2;
+}
+
+extern "C" Ugen *Mult_aa_a_create(Ugen *a, Ugen *b)
+{
+    return new Mult_aa_a(a, b);
+}
+
+Mult_aa_a_inplace::Mult_aa_a_inplace(Ugen *a, Ugen *b)
+{
+    block_count = 0;
+    this->a = a;
+    this->b = b;
+}
+
+void Mult_aa_a_inplace::run(long block_num)
+{
+    if (a->block_count < block_num) {
+        a->run(block_num);
+    }
+    if (b->block_count < block_num) {
+        b->run(block_num);
+    }
+    block_count = block_num;
+    Mult_aa_a_inplace::compute();
+}
+
+void Mult_aa_a_inplace::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs = a->get_outs();
     sample *a_samps = a->get_outs();
     sample *b_samps = b->get_outs();
     for (int i = 0; i < BL; i++) {
@@ -26,6 +75,25 @@ void Mult_aa_a::run(long block_num)
     }
 }
 
+int Mult_aa_a_inplace::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = a;
+        inputs[1] = b;
+    }
+    return 2;
+}
+
+Ugen *Mult_aa_a_inplace::get_inplace_input()
+{
+    return a;
+}
+
+extern "C" Ugen *Mult_aa_a_inplace_create(Ugen *a, Ugen *b)
+{
+    return new Mult_aa_a_inplace(a, b);
+}
+
 Mult_ab_a::Mult_ab_a(Ugen *a, Ugen *b)
 {
     block_count = 0;
@@ -43,14 +111,84 @@ void Mult_ab_a::run(long block_num)
         b->run(block_num);
     }
     block_count = block_num;
+    Mult_ab_a::compute();
+}
+
+void Mult_ab_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
     sample *a_samps = a->get_outs();
-    sample b_step = (b->get_out() - b_arate) * BR_RECIP;
+    sample b_step = (b->get_out() - b_arate) * BL_RECIP;
     for (int i = 0; i < BL; i++) {
         outs[i] = (a_samps[i] * b_arate);
             b_arate += b_step;
     }
 }
 
+int Mult_ab_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = a;
+        inputs[1] = b;
+    }
+    return 2;
+}
+
+extern "C" Ugen *Mult_ab_a_create(Ugen *a, Ugen *b)
+{
+    return new Mult_ab_a(a, b);
+}
+
+Mult_ab_a_inplace::Mult_ab_a_inplace(Ugen *a, Ugen *b)
+{
+    block_count = 0;
+    this->a = a;
+    this->b = b;
+    b_arate = 0;
+}
+
+void Mult_ab_a_inplace::run(long block_num)
+{
+    if (a->block_count < block_num) {
+        a->run(block_num);
+    }
+    if (b->block_count < block_num) {
+        b->run(block_num);
+    }
+    block_count = block_num;
+    Mult_ab_a_inplace::compute();
+}
+
+void Mult_ab_a_inplace::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs = a->get_outs();
+    sample *a_samps = a->get_outs();
+    sample b_step = (b->get_out() - b_arate) * BL_RECIP;
+    for (int i = 0; i < BL; i++) {
+        outs[i] = (a_samps[i] * b_arate);
+            b_arate += b_step;
+    }
+}
+
+int Mult_ab_a_inplace::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = a;
+        inputs[1] = b;
+    }
+    return 2;
+}
+
+Ugen *Mult_ab_a_inplace::get_inplace_input()
+{
+    return a;
+}
+
+extern "C" Ugen *Mult_ab_a_inplace_create(Ugen *a, Ugen *b)
+{
+    return new Mult_ab_a_inplace(a, b);
+}
+
 Mult_bb_b::Mult_bb_b(Ugen *a, Ugen *b)
 {
     block_count = 0;
@@ -67,5 +205,24 @@ void Mult_bb_b::run(long block_num)
         b->run(block_num);
     }
     block_count = block_num;
+    Mult_bb_b::compute();
+}
+
+void Mult_bb_b::compute() UGG_RESTRICT_THIS
+{
     out = (a->get_out() * b->get_out());
 }
+
+int Mult_bb_b::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = a;
+        inputs[1] = b;
+    }
+    return 2;
+}
+
+extern "C" Ugen *Mult_bb_b_create(Ugen *a, Ugen *b)
+{
+    return new Mult_bb_b(a, b);
+}
@@ -0,0 +1,62 @@
+/* mult kernels: plain C, generated automatically, do not edit */
+
+#ifndef MULT_KERNELS_H
+#define MULT_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    int unused;  /* C structs cannot be empty */
+} Mult_aa_a_state;
+
+static inline void Mult_aa_a_init(Mult_aa_a_state *s)
+{
+    (void) s;
+}
+
+static inline void Mult_aa_a_process(Mult_aa_a_state *s, const sample *UGG_RESTRICT a_samps, const sample *UGG_RESTRICT b_samps, sample *UGG_RESTRICT out)
+{
+    (void) s;
+    for (int i = 0; i < BL; i++) {
+        out[i] = (a_samps[i] * b_samps[i]);
+    }
+}
+
+typedef struct {
+    sample b_arate;
+} Mult_ab_a_state;
+
+static inline void Mult_ab_a_init(Mult_ab_a_state *s)
+{
+    sample b_arate;
+    b_arate = 0;
+    s->b_arate = b_arate;
+}
+
+static inline void Mult_ab_a_process(Mult_ab_a_state *s, const sample *UGG_RESTRICT a_samps, sample b, sample *UGG_RESTRICT out)
+{
+    sample b_arate = s->b_arate;
+    sample b_step = (b - b_arate) * BL_RECIP;
+    for (int i = 0; i < BL; i++) {
+        out[i] = (a_samps[i] * b_arate);
+            b_arate += b_step;
+    }
+    s->b_arate = b_arate;
+}
+
+typedef struct {
+    int unused;  /* C structs cannot be empty */
+} Mult_bb_b_state;
+
+static inline void Mult_bb_b_init(Mult_bb_b_state *s)
+{
+    (void) s;
+}
+
+static inline void Mult_bb_b_process(Mult_bb_b_state *s, sample a, sample b, sample *UGG_RESTRICT out)
+{
+    (void) s;
+    *out = (a * b);
+}
+
+#endif
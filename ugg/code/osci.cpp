@@ -7,7 +7,6 @@ Osci_acc_a::Osci_acc_a(Ugen *hz, double phase, Table_ptr table)
 {
     block_count = 0;
     this->table = table;
-    this->phase = phase;
     table_len = table_len(table);
     this->hz = hz;
     indexf = (phase * table_len);
@@ -19,9 +18,15 @@ void Osci_acc_a::run(long block_num)
         hz->run(block_num);
     }
     block_count = block_num;
+    Osci_acc_a::compute();
+}
+
+void Osci_acc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
     sample *hz_samps = hz->get_outs();
     for (int i = 0; i < BL; i++) {
-        int index = int(indexf);
+        int index = ((int) indexf);
         sample x1 = tblget(table, index);
         outs[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
         double indexf_next = phase_wrap((indexf + ((hz_samps[i] * table_len) * AR_RECIP)), table_len);
@@ -29,11 +34,23 @@ void Osci_acc_a::run(long block_num)
     }
 }
 
+int Osci_acc_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = hz;
+    }
+    return 1;
+}
+
+extern "C" Ugen *Osci_acc_a_create(Ugen *hz, double phase, Table_ptr table)
+{
+    return new Osci_acc_a(hz, phase, table);
+}
+
 Osci_bcc_a::Osci_bcc_a(Ugen *hz, double phase, Table_ptr table)
 {
     block_count = 0;
     this->table = table;
-    this->phase = phase;
     table_len = table_len(table);
     this->hz = hz;
     indexf = (phase * table_len);
@@ -45,9 +62,15 @@ void Osci_bcc_a::run(long block_num)
         hz->run(block_num);
     }
     block_count = block_num;
+    Osci_bcc_a::compute();
+}
+
+void Osci_bcc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
     sample t1 = ((hz->get_out() * table_len) * AR_RECIP);
     for (int i = 0; i < BL; i++) {
-        int index = int(indexf);
+        int index = ((int) indexf);
         sample x1 = tblget(table, index);
         outs[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
         double indexf_next = phase_wrap((indexf + t1), table_len);
@@ -55,25 +78,53 @@ void Osci_bcc_a::run(long block_num)
     }
 }
 
+int Osci_bcc_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = hz;
+    }
+    return 1;
+}
+
+extern "C" Ugen *Osci_bcc_a_create(Ugen *hz, double phase, Table_ptr table)
+{
+    return new Osci_bcc_a(hz, phase, table);
+}
+
 Osci_ccc_a::Osci_ccc_a(double hz, double phase, Table_ptr table)
 {
     block_count = 0;
     this->table = table;
-    this->phase = phase;
     table_len = table_len(table);
-    this->hz = hz;
-    t2 = ((hz * table_len) * AR_RECIP);
+    t1 = ((hz * table_len) * AR_RECIP);
     indexf = (phase * table_len);
 }
 
 void Osci_ccc_a::run(long block_num)
 {
     block_count = block_num;
+    Osci_ccc_a::compute();
+}
+
+void Osci_ccc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
     for (int i = 0; i < BL; i++) {
-        int index = int(indexf);
+        int index = ((int) indexf);
         sample x1 = tblget(table, index);
         outs[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
-        double indexf_next = phase_wrap((indexf + t2), table_len);
+        double indexf_next = phase_wrap((indexf + t1), table_len);
         indexf = indexf_next;
     }
 }
+
+int Osci_ccc_a::get_inputs(Ugen **inputs)
+{
+    (void) inputs;
+    return 0;
+}
+
+extern "C" Ugen *Osci_ccc_a_create(double hz, double phase, Table_ptr table)
+{
+    return new Osci_ccc_a(hz, phase, table);
+}
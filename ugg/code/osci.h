@@ -2,7 +2,6 @@
 
 class Osci_acc_a : public Ugen_outa {
     Table_ptr table;
-    double phase;
     int table_len;
     Ugen *hz;
     double indexf;
@@ -10,11 +9,14 @@ class Osci_acc_a : public Ugen_outa {
   public:
     Osci_acc_a(Ugen *hz, double phase, Table_ptr table);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
 };
 
+extern "C" Ugen *Osci_acc_a_create(Ugen *hz, double phase, Table_ptr table);
+
 class Osci_bcc_a : public Ugen_outa {
     Table_ptr table;
-    double phase;
     int table_len;
     Ugen *hz;
     double indexf;
@@ -22,18 +24,24 @@ class Osci_bcc_a : public Ugen_outa {
   public:
     Osci_bcc_a(Ugen *hz, double phase, Table_ptr table);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
 };
 
+extern "C" Ugen *Osci_bcc_a_create(Ugen *hz, double phase, Table_ptr table);
+
 class Osci_ccc_a : public Ugen_outa {
     Table_ptr table;
-    double phase;
     int table_len;
-    double hz;
-    sample t2;
+    sample t1;
     double indexf;
 
   public:
     Osci_ccc_a(double hz, double phase, Table_ptr table);
     void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
 };
 
+extern "C" Ugen *Osci_ccc_a_create(double hz, double phase, Table_ptr table);
+
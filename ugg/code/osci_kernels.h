@@ -0,0 +1,110 @@
+/* osci kernels: plain C, generated automatically, do not edit */
+
+#ifndef OSCI_KERNELS_H
+#define OSCI_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    double indexf;
+} Osci_acc_a_state;
+
+static inline void Osci_acc_a_init(Osci_acc_a_state *s, double phase, Table_ptr table)
+{
+    int table_len;
+    double indexf;
+    s->table = table;
+    table_len = table_len(table);
+    indexf = (phase * table_len);
+    s->table_len = table_len;
+    s->indexf = indexf;
+}
+
+static inline void Osci_acc_a_process(Osci_acc_a_state *s, const sample *UGG_RESTRICT hz_samps, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    double indexf = s->indexf;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + ((hz_samps[i] * table_len) * AR_RECIP)), table_len);
+        indexf = indexf_next;
+    }
+    s->indexf = indexf;
+}
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    double indexf;
+} Osci_bcc_a_state;
+
+static inline void Osci_bcc_a_init(Osci_bcc_a_state *s, double phase, Table_ptr table)
+{
+    int table_len;
+    double indexf;
+    s->table = table;
+    table_len = table_len(table);
+    indexf = (phase * table_len);
+    s->table_len = table_len;
+    s->indexf = indexf;
+}
+
+static inline void Osci_bcc_a_process(Osci_bcc_a_state *s, sample hz, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    double indexf = s->indexf;
+    sample t1 = ((hz * table_len) * AR_RECIP);
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+    s->indexf = indexf;
+}
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+} Osci_ccc_a_state;
+
+static inline void Osci_ccc_a_init(Osci_ccc_a_state *s, double hz, double phase, Table_ptr table)
+{
+    int table_len;
+    sample t1;
+    double indexf;
+    s->table = table;
+    table_len = table_len(table);
+    t1 = ((hz * table_len) * AR_RECIP);
+    indexf = (phase * table_len);
+    s->table_len = table_len;
+    s->t1 = t1;
+    s->indexf = indexf;
+}
+
+static inline void Osci_ccc_a_process(Osci_ccc_a_state *s, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    sample t1 = s->t1;
+    double indexf = s->indexf;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+    s->indexf = indexf;
+}
+
+#endif
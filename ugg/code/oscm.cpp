@@ -0,0 +1,87 @@
+// oscm implementations
+
+#include "ugen.h"
+#include "oscm.h"
+
+Oscm_bcc_a::Oscm_bcc_a(Ugen *hz, double phase, Mipmap_ptr mipmap)
+{
+    block_count = 0;
+    this->mipmap = mipmap;
+    this->hz = hz;
+    table_len = mipmap_len(mipmap);
+    indexf = (phase * table_len);
+}
+
+void Oscm_bcc_a::run(long block_num)
+{
+    if (hz->block_count < block_num) {
+        hz->run(block_num);
+    }
+    block_count = block_num;
+    Oscm_bcc_a::compute();
+}
+
+void Oscm_bcc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    Table_ptr table = mipmap_table(mipmap, hz->get_out());
+    sample t1 = ((hz->get_out() * table_len) * AR_RECIP);
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        outs[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+}
+
+int Oscm_bcc_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = hz;
+    }
+    return 1;
+}
+
+extern "C" Ugen *Oscm_bcc_a_create(Ugen *hz, double phase, Mipmap_ptr mipmap)
+{
+    return new Oscm_bcc_a(hz, phase, mipmap);
+}
+
+Oscm_ccc_a::Oscm_ccc_a(double hz, double phase, Mipmap_ptr mipmap)
+{
+    block_count = 0;
+    table = mipmap_table(mipmap, hz);
+    table_len = mipmap_len(mipmap);
+    t1 = ((hz * table_len) * AR_RECIP);
+    indexf = (phase * table_len);
+}
+
+void Oscm_ccc_a::run(long block_num)
+{
+    block_count = block_num;
+    Oscm_ccc_a::compute();
+}
+
+void Oscm_ccc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        outs[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+}
+
+int Oscm_ccc_a::get_inputs(Ugen **inputs)
+{
+    (void) inputs;
+    return 0;
+}
+
+extern "C" Ugen *Oscm_ccc_a_create(double hz, double phase, Mipmap_ptr mipmap)
+{
+    return new Oscm_ccc_a(hz, phase, mipmap);
+}
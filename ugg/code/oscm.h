@@ -0,0 +1,32 @@
+// oscm declarations
+
+class Oscm_bcc_a : public Ugen_outa {
+    Mipmap_ptr mipmap;
+    Ugen *hz;
+    int table_len;
+    double indexf;
+
+  public:
+    Oscm_bcc_a(Ugen *hz, double phase, Mipmap_ptr mipmap);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+};
+
+extern "C" Ugen *Oscm_bcc_a_create(Ugen *hz, double phase, Mipmap_ptr mipmap);
+
+class Oscm_ccc_a : public Ugen_outa {
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+
+  public:
+    Oscm_ccc_a(double hz, double phase, Mipmap_ptr mipmap);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+};
+
+extern "C" Ugen *Oscm_ccc_a_create(double hz, double phase, Mipmap_ptr mipmap);
+
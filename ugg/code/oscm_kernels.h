@@ -0,0 +1,81 @@
+/* oscm kernels: plain C, generated automatically, do not edit */
+
+#ifndef OSCM_KERNELS_H
+#define OSCM_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    Mipmap_ptr mipmap;
+    int table_len;
+    double indexf;
+} Oscm_bcc_a_state;
+
+static inline void Oscm_bcc_a_init(Oscm_bcc_a_state *s, double phase, Mipmap_ptr mipmap)
+{
+    int table_len;
+    double indexf;
+    s->mipmap = mipmap;
+    table_len = mipmap_len(mipmap);
+    indexf = (phase * table_len);
+    s->table_len = table_len;
+    s->indexf = indexf;
+}
+
+static inline void Oscm_bcc_a_process(Oscm_bcc_a_state *s, sample hz, sample *UGG_RESTRICT out)
+{
+    Mipmap_ptr mipmap = s->mipmap;
+    int table_len = s->table_len;
+    double indexf = s->indexf;
+    Table_ptr table = mipmap_table(mipmap, hz);
+    sample t1 = ((hz * table_len) * AR_RECIP);
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+    s->indexf = indexf;
+}
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+} Oscm_ccc_a_state;
+
+static inline void Oscm_ccc_a_init(Oscm_ccc_a_state *s, double hz, double phase, Mipmap_ptr mipmap)
+{
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+    table = mipmap_table(mipmap, hz);
+    table_len = mipmap_len(mipmap);
+    t1 = ((hz * table_len) * AR_RECIP);
+    indexf = (phase * table_len);
+    s->table = table;
+    s->table_len = table_len;
+    s->t1 = t1;
+    s->indexf = indexf;
+}
+
+static inline void Oscm_ccc_a_process(Oscm_ccc_a_state *s, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    sample t1 = s->t1;
+    double indexf = s->indexf;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = (x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1)));
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        indexf = indexf_next;
+    }
+    s->indexf = indexf;
+}
+
+#endif
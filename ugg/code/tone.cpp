@@ -0,0 +1,169 @@
+// tone implementations
+
+#include "ugen.h"
+#include "tone.h"
+
+Tone_acccc_a::Tone_acccc_a(Ugen *hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    block_count = 0;
+    this->table = table;
+    table_len = table_len(table);
+    this->hz = hz;
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+}
+
+void Tone_acccc_a::run(long block_num)
+{
+    if (hz->block_count < block_num) {
+        hz->run(block_num);
+    }
+    block_count = block_num;
+    Tone_acccc_a::compute();
+}
+
+void Tone_acccc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    sample *hz_samps = hz->get_outs();
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        outs[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + ((hz_samps[i] * table_len) * AR_RECIP)), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+}
+
+int Tone_acccc_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = hz;
+    }
+    return 1;
+}
+void Tone_acccc_a::set_amp(sample amp) {
+    state = amp;
+}
+
+extern "C" Ugen *Tone_acccc_a_create(Ugen *hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    return new Tone_acccc_a(hz, phase, table, amp, time);
+}
+
+extern "C" void Tone_acccc_a_set_amp(Ugen *ugen, sample amp)
+{
+    ((Tone_acccc_a *) ugen)->set_amp(amp);
+}
+
+Tone_bcccc_a::Tone_bcccc_a(Ugen *hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    block_count = 0;
+    this->table = table;
+    table_len = table_len(table);
+    this->hz = hz;
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+}
+
+void Tone_bcccc_a::run(long block_num)
+{
+    if (hz->block_count < block_num) {
+        hz->run(block_num);
+    }
+    block_count = block_num;
+    Tone_bcccc_a::compute();
+}
+
+void Tone_bcccc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    sample t1 = ((hz->get_out() * table_len) * AR_RECIP);
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        outs[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+}
+
+int Tone_bcccc_a::get_inputs(Ugen **inputs)
+{
+    if (inputs) {
+        inputs[0] = hz;
+    }
+    return 1;
+}
+void Tone_bcccc_a::set_amp(sample amp) {
+    state = amp;
+}
+
+extern "C" Ugen *Tone_bcccc_a_create(Ugen *hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    return new Tone_bcccc_a(hz, phase, table, amp, time);
+}
+
+extern "C" void Tone_bcccc_a_set_amp(Ugen *ugen, sample amp)
+{
+    ((Tone_bcccc_a *) ugen)->set_amp(amp);
+}
+
+Tone_ccccc_a::Tone_ccccc_a(double hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    block_count = 0;
+    this->table = table;
+    table_len = table_len(table);
+    t1 = ((hz * table_len) * AR_RECIP);
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+}
+
+void Tone_ccccc_a::run(long block_num)
+{
+    block_count = block_num;
+    Tone_ccccc_a::compute();
+}
+
+void Tone_ccccc_a::compute() UGG_RESTRICT_THIS
+{
+    sample *outs = this->outs;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        outs[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+}
+
+int Tone_ccccc_a::get_inputs(Ugen **inputs)
+{
+    (void) inputs;
+    return 0;
+}
+void Tone_ccccc_a::set_amp(sample amp) {
+    state = amp;
+}
+
+extern "C" Ugen *Tone_ccccc_a_create(double hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    return new Tone_ccccc_a(hz, phase, table, amp, time);
+}
+
+extern "C" void Tone_ccccc_a_set_amp(Ugen *ugen, sample amp)
+{
+    ((Tone_ccccc_a *) ugen)->set_amp(amp);
+}
@@ -0,0 +1,59 @@
+// tone declarations
+
+class Tone_acccc_a : public Ugen_outa {
+    Table_ptr table;
+    int table_len;
+    Ugen *hz;
+    double indexf;
+    sample decay;
+    sample state;
+
+  public:
+    Tone_acccc_a(Ugen *hz, double phase, Table_ptr table, sample amp, sample time);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+    void set_amp(sample amp);
+};
+
+extern "C" Ugen *Tone_acccc_a_create(Ugen *hz, double phase, Table_ptr table, sample amp, sample time);
+extern "C" void Tone_acccc_a_set_amp(Ugen *ugen, sample amp);
+
+class Tone_bcccc_a : public Ugen_outa {
+    Table_ptr table;
+    int table_len;
+    Ugen *hz;
+    double indexf;
+    sample decay;
+    sample state;
+
+  public:
+    Tone_bcccc_a(Ugen *hz, double phase, Table_ptr table, sample amp, sample time);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+    void set_amp(sample amp);
+};
+
+extern "C" Ugen *Tone_bcccc_a_create(Ugen *hz, double phase, Table_ptr table, sample amp, sample time);
+extern "C" void Tone_bcccc_a_set_amp(Ugen *ugen, sample amp);
+
+class Tone_ccccc_a : public Ugen_outa {
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+    sample decay;
+    sample state;
+
+  public:
+    Tone_ccccc_a(double hz, double phase, Table_ptr table, sample amp, sample time);
+    void run(long block_num);
+    void compute() UGG_RESTRICT_THIS;
+    int get_inputs(Ugen **inputs);
+    void set_amp(sample amp);
+};
+
+extern "C" Ugen *Tone_ccccc_a_create(double hz, double phase, Table_ptr table, sample amp, sample time);
+extern "C" void Tone_ccccc_a_set_amp(Ugen *ugen, sample amp);
+
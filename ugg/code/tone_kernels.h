@@ -0,0 +1,167 @@
+/* tone kernels: plain C, generated automatically, do not edit */
+
+#ifndef TONE_KERNELS_H
+#define TONE_KERNELS_H
+
+#include "ugen.h"
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    double indexf;
+    sample decay;
+    sample state;
+} Tone_acccc_a_state;
+
+static inline void Tone_acccc_a_init(Tone_acccc_a_state *s, double phase, Table_ptr table, sample amp, sample time)
+{
+    int table_len;
+    double indexf;
+    sample decay;
+    sample state;
+    s->table = table;
+    table_len = table_len(table);
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+    s->table_len = table_len;
+    s->indexf = indexf;
+    s->decay = decay;
+    s->state = state;
+}
+
+static inline void Tone_acccc_a_process(Tone_acccc_a_state *s, const sample *UGG_RESTRICT hz_samps, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    double indexf = s->indexf;
+    sample decay = s->decay;
+    sample state = s->state;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + ((hz_samps[i] * table_len) * AR_RECIP)), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+    s->indexf = indexf;
+    s->state = state;
+}
+
+static inline void Tone_acccc_a_set_amp(Tone_acccc_a_state *s, sample amp)
+{
+    s->state = amp;
+}
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    double indexf;
+    sample decay;
+    sample state;
+} Tone_bcccc_a_state;
+
+static inline void Tone_bcccc_a_init(Tone_bcccc_a_state *s, double phase, Table_ptr table, sample amp, sample time)
+{
+    int table_len;
+    double indexf;
+    sample decay;
+    sample state;
+    s->table = table;
+    table_len = table_len(table);
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+    s->table_len = table_len;
+    s->indexf = indexf;
+    s->decay = decay;
+    s->state = state;
+}
+
+static inline void Tone_bcccc_a_process(Tone_bcccc_a_state *s, sample hz, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    double indexf = s->indexf;
+    sample decay = s->decay;
+    sample state = s->state;
+    sample t1 = ((hz * table_len) * AR_RECIP);
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+    s->indexf = indexf;
+    s->state = state;
+}
+
+static inline void Tone_bcccc_a_set_amp(Tone_bcccc_a_state *s, sample amp)
+{
+    s->state = amp;
+}
+
+typedef struct {
+    Table_ptr table;
+    int table_len;
+    sample t1;
+    double indexf;
+    sample decay;
+    sample state;
+} Tone_ccccc_a_state;
+
+static inline void Tone_ccccc_a_init(Tone_ccccc_a_state *s, double hz, double phase, Table_ptr table, sample amp, sample time)
+{
+    int table_len;
+    sample t1;
+    double indexf;
+    sample decay;
+    sample state;
+    s->table = table;
+    table_len = table_len(table);
+    t1 = ((hz * table_len) * AR_RECIP);
+    indexf = (phase * table_len);
+    sample dursamples = fmax(1, (time * AR));
+    decay = (amp / dursamples);
+    state = amp;
+    s->table_len = table_len;
+    s->t1 = t1;
+    s->indexf = indexf;
+    s->decay = decay;
+    s->state = state;
+}
+
+static inline void Tone_ccccc_a_process(Tone_ccccc_a_state *s, sample *UGG_RESTRICT out)
+{
+    Table_ptr table = s->table;
+    int table_len = s->table_len;
+    sample t1 = s->t1;
+    double indexf = s->indexf;
+    sample decay = s->decay;
+    sample state = s->state;
+    for (int i = 0; i < BL; i++) {
+        int index = ((int) indexf);
+        sample x1 = tblget(table, index);
+        out[i] = ((x1 + ((indexf - index) * (tblget(table, (index + 1)) - x1))) * state);
+        double indexf_next = phase_wrap((indexf + t1), table_len);
+        sample state_next = fmax((state - decay), 0);
+        indexf = indexf_next;
+        state = state_next;
+    }
+    s->indexf = indexf;
+    s->state = state;
+}
+
+static inline void Tone_ccccc_a_set_amp(Tone_ccccc_a_state *s, sample amp)
+{
+    s->state = amp;
+}
+
+#endif
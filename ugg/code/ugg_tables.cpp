@@ -0,0 +1,3516 @@
+// ugg_tables.cpp -- tables computed by ugtables.py, generated automatically,
+// do not edit
+
+#include "ugen.h"
+#include "ugg_tables.h"
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_1_data = {1025, {
+    0.0, 0.006135884649154475, 0.012271538285719925,
+    0.01840672990580482, 0.024541228522912288, 0.030674803176636626,
+    0.03680722294135883, 0.04293825693494082, 0.049067674327418015,
+    0.055195244349689934, 0.06132073630220858, 0.06744391956366405,
+    0.07356456359966743, 0.07968243797143013, 0.0857973123444399,
+    0.09190895649713272, 0.0980171403295606, 0.10412163387205459,
+    0.11022220729388306, 0.11631863091190475, 0.1224106751992162,
+    0.12849811079379317, 0.13458070850712617, 0.1406582393328492,
+    0.14673047445536175, 0.15279718525844344, 0.15885814333386145,
+    0.16491312048996992, 0.17096188876030122, 0.17700422041214875,
+    0.18303988795514095, 0.1890686641498062, 0.19509032201612825,
+    0.2011046348420919, 0.20711137619221856, 0.21311031991609136,
+    0.2191012401568698, 0.22508391135979283, 0.2310581082806711,
+    0.2370236059943672, 0.24298017990326387, 0.24892760574572015,
+    0.25486565960451457, 0.2607941179152755, 0.26671275747489837,
+    0.272621355449949, 0.27851968938505306, 0.2844075372112719,
+    0.29028467725446233, 0.2961508882436238, 0.3020059493192281,
+    0.30784964004153487, 0.3136817403988915, 0.3195020308160157,
+    0.3253102921622629, 0.33110630575987643, 0.33688985339222005,
+    0.3426607173119944, 0.34841868024943456, 0.35416352542049034,
+    0.3598950365349881, 0.36561299780477385, 0.37131719395183754,
+    0.37700741021641826, 0.3826834323650898, 0.38834504669882625,
+    0.3939920400610481, 0.3996241998456468, 0.40524131400498986,
+    0.4108431710579039, 0.41642956009763715, 0.4220002707997997,
+    0.4275550934302821, 0.43309381885315196, 0.43861623853852766,
+    0.4441221445704292, 0.44961132965460654, 0.45508358712634384,
+    0.46053871095824, 0.4659764957679662, 0.47139673682599764,
+    0.4767992300633221, 0.4821837720791227, 0.487550160148436,
+    0.49289819222978404, 0.49822766697278187, 0.5035383837257176,
+    0.508830142543107, 0.5141027441932217, 0.5193559901655896,
+    0.524589682678469, 0.5298036246862946, 0.5349976198870972,
+    0.5401714727298929, 0.5453249884220465, 0.5504579729366048,
+    0.5555702330196022, 0.560661576197336, 0.5657318107836131,
+    0.5707807458869673, 0.5758081914178453, 0.5808139580957645,
+    0.5857978574564389, 0.5907597018588742, 0.5956993044924334,
+    0.600616479383869, 0.6055110414043255, 0.6103828062763095,
+    0.6152315905806268, 0.6200572117632891, 0.6248594881423863,
+    0.629638238914927, 0.6343932841636455, 0.6391244448637757,
+    0.6438315428897914, 0.6485144010221124, 0.6531728429537768,
+    0.6578066932970786, 0.6624157775901718, 0.6669999223036375,
+    0.6715589548470183, 0.6760927035753159, 0.680600997795453,
+    0.6850836677727004, 0.6895405447370668, 0.693971460889654,
+    0.6983762494089729, 0.7027547444572253, 0.7071067811865475,
+    0.7114321957452164, 0.7157308252838186, 0.7200025079613817,
+    0.7242470829514669, 0.7284643904482252, 0.7326542716724128,
+    0.7368165688773698, 0.7409511253549591, 0.745057785441466,
+    0.7491363945234593, 0.7531867990436124, 0.7572088465064845,
+    0.7612023854842618, 0.765167265622459, 0.7691033376455796,
+    0.773010453362737, 0.7768884656732324, 0.7807372285720944,
+    0.7845565971555752, 0.7883464276266062, 0.7921065773002124,
+    0.7958369046088835, 0.799537269107905, 0.8032075314806448,
+    0.8068475535437992, 0.8104571982525948, 0.8140363297059483,
+    0.8175848131515837, 0.8211025149911046, 0.8245893027850253,
+    0.8280450452577558, 0.8314696123025452, 0.83486287498638,
+    0.838224705554838, 0.8415549774368983, 0.844853565249707,
+    0.8481203448032971, 0.8513551931052652, 0.8545579883654005,
+    0.8577286100002721, 0.8608669386377673, 0.8639728561215867,
+    0.8670462455156926, 0.8700869911087113, 0.8730949784182901,
+    0.8760700941954066, 0.8790122264286334, 0.8819212643483549,
+    0.8847970984309378, 0.8876396204028539, 0.8904487232447579,
+    0.8932243011955153, 0.8959662497561851, 0.8986744656939538,
+    0.901348847046022, 0.9039892931234433, 0.9065957045149153,
+    0.9091679830905223, 0.9117060320054299, 0.9142097557035307,
+    0.9166790599210427, 0.9191138516900578, 0.9215140393420419,
+    0.9238795325112867, 0.9262102421383113, 0.9285060804732155,
+    0.9307669610789837, 0.9329927988347388, 0.9351835099389475,
+    0.937339011912575, 0.9394592236021899, 0.9415440651830208,
+    0.9435934581619604, 0.9456073253805213, 0.9475855910177411,
+    0.9495281805930367, 0.9514350209690083, 0.9533060403541938,
+    0.9551411683057707, 0.9569403357322089, 0.9587034748958716,
+    0.9604305194155658, 0.9621214042690416, 0.9637760657954398,
+    0.9653944416976894, 0.9669764710448521, 0.9685220942744173,
+    0.970031253194544, 0.9715038909862518, 0.9729399522055601,
+    0.9743393827855759, 0.9757021300385286, 0.9770281426577544,
+    0.9783173707196277, 0.9795697656854405, 0.9807852804032304,
+    0.9819638691095552, 0.9831054874312163, 0.984210092386929,
+    0.9852776423889412, 0.9863080972445987, 0.9873014181578584,
+    0.9882575677307495, 0.989176509964781, 0.9900582102622971,
+    0.99090263542778, 0.9917097536690995, 0.99247953459871,
+    0.9932119492347945, 0.9939069700023561, 0.9945645707342554,
+    0.9951847266721968, 0.9957674144676598, 0.996312612182778,
+    0.9968202992911657, 0.9972904566786902, 0.9977230666441916,
+    0.9981181129001492, 0.9984755805732948, 0.9987954562051724,
+    0.9990777277526454, 0.9993223845883495, 0.9995294175010931,
+    0.9996988186962042, 0.9998305817958234, 0.9999247018391445,
+    0.9999811752826011, 1.0, 0.9999811752826011,
+    0.9999247018391445, 0.9998305817958234, 0.9996988186962042,
+    0.9995294175010931, 0.9993223845883495, 0.9990777277526454,
+    0.9987954562051724, 0.9984755805732948, 0.9981181129001492,
+    0.9977230666441916, 0.9972904566786902, 0.9968202992911658,
+    0.996312612182778, 0.9957674144676598, 0.9951847266721969,
+    0.9945645707342554, 0.9939069700023561, 0.9932119492347945,
+    0.99247953459871, 0.9917097536690995, 0.99090263542778,
+    0.9900582102622971, 0.989176509964781, 0.9882575677307495,
+    0.9873014181578584, 0.9863080972445987, 0.9852776423889412,
+    0.984210092386929, 0.9831054874312163, 0.9819638691095552,
+    0.9807852804032304, 0.9795697656854405, 0.9783173707196277,
+    0.9770281426577544, 0.9757021300385286, 0.9743393827855759,
+    0.9729399522055602, 0.9715038909862518, 0.970031253194544,
+    0.9685220942744174, 0.9669764710448521, 0.9653944416976894,
+    0.9637760657954398, 0.9621214042690416, 0.9604305194155659,
+    0.9587034748958716, 0.9569403357322089, 0.9551411683057707,
+    0.9533060403541939, 0.9514350209690083, 0.9495281805930367,
+    0.9475855910177412, 0.9456073253805214, 0.9435934581619604,
+    0.9415440651830208, 0.9394592236021899, 0.937339011912575,
+    0.9351835099389476, 0.9329927988347388, 0.9307669610789837,
+    0.9285060804732156, 0.9262102421383114, 0.9238795325112867,
+    0.921514039342042, 0.9191138516900578, 0.9166790599210427,
+    0.9142097557035307, 0.9117060320054299, 0.9091679830905225,
+    0.9065957045149153, 0.9039892931234434, 0.901348847046022,
+    0.8986744656939539, 0.8959662497561852, 0.8932243011955152,
+    0.890448723244758, 0.8876396204028539, 0.8847970984309379,
+    0.881921264348355, 0.8790122264286335, 0.8760700941954066,
+    0.8730949784182902, 0.8700869911087115, 0.8670462455156928,
+    0.8639728561215868, 0.8608669386377672, 0.8577286100002721,
+    0.8545579883654005, 0.8513551931052652, 0.8481203448032972,
+    0.8448535652497072, 0.8415549774368984, 0.8382247055548382,
+    0.8348628749863801, 0.8314696123025455, 0.8280450452577558,
+    0.8245893027850252, 0.8211025149911048, 0.8175848131515837,
+    0.8140363297059485, 0.8104571982525948, 0.8068475535437994,
+    0.8032075314806449, 0.7995372691079052, 0.7958369046088836,
+    0.7921065773002123, 0.7883464276266063, 0.7845565971555751,
+    0.7807372285720946, 0.7768884656732324, 0.7730104533627371,
+    0.7691033376455796, 0.7651672656224591, 0.7612023854842619,
+    0.7572088465064847, 0.7531867990436125, 0.7491363945234593,
+    0.7450577854414661, 0.740951125354959, 0.73681656887737,
+    0.7326542716724128, 0.7284643904482253, 0.7242470829514669,
+    0.7200025079613818, 0.7157308252838187, 0.7114321957452167,
+    0.7071067811865476, 0.7027547444572252, 0.6983762494089729,
+    0.693971460889654, 0.689540544737067, 0.6850836677727004,
+    0.6806009977954532, 0.6760927035753159, 0.6715589548470186,
+    0.6669999223036376, 0.662415777590172, 0.6578066932970787,
+    0.6531728429537766, 0.6485144010221126, 0.6438315428897914,
+    0.6391244448637758, 0.6343932841636455, 0.6296382389149272,
+    0.6248594881423863, 0.6200572117632894, 0.6152315905806269,
+    0.6103828062763097, 0.6055110414043257, 0.6006164793838689,
+    0.5956993044924335, 0.5907597018588742, 0.585797857456439,
+    0.5808139580957645, 0.5758081914178454, 0.5707807458869673,
+    0.5657318107836135, 0.5606615761973361, 0.5555702330196022,
+    0.5504579729366049, 0.5453249884220464, 0.540171472729893,
+    0.5349976198870972, 0.5298036246862948, 0.524589682678469,
+    0.5193559901655898, 0.5141027441932218, 0.5088301425431073,
+    0.5035383837257177, 0.49822766697278176, 0.49289819222978415,
+    0.4875501601484359, 0.4821837720791229, 0.4767992300633221,
+    0.47139673682599786, 0.4659764957679662, 0.4605387109582402,
+    0.4550835871263439, 0.4496113296546069, 0.4441221445704293,
+    0.43861623853852755, 0.43309381885315207, 0.42755509343028203,
+    0.42200027079979985, 0.41642956009763715, 0.41084317105790413,
+    0.4052413140049899, 0.39962419984564707, 0.39399204006104815,
+    0.3883450466988266, 0.3826834323650899, 0.37700741021641815,
+    0.3713171939518377, 0.3656129978047738, 0.35989503653498833,
+    0.3541635254204904, 0.3484186802494348, 0.34266071731199443,
+    0.33688985339222033, 0.3311063057598765, 0.32531029216226326,
+    0.3195020308160158, 0.3136817403988914, 0.30784964004153503,
+    0.30200594931922803, 0.296150888243624, 0.2902846772544624,
+    0.2844075372112721, 0.27851968938505317, 0.27262135544994925,
+    0.2667127574748985, 0.26079411791527585, 0.2548656596045147,
+    0.2489276057457201, 0.24298017990326407, 0.23702360599436717,
+    0.23105810828067133, 0.22508391135979283, 0.21910124015687005,
+    0.21311031991609142, 0.20711137619221884, 0.201104634842092,
+    0.1950903220161286, 0.18906866414980636, 0.1830398879551409,
+    0.17700422041214894, 0.17096188876030122, 0.16491312048997014,
+    0.15885814333386147, 0.15279718525844369, 0.1467304744553618,
+    0.14065823933284954, 0.13458070850712628, 0.12849811079379309,
+    0.12241067519921635, 0.11631863091190471, 0.11022220729388324,
+    0.10412163387205457, 0.09801714032956083, 0.09190895649713275,
+    0.08579731234444016, 0.0796824379714302, 0.07356456359966773,
+    0.06744391956366418, 0.06132073630220849, 0.055195244349690094,
+    0.049067674327417966, 0.04293825693494102, 0.03680722294135883,
+    0.030674803176636865, 0.024541228522912326, 0.0184067299058051,
+    0.012271538285720007, 0.006135884649154799, 1.2246467991473532e-16,
+    -0.006135884649154554, -0.012271538285719762, -0.01840672990580486,
+    -0.02454122852291208, -0.03067480317663662, -0.03680722294135858,
+    -0.04293825693494078, -0.049067674327417724, -0.05519524434968985,
+    -0.061320736302208245, -0.06744391956366393, -0.0735645635996675,
+    -0.07968243797142995, -0.08579731234443992, -0.09190895649713252,
+    -0.09801714032956059, -0.10412163387205432, -0.110222207293883,
+    -0.11631863091190447, -0.1224106751992161, -0.12849811079379284,
+    -0.13458070850712606, -0.1406582393328493, -0.14673047445536158,
+    -0.15279718525844344, -0.15885814333386122, -0.1649131204899699,
+    -0.17096188876030097, -0.1770042204121487, -0.18303988795514065,
+    -0.1890686641498061, -0.19509032201612836, -0.20110463484209176,
+    -0.2071113761922186, -0.2131103199160912, -0.2191012401568698,
+    -0.2250839113597926, -0.23105810828067108, -0.23702360599436695,
+    -0.24298017990326382, -0.24892760574571987, -0.25486565960451446,
+    -0.2607941179152756, -0.26671275747489825, -0.27262135544994903,
+    -0.2785196893850529, -0.2844075372112718, -0.2902846772544621,
+    -0.2961508882436238, -0.3020059493192278, -0.3078496400415348,
+    -0.3136817403988912, -0.3195020308160156, -0.325310292162263,
+    -0.33110630575987626, -0.3368898533922201, -0.3426607173119942,
+    -0.34841868024943456, -0.3541635254204901, -0.3598950365349881,
+    -0.3656129978047736, -0.37131719395183743, -0.3770074102164179,
+    -0.38268343236508967, -0.38834504669882636, -0.39399204006104793,
+    -0.39962419984564684, -0.4052413140049897, -0.4108431710579039,
+    -0.41642956009763693, -0.4220002707997996, -0.4275550934302818,
+    -0.43309381885315185, -0.4386162385385273, -0.4441221445704291,
+    -0.44961132965460665, -0.45508358712634367, -0.46053871095824006,
+    -0.46597649576796596, -0.47139673682599764, -0.47679923006332187,
+    -0.48218377207912266, -0.48755016014843566, -0.4928981922297839,
+    -0.49822766697278154, -0.5035383837257175, -0.5088301425431071,
+    -0.5141027441932216, -0.5193559901655896, -0.5245896826784687,
+    -0.5298036246862946, -0.5349976198870969, -0.5401714727298929,
+    -0.5453249884220461, -0.5504579729366047, -0.555570233019602,
+    -0.5606615761973359, -0.5657318107836132, -0.5707807458869671,
+    -0.5758081914178453, -0.5808139580957643, -0.5857978574564389,
+    -0.5907597018588739, -0.5956993044924332, -0.6006164793838686,
+    -0.6055110414043254, -0.6103828062763095, -0.6152315905806267,
+    -0.6200572117632892, -0.6248594881423862, -0.629638238914927,
+    -0.6343932841636453, -0.6391244448637757, -0.6438315428897913,
+    -0.6485144010221123, -0.6531728429537765, -0.6578066932970785,
+    -0.6624157775901718, -0.6669999223036374, -0.6715589548470184,
+    -0.6760927035753158, -0.680600997795453, -0.6850836677727001,
+    -0.6895405447370668, -0.6939714608896538, -0.6983762494089728,
+    -0.7027547444572251, -0.7071067811865475, -0.7114321957452164,
+    -0.7157308252838185, -0.7200025079613817, -0.7242470829514668,
+    -0.7284643904482252, -0.7326542716724126, -0.7368165688773698,
+    -0.7409511253549589, -0.7450577854414658, -0.749136394523459,
+    -0.7531867990436124, -0.7572088465064842, -0.761202385484262,
+    -0.765167265622459, -0.7691033376455795, -0.7730104533627367,
+    -0.7768884656732326, -0.7807372285720944, -0.784556597155575,
+    -0.7883464276266059, -0.7921065773002124, -0.7958369046088835,
+    -0.7995372691079048, -0.803207531480645, -0.8068475535437992,
+    -0.8104571982525947, -0.8140363297059481, -0.8175848131515838,
+    -0.8211025149911046, -0.8245893027850251, -0.8280450452577555,
+    -0.8314696123025452, -0.83486287498638, -0.8382247055548379,
+    -0.8415549774368986, -0.844853565249707, -0.8481203448032971,
+    -0.8513551931052649, -0.8545579883654006, -0.857728610000272,
+    -0.8608669386377671, -0.8639728561215865, -0.8670462455156926,
+    -0.8700869911087113, -0.8730949784182899, -0.8760700941954067,
+    -0.8790122264286334, -0.8819212643483549, -0.8847970984309376,
+    -0.887639620402854, -0.8904487232447579, -0.8932243011955152,
+    -0.8959662497561849, -0.8986744656939538, -0.9013488470460219,
+    -0.9039892931234431, -0.9065957045149154, -0.9091679830905224,
+    -0.9117060320054298, -0.9142097557035305, -0.9166790599210427,
+    -0.9191138516900577, -0.9215140393420418, -0.9238795325112865,
+    -0.9262102421383114, -0.9285060804732155, -0.9307669610789836,
+    -0.932992798834739, -0.9351835099389476, -0.9373390119125748,
+    -0.9394592236021897, -0.9415440651830208, -0.9435934581619603,
+    -0.9456073253805212, -0.9475855910177412, -0.9495281805930367,
+    -0.9514350209690083, -0.9533060403541938, -0.9551411683057708,
+    -0.9569403357322088, -0.9587034748958715, -0.9604305194155657,
+    -0.9621214042690416, -0.9637760657954398, -0.9653944416976893,
+    -0.9669764710448522, -0.9685220942744173, -0.970031253194544,
+    -0.9715038909862517, -0.9729399522055602, -0.9743393827855759,
+    -0.9757021300385285, -0.9770281426577543, -0.9783173707196277,
+    -0.9795697656854405, -0.9807852804032303, -0.9819638691095554,
+    -0.9831054874312163, -0.984210092386929, -0.9852776423889411,
+    -0.9863080972445987, -0.9873014181578583, -0.9882575677307495,
+    -0.9891765099647809, -0.9900582102622971, -0.99090263542778,
+    -0.9917097536690995, -0.9924795345987101, -0.9932119492347945,
+    -0.9939069700023561, -0.9945645707342554, -0.9951847266721969,
+    -0.9957674144676598, -0.996312612182778, -0.9968202992911657,
+    -0.9972904566786902, -0.9977230666441916, -0.9981181129001492,
+    -0.9984755805732948, -0.9987954562051724, -0.9990777277526454,
+    -0.9993223845883494, -0.9995294175010931, -0.9996988186962042,
+    -0.9998305817958234, -0.9999247018391445, -0.9999811752826011,
+    -1.0, -0.9999811752826011, -0.9999247018391445,
+    -0.9998305817958234, -0.9996988186962042, -0.9995294175010931,
+    -0.9993223845883495, -0.9990777277526454, -0.9987954562051724,
+    -0.9984755805732948, -0.9981181129001492, -0.9977230666441916,
+    -0.9972904566786902, -0.9968202992911657, -0.996312612182778,
+    -0.9957674144676598, -0.9951847266721969, -0.9945645707342554,
+    -0.9939069700023561, -0.9932119492347946, -0.9924795345987101,
+    -0.9917097536690995, -0.99090263542778, -0.9900582102622971,
+    -0.9891765099647809, -0.9882575677307495, -0.9873014181578584,
+    -0.9863080972445988, -0.9852776423889412, -0.9842100923869291,
+    -0.9831054874312164, -0.9819638691095554, -0.9807852804032304,
+    -0.9795697656854406, -0.9783173707196278, -0.9770281426577543,
+    -0.9757021300385286, -0.974339382785576, -0.9729399522055603,
+    -0.9715038909862518, -0.970031253194544, -0.9685220942744174,
+    -0.9669764710448523, -0.9653944416976894, -0.96377606579544,
+    -0.9621214042690417, -0.9604305194155658, -0.9587034748958716,
+    -0.9569403357322089, -0.9551411683057709, -0.9533060403541939,
+    -0.9514350209690084, -0.9495281805930368, -0.9475855910177413,
+    -0.9456073253805213, -0.9435934581619604, -0.9415440651830209,
+    -0.9394592236021898, -0.937339011912575, -0.9351835099389477,
+    -0.9329927988347391, -0.9307669610789837, -0.9285060804732156,
+    -0.9262102421383115, -0.9238795325112866, -0.9215140393420419,
+    -0.9191138516900579, -0.9166790599210428, -0.9142097557035306,
+    -0.9117060320054299, -0.9091679830905225, -0.9065957045149156,
+    -0.9039892931234433, -0.9013488470460221, -0.898674465693954,
+    -0.895966249756185, -0.8932243011955153, -0.890448723244758,
+    -0.8876396204028542, -0.8847970984309377, -0.881921264348355,
+    -0.8790122264286336, -0.8760700941954069, -0.8730949784182901,
+    -0.8700869911087115, -0.8670462455156929, -0.8639728561215866,
+    -0.8608669386377673, -0.8577286100002722, -0.8545579883654008,
+    -0.8513551931052651, -0.8481203448032973, -0.8448535652497072,
+    -0.8415549774368988, -0.838224705554838, -0.8348628749863801,
+    -0.8314696123025455, -0.8280450452577557, -0.8245893027850253,
+    -0.8211025149911049, -0.817584813151584, -0.8140363297059483,
+    -0.8104571982525949, -0.8068475535437994, -0.8032075314806453,
+    -0.799537269107905, -0.7958369046088837, -0.7921065773002126,
+    -0.7883464276266061, -0.7845565971555752, -0.7807372285720946,
+    -0.7768884656732328, -0.7730104533627369, -0.7691033376455797,
+    -0.7651672656224592, -0.7612023854842622, -0.7572088465064846,
+    -0.7531867990436126, -0.7491363945234596, -0.7450577854414658,
+    -0.7409511253549591, -0.73681656887737, -0.7326542716724131,
+    -0.7284643904482251, -0.724247082951467, -0.7200025079613819,
+    -0.715730825283819, -0.7114321957452164, -0.7071067811865477,
+    -0.7027547444572256, -0.6983762494089727, -0.693971460889654,
+    -0.6895405447370672, -0.6850836677727008, -0.680600997795453,
+    -0.676092703575316, -0.6715589548470187, -0.666999922303638,
+    -0.6624157775901718, -0.6578066932970789, -0.6531728429537771,
+    -0.6485144010221123, -0.6438315428897915, -0.639124444863776,
+    -0.6343932841636459, -0.629638238914927, -0.6248594881423865,
+    -0.6200572117632895, -0.6152315905806274, -0.6103828062763095,
+    -0.6055110414043257, -0.6006164793838693, -0.5956993044924332,
+    -0.5907597018588743, -0.5857978574564391, -0.580813958095765,
+    -0.5758081914178452, -0.5707807458869674, -0.5657318107836136,
+    -0.5606615761973366, -0.5555702330196022, -0.550457972936605,
+    -0.5453249884220468, -0.5401714727298927, -0.5349976198870973,
+    -0.5298036246862949, -0.5245896826784694, -0.5193559901655895,
+    -0.5141027441932219, -0.5088301425431074, -0.5035383837257181,
+    -0.49822766697278187, -0.49289819222978426, -0.4875501601484364,
+    -0.4821837720791226, -0.4767992300633222, -0.4713967368259979,
+    -0.4659764957679667, -0.46053871095823995, -0.455083587126344,
+    -0.449611329654607, -0.4441221445704298, -0.43861623853852766,
+    -0.4330938188531522, -0.42755509343028253, -0.42200027079979957,
+    -0.41642956009763726, -0.41084317105790424, -0.4052413140049904,
+    -0.3996241998456468, -0.39399204006104827, -0.3883450466988267,
+    -0.3826834323650904, -0.37700741021641826, -0.3713171939518378,
+    -0.36561299780477435, -0.359895036534988, -0.3541635254204905,
+    -0.3484186802494349, -0.34266071731199493, -0.33688985339222,
+    -0.3311063057598766, -0.32531029216226337, -0.31950203081601547,
+    -0.3136817403988915, -0.30784964004153514, -0.3020059493192286,
+    -0.29615088824362373, -0.2902846772544625, -0.2844075372112722,
+    -0.27851968938505367, -0.272621355449949, -0.2667127574748986,
+    -0.26079411791527596, -0.2548656596045144, -0.2489276057457202,
+    -0.24298017990326418, -0.23702360599436773, -0.231058108280671,
+    -0.22508391135979297, -0.21910124015687016, -0.21311031991609197,
+    -0.20711137619221853, -0.20110463484209212, -0.19509032201612872,
+    -0.18906866414980603, -0.183039887955141, -0.17700422041214905,
+    -0.17096188876030177, -0.1649131204899698, -0.15885814333386158,
+    -0.1527971852584438, -0.1467304744553624, -0.1406582393328492,
+    -0.13458070850712642, -0.12849811079379364, -0.12241067519921603,
+    -0.11631863091190484, -0.11022220729388336, -0.10412163387205513,
+    -0.0980171403295605, -0.09190895649713288, -0.08579731234444028,
+    -0.07968243797143075, -0.07356456359966741, -0.06744391956366429,
+    -0.06132073630220906, -0.055195244349689775, -0.04906767432741809,
+    -0.04293825693494114, -0.036807222941359394, -0.030674803176636543,
+    -0.024541228522912448, -0.018406729905805226, -0.012271538285720572,
+    -0.006135884649154477, -2.4492935982947064e-16,
+}};
+Table_ptr const ugg_table_saw_1 = (Table_ptr) &saw_1_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_128_data = {1025, {
+    0.0, 0.7586692835345606, 1.3685274087326698,
+    1.7332946416323716, 1.8396492266499405, 1.7535785358792102,
+    1.5860638210760611, 1.4447938138303793, 1.3936398425479404,
+    1.4364210563130018, 1.529052534263744, 1.6108428288687366,
+    1.6378983191316985, 1.602615006678995, 1.5318566001341034,
+    1.4677413610961427, 1.4431377661175628, 1.465201812118489,
+    1.5146082358060418, 1.5590934144560011, 1.5725257001823578,
+    1.548666600449876, 1.5026861498749693, 1.4607565611949038,
+    1.44449879153187, 1.4592883106707728, 1.4925653434322252,
+    1.5222917329591006, 1.5300706861834081, 1.5112611150796433,
+    1.4766387765865274, 1.4452533824112828, 1.4330844277297692,
+    1.44415943334813, 1.4689959032358042, 1.4908050170115354,
+    1.4954863481852239, 1.4795261760252811, 1.4514279094113656,
+    1.4262100699850717, 1.4164705658895522, 1.4252892537598225,
+    1.4449290521886033, 1.4617953931112966, 1.4645193115458637,
+    1.4503909596749076, 1.4265316151288068, 1.4053654389481658,
+    1.3972373909139022, 1.4045386387856844, 1.4206534232724979,
+    1.4341368361576081, 1.4355104700481065, 1.4226601868665132,
+    1.401779377814149, 1.3834813640844472, 1.376501567042574,
+    1.3827112411556037, 1.3962751589158393, 1.4072951559026328,
+    1.407680055009751, 1.3957732054819865, 1.3771022563373527,
+    1.3609436337453191, 1.3548244133701837, 1.3602102911412883,
+    1.3718406472290892, 1.3809847011613803, 1.3806135439916052,
+    1.3694324793566746, 1.3524680922023036, 1.3379683165116443,
+    1.3325187894421657, 1.3372601872212595, 1.347372759507648,
+    1.355038988600013, 1.3540703216251266, 1.3434655437932486,
+    1.3278602545349434, 1.3146857788729156, 1.3097728131486026,
+    1.3139956822753296, 1.3228838260179245, 1.3293544682276504,
+    1.327901170728653, 1.3177655720371464, 1.30326944340824,
+    1.291179318964069, 1.2867063748165335, 1.2905025626862947,
+    1.298380969015325, 1.303863369124035, 1.3020086519589371,
+    1.2922628758923524, 1.2786901291788049, 1.2675046404113988,
+    1.2633994888337141, 1.2668380289000576, 1.2738685349249252,
+    1.2785194813813534, 1.276326443455404, 1.2669100629660983,
+    1.2541188570688837, 1.2437004008594954, 1.2399075961586659,
+    1.2430416828134685, 1.2493492978741705, 1.2532902161608839,
+    1.2508078395678524, 1.2416737829804283, 1.2295533786819397,
+    1.2197942671533761, 1.216270323909611, 1.2191418108245493,
+    1.224825095790412, 1.228151932517558, 1.225418998488992,
+    1.2165298867105077, 1.2049921797566245, 1.195806561444646,
+    1.1925167480980852, 1.1951591552601133, 1.2002971853743958,
+    1.203087064031043, 1.2001347988718027, 1.1914604579400703,
+    1.1804342102879755, 1.1717525465646939, 1.1686686862365472,
+    1.1711092720652354, 1.1757664494489617, 1.1780822855440554,
+    1.1749362007087034, 1.1664519243976124, 1.1558787236659713,
+    1.1476439082855459, 1.144742829598232, 1.1470040565306598,
+    1.1512335228853712, 1.1531273058560916, 1.1498085097743853,
+    1.1414938162948303, 1.1313251772671262, 1.1234897454386399,
+    1.1207521656676258, 1.1228527604697633, 1.126698871694413,
+    1.1282140505017637, 1.1247402042474386, 1.1165779275054752,
+    1.1067731690660658, 1.0992972484923909, 1.0967069519272519,
+    1.098662688161302, 1.102162844179327, 1.10333609511143,
+    1.0997221219672564, 1.0916977348714996, 1.0822223960896231,
+    1.075072175233958, 1.0726153978188098, 1.0744396834777923,
+    1.0776257048841846, 1.078488264086127, 1.0747468853265494,
+    1.0668479875000778, 1.057672626517581, 1.050819190961785,
+    1.0484841520460357, 1.0501884778040727, 1.0530876576459705,
+    1.0536663409360956, 1.0498084865111292, 1.0420244107033885,
+    1.033123680538127, 1.0265421161660524, 1.0243186570941412,
+    1.025912943043753, 1.0285488615710936, 1.028866855646498,
+    1.0249019832485255, 1.0172234889102263, 1.0085754169537704,
+    1.002244109772002, 1.000123411341657, 1.001616278604247,
+    1.0040094423135364, 1.0040869261897167, 1.0000232721762077,
+    0.9924423040216077, 0.9840277236453773, 0.9779278066899112,
+    0.9759021656948074, 0.9773011516207111, 0.9794695001696974,
+    0.9793241387539156, 0.9751689176697299, 0.9676784133654845,
+    0.9594805106747017, 0.9535954224337027, 0.9516580730644393,
+    0.9529698035154333, 0.9549291159767994, 0.9545764560857267,
+    0.9503360209173245, 0.9429297563770836, 0.9349337052229614,
+    0.9292488336534529, 0.9273938033731663, 0.9286241319589861,
+    0.9303883554703967, 0.9298421465376431, 0.9255221186166196,
+    0.9181945824145384, 0.9103872478274871, 0.9048896408125071,
+    0.9031116330238477, 0.9042657546126834, 0.9058472725444255,
+    0.9051197285611544, 0.9007251037577378, 0.8934713943278844,
+    0.8858410895494964, 0.8805192174637638, 0.8788135152105594,
+    0.8798960592087467, 0.8813059117186116, 0.8804079268595716,
+    0.87594316307084, 0.8687589039106722, 0.8612951898187318,
+    0.8561387493534796, 0.85450113569402, 0.8555162432674172,
+    0.8567643100260841, 0.8557056374390816, 0.8511747271856528,
+    0.8440559964132831, 0.8367495147762573, 0.8317492657218523,
+    0.8301759574316507, 0.8311273458701487, 0.8322224984717755,
+    0.831011899519409, 0.8264184305866403, 0.8193617020372091,
+    0.8122040359880479, 0.8073516645593829, 0.8058392565780846,
+    0.8067302732836479, 0.8076805031696259, 0.8063258727822342,
+    0.8016730791876462, 0.794675172858127, 0.7876587294375473,
+    0.782946733139129, 0.7814921517433218, 0.7823258197806234,
+    0.7831383462369348, 0.7816468188094144, 0.7769376238853124,
+    0.769995664007743, 0.7631135747301211, 0.7585351648254869,
+    0.7571356279384718, 0.7579146846768247, 0.7585960465033609,
+    0.756974085836714, 0.7522111388420959, 0.7453225182239362,
+    0.7385685544600133, 0.7341175729251503, 0.7327705563027482,
+    0.7334974863639437, 0.7340536200771804, 0.7323070961510922,
+    0.7274928035392594, 0.7206551530851631, 0.7140236537029498,
+    0.7096945021711594, 0.7083977104555502, 0.7090747739397323,
+    0.7095110808007041, 0.7076453356108463, 0.7027818878563267,
+    0.6959930503993804, 0.6894788596066931, 0.6852664382998918,
+    0.6840177801300266, 0.6846470369030474, 0.6849684406189632,
+    0.6829883448817103, 0.6780777395963624, 0.6713357473337753,
+    0.6649341610585567, 0.6608338160815842, 0.6596313826027207,
+    0.660214713280374, 0.6604257098800139, 0.6583357120687787,
+    0.6533797740002232, 0.6466828289599138, 0.6403895484137831,
+    0.636397026089187, 0.6352390723255964, 0.6357781964732125,
+    0.6358828975809565, 0.6336870664904483, 0.6286874648877804,
+    0.6220339219565072, 0.615845013272402, 0.6119564204320557,
+    0.6108413490834833, 0.6113378410563781, 0.6113400115705824,
+    0.6090420733919223, 0.604000337137376, 0.5973886892642073,
+    0.5913005482949586, 0.5875123176357776, 0.5864386649354801,
+    0.5868939677112367, 0.586797058717146, 0.5844004294356709,
+    0.5793179602717362, 0.5727468255274153, 0.5667561470495827,
+    0.5630650068141193, 0.5620314301483776, 0.5624468674420257,
+    0.5622540450479474, 0.5597618588376, 0.5546399429631776,
+    0.5481080531899221, 0.5422118038844573, 0.5386147512513613,
+    0.5376200182906852, 0.5379968051952344, 0.537710975865944,
+    0.535126110042217, 0.5299659283061431, 0.5234721191361815,
+    0.5176675138210597, 0.5141617914913199, 0.5132047706245029,
+    0.5135440229796916, 0.5131678558476539, 0.510492952849725,
+    0.5052955897329137, 0.498838791789917, 0.49312327246431603,
+    0.4897063480119855, 0.4887859999075777, 0.489088742567308,
+    0.4886246891255937, 0.4858621759235292, 0.48062862747071744,
+    0.4742078585976363, 0.4685790759268528, 0.46524862355057056,
+    0.4643639936980262, 0.4646311678402535, 0.46408147935802563,
+    0.46123358461914066, 0.4559647654561322, 0.44957912383719834,
+    0.44403492076476636, 0.44078880513283614, 0.4399390172381521,
+    0.4401714868389475, 0.4395382297881082, 0.4366069990856149,
+    0.43130374863718274, 0.42495240670199774, 0.4194908039230731,
+    0.41632706585110246, 0.4155113159808938, 0.41570987355602645,
+    0.414994943294257, 0.4119822525987186, 0.40664534060514895,
+    0.4003275396194464, 0.3949467226892001, 0.3918635664283399,
+    0.39108111781187666, 0.3912464895139981, 0.3904516224331156,
+    0.387359190091817, 0.381989321507538, 0.3757043667693025,
+    0.3704026746532549, 0.3673984565994942, 0.3666486350115783,
+    0.3667814851581599, 0.3659082694763259, 0.36273766685577985,
+    0.3573354862014578, 0.3510827427728364, 0.34585865767398805,
+    0.34293187633637856, 0.34221406599501036, 0.34231500109147,
+    0.34136488644202834, 0.33811754738372835, 0.33268364261299016,
+    0.3264625315283642, 0.3213146698495944, 0.31846395693839147,
+    0.3177775968605685, 0.3178471691737736, 0.31682147512195635,
+    0.31349870434012467, 0.30803361027336723, 0.3018436051724254,
+    0.2967707094926212, 0.2939948220079912, 0.2933394027750358,
+    0.2933781135046251, 0.2922780371046719, 0.2888810176367134,
+    0.2833852190070737, 0.2772258431489185, 0.27222677510840054,
+    0.2695245883270762, 0.2688996492176718, 0.26890795130597084,
+    0.2677345737955789, 0.26426437360034377, 0.25873830775063494,
+    0.25260913137108204, 0.24768286537648998, 0.245053366648158,
+    0.24445849310314308, 0.24443679371876276, 0.24319108643413878,
+    0.23964866421982356, 0.23409272348373994, 0.22799336146329993,
+    0.22313897913473052, 0.22058126241228568, 0.22001608380028448,
+    0.21996474652552894, 0.21864757610862054, 0.21503378646062324,
+    0.20944832025687266, 0.2033784300715103, 0.19859511536557528,
+    0.1961083764041131, 0.19557256406150011, 0.1954919108094356,
+    0.19410404376877982, 0.19041964163777025, 0.18480495830170987,
+    0.17876423823239673, 0.1740512731843748, 0.17163480535316133,
+    0.17112807087561085, 0.17101838355896784, 0.1695604902366265,
+    0.16580613483845072, 0.16016250321216688, 0.15415069079282748,
+    0.14950745182945802, 0.14716064248925229, 0.14668273625554232,
+    0.14654425822626743, 0.14501691621560267, 0.14119317438676868,
+    0.1355208251854998, 0.12953769587198147, 0.12496365065370088,
+    0.12268597805917017, 0.12223668797081076, 0.12206962524622683,
+    0.1204733222982655, 0.11658067134408372, 0.11087979831395581,
+    0.10492516435942356, 0.10041986911752229, 0.09821089981085938,
+    0.09779005023383376, 0.09759457252271686, 0.0959297089726611,
+    0.09196853903888652, 0.0862392999185445, 0.08031300944316,
+    0.07587610678311256, 0.07373549345081236, 0.07334294434803934,
+    0.07311918588765721, 0.07138607662751024, 0.06735669262081405,
+    0.061599209917172826, 0.055701146162146505, 0.05133236330982085,
+    0.049259843079904386, 0.0488954893252232, 0.048643549538132706,
+    0.04684242555628493, 0.042745048633804364, 0.036959410220109915,
+    0.031089490978308133, 0.026788638450598017, 0.024784031612387132,
+    0.02444780247888857, 0.024167746456428038, 0.022298755960254657,
+    0.018133524603806458, 0.012319784146224075, 0.006477961363383901,
+    0.0022449320494314718, 0.00030814118258776923, -5.150054650241103e-16,
+    -0.000308141182587361, -0.0022449320494314583, -0.006477961363383722,
+    -0.012319784146221195, -0.01813352460380631, -0.022298755960250376,
+    -0.02416774645642758, -0.024447802478888253, -0.024784031612386622,
+    -0.02678863845059809, -0.031089490978311075, -0.036959410220108534,
+    -0.04274504863380449, -0.046842425556284296, -0.04864354953813267,
+    -0.048895489325220365, -0.04925984307990565, -0.0513323633098215,
+    -0.05570114616214696, -0.06159920991717308, -0.06735669262081195,
+    -0.07138607662751022, -0.07311918588765466, -0.0733429443480393,
+    -0.07373549345081329, -0.07587610678311225, -0.0803130094431606,
+    -0.08623929991854463, -0.09196853903888581, -0.09592970897266348,
+    -0.09759457252271657, -0.0977900502338353, -0.0982108998108582,
+    -0.10041986911752135, -0.10492516435942344, -0.11087979831395861,
+    -0.11658067134408291, -0.1204733222982622, -0.12206962524622761,
+    -0.12223668797081297, -0.12268597805916961, -0.12496365065370107,
+    -0.12953769587197983, -0.13552082518549724, -0.1411931743867683,
+    -0.14501691621560053, -0.14654425822626813, -0.14668273625553763,
+    -0.14716064248925076, -0.1495074518294589, -0.1541506907928265,
+    -0.1601625032121669, -0.16580613483845016, -0.1695604902366246,
+    -0.17101838355896795, -0.17112807087561063, -0.17163480535315773,
+    -0.17405127318437455, -0.1787642382323952, -0.1848049583017095,
+    -0.19041964163777286, -0.19410404376877957, -0.19549191080943892,
+    -0.19557256406149953, -0.1961083764041118, -0.19859511536557406,
+    -0.20337843007151124, -0.20944832025687227, -0.2150337864606227,
+    -0.21864757610862315, -0.21996474652553, -0.2200160838002867,
+    -0.22058126241228587, -0.22313897913472985, -0.22799336146329932,
+    -0.23409272348374205, -0.23964866421982442, -0.24319108643414017,
+    -0.2444367937187618, -0.24445849310314277, -0.2450533666481574,
+    -0.24768286537649084, -0.25260913137108215, -0.25873830775063617,
+    -0.2642643736003428, -0.26773457379557913, -0.2689079513059723,
+    -0.26889964921767173, -0.26952458832707527, -0.27222677510840054,
+    -0.2772258431489211, -0.28338521900707336, -0.28888101763671487,
+    -0.29227803710467287, -0.2933781135046226, -0.29333940277503223,
+    -0.29399482200799126, -0.2967707094926206, -0.30184360517242587,
+    -0.3080336102733719, -0.31349870434012483, -0.3168214751219588,
+    -0.3178471691737739, -0.31777759686056867, -0.3184639569383904,
+    -0.3213146698495939, -0.3264625315283643, -0.3326836426129906,
+    -0.3381175473837299, -0.3413648864420289, -0.34231500109147034,
+    -0.3422140659950114, -0.34293187633637934, -0.34585865767398893,
+    -0.351082742772837, -0.3573354862014522, -0.3627376668557797,
+    -0.3659082694763237, -0.3667814851581578, -0.3666486350115789,
+    -0.3673984565994953, -0.37040267465325405, -0.37570436676930213,
+    -0.38198932150753717, -0.3873591900918162, -0.3904516224331157,
+    -0.39124648951399593, -0.3910811178118763, -0.3918635664283412,
+    -0.39494672268920106, -0.40032753961944595, -0.40664534060514934,
+    -0.4119822525987168, -0.4149949432942579, -0.41570987355602673,
+    -0.41551131598089386, -0.41632706585110524, -0.41949080392307236,
+    -0.424952406701997, -0.43130374863717963, -0.43660699908561534,
+    -0.4395382297881078, -0.4401714868389466, -0.4399390172381534,
+    -0.4407888051328355, -0.4440349207647666, -0.4495791238371972,
+    -0.4559647654561315, -0.4612335846191429, -0.4640814793580247,
+    -0.4646311678402545, -0.46436399369802706, -0.4652486235505705,
+    -0.4685790759268529, -0.4742078585976348, -0.48062862747072355,
+    -0.48586217592352804, -0.4886246891255941, -0.4890887425673066,
+    -0.48878599990757693, -0.4897063480119833, -0.49312327246431714,
+    -0.4988387917899186, -0.5052955897329153, -0.5104929528497254,
+    -0.5131678558476538, -0.5135440229796939, -0.5132047706245022,
+    -0.5141617914913226, -0.5176675138210549, -0.5234721191361829,
+    -0.5299659283061406, -0.5351261100422163, -0.5377109758659498,
+    -0.5379968051952351, -0.5376200182906836, -0.5386147512513626,
+    -0.5422118038844612, -0.5481080531899206, -0.5546399429631795,
+    -0.5597618588375985, -0.5622540450479481, -0.5624468674420259,
+    -0.5620314301483793, -0.5630650068141214, -0.5667561470495831,
+    -0.5727468255274145, -0.5793179602717337, -0.5844004294356706,
+    -0.5867970587171467, -0.5868939677112375, -0.5864386649354811,
+    -0.5875123176357783, -0.5913005482949597, -0.5973886892642054,
+    -0.6040003371373764, -0.609042073391924, -0.6113400115705819,
+    -0.611337841056378, -0.6108413490834831, -0.611956420432056,
+    -0.6158450132724025, -0.6220339219565085, -0.6286874648877807,
+    -0.6336870664904449, -0.6358828975809571, -0.6357781964732133,
+    -0.6352390723255973, -0.6363970260891879, -0.640389548413785,
+    -0.6466828289599118, -0.6533797740002242, -0.658335712068776,
+    -0.660425709880016, -0.6602147132803737, -0.6596313826027214,
+    -0.6608338160815843, -0.6649341610585561, -0.6713357473337753,
+    -0.6780777395963625, -0.6829883448817119, -0.6849684406189578,
+    -0.6846470369030482, -0.6840177801300308, -0.6852664382998899,
+    -0.6894788596066925, -0.6959930503993813, -0.7027818878563267,
+    -0.7076453356108489, -0.7095110808007014, -0.7090747739397314,
+    -0.7083977104555479, -0.7096945021711589, -0.7140236537029463,
+    -0.7206551530851634, -0.7274928035392598, -0.7323070961510916,
+    -0.7340536200771797, -0.7334974863639451, -0.7327705563027463,
+    -0.7341175729251491, -0.7385685544600161, -0.7453225182239349,
+    -0.7522111388420938, -0.7569740858367121, -0.7585960465033621,
+    -0.7579146846768243, -0.7571356279384699, -0.7585351648254871,
+    -0.7631135747301186, -0.7699956640077422, -0.7769376238853116,
+    -0.7816468188094194, -0.7831383462369361, -0.7823258197806222,
+    -0.7814921517433231, -0.78294673313913, -0.7876587294375442,
+    -0.7946751728581255, -0.8016730791876462, -0.8063258727822351,
+    -0.8076805031696248, -0.8067302732836447, -0.805839256578083,
+    -0.807351664559384, -0.8122040359880477, -0.8193617020372093,
+    -0.8264184305866408, -0.8310118995194072, -0.8322224984717742,
+    -0.8311273458701512, -0.8301759574316518, -0.8317492657218489,
+    -0.8367495147762573, -0.8440559964132838, -0.8511747271856518,
+    -0.8557056374390812, -0.8567643100260841, -0.8555162432674153,
+    -0.8545011356940169, -0.8561387493534811, -0.8612951898187324,
+    -0.8687589039106721, -0.8759431630708425, -0.8804079268595694,
+    -0.8813059117186103, -0.8798960592087489, -0.8788135152105608,
+    -0.8805192174637623, -0.8858410895494973, -0.8934713943278834,
+    -0.9007251037577378, -0.9051197285611531, -0.905847272544425,
+    -0.9042657546126829, -0.9031116330238482, -0.9048896408125073,
+    -0.9103872478274868, -0.9181945824145384, -0.9255221186166203,
+    -0.9298421465376447, -0.9303883554703979, -0.9286241319589892,
+    -0.9273938033731667, -0.9292488336534519, -0.9349337052229626,
+    -0.9429297563770824, -0.9503360209173277, -0.9545764560857262,
+    -0.9549291159768053, -0.9529698035154318, -0.9516580730644398,
+    -0.9535954224337027, -0.9594805106747007, -0.9676784133654852,
+    -0.9751689176697312, -0.9793241387539156, -0.9794695001696965,
+    -0.9773011516207137, -0.9759021656948069, -0.9779278066899125,
+    -0.9840277236453767, -0.9924423040216107, -1.0000232721762077,
+    -1.004086926189714, -1.0040094423135342, -1.0016162786042488,
+    -1.000123411341655, -1.0022441097720005, -1.0085754169537688,
+    -1.0172234889102285, -1.0249019832485262, -1.0288668556464988,
+    -1.0285488615710938, -1.0259129430437575, -1.0243186570941412,
+    -1.0265421161660515, -1.0331236805381272, -1.0420244107033891,
+    -1.04980848651113, -1.053666340936096, -1.0530876576459716,
+    -1.0501884778040722, -1.048484152046039, -1.050819190961787,
+    -1.0576726265175793, -1.0668479875000763, -1.0747468853265487,
+    -1.0784882640861255, -1.077625704884179, -1.074439683477793,
+    -1.0726153978188073, -1.0750721752339572, -1.0822223960896251,
+    -1.0916977348714998, -1.099722121967258, -1.1033360951114275,
+    -1.1021628441793276, -1.0986626881613053, -1.0967069519272516,
+    -1.0992972484923929, -1.1067731690660707, -1.1165779275054732,
+    -1.1247402042474366, -1.128214050501767, -1.126698871694415,
+    -1.1228527604697613, -1.1207521656676251, -1.1234897454386423,
+    -1.1313251772671258, -1.1414938162948325, -1.1498085097743915,
+    -1.1531273058560931, -1.1512335228853716, -1.1470040565306572,
+    -1.144742829598233, -1.1476439082855445, -1.1558787236659733,
+    -1.1664519243976093, -1.174936200708697, -1.1780822855440547,
+    -1.175766449448963, -1.1711092720652359, -1.1686686862365463,
+    -1.171752546564692, -1.180434210287972, -1.1914604579400707,
+    -1.2001347988718032, -1.2030870640310463, -1.2002971853743991,
+    -1.1951591552601128, -1.1925167480980852, -1.1958065614446467,
+    -1.2049921797566236, -1.2165298867105039, -1.2254189984889918,
+    -1.2281519325175638, -1.2248250957904119, -1.2191418108245504,
+    -1.21627032390961, -1.2197942671533732, -1.2295533786819393,
+    -1.2416737829804254, -1.250807839567852, -1.2532902161608803,
+    -1.2493492978741723, -1.2430416828134685, -1.2399075961586714,
+    -1.2437004008594927, -1.2541188570688844, -1.266910062966099,
+    -1.2763264434554034, -1.2785194813813512, -1.2738685349249286,
+    -1.2668380289000598, -1.2633994888337121, -1.267504640411401,
+    -1.2786901291788026, -1.2922628758923553, -1.3020086519589376,
+    -1.3038633691240331, -1.2983809690153267, -1.290502562686297,
+    -1.2867063748165324, -1.291179318964071, -1.3032694434082401,
+    -1.3177655720371468, -1.3279011707286525, -1.3293544682276497,
+    -1.3228838260179179, -1.3139956822753298, -1.3097728131486022,
+    -1.314685778872918, -1.3278602545349423, -1.343465543793247,
+    -1.3540703216251277, -1.3550389886000127, -1.3473727595076486,
+    -1.3372601872212588, -1.332518789442167, -1.337968316511646,
+    -1.352468092202298, -1.3694324793566752, -1.3806135439916045,
+    -1.3809847011613803, -1.3718406472290883, -1.3602102911412965,
+    -1.3548244133701863, -1.3609436337453178, -1.3771022563373505,
+    -1.3957732054819851, -1.4076800550097492, -1.407295155902633,
+    -1.396275158915841, -1.3827112411556053, -1.376501567042574,
+    -1.3834813640844466, -1.4017793778141487, -1.4226601868665167,
+    -1.4355104700481052, -1.4341368361576081, -1.4206534232724997,
+    -1.4045386387856844, -1.3972373909138989, -1.4053654389481736,
+    -1.4265316151288037, -1.4503909596749054, -1.4645193115458626,
+    -1.4617953931112981, -1.4449290521886038, -1.4252892537598247,
+    -1.4164705658895518, -1.4262100699850684, -1.451427909411365,
+    -1.479526176025279, -1.4954863481852243, -1.4908050170115363,
+    -1.468995903235803, -1.4441594333481307, -1.4330844277297667,
+    -1.4452533824112803, -1.4766387765865256, -1.5112611150796407,
+    -1.530070686183408, -1.5222917329591001, -1.4925653434322277,
+    -1.4592883106707717, -1.4444987915318734, -1.4607565611948985,
+    -1.502686149874968, -1.54866660044988, -1.5725257001823572,
+    -1.5590934144560014, -1.5146082358060453, -1.4652018121184935,
+    -1.443137766117558, -1.4677413610961423, -1.5318566001341,
+    -1.6026150066789913, -1.6378983191316965, -1.6108428288687395,
+    -1.5290525342637498, -1.436421056313003, -1.3936398425479408,
+    -1.4447938138303766, -1.586063821076057, -1.7535785358791938,
+    -1.8396492266499405, -1.7332946416323798, -1.3685274087326955,
+    -0.7586692835345827, -3.3605947937655406e-14,
+}};
+Table_ptr const ugg_table_saw_128 = (Table_ptr) &saw_128_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_16_data = {1025, {
+    0.0, 0.09811718841470701, 0.1958893085798658,
+    0.2929734079862685, 0.38903075018063416, 0.48372888435399036,
+    0.5767436691439805, 0.6677612359550664, 0.7564798775796638,
+    0.842611848494562, 0.9258850639056155, 1.006044685413843,
+    1.0828545820710804, 1.1560986565757756, 1.2255820274212241,
+    1.2911320589407396, 1.3525992323875289, 1.409857852431577,
+    1.4628065847412914, 1.5113688216334982, 1.5554928741107137,
+    1.5951519899485143, 1.630344198837287, 1.6610919869106509,
+    1.6874418042966315, 1.7094634105966355, 1.727249064421124,
+    1.7409125642798138, 1.7505881492288333, 1.7564292687087744,
+    1.758607231957827, 1.7573097482457534, 1.7527393699406746,
+    1.7451118510856438, 1.734654434720862, 1.7216040826360162,
+    1.7062056615725698, 1.688710100115674, 1.6693725306186302,
+    1.6484504304892695, 1.6262017770380672, 1.6028832298440883,
+    1.5787483542396468, 1.5540458990515824, 1.5290181411708323,
+    1.5038993088579296, 1.4789140949363715, 1.4542762701854757,
+    1.4301874063268774, 1.4068357170126273, 1.3843950241764802,
+    1.3630238560128263, 1.3428646817092706, 1.3240432868890561,
+    1.306668292528429, 1.290830818911825, 1.2766042949846914,
+    1.2640444122699568, 1.2531892213396514, 1.2440593676877465,
+    1.2366584627433577, 1.2309735847040795, 1.2269759028660232,
+    1.2246214181880548, 1.223851811960273, 1.2245953936576177,
+    1.22676813835466, 1.2302748034623956, 1.2350101140265597,
+    1.2408600054032592, 1.2477029118042298, 1.2554110889825474,
+    1.2638519592111281, 1.2728894666907182, 1.2823854316105376,
+    1.292200891271367, 1.3021974169651633, 1.3122383956836199,
+    1.3221902661963352, 1.3319236995922878, 1.3413147150104558,
+    1.3502457219903259, 1.3586064816437222, 1.366294979678409,
+    1.373218205183384, 1.3792928300073568, 1.3844457845171063,
+    1.3886147265023137, 1.3917484009892944, 1.393806889728654,
+    1.3947617501224656, 1.3945960443460956, 1.3933042603897616,
+    1.3908921276867512, 1.3873763309009401, 1.3827841263081526,
+    1.3771528660167134, 1.370529436025655, 1.3629696148082828,
+    1.3545373597287418, 1.3453040291450515, 1.335347548519722,
+    1.3247515292451753, 1.3136043491932456, 1.3019982042142109,
+    1.2900281399401357, 1.2777910732896511, 1.26538481302717,
+    1.252907088600428, 1.2404545962682276, 1.2281220712382583,
+    1.2160013941664412, 1.2041807399286504, 1.192743776067763,
+    1.1817689177491817, 1.1713286454322749, 1.1614888907898648,
+    1.1523084956899037, 1.1438387482997545, 1.1361229995915676,
+    1.1291963627245325, 1.1230854969640636, 1.117808476976884,
+    1.113374747522243, 1.1097851627507063, 1.1070321085304924,
+    1.1050997054544316, 1.1039640894451215, 1.1035937661783106,
+    1.1039500348910445, 1.1049874765372956, 1.1066545007047923,
+    1.108893945217121, 1.111643721918809, 1.1148375017814018,
+    1.1184054321781403, 1.1222748789556982, 1.1263711857849343,
+    1.1306184431992725, 1.1349402597291, 1.1392605276127188,
+    1.143504175707395, 1.1475979024358791, 1.151470881881667,
+    1.1550554364868808, 1.15828767020617, 1.161108056423944,
+    1.163461975445776, 1.1653001969225687, 1.1665793031524858,
+    1.16726204982458, 1.1673176614134506, 1.1667220590995295,
+    1.1654580197682842, 1.163515265327049, 1.1608904822637525,
+    1.1575872720509275, 1.15361603366459, 1.1489937801346468,
+    1.143743891665344, 1.1378958084552362, 1.1314846669007956,
+    1.1245508833811493, 1.1171396902889514, 1.1093006293900183,
+    1.1010870079585142, 1.092555323442157, 1.0837646626607012,
+    1.0747760817289587, 1.0656519730216216, 1.0564554255604635,
+    1.0472495852051438, 1.0380970209672988, 1.02905910364513,
+    1.020195402793948, 1.0115631078094638, 1.0032164786077868,
+    0.9952063310424905, 0.9875795618084716, 0.9803787171488776,
+    0.973641609209719, 0.9674009833818, 0.9616842394365264,
+    0.9565132087063816, 0.9519039889880522, 0.9478668382619757,
+    0.9444061277323825, 0.9415203541023777, 0.9392022104151028,
+    0.9374387142201454, 0.9362113912695569, 0.9354965124154941,
+    0.9352653808764859, 0.9354846665664898, 0.9361167837444958,
+    0.9371203078465336, 0.93845042700996, 0.9400594234951293,
+    0.9418971799543311, 0.9439117052946256, 0.9460496747312241,
+    0.94825697853258, 0.9504792739178193, 0.9526625345815349,
+    0.9547535923897098, 0.9567006659125664, 0.9584538706338279,
+    0.9599657058991362, 0.961191513936632, 0.9620899065969521,
+    0.9626231558147282, 0.9627575441852867, 0.962463672474491,
+    0.9617167213322267, 0.9604966649560716, 0.9587884349465585,
+    0.9565820331039365, 0.953872592433504, 0.9506603861471573,
+    0.9469507849676919, 0.942754163554448, 0.9380857573691541,
+    0.9329654717844156, 0.9274176456995281, 0.921470772364851,
+    0.915157180522599, 0.9085126793448912, 0.9015761709857153,
+    0.8943892348590925, 0.8869956880084777, 0.8794411261401558,
+    0.8717724500542301, 0.8640373823196078, 0.8562839791032375,
+    0.848560142078514, 0.8409131353034011, 0.8333891118760491,
+    0.8260326550456939, 0.8188863382809601, 0.811990308578403,
+    0.8053818970336716, 0.7990952603988769, 0.7931610570158101,
+    0.7876061601491634, 0.7824534113505441, 0.7777214160671045,
+    0.773424383272128, 0.7695720104435191, 0.7661694147542941,
+    0.763217110871604, 0.7607110352921448, 0.7586426166767204,
+    0.7569988911898239, 0.7557626614058467, 0.7549126969163029,
+    0.7544239743663572, 0.7542679542679542, 0.7544128915845114,
+    0.7548241767619094, 0.7554647035952902, 0.7562952600736503,
+    0.757274938136652, 0.7583615581122527, 0.7595121034811461,
+    0.7606831615355908, 0.7618313654664534, 0.7629138334233967,
+    0.7638886001486577, 0.7647150368840494, 0.765354255392428,
+    0.7657694921172676, 0.7659264687251524, 0.765793725533483,
+    0.7653429246168163, 0.7645491197068308, 0.7633909903496835,
+    0.761851038156785, 0.7599157433770031, 0.7575756804259384,
+    0.7548255914271309, 0.7516644172465085, 0.7480952859309102,
+    0.7441254588896795, 0.7397662355809654, 0.7350328178772438,
+    0.7299441356835872, 0.7245226357635494, 0.7187940360873131,
+    0.7127870483516658, 0.7065330716280213, 0.7000658603703226,
+    0.6934211702564889, 0.6866363855430017, 0.679750131780227,
+    0.6728018778647451, 0.6658315314931854, 0.658879032129055,
+    0.6519839455996981, 0.6451850644047679, 0.6385200177411452,
+    0.6320248951329079, 0.6257338874002252, 0.6196789485094751,
+    0.6138894816207286, 0.6083920523902373, 0.6032101322975865,
+    0.5983638744526498, 0.5938699239996911, 0.5897412648784127,
+    0.5859871043280541, 0.5826127961346822, 0.5796198032274221,
+    0.5770056998306211, 0.5747642129797457, 0.5728853028132664,
+    0.5713552806647629, 0.5701569636028938, 0.5692698637053825,
+    0.5686704100104494, 0.568332200768364, 0.5682262833202864,
+    0.5683214586640855, 0.5685846075299265, 0.5689810345844594,
+    0.5694748272131906, 0.5700292251977743, 0.570606997509637,
+    0.5711708223843743, 0.5716836668231701, 0.5721091616881183,
+    0.5724119686174286, 0.5725581350832907, 0.5725154340486462,
+    0.5722536848476744, 0.5717450521166985, 0.5709643198353661,
+    0.569889137799679, 0.5685002381363455, 0.5667816197787106,
+    0.5647206991551774, 0.5623084256881048, 0.5595393610611364,
+    0.5564117215820737, 0.5529273833431185, 0.5490918502566706,
+    0.5449141854191619, 0.5404069066239542, 0.5355858472031949,
+    0.5304699837245124, 0.5250812323977339, 0.5194442163564589,
+    0.5135860062660638, 0.5075358369709411, 0.5013248031267029,
+    0.4949855369657299, 0.4885518715146387, 0.48205849271849666,
+    0.4755405840277055, 0.4690334670682905, 0.4625722420446346,
+    0.4561914315150137, 0.449924631135056, 0.44380417088284685,
+    0.4378607901629236, 0.4321233300359529, 0.42661844563823503,
+    0.42137034164216136, 0.4164005333675789, 0.41172763588733835,
+    0.4073671831806489, 0.403331479078449, 0.3996294814187961,
+    0.39626672049076384, 0.39324525249582754, 0.3905636483998971,
+    0.38821701819049037, 0.38619707019574523, 0.38449220476857804,
+    0.38308764129389444, 0.38196557714277013, 0.3811053768783019,
+    0.3804837897165322, 0.38007519296548153, 0.37985185890863965,
+    0.37978424236878655, 0.3798412859860138, 0.37999074007222483,
+    0.3801994937649051, 0.38043391409684213, 0.3806601895267898,
+    0.38084467443938586, 0.38095423112129345, 0.38095656575443226,
+    0.3808205550358701, 0.38051656013674395, 0.3800167248482763,
+    0.37929525493015787, 0.3783286758735259, 0.3770960665154043,
+    0.3755792661914762, 0.37376305338686266, 0.37163529413737706,
+    0.3691870587435207, 0.3664127056831417, 0.36330993194284267,
+    0.35987978932964687, 0.3561266666694525, 0.3520582381441454,
+    0.3476853783612966, 0.3430220450856919, 0.33808513088731384,
+    0.3328942852723087, 0.3274717091590789, 0.32184192383778404,
+    0.3160315168055978, 0.31006886709942755, 0.30398385295035324,
+    0.2978075447575575, 0.29157188652254545, 0.2853093689954591,
+    0.27905269786319536, 0.27283446035327946, 0.2666867936374145,
+    0.2606410583944984, 0.25472752083475775, 0.2489750463954041,
+    0.24341080819451225, 0.23806001317532172, 0.23294564868913906,
+    0.22808825205364552, 0.22350570538669118, 0.21921305775607122,
+    0.21522237640603217, 0.211542628524086, 0.2081795947002969,
+    0.20513581490849284, 0.20241056750841196, 0.19999988143262826,
+    0.19789658138591054, 0.19609036555058568, 0.19456791496310558,
+    0.19331303340744116, 0.19230681636351488, 0.19152784725665883,
+    0.19095241897997772, 0.1905547784082613, 0.19030739139219938,
+    0.19018122551755398, 0.19014604773740673, 0.1901707338386353,
+    0.1902235865876492, 0.19027265931635057, 0.1902860816580394,
+    0.1902323841251177, 0.19008081823595607, 0.18980166894717387,
+    0.18936655622913184, 0.18874872273588392, 0.18792330466503848,
+    0.18686758307630266, 0.1855612131383333, 0.1839864289996977,
+    0.18212822222900737, 0.17997449203908136, 0.17751616579761864,
+    0.17474728862925515, 0.17166508122820143, 0.16826996532351557,
+    0.16456555656729663, 0.16055862494637962, 0.15625902314705734,
+    0.15167958362674402, 0.14683598546292423, 0.14174659235513493,
+    0.13643226344696294, 0.1309161389091663, 0.12522340247937888,
+    0.11938102338572548, 0.11341748028893253, 0.10736247005788194,
+    0.1012466043454251, 0.09510109705292982, 0.08895744586245452,
+    0.08284711107362784, 0.07680119500766647, 0.07085012523339365,
+    0.06502334482953574, 0.059349012824569, 0.05385371785057268,
+    0.048562207912137695, 0.043497139006618446, 0.03867884513970587,
+    0.034125132062292306, 0.02985109681319293, 0.02586897488985581,
+    0.022188016588459467, 0.018814393758547626, 0.015751137908630353,
+    0.012998110281074263, 0.010552004190351962, 0.008406379591587698,
+    0.006551729519642711, 0.004975577715980169, 0.0036626064445921492,
+    0.0025948131924505963, 0.0017516946573576686, 0.00111045614983458,
+    0.0006462442782447802, 0.00033240055074309604, 0.00014073331579059892,
+    4.1805277455505515e-05, 5.233663959723222e-06, 2.86535881786707e-16,
+    -5.233663959723511e-06, -4.1805277455502045e-05, -0.00014073331579059315,
+    -0.00033240055074309604, -0.0006462442782447757, -0.0011104561498345338,
+    -0.0017516946573576248, -0.002594813192450557, -0.0036626064445921007,
+    -0.004975577715980109, -0.006551729519642665, -0.008406379591587633,
+    -0.010552004190351892, -0.012998110281074053, -0.015751137908630152,
+    -0.018814393758547356, -0.022188016588459435, -0.02586897488985579,
+    -0.02985109681319291, -0.03412513206229211, -0.038678845139705674,
+    -0.043497139006618286, -0.0485622079121375, -0.05385371785057252,
+    -0.05934901282456856, -0.06502334482953524, -0.07085012523339318,
+    -0.07680119500766647, -0.08284711107362785, -0.08895744586245426,
+    -0.0951010970529296, -0.10124660434542486, -0.10736247005788169,
+    -0.11341748028893227, -0.11938102338572522, -0.12522340247937824,
+    -0.13091613890916573, -0.13643226344696202, -0.14174659235513515,
+    -0.14683598546292412, -0.15167958362674383, -0.15625902314705692,
+    -0.16055862494637943, -0.1645655565672961, -0.16826996532351543,
+    -0.17166508122820093, -0.17474728862925454, -0.17751616579761775,
+    -0.1799744920390809, -0.18212822222900743, -0.18398642899969792,
+    -0.18556121313833296, -0.18686758307630263, -0.18792330466503815,
+    -0.18874872273588386, -0.1893665562291315, -0.18980166894717387,
+    -0.19008081823595557, -0.19023238412511745, -0.19028608165803934,
+    -0.19027265931635085, -0.19022358658764915, -0.1901707338386353,
+    -0.1901460477374066, -0.19018122551755393, -0.19030739139219932,
+    -0.19055477840826124, -0.19095241897997767, -0.19152784725665856,
+    -0.19230681636351524, -0.19331303340744102, -0.19456791496310524,
+    -0.19609036555058573, -0.1978965813859106, -0.1999998814326279,
+    -0.20241056750841213, -0.20513581490849273, -0.20817959470029682,
+    -0.2115426285240863, -0.21522237640603253, -0.21921305775607144,
+    -0.22350570538669084, -0.22808825205364486, -0.23294564868913864,
+    -0.23806001317532152, -0.24341080819451225, -0.2489750463954038,
+    -0.2547275208347579, -0.2606410583944982, -0.26668679363741515,
+    -0.27283446035327996, -0.27905269786319586, -0.2853093689954583,
+    -0.29157188652254507, -0.2978075447575564, -0.3039838529503533,
+    -0.3100688670994275, -0.3160315168055976, -0.3218419238377838,
+    -0.327471709159079, -0.33289428527230874, -0.33808513088731473,
+    -0.3430220450856924, -0.3476853783612956, -0.35205823814414455,
+    -0.35612666666945164, -0.359879789329647, -0.36330993194284256,
+    -0.36641270568314144, -0.3691870587435211, -0.3716352941373766,
+    -0.37376305338686355, -0.37557926619147697, -0.37709606651540456,
+    -0.37832867587352537, -0.37929525493015753, -0.3800167248482752,
+    -0.38051656013674373, -0.38082055503587003, -0.38095656575443176,
+    -0.3809542311212935, -0.38084467443938586, -0.38066018952678976,
+    -0.3804339140968423, -0.38019949376490575, -0.37999074007222455,
+    -0.37984128598601374, -0.3797842423687864, -0.37985185890863965,
+    -0.3800751929654812, -0.3804837897165323, -0.38110537687830165,
+    -0.3819655771427699, -0.38308764129389417, -0.38449220476857804,
+    -0.3861970701957448, -0.3882170181904902, -0.39056364839989666,
+    -0.3932452524958273, -0.39626672049076334, -0.3996294814187966,
+    -0.40333147907844846, -0.40736718318064874, -0.4117276358873372,
+    -0.416400533367579, -0.4213703416421607, -0.4266184456382346,
+    -0.43212333003595144, -0.4378607901629239, -0.4438041708828456,
+    -0.4499246311350554, -0.4561914315150149, -0.46257224204463465,
+    -0.4690334670682901, -0.47554058402770444, -0.4820584927184967,
+    -0.48855187151463797, -0.4949855369657303, -0.5013248031267008,
+    -0.5075358369709404, -0.5135860062660629, -0.5194442163564584,
+    -0.5250812323977362, -0.5304699837245131, -0.5355858472031946,
+    -0.5404069066239533, -0.5449141854191634, -0.5490918502566698,
+    -0.5529273833431185, -0.5564117215820717, -0.559539361061136,
+    -0.5623084256881037, -0.564720699155177, -0.5667816197787131,
+    -0.5685002381363458, -0.5698891377996785, -0.5709643198353656,
+    -0.5717450521166995, -0.5722536848476736, -0.5725154340486476,
+    -0.5725581350832897, -0.5724119686174279, -0.5721091616881175,
+    -0.5716836668231706, -0.5711708223843757, -0.5706069975096385,
+    -0.5700292251977741, -0.5694748272131902, -0.5689810345844595,
+    -0.5685846075299265, -0.5683214586640852, -0.5682262833202859,
+    -0.5683322007683639, -0.5686704100104496, -0.5692698637053822,
+    -0.5701569636028949, -0.5713552806647636, -0.5728853028132661,
+    -0.5747642129797448, -0.5770056998306214, -0.5796198032274223,
+    -0.5826127961346814, -0.5859871043280549, -0.5897412648784123,
+    -0.5938699239996912, -0.5983638744526493, -0.6032101322975868,
+    -0.6083920523902373, -0.6138894816207281, -0.6196789485094741,
+    -0.6257338874002248, -0.6320248951329082, -0.6385200177411443,
+    -0.6451850644047685, -0.6519839455996977, -0.6588790321290552,
+    -0.6658315314931854, -0.6728018778647448, -0.679750131780226,
+    -0.6866363855430017, -0.6934211702564874, -0.7000658603703218,
+    -0.7065330716280217, -0.7127870483516646, -0.7187940360873135,
+    -0.724522635763549, -0.7299441356835874, -0.7350328178772428,
+    -0.7397662355809655, -0.7441254588896788, -0.7480952859309097,
+    -0.7516644172465081, -0.7548255914271306, -0.7575756804259375,
+    -0.759915743377003, -0.7618510381567863, -0.7633909903496835,
+    -0.7645491197068307, -0.765342924616817, -0.7657937255334819,
+    -0.7659264687251522, -0.7657694921172677, -0.7653542553924281,
+    -0.7647150368840483, -0.7638886001486572, -0.7629138334233971,
+    -0.7618313654664528, -0.7606831615355909, -0.7595121034811461,
+    -0.7583615581122533, -0.7572749381366515, -0.7562952600736497,
+    -0.7554647035952903, -0.7548241767619102, -0.7544128915845106,
+    -0.7542679542679543, -0.7544239743663584, -0.7549126969163015,
+    -0.7557626614058465, -0.7569988911898236, -0.7586426166767206,
+    -0.7607110352921441, -0.7632171108716042, -0.766169414754294,
+    -0.7695720104435202, -0.7734243832721276, -0.7777214160671037,
+    -0.7824534113505448, -0.7876061601491625, -0.7931610570158097,
+    -0.7990952603988765, -0.8053818970336728, -0.8119903085784018,
+    -0.8188863382809591, -0.826032655045694, -0.8333891118760485,
+    -0.8409131353034005, -0.8485601420785135, -0.8562839791032367,
+    -0.8640373823196078, -0.8717724500542297, -0.8794411261401556,
+    -0.8869956880084771, -0.8943892348590925, -0.9015761709857145,
+    -0.9085126793448902, -0.9151571805225985, -0.9214707723648515,
+    -0.9274176456995271, -0.932965471784415, -0.9380857573691541,
+    -0.9427541635544479, -0.9469507849676919, -0.9506603861471578,
+    -0.9538725924335035, -0.9565820331039357, -0.9587884349465585,
+    -0.9604966649560713, -0.9617167213322272, -0.9624636724744906,
+    -0.9627575441852864, -0.9626231558147287, -0.9620899065969516,
+    -0.9611915139366319, -0.9599657058991357, -0.9584538706338291,
+    -0.9567006659125668, -0.9547535923897107, -0.9526625345815357,
+    -0.9504792739178187, -0.948256978532579, -0.9460496747312237,
+    -0.9439117052946261, -0.9418971799543308, -0.9400594234951305,
+    -0.9384504270099604, -0.9371203078465324, -0.9361167837444966,
+    -0.9354846665664899, -0.9352653808764868, -0.9354965124154949,
+    -0.9362113912695565, -0.9374387142201451, -0.9392022104151031,
+    -0.9415203541023771, -0.9444061277323822, -0.9478668382619754,
+    -0.9519039889880516, -0.9565132087063818, -0.9616842394365264,
+    -0.9674009833818011, -0.9736416092097187, -0.9803787171488771,
+    -0.9875795618084704, -0.9952063310424908, -1.0032164786077862,
+    -1.0115631078094636, -1.0201954027939468, -1.0290591036451295,
+    -1.0380970209672995, -1.0472495852051433, -1.0564554255604643,
+    -1.0656519730216212, -1.0747760817289582, -1.0837646626607,
+    -1.092555323442157, -1.1010870079585144, -1.1093006293900178,
+    -1.1171396902889514, -1.124550883381148, -1.1314846669007952,
+    -1.137895808455235, -1.1437438916653435, -1.1489937801346475,
+    -1.1536160336645909, -1.1575872720509275, -1.1608904822637522,
+    -1.1635152653270493, -1.165458019768284, -1.1667220590995289,
+    -1.1673176614134517, -1.167262049824581, -1.1665793031524856,
+    -1.1653001969225691, -1.163461975445776, -1.161108056423945,
+    -1.1582876702061693, -1.1550554364868795, -1.151470881881668,
+    -1.1475979024358793, -1.1435041757073954, -1.1392605276127188,
+    -1.134940259729101, -1.130618443199272, -1.1263711857849332,
+    -1.122274878955699, -1.1184054321781416, -1.1148375017814032,
+    -1.1116437219188076, -1.1088939452171214, -1.1066545007047912,
+    -1.104987476537296, -1.1039500348910434, -1.1035937661783106,
+    -1.1039640894451208, -1.105099705454431, -1.1070321085304924,
+    -1.109785162750708, -1.1133747475222435, -1.117808476976882,
+    -1.1230854969640636, -1.1291963627245314, -1.1361229995915674,
+    -1.143838748299754, -1.1523084956899043, -1.1614888907898644,
+    -1.171328645432275, -1.1817689177491808, -1.1927437760677622,
+    -1.2041807399286506, -1.21600139416644, -1.2281220712382581,
+    -1.2404545962682263, -1.2529070886004283, -1.26538481302717,
+    -1.2777910732896502, -1.2900281399401354, -1.3019982042142104,
+    -1.3136043491932454, -1.3247515292451744, -1.3353475485197217,
+    -1.3453040291450515, -1.3545373597287416, -1.3629696148082822,
+    -1.3705294360256546, -1.3771528660167134, -1.3827841263081524,
+    -1.3873763309009397, -1.3908921276867516, -1.3933042603897614,
+    -1.3945960443460959, -1.3947617501224652, -1.3938068897286544,
+    -1.3917484009892944, -1.3886147265023137, -1.3844457845171063,
+    -1.3792928300073575, -1.3732182051833839, -1.3662949796784096,
+    -1.3586064816437224, -1.3502457219903263, -1.341314715010456,
+    -1.3319236995922883, -1.3221902661963356, -1.31223839568362,
+    -1.3021974169651649, -1.2922008912713676, -1.2823854316105374,
+    -1.2728894666907182, -1.2638519592111284, -1.2554110889825476,
+    -1.2477029118042302, -1.2408600054032606, -1.2350101140265604,
+    -1.2302748034623954, -1.2267681383546603, -1.2245953936576182,
+    -1.223851811960274, -1.2246214181880537, -1.2269759028660234,
+    -1.2309735847040788, -1.2366584627433563, -1.2440593676877463,
+    -1.253189221339651, -1.2640444122699577, -1.2766042949846907,
+    -1.2908308189118236, -1.3066682925284283, -1.3240432868890553,
+    -1.3428646817092684, -1.3630238560128247, -1.3843950241764797,
+    -1.4068357170126276, -1.430187406326876, -1.4542762701854746,
+    -1.4789140949363708, -1.503899308857928, -1.5290181411708301,
+    -1.554045899051582, -1.5787483542396459, -1.6028832298440876,
+    -1.6262017770380655, -1.6484504304892673, -1.6693725306186284,
+    -1.6887101001156735, -1.7062056615725691, -1.7216040826360168,
+    -1.734654434720861, -1.7451118510856434, -1.7527393699406737,
+    -1.7573097482457531, -1.7586072319578268, -1.7564292687087748,
+    -1.7505881492288349, -1.740912564279813, -1.7272490644211245,
+    -1.709463410596636, -1.6874418042966335, -1.6610919869106506,
+    -1.6303441988372882, -1.595151989948517, -1.5554928741107141,
+    -1.5113688216335006, -1.4628065847412934, -1.4098578524315815,
+    -1.3525992323875293, -1.2911320589407418, -1.2255820274212263,
+    -1.1560986565757798, -1.0828545820710804, -1.0060446854138472,
+    -0.9258850639056218, -0.8426118484945637, -0.7564798775796686,
+    -0.6677612359550706, -0.5767436691439864, -0.4837288843539891,
+    -0.38903075018063765, -0.2929734079862724, -0.19588930857987258,
+    -0.09811718841470848, -4.491941520844944e-15,
+}};
+Table_ptr const ugg_table_saw_16 = (Table_ptr) &saw_16_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_2_data = {1025, {
+    0.0, 0.012271653792014437, 0.02454215254717607,
+    0.036810341376484236, 0.049075065686621296, 0.06133517132774091,
+    0.07358950474119255, 0.08583691310716077, 0.09807624449219832,
+    0.11030634799663147, 0.12252607390181668, 0.13473427381722713,
+    0.1469298008273483, 0.15911150963836085, 0.17127825672459052,
+    0.1834289004747032, 0.19556230133762473, 0.20767732196816385,
+    0.21977282737231796, 0.2318476850522403, 0.24390076515084813,
+    0.2559309405960505, 0.2679370872445753, 0.27991808402537577,
+    0.29187281308259294, 0.3038001599180575, 0.3156990135333072,
+    0.3275682665711014, 0.33940681545641127, 0.35121356053686603,
+    0.36298740622263503, 0.37472726112572496, 0.3864320381986731,
+    0.3981006548726159, 0.4097320331947135, 0.42132509996490997,
+    0.43287878687201087, 0.44439203062905663, 0.4558637731079744,
+    0.4672929614734872, 0.47867854831626266, 0.4900194917852815,
+    0.5013147557194066, 0.5125633097781344, 0.5237641295715092,
+    0.5349161967891835, 0.5460184993286017, 0.5570700314222952,
+    0.5680697937642634, 0.5790167936354303, 0.5899100450281507,
+    0.6007485687697542, 0.6115313926451083, 0.6222575515181785,
+    0.6329260874525764, 0.6435360498310696, 0.6540864954740429,
+    0.6645764887568901, 0.675005101726323, 0.6853714142155762,
+    0.6956745139584972, 0.7059134967025004, 0.7160874663203709,
+    0.7261955349209047, 0.7362368229583636, 0.7462104593407355,
+    0.7561155815367815, 0.7659513356818533, 0.7757168766824694,
+    0.7854113683196335, 0.7950339833508794, 0.8045839036110292,
+    0.8140603201116505, 0.8234624331391991, 0.8327894523518308,
+    0.842040596874871, 0.8512150953949289, 0.8603121862526413,
+    0.8693311175340319, 0.8782711471604788, 0.8871315429772703,
+    0.8959115828407411, 0.9046105547039762, 0.9132277567010686,
+    0.9217624972299201, 0.9302140950335752, 0.9385818792800733,
+    0.9468651896408102, 0.9550633763673991, 0.9631758003670166,
+    0.9712018332762267, 0.9791408575332715, 0.9869922664488189,
+    0.9947554642751539, 1.0024298662738118, 1.0100148987816338,
+    1.0175099992752457, 1.0249146164339438, 1.0322282102009825,
+    1.0394502518432547, 1.0465802240093558, 1.0536176207860253,
+    1.0605619477529573, 1.067412722035971, 1.0741694723585378,
+    1.0808317390916518, 1.0873990743020454, 1.0938710417987356,
+    1.1002472171778988, 1.1065271878660692, 1.1127105531616506,
+    1.1187969242747409, 1.1247859243652607, 1.1306771885793838,
+    1.136470364084262, 1.1421651101010417, 1.1477610979361672,
+    1.1532580110109687, 1.1586555448895268, 1.1639534073048154,
+    1.1691513181831168, 1.1742490096667049, 1.179246226134798,
+    1.184142724222775, 1.188938272839653, 1.1936326531838288,
+    1.198225658757075, 1.2027170953767976, 1.2071067811865475,
+    1.2113945466647886, 1.2155802346319207, 1.2196637002555564,
+    1.223644811054053, 1.2275234468982998, 1.231299500011758,
+    1.2349728749687587, 1.2385434886910576, 1.242011270442644,
+    1.2453761618228143, 1.2486381167575025, 1.251797101488875,
+    1.254853094563191, 1.2578060868169296, 1.2606560813611878,
+    1.263403093564352, 1.2660471510330462, 1.2685882935913586,
+    1.2710265732583554, 1.2733620542238782, 1.2755948128226384,
+    1.2777249375066033, 1.279752528815688, 1.2816776993467494,
+    1.2835005737208962, 1.285221288549113, 1.286839992396209,
+    1.288356845743094, 1.2897720209473922, 1.2910857022023947,
+    1.2922980854943635, 1.2934093785581886, 1.294419800831409,
+    1.2953295834066032, 1.2961389689821596, 1.2968482118114286,
+    1.2974575776502741, 1.2979673437030228, 1.2983777985668274,
+    1.2986892421744496, 1.2989019857354707, 1.2990163516759425,
+    1.299032673576486, 1.2989512961088474, 1.2987725749709227,
+    1.2984968768202603, 1.2981245792060525, 1.2976560704996276,
+    1.2970917498234504, 1.2964320269786458, 1.2956773223710552,
+    1.2948280669358379, 1.2938847020606268, 1.292847679507257,
+    1.2917174613320692, 1.290494519804812, 1.2891793373261449,
+    1.2877724063437646, 1.2862742292671596, 1.28468531838101,
+    1.2830061957572492, 1.2812373931657912, 1.2793794519839512,
+    1.2774329231045605, 1.2753983668427977, 1.273276352841749,
+    1.2710674599767104, 1.268772276258248, 1.2663913987340334,
+    1.2639254333894634, 1.2613749950470856, 1.2587407072648436,
+    1.2560232022331537, 1.2532231206708349, 1.250341111719904,
+    1.2473778328392533, 1.2443339496972279, 1.2412101360631165,
+    1.2380070736975775, 1.2347254522420101, 1.2313659691068948,
+    1.2279293293591143, 1.224416245608276, 1.2208274378920507,
+    1.2171636335605482, 1.213425567159744, 1.2096139803139787,
+    1.2057296216075428, 1.2017732464653719, 1.1977456170328635,
+    1.1936475020548396, 1.1894796767536695, 1.185242922706573,
+    1.1809380277221226, 1.1765657857159646, 1.1721269965857755,
+    1.1676224660854742, 1.1630530056987105, 1.1584194325116464,
+    1.1537225690850514, 1.1489632433257304, 1.1441422883573042,
+    1.1392605423903635, 1.1343188485920122, 1.1293180549548236,
+    1.1242590141652293, 1.1191425834713569, 1.113969624550342,
+    1.1087410033751302, 1.103457590080791, 1.098120258830365,
+    1.0927298876802611, 1.0872873584452303, 1.0817935565629286,
+    1.0762493709580965, 1.0706556939063712, 1.0650134208977549,
+    1.0593234504997573, 1.0535866842202364, 1.0478040263699528,
+    1.0419763839248655, 1.0361046663881834, 1.0301897856521973,
+    1.0242326558599133, 1.0182341932665029, 1.0121953161006008,
+    1.0061169444254612, 1.0, 0.9938454061397413,
+    0.9876540875776885, 0.9814269703251441, 0.9751649815324954,
+    0.968869049349989, 0.9625401027885158, 0.9561790715804254,
+    0.9497868860403921, 0.9433644769263533, 0.9369127753005412,
+    0.9304327123906286, 0.9239252194510095, 0.9173912276242352,
+    0.9108316678026275, 0.9042474704900895, 0.8976395656641327,
+    0.8910088826381461, 0.8843563499239212, 0.877682895094459,
+    0.8709894446470781, 0.8642769238668423, 0.8575462566903309,
+    0.8507983655697706, 0.84403417133755, 0.8372545930711356,
+    0.8304605479584128, 0.8236529511634672, 0.8168327156928312,
+    0.8100007522622117, 0.8031579691637223, 0.7963052721336366,
+    0.7894435642206856, 0.7825737456549166, 0.7756967137171328,
+    0.768813362608936, 0.7619245833233876, 0.7550312635163122,
+    0.7481342873782568, 0.7412345355071317, 0.7343328847815451,
+    0.727430208234856, 0.7205273749299601, 0.7136252498348307,
+    0.7067246936988291, 0.6998265629298073, 0.6929317094720174,
+    0.6860409806848485, 0.679155219222408, 0.6722752629139641,
+    0.6654019446452712, 0.6585360922407889, 0.65167852834682,
+    0.6448300703155785, 0.637991530090208, 0.6311637140907673,
+    0.6243474231011982, 0.6175434521572942, 0.6107525904356867,
+    0.6039756211438617, 0.5972133214112296, 0.5904664621812572,
+    0.5837358081046822, 0.577022117433825, 0.570326141918013,
+    0.5636486267001328, 0.5569903102143243, 0.5503519240848365,
+    0.5437341930260513, 0.5371378347437004, 0.5305635598372804,
+    0.5240120717036858, 0.5174840664420751, 0.5109802327599748,
+    0.504501251880651, 0.4980477974517435, 0.4916205354551927,
+    0.48522012411846066, 0.478847213827062, 0.47250244703842537,
+    0.46618645819708243, 0.4598998736512146, 0.4536433115705531,
+    0.44741738186565777, 0.44122268610857546, 0.4350598174548995,
+    0.42892936056723113, 0.42283189154006384, 0.41676797782609465,
+    0.4107381781639735, 0.4047430425075076, 0.3987831119563203,
+    0.39285891868798567, 0.38697098589163725, 0.38111982770307296,
+    0.3753059491413513, 0.3695298460469022, 0.36379200502114806,
+    0.3580929033676557, 0.35243300903481733, 0.3468127805600733,
+    0.34123266701568794, 0.33569310795607643, 0.33019453336670257,
+    0.32473736361454053, 0.3193220094001224, 0.31394887171116365,
+    0.3086183417777862, 0.30333080102933435, 0.29808662105279504,
+    0.29288616355283037, 0.2877297803134186, 0.28261781316112194,
+    0.27755059392997145, 0.2725284444279885, 0.26755167640533273,
+    0.2626205915240942, 0.2577354813297225, 0.2528966272241042,
+    0.24810430044028803, 0.24335876201886053, 0.23866026278598101,
+    0.2340090433330677, 0.22940533399815072, 0.2248493548488807,
+    0.22034131566720705, 0.21588141593571658, 0.2114698448256444,
+    0.20710678118654757, 0.20279239353765294, 0.1985268400608708,
+    0.19431026859547923, 0.19014281663448085, 0.18602461132262577,
+    0.18195576945610814, 0.17793639748392692, 0.1739665915109201,
+    0.17004643730245955, 0.16617601029081697, 0.16235537558318874,
+    0.1585845879713862, 0.15486369194318333, 0.15119272169532078,
+    0.14757170114816764, 0.14400064396203027, 0.14047955355511332,
+    0.13700842312312206, 0.13358723566050928, 0.13021596398335494,
+    0.12689457075388355, 0.12362300850660568, 0.12040121967608597,
+    0.117229136626329, 0.11410668168177723, 0.11103376715992058,
+    0.10801029540550389, 0.10503615882633499, 0.10211123993067978,
+    0.09923541136624392, 0.09640853596072835, 0.09363046676395886,
+    0.09090104709157598, 0.08822011057028106, 0.08558748118463172,
+    0.08300297332537548, 0.08046639183931781, 0.07797753208071129,
+    0.07553617996416268, 0.07314211201904425, 0.07079509544540386,
+    0.06849488817136196, 0.06624123891198846, 0.06403388722964803,
+    0.06187256359580334, 0.05975698945426927, 0.057686877285903104,
+    0.055661930674725135, 0.053681844375453536, 0.051746304382448205,
+    0.04985498800004645, 0.048007563914284235, 0.04620369226598747,
+    0.04444302472522449, 0.04272520456710477, 0.04104986674891359,
+    0.03941663798857026, 0.03782513684439487, 0.03627497379617434,
+    0.034765751327510364, 0.03329706400944049, 0.03186849858531465,
+    0.03047963405691706, 0.02913004177181605, 0.0278192855119318,
+    0.02654692158330413, 0.025312498907047287, 0.024115559111479,
+    0.022955636625404507, 0.021832258772546242, 0.020744945867098685,
+    0.019693211310397363, 0.018676561688683258, 0.017694496871949572,
+    0.016746510113852975, 0.015832088152674784, 0.01495071131331549,
+    0.014101853610305415, 0.013284982851817229, 0.012499560744661298,
+    0.0117450430002487, 0.011020879441504539, 0.010326514110714557,
+    0.009661385378287535, 0.009024926052416782, 0.008416563489622553,
+    0.007835719706158789, 0.0072818114902651054, 0.0067542505152471954,
+    0.00625244345336784, 0.005775792090529003, 0.005323693441728783,
+    0.004895539867272786, 0.00449071918972363, 0.004108614811567879,
+    0.0037486058335834127, 0.003410067173887449, 0.0030923696876468953,
+    0.002794880287431495, 0.0025169620641912194, 0.002257974408838459,
+    0.0020172731344157147, 0.0017942105988293933, 0.0015881358281305546,
+    0.0013983946403227088, 0.001224329769676985, 0.001065280991535883,
+    0.0009205852475842602, 0.0007895767715692115, 0.0006715872154481606,
+    0.0005659457759453063, 0.0004719793214964657, 0.00038901251956224847,
+    0.0003163679642892714, 0.0002533663044994028, 0.00019932637198653846,
+    0.00015356531010096708, 0.00011539870260047352, 8.414070274841146e-05,
+    5.910416263771312e-05, 3.9600762720880256e-05, 2.49411415251255e-05,
+    1.4435025532336804e-05, 7.391359203280656e-06, 3.1184351254043285e-06,
+    9.240242637830604e-07, 1.1550629451257538e-07, 0.0,
+    -1.1550629451257538e-07, -9.240242637830604e-07, -3.1184351254043285e-06,
+    -7.391359203280656e-06, -1.4435025532336804e-05, -2.494114152511856e-05,
+    -3.9600762720880256e-05, -5.910416263771312e-05, -8.414070274841146e-05,
+    -0.00011539870260047352, -0.00015356531010096708, -0.00019932637198655234,
+    -0.0002533663044994028, -0.00031636796428928526, -0.00038901251956224847,
+    -0.0004719793214964657, -0.0005659457759453063, -0.0006715872154481606,
+    -0.0007895767715692115, -0.0009205852475842463, -0.001065280991535883,
+    -0.0012243297696770128, -0.001398394640322681, -0.0015881358281305824,
+    -0.0017942105988293933, -0.002017273134415687, -0.002257974408838459,
+    -0.0025169620641911916, -0.002794880287431467, -0.0030923696876468676,
+    -0.003410067173887449, -0.003748605833583385, -0.004108614811567851,
+    -0.004490719189723602, -0.004895539867272786, -0.005323693441728755,
+    -0.005775792090529003, -0.006252443453367812, -0.0067542505152471954,
+    -0.00728181149026505, -0.007835719706158789, -0.008416563489622553,
+    -0.009024926052416782, -0.009661385378287535, -0.010326514110714557,
+    -0.011020879441504483, -0.01174504300024859, -0.012499560744661187,
+    -0.013284982851817229, -0.014101853610305415, -0.014950711313315435,
+    -0.015832088152674784, -0.01674651011385292, -0.017694496871949517,
+    -0.018676561688683202, -0.019693211310397307, -0.02074494586709863,
+    -0.021832258772546187, -0.022955636625404452, -0.024115559111478946,
+    -0.025312498907047287, -0.026546921583304017, -0.027819285511931746,
+    -0.029130041771815995, -0.030479634056917004, -0.0318684985853146,
+    -0.033297064009440436, -0.03476575132751031, -0.03627497379617428,
+    -0.03782513684439481, -0.0394166379885702, -0.04104986674891353,
+    -0.04272520456710466, -0.044443024725224434, -0.04620369226598742,
+    -0.04800756391428418, -0.049854988000046396, -0.051746304382448205,
+    -0.05368184437545348, -0.055661930674725024, -0.05768687728590299,
+    -0.05975698945426916, -0.06187256359580323, -0.06403388722964792,
+    -0.06624123891198835, -0.06849488817136185, -0.0707950954454038,
+    -0.07314211201904414, -0.07553617996416268, -0.07797753208071118,
+    -0.0804663918393177, -0.08300297332537537, -0.08558748118463172,
+    -0.08822011057028095, -0.09090104709157587, -0.0936304667639587,
+    -0.09640853596072818, -0.09923541136624375, -0.10211123993067978,
+    -0.10503615882633494, -0.10801029540550372, -0.11103376715992053,
+    -0.11410668168177712, -0.11722913662632883, -0.1204012196760858,
+    -0.12362300850660551, -0.12689457075388338, -0.13021596398335478,
+    -0.13358723566050912, -0.137008423123122, -0.14047955355511316,
+    -0.1440006439620301, -0.1475717011481676, -0.15119272169532072,
+    -0.15486369194318317, -0.15858458797138608, -0.16235537558318852,
+    -0.1661760102908168, -0.17004643730245939, -0.17396659151091998,
+    -0.1779363974839268, -0.18195576945610792, -0.18602461132262554,
+    -0.19014281663448063, -0.19431026859547906, -0.19852684006087068,
+    -0.20279239353765283, -0.20710678118654746, -0.21146984482564418,
+    -0.21588141593571636, -0.22034131566720688, -0.22484935484888058,
+    -0.2294053339981506, -0.2340090433330675, -0.2386602627859808,
+    -0.24335876201886042, -0.2481043004402878, -0.252896627224104,
+    -0.25773548132972235, -0.26262059152409367, -0.26755167640533284,
+    -0.27252844442798835, -0.2775505939299713, -0.28261781316112133,
+    -0.2877297803134188, -0.2928861635528301, -0.2980866210527949,
+    -0.30333080102933374, -0.30861834177778635, -0.3139488717111635,
+    -0.3193220094001218, -0.3247373636145407, -0.3301945333667023,
+    -0.33569310795607626, -0.3412326670156873, -0.3468127805600735,
+    -0.35243300903481717, -0.3580929033676555, -0.36379200502114745,
+    -0.36952984604690187, -0.37530594914135107, -0.38111982770307234,
+    -0.3869709858916375, -0.39285891868798534, -0.3987831119563201,
+    -0.404743042507507, -0.41073817816397373, -0.4167679778260944,
+    -0.4228318915400636, -0.42892936056723047, -0.4350598174548993,
+    -0.44122268610857523, -0.44741738186565705, -0.45364331157055326,
+    -0.4598998736512144, -0.46618645819708215, -0.47250244703842464,
+    -0.47884721382706225, -0.48522012411846044, -0.4916205354551925,
+    -0.49804779745174277, -0.5045012518806506, -0.5109802327599746,
+    -0.5174840664420743, -0.5240120717036861, -0.5305635598372801,
+    -0.5371378347436999, -0.5437341930260506, -0.5503519240848364,
+    -0.5569903102143241, -0.5636486267001322, -0.5703261419180123,
+    -0.577022117433825, -0.5837358081046818, -0.5904664621812568,
+    -0.5972133214112298, -0.6039756211438617, -0.6107525904356863,
+    -0.6175434521572936, -0.6243474231011981, -0.631163714090767,
+    -0.6379915300902075, -0.6448300703155787, -0.65167852834682,
+    -0.6585360922407888, -0.6654019446452708, -0.6722752629139643,
+    -0.6791552192224077, -0.686040980684848, -0.6929317094720167,
+    -0.6998265629298073, -0.7067246936988288, -0.7136252498348301,
+    -0.7205273749299603, -0.7274302082348559, -0.7343328847815449,
+    -0.7412345355071313, -0.748134287378257, -0.755031263516312,
+    -0.7619245833233872, -0.7688133626089352, -0.7756967137171328,
+    -0.7825737456549163, -0.7894435642206851, -0.7963052721336368,
+    -0.8031579691637222, -0.8100007522622115, -0.8168327156928307,
+    -0.8236529511634674, -0.8304605479584125, -0.8372545930711351,
+    -0.8440341713375492, -0.8507983655697706, -0.8575462566903307,
+    -0.8642769238668419, -0.8709894446470784, -0.877682895094459,
+    -0.8843563499239209, -0.8910088826381457, -0.8976395656641329,
+    -0.9042474704900892, -0.910831667802627, -0.9173912276242344,
+    -0.9239252194510094, -0.9304327123906284, -0.9369127753005406,
+    -0.9433644769263535, -0.9497868860403921, -0.9561790715804251,
+    -0.9625401027885152, -0.968869049349989, -0.9751649815324951,
+    -0.9814269703251437, -0.9876540875776878, -0.9938454061397413,
+    -0.9999999999999998, -1.0061169444254607, -1.0121953161006008,
+    -1.0182341932665029, -1.024232655859913, -1.0301897856521969,
+    -1.0361046663881834, -1.0419763839248652, -1.0478040263699524,
+    -1.0535866842202357, -1.0593234504997573, -1.0650134208977546,
+    -1.0706556939063707, -1.0762493709580967, -1.0817935565629286,
+    -1.08728735844523, -1.0927298876802605, -1.098120258830365,
+    -1.1034575900807908, -1.1087410033751297, -1.1139696245503414,
+    -1.1191425834713569, -1.1242590141652289, -1.1293180549548232,
+    -1.1343188485920124, -1.1392605423903635, -1.1441422883573038,
+    -1.1489632433257297, -1.1537225690850514, -1.1584194325116464,
+    -1.16305300569871, -1.1676224660854735, -1.1721269965857752,
+    -1.1765657857159644, -1.1809380277221222, -1.185242922706573,
+    -1.1894796767536695, -1.1936475020548396, -1.197745617032863,
+    -1.2017732464653719, -1.2057296216075426, -1.2096139803139785,
+    -1.2134255671597438, -1.2171636335605482, -1.2208274378920505,
+    -1.2244162456082757, -1.2279293293591145, -1.2313659691068948,
+    -1.2347254522420097, -1.238007073697577, -1.2412101360631165,
+    -1.2443339496972277, -1.247377832839253, -1.2503411117199037,
+    -1.2532231206708346, -1.2560232022331534, -1.2587407072648433,
+    -1.2613749950470856, -1.2639254333894634, -1.2663913987340334,
+    -1.2687722762582478, -1.2710674599767102, -1.273276352841749,
+    -1.2753983668427975, -1.2774329231045605, -1.2793794519839512,
+    -1.2812373931657912, -1.283006195757249, -1.2846853183810103,
+    -1.2862742292671596, -1.2877724063437646, -1.2891793373261446,
+    -1.290494519804812, -1.2917174613320692, -1.292847679507257,
+    -1.2938847020606268, -1.2948280669358379, -1.2956773223710552,
+    -1.2964320269786458, -1.2970917498234504, -1.2976560704996276,
+    -1.2981245792060525, -1.29849687682026, -1.2987725749709227,
+    -1.2989512961088474, -1.299032673576486, -1.2990163516759425,
+    -1.2989019857354707, -1.2986892421744496, -1.2983777985668274,
+    -1.2979673437030228, -1.2974575776502741, -1.2968482118114286,
+    -1.2961389689821599, -1.2953295834066032, -1.294419800831409,
+    -1.2934093785581886, -1.2922980854943635, -1.2910857022023947,
+    -1.2897720209473922, -1.2883568457430943, -1.286839992396209,
+    -1.2852212885491132, -1.2835005737208962, -1.2816776993467496,
+    -1.279752528815688, -1.2777249375066035, -1.2755948128226384,
+    -1.2733620542238782, -1.2710265732583554, -1.2685882935913588,
+    -1.2660471510330464, -1.263403093564352, -1.2606560813611878,
+    -1.2578060868169296, -1.2548530945631913, -1.2517971014888751,
+    -1.2486381167575027, -1.2453761618228145, -1.2420112704426438,
+    -1.2385434886910576, -1.234972874968759, -1.2312995000117581,
+    -1.2275234468982996, -1.2236448110540532, -1.2196637002555566,
+    -1.215580234631921, -1.2113945466647886, -1.2071067811865477,
+    -1.2027170953767978, -1.1982256587570748, -1.1936326531838288,
+    -1.1889382728396534, -1.1841427242227756, -1.179246226134798,
+    -1.174249009666705, -1.169151318183117, -1.1639534073048161,
+    -1.1586555448895268, -1.153258011010969, -1.1477610979361677,
+    -1.1421651101010415, -1.1364703640842622, -1.130677188579384,
+    -1.1247859243652614, -1.1187969242747409, -1.1127105531616508,
+    -1.1065271878660696, -1.1002472171778996, -1.0938710417987356,
+    -1.0873990743020456, -1.0808317390916524, -1.0741694723585375,
+    -1.0674127220359713, -1.0605619477529575, -1.0536176207860257,
+    -1.0465802240093556, -1.039450251843255, -1.0322282102009832,
+    -1.0249146164339447, -1.0175099992752457, -1.010014898781634,
+    -1.0024298662738123, -0.9947554642751539, -0.986992266448819,
+    -0.9791408575332721, -0.9712018332762273, -0.9631758003670164,
+    -0.9550633763673995, -0.9468651896408109, -0.9385818792800742,
+    -0.9302140950335752, -0.9217624972299204, -0.9132277567010691,
+    -0.904610554703976, -0.8959115828407413, -0.8871315429772707,
+    -0.8782711471604796, -0.8693311175340317, -0.8603121862526415,
+    -0.8512150953949297, -0.842040596874872, -0.8327894523518309,
+    -0.8234624331391995, -0.8140603201116513, -0.8045839036110289,
+    -0.7950339833508796, -0.7854113683196342, -0.7757168766824704,
+    -0.7659513356818531, -0.7561155815367819, -0.7462104593407364,
+    -0.7362368229583647, -0.7261955349209047, -0.7160874663203715,
+    -0.7059134967025013, -0.6956745139584971, -0.6853714142155765,
+    -0.6750051017263236, -0.6645764887568911, -0.6540864954740426,
+    -0.6435360498310699, -0.6329260874525771, -0.6222575515181781,
+    -0.6115313926451083, -0.6007485687697548, -0.5899100450281516,
+    -0.5790167936354302, -0.5680697937642637, -0.5570700314222957,
+    -0.5460184993286028, -0.5349161967891833, -0.5237641295715096,
+    -0.5125633097781351, -0.5013147557194062, -0.4900194917852816,
+    -0.4786785483162632, -0.4672929614734882, -0.4558637731079742,
+    -0.4443920306290569, -0.43287878687201153, -0.42132509996491113,
+    -0.4097320331947134, -0.39810065487261637, -0.386432038198674,
+    -0.37472726112572463, -0.36298740622263514, -0.3512135605368666,
+    -0.33940681545641227, -0.32756826657110116, -0.3156990135333074,
+    -0.3038001599180582, -0.29187281308259416, -0.27991808402537577,
+    -0.2679370872445758, -0.25593094059605137, -0.2439007651508478,
+    -0.23184768505224046, -0.21977282737231857, -0.20767732196816496,
+    -0.19556230133762453, -0.1834289004747035, -0.1712782567245913,
+    -0.1591115096383621, -0.1469298008273483, -0.1347342738172276,
+    -0.12252607390181763, -0.11030634799663114, -0.09807624449219847,
+    -0.0858369131071614, -0.07358950474119366, -0.061335171327740745,
+    -0.049075065686621615, -0.03681034137648505, -0.024542152547177364,
+    -0.012271653792014442, -4.898587196589413e-16,
+}};
+Table_ptr const ugg_table_saw_2 = (Table_ptr) &saw_2_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_256_data = {1025, {
+    0.0, 1.3696460600125084, 1.8457971340853572,
+    1.5972170158120549, 1.4058877193808361, 1.5424430327085115,
+    1.6563420450479869, 1.555281639736487, 1.467633512562188,
+    1.540270582565874, 1.6032652554139855, 1.538383033192567,
+    1.4812423931371894, 1.5304995396596854, 1.5731060888023372,
+    1.5246075024650447, 1.4820758627974462, 1.5192019500872704,
+    1.5508176235227178, 1.5116684766919826, 1.477709805447742,
+    1.507406950825684, 1.5321464922231036, 1.4990440226467763,
+    1.4707243986822174, 1.495403174863437, 1.5154335960156764,
+    1.4865636243973694, 1.4622362993881124, 1.4832967646369588,
+    1.4998991735961251, 1.474158340804921, 1.4528068192545103,
+    1.471134108266239, 1.485128709960724, 1.4617960133630519,
+    1.442748810359125, 1.4589380770576885, 1.4708815972432412,
+    1.4494600111859444, 1.432250383052783, 1.4467210012902336,
+    1.4570086258405983, 1.4371410343332784, 1.4214314200422034,
+    1.4344900032333388, 1.4434123640740386, 1.4248335531468246,
+    1.4103719280040183, 1.4222494293277204, 1.430026497843238,
+    1.4125341128323883, 1.3991273400848432, 1.4100020537180782,
+    1.4168043293641213, 1.4002404649753444, 1.387737275479955,
+    1.3977497143506903, 1.4037120248117922, 1.3879510952945713,
+    1.3762308021563703, 1.3854936679469396, 1.3907244709485977,
+    1.375664953763584, 1.3646297294495713, 1.3732347973520809,
+    1.377822636014349, 1.3633812937490457, 1.352950740312131,
+    1.3609737374616235, 1.3649918341805758, 1.3510995726022728,
+    1.3412068137525597, 1.3487109543125062, 1.3522205521839983,
+    1.3388193882707713, 1.3294081986100295, 1.3364467962360886,
+    1.3394996365957066, 1.3265404377522312, 1.3175630955029958,
+    1.324181527806619, 1.3268217187264615, 1.314262489195205,
+    1.3056781441190224, 1.3119153528933951, 1.3141807998797699,
+    1.301985362754459, 1.2937587777206347, 1.299648430637374,
+    1.3015719471143785, 1.2897089171968068, 1.281809485242989,
+    1.287380886729415, 1.2889910666269915, 1.277433040365027,
+    1.2698340079134236, 1.275112821505237, 1.2764347325955794,
+    1.2651576422802895, 1.2578354887128682, 1.2628443158439404,
+    1.2639000562698572, 1.2528826500806092, 1.245816587366723,
+    1.2505754355256422, 1.2513845846846725, 1.2406080042573642,
+    1.2337795697962504, 1.2383062344916609, 1.2388862214606076,
+    1.2283336558229176, 1.2217263784115961, 1.2260367573120776,
+    1.2264031642699462, 1.21605956415512, 1.2096586878683129,
+    1.2137670410734998, 1.213933855015601, 1.203785695339927,
+    1.1975779496775103, 1.2014971168376394, 1.2014769398067242,
+    1.1915120208848182, 1.1854854281853526, 1.1892270107786962,
+    1.1890312365549596, 1.1792385167111608, 1.1733822298090144,
+    1.1769567450779168, 1.1765957085506602, 1.1669651623584518,
+    1.1612693269589596, 1.1646863386328012, 1.1641694427700742,
+    1.1546919403510636, 1.1491475777410898, 1.1524158076235935,
+    1.1517516319538814, 1.1424188356905922, 1.137017742282496,
+    1.1401451659689557, 1.139341559713781, 1.130145835446162,
+    1.1248804963370964, 1.1278744256949156, 1.1269385880865426,
+    1.117872928421658, 1.1127364426856086, 1.1156035972354688,
+    1.1145421470788446, 1.1056001048837925, 1.100586120736051,
+    1.1033326896789128, 1.1021517258410112, 1.0933273563386476,
+    1.088430014647641, 1.0910617109708314, 1.0897668651810968,
+    1.081054675347042, 1.0762685602364424, 1.0787906680822366,
+    1.0773871511877007, 1.06878205537121, 1.0641021508706956,
+    1.0665195671495558, 1.0650122097745351, 1.056509490646871,
+    1.0519311425241704, 1.054248413591674, 1.052641701994985,
+    1.0442369760759975, 1.0397558581245823, 1.0419772122082984,
+    1.0402753200027626, 1.0319645071365036, 1.0275765913092023,
+    1.029705967262924, 1.02791278355706, 1.019692079805943,
+    1.0153936096798306, 1.0174346825531186, 1.0155538369884294,
+    1.0074196904967185, 1.003207157633334, 1.0051633614702817,
+    1.0031982465560767, 0.9951473360008937, 0.9910174588309456,
+    0.9928920070506646, 0.9908457981388548, 0.9828750134430035,
+    0.9788247183589479, 0.9806206220190454, 0.9784962952118512,
+    0.970602720239581, 0.9666291246249102, 0.9683492088262835,
+    0.9661495570681453, 0.9583304540643035, 0.9544308510264243,
+    0.9560777696816681, 0.953805417251774, 0.946058212817912,
+    0.9422300574235715, 0.943806306580937, 0.9414637221732176,
+    0.933785994602145, 0.9300268914415787, 0.9315348213305278,
+    0.9291243298830367, 0.921513797697111, 0.9178214896260366,
+    0.919263315568706, 0.9167871089830065, 0.909241620541572,
+    0.905613978469834, 0.9069917907839818, 0.9044519376570608,
+    0.8969694617157247, 0.8934044753281022, 0.8947202483312151,
+    0.8921187028069468, 0.8846973199261242, 0.8811930892351858,
+    0.8824486894457381, 0.8797872992796308, 0.872425193992456,
+    0.8689799216356688, 0.8701771152557597, 0.867457629175261,
+    0.8601530828358878, 0.8567650670398131, 0.8579055267932971,
+    0.855129601226068, 0.8478809854688055, 0.8445486136124168,
+    0.8456339250038267, 0.8428031302378393, 0.8356089009857371,
+    0.8323306437028022, 0.833362310754824, 0.8304781365867482,
+    0.8233368285553148, 0.8201112343227441, 0.8210906848433294,
+    0.818154545765224, 0.8110647674131429, 0.8078904575781856,
+    0.8088190480026816, 0.8058322879713616, 0.7987927168554508,
+    0.7956683810598867, 0.7965474009084963, 0.7935112977370862,
+    0.7865206762334392, 0.7834450681974975, 0.7842757441840089,
+    0.781191513590864, 0.7742486449482416, 0.7712205785809995,
+    0.7720040784048526, 0.7688728777512513, 0.7619766224463966,
+    0.7589949682529652, 0.7597324041033215, 0.7565553358480512,
+    0.7497046082158205, 0.7467682899747045, 0.7474607217722034,
+    0.7442388366682041, 0.7374326017821613, 0.7345405934689678,
+    0.735189031868216, 0.7319233319238814, 0.7251606027055627,
+    0.7223119256416081, 0.7229173348151048, 0.7196087760405704,
+    0.712888610577696, 0.7100823307842761, 0.7106456310064294,
+    0.7072951259630937, 0.7006166250191344, 0.6978518507600571,
+    0.6983739208080818, 0.6949823409779219, 0.6883446456769591,
+    0.6856205251736867, 0.6861022045605502, 0.6826703825500743,
+    0.6760726722225933, 0.6733883915278166, 0.6738304825809935,
+    0.6703592141733198, 0.6638007043498423, 0.6611554853666919,
+    0.6615587551650826, 0.6580488012323716, 0.6515287417731266,
+    0.6489218404083646, 0.6492870225887101, 0.6457391108759627,
+    0.6392567842258556, 0.6366874886665437, 0.6370152851095231,
+    0.6334301118998498, 0.6269848314589788, 0.6244524605630033,
+    0.6247435429683168, 0.6211217746387833, 0.6147128832396397,
+    0.6122167850314133, 0.6124717963903146, 0.6088140708666923,
+    0.6024409393499582, 0.5999804896133321, 0.6002000455863263,
+    0.5965069737043143, 0.5901689995859312, 0.5877436005470706,
+    0.5879282907538033, 0.5842004575337051, 0.5778970637564078,
+    0.5755061428500508, 0.5756565320778205, 0.5718944979188955,
+    0.5656251316821745, 0.5632681403951821, 0.5633847697319525,
+    0.5595890715322984, 0.5533532031950931, 0.551029615981803,
+    0.5511130038790917, 0.5472841560863374, 0.5410812781373303,
+    0.5387905914016244, 0.5388412346721874, 0.5349797302698479,
+    0.5288093563606452, 0.5265510875000804, 0.5265694622549423,
+    0.5226757736888431, 0.5165374377257261, 0.5143111242334842,
+    0.5142976867624123, 0.5103722668113553, 0.504265522101609,
+    0.5020707207223181, 0.5020259083216265, 0.4980691909159665,
+    0.49199360936509046, 0.4898298953009622, 0.4897541270520824,
+    0.4857665280437191, 0.4797216994002497, 0.4775886655641578,
+    0.4774823430662465, 0.4734642609532305, 0.4674497920979573,
+    0.46534704841045516, 0.4652105564700095, 0.4611623730786217,
+    0.4551778873554541, 0.45310506008288853, 0.45293876736310046,
+    0.44886084849018026, 0.44290598507595735, 0.44086271620706624,
+    0.4406669758394693, 0.43655967185745465, 0.43063408516825274,
+    0.42862003182694863, 0.42839518198764404, 0.4242588284146211,
+    0.41836218754641313, 0.4163770214383416, 0.41612338589104697,
+    0.41195830392797944, 0.4060902921294399, 0.4041336990204879,
+    0.4038515876283319, 0.3996580846653484, 0.3938183988409825,
+    0.3918900780656919, 0.3915797872736158, 0.3873581573673119,
+    0.38154650760907116, 0.37964617160726916, 0.37930798489676926,
+    0.3750585092200846, 0.3692746183658624, 0.36740199224585873,
+    0.367036180563667, 0.36275912782995007, 0.3570027310474162,
+    0.3551575521742934, 0.3547643743363871, 0.3504600011991082,
+    0.34473084559346573, 0.3429128632010348, 0.34249256627342056,
+    0.3381611177028693, 0.3324589619472357, 0.3306679367724023,
+    0.3302207564298764, 0.3258624660680528, 0.3201870800552441,
+    0.31842278399355683, 0.3179489448576483, 0.313564035352533,
+    0.3079151998671353, 0.30617741564842943, 0.30567713160558807,
+    0.30126581492584986, 0.29564332133553856, 0.2939318422186157,
+    0.2934053167196496, 0.2889677944507839, 0.2833714444158789,
+    0.2816860739013317, 0.281133500243035, 0.2766699638658523,
+    0.27109956906628, 0.26944012062649286, 0.2688616822163318,
+    0.26437231336864053, 0.25882769524742466, 0.2571939920729851,
+    0.2565898626776246, 0.2520748333999126, 0.24655582292243433,
+    0.24494769768418917, 0.24431804166260748, 0.23977751462844993,
+    0.23428395205676134, 0.23270124668277856, 0.23204621920470486,
+    0.22748034793656147, 0.22201208261809247, 0.22045464808493329,
+    0.2197743953351474, 0.21518332440618734, 0.2097402145762545,
+    0.2082079107138988, 0.20750257008307332, 0.20288643530565154,
+    0.1974683479031187, 0.1959610432130239, 0.1952307434756119,
+    0.19058967207679503, 0.18519648257253993, 0.18371405405828517,
+    0.1829589155379474, 0.17829302632279978, 0.17292461856027846,
+    0.17146695157034386, 0.17068708629340473, 0.1659964897962686,
+    0.1606527558439071, 0.15921974392617533, 0.15841525576350407,
+    0.1537000543878345, 0.14838089440279248, 0.146972439170307,
+    0.14614342396802232, 0.1414037121151016, 0.13610903421801449,
+    0.13472504522567036, 0.13387159092503909, 0.12910745511194494,
+    0.12383717527230842, 0.12247756990418115, 0.1215997566510001,
+    0.11681127561811443, 0.11156531755004065, 0.11023002091695856,
+    0.10932792116074858, 0.10451516596911899, 0.09929346103715185,
+    0.09798240588432508, 0.09705608446756903, 0.0922191185863743,
+    0.08702160572111782, 0.08573473234553743, 0.08478424658322106,
+    0.07992312596757058, 0.0747497515909396, 0.07348700776831495,
+    0.07251240751797319, 0.0676271806772393, 0.06247789863708042,
+    0.061239239558189926, 0.0602405672806155, 0.0553312753374939,
+    0.050206046851466304, 0.04899143506767909, 0.047968725878517235,
+    0.043035402618930525, 0.037934196227458784, 0.03674360160531989,
+    0.03569688331759622, 0.03073955523162754, 0.025662346759830663,
+    0.024495746444628465, 0.02342503960238408, 0.018443725916289313,
+    0.013390498444767474, 0.012247876832897193, 0.011153194735992746,
+    0.006147907435414907, 0.0011186512798377962, -7.090648803369895e-16,
+    -0.0011186512798375852, -0.0061479074354156655, -0.011153194735993039,
+    -0.01224787683289534, -0.013390498444766325, -0.018443725916284393,
+    -0.02342503960238357, -0.02449574644462739, -0.025662346759832044,
+    -0.030739555231629103, -0.03569688331759876, -0.036743601605319205,
+    -0.0379341962274571, -0.043035402618929706, -0.047968725878517963,
+    -0.04899143506767272, -0.050206046851467394, -0.055331275337495184,
+    -0.06024056728062007, -0.06123923955818962, -0.06247789863707916,
+    -0.06762718067723857, -0.07251240751796877, -0.07348700776831436,
+    -0.07474975159093994, -0.07992312596757001, -0.08478424658321645,
+    -0.0857347323455389, -0.08702160572111886, -0.09221911858637447,
+    -0.09705608446756829, -0.0979824058843276, -0.0992934610371503,
+    -0.10451516596911717, -0.10932792116074938, -0.11023002091696585,
+    -0.11156531755003898, -0.11681127561811339, -0.12159975665100128,
+    -0.12247756990418188, -0.12383717527230766, -0.12910745511194402,
+    -0.1338715909250375, -0.13472504522566817, -0.1361090342180136,
+    -0.14140371211509847, -0.14614342396802063, -0.14697243917030275,
+    -0.14838089440279514, -0.15370005438783463, -0.15841525576350243,
+    -0.1592197439261766, -0.16065275584390729, -0.1659964897962685,
+    -0.17068708629340354, -0.17146695157034386, -0.17292461856027455,
+    -0.17829302632279842, -0.1829589155379458, -0.18371405405828453,
+    -0.18519648257254545, -0.19058967207679015, -0.1952307434756137,
+    -0.195961043213024, -0.197468347903118, -0.20288643530564798,
+    -0.2075025700830745, -0.20820791071389952, -0.20974021457625452,
+    -0.21518332440619128, -0.21977439533514692, -0.22045464808493592,
+    -0.22201208261808975, -0.22748034793655664, -0.23204621920470553,
+    -0.2327012466827776, -0.23428395205676175, -0.2397775146284528,
+    -0.24431804166260715, -0.2449476976841892, -0.24655582292243317,
+    -0.25207483339991094, -0.2565898626776248, -0.25719399207298693,
+    -0.2588276952474272, -0.26437231336864053, -0.26886168221633383,
+    -0.26944012062649314, -0.2710995690662784, -0.2766699638658516,
+    -0.2811335002430373, -0.28168607390133005, -0.2833714444158814,
+    -0.28896779445078424, -0.29340531671964715, -0.2939318422186125,
+    -0.29564332133553983, -0.30126581492584886, -0.30567713160558707,
+    -0.3061774156484355, -0.30791519986714083, -0.31356403535253485,
+    -0.3179489448576481, -0.31842278399355745, -0.3201870800552431,
+    -0.32586246606805264, -0.3302207564298751, -0.3306679367724063,
+    -0.3324589619472391, -0.33816111770286955, -0.3424925662734252,
+    -0.3429128632010363, -0.3447308455934672, -0.3504600011991099,
+    -0.35476437433638824, -0.35515755217428596, -0.35700273104741614,
+    -0.3627591278299476, -0.3670361805636688, -0.36740199224586023,
+    -0.3692746183658633, -0.37505850922008305, -0.3793079848967706,
+    -0.3796461716072679, -0.381546507609069, -0.3873581573673127,
+    -0.3915797872736117, -0.39189007806569226, -0.39381839884098346,
+    -0.3996580846653476, -0.40385158762832474, -0.40413369902048824,
+    -0.4060902921294411, -0.41195830392798105, -0.41612338589104975,
+    -0.4163770214383425, -0.4183621875464163, -0.424258828414621,
+    -0.4283951819876423, -0.428620031826945, -0.43063408516825313,
+    -0.43655967185745326, -0.44066697583946807, -0.44086271620706846,
+    -0.44290598507595186, -0.44886084849017965, -0.4529387673630999,
+    -0.4531050600828854, -0.4551778873554549, -0.46116237307862046,
+    -0.46521055647001097, -0.46534704841045615, -0.4674497920979579,
+    -0.4734642609532324, -0.4774823430662459, -0.47758866556416296,
+    -0.47972169940024834, -0.4857665280437202, -0.4897541270520816,
+    -0.48982989530096194, -0.4919936093650907, -0.4980691909159633,
+    -0.5020259083216286, -0.5020707207223193, -0.50426552210161,
+    -0.5103722668113548, -0.5142976867624138, -0.514311124233485,
+    -0.5165374377257279, -0.5226757736888379, -0.5265694622549422,
+    -0.526551087500078, -0.5288093563606394, -0.5349797302698561,
+    -0.5388412346721879, -0.5387905914016247, -0.5410812781373315,
+    -0.5472841560863422, -0.5511130038790898, -0.5510296159818042,
+    -0.5533532031950908, -0.5595890715322984, -0.5633847697319531,
+    -0.5632681403951862, -0.5656251316821787, -0.5718944979188948,
+    -0.5756565320778202, -0.5755061428500488, -0.5778970637564096,
+    -0.5842004575337039, -0.5879282907538046, -0.5877436005470719,
+    -0.5901689995859323, -0.5965069737043156, -0.6002000455863259,
+    -0.5999804896133314, -0.602440939349958, -0.6088140708666877,
+    -0.6124717963903176, -0.61221678503141, -0.61471288323964,
+    -0.6211217746387832, -0.62474354296832, -0.624452460563004,
+    -0.6269848314589787, -0.6334301118998503, -0.6370152851095224,
+    -0.6366874886665405, -0.6392567842258564, -0.645739110875964,
+    -0.6492870225887089, -0.6489218404083654, -0.6515287417731292,
+    -0.6580488012323721, -0.6615587551650812, -0.6611554853666917,
+    -0.6638007043498422, -0.6703592141733243, -0.6738304825809942,
+    -0.6733883915278156, -0.6760726722225904, -0.682670382550068,
+    -0.6861022045605529, -0.6856205251736897, -0.6883446456769567,
+    -0.6949823409779207, -0.6983739208080821, -0.6978518507600567,
+    -0.7006166250191388, -0.7072951259630897, -0.7106456310064286,
+    -0.7100823307842739, -0.7128886105776949, -0.7196087760405655,
+    -0.722917334815105, -0.7223119256416086, -0.7251606027055623,
+    -0.731923331923883, -0.7351890318682159, -0.7345405934689669,
+    -0.7374326017821636, -0.7442388366682066, -0.7474607217722047,
+    -0.7467682899747011, -0.7497046082158195, -0.7565553358480511,
+    -0.7597324041033228, -0.7589949682529622, -0.7619766224463974,
+    -0.7688728777512487, -0.7720040784048522, -0.7712205785809997,
+    -0.7742486449482446, -0.7811915135908668, -0.7842757441840071,
+    -0.7834450681974993, -0.786520676233441, -0.7935112977370818,
+    -0.7965474009084945, -0.7956683810598862, -0.7987927168554488,
+    -0.8058322879713623, -0.8088190480026755, -0.8078904575781853,
+    -0.8110647674131444, -0.8181545457652232, -0.8210906848433301,
+    -0.8201112343227455, -0.8233368285553139, -0.8304781365867471,
+    -0.8333623107548258, -0.8323306437028042, -0.8356089009857348,
+    -0.8428031302378378, -0.8456339250038272, -0.8445486136124163,
+    -0.8478809854688057, -0.8551296012260681, -0.8579055267932953,
+    -0.8567650670398117, -0.86015308283589, -0.867457629175262,
+    -0.8701771152557611, -0.8689799216356721, -0.8724251939924506,
+    -0.8797872992796281, -0.8824486894457397, -0.8811930892351879,
+    -0.8846973199261224, -0.892118702806947, -0.8947202483312128,
+    -0.893404475328103, -0.8969694617157242, -0.9044519376570596,
+    -0.906991790783981, -0.9056139784698328, -0.9092416205415713,
+    -0.9167871089830067, -0.9192633155687062, -0.9178214896260398,
+    -0.9215137976971027, -0.9291243298830373, -0.9315348213305285,
+    -0.9300268914415807, -0.9337859946021451, -0.9414637221732196,
+    -0.9438063065809342, -0.9422300574235757, -0.9460582128179107,
+    -0.9538054172517868, -0.9560777696816685, -0.9544308510264249,
+    -0.9583304540643038, -0.966149557068144, -0.9683492088262812,
+    -0.9666291246249125, -0.9706027202395805, -0.9784962952118529,
+    -0.9806206220190508, -0.9788247183589459, -0.9828750134430044,
+    -0.9908457981388528, -0.9928920070506668, -0.9910174588309397,
+    -0.9951473360008918, -1.0031982465560725, -1.005163361470284,
+    -1.003207157633335, -1.0074196904967203, -1.0155538369884307,
+    -1.017434682553123, -1.0153936096798313, -1.0196920798059463,
+    -1.0279127835570592, -1.0297059672629287, -1.0275765913092019,
+    -1.031964507136503, -1.040275320002765, -1.0419772122082986,
+    -1.0397558581245832, -1.044236976075998, -1.0526417019949865,
+    -1.0542484135916732, -1.0519311425241726, -1.0565094906468748,
+    -1.0650122097745327, -1.0665195671495544, -1.0641021508706967,
+    -1.0687820553712073, -1.077387151187696, -1.0787906680822377,
+    -1.0762685602364417, -1.0810546753470405, -1.0897668651810997,
+    -1.0910617109708312, -1.0884300146476422, -1.0933273563386448,
+    -1.1021517258410132, -1.1033326896789175, -1.100586120736053,
+    -1.105600104883794, -1.1145421470788495, -1.1156035972354674,
+    -1.1127364426856157, -1.11787292842166, -1.126938588086544,
+    -1.1278744256949138, -1.124880496337096, -1.1301458354461635,
+    -1.1393415597137788, -1.140145165968959, -1.1370177422825087,
+    -1.1424188356905907, -1.1517516319538834, -1.152415807623591,
+    -1.1491475777410909, -1.154691940351065, -1.164169442770074,
+    -1.1646863386327988, -1.1612693269589527, -1.1669651623584516,
+    -1.176595708550663, -1.1769567450779181, -1.173382229809015,
+    -1.179238516711159, -1.189031236554958, -1.1892270107786984,
+    -1.1854854281853526, -1.191512020884822, -1.2014769398067315,
+    -1.201497116837643, -1.1975779496775112, -1.2037856953399284,
+    -1.2139338550155987, -1.2137670410734909, -1.2096586878683122,
+    -1.216059564155125, -1.2264031642699462, -1.2260367573120767,
+    -1.2217263784115944, -1.2283336558229163, -1.2388862214606082,
+    -1.2383062344916573, -1.2337795697962497, -1.2406080042573608,
+    -1.251384584684674, -1.2505754355256438, -1.2458165873667295,
+    -1.2528826500806096, -1.263900056269858, -1.262844315843941,
+    -1.257835488712867, -1.2651576422802866, -1.2764347325955825,
+    -1.275112821505238, -1.2698340079134205, -1.2774330403650183,
+    -1.2889910666269888, -1.2873808867294179, -1.2818094852429982,
+    -1.2897089171968061, -1.3015719471143812, -1.2996484306373757,
+    -1.2937587777206332, -1.30198536275446, -1.3141807998797657,
+    -1.3119153528933967, -1.305678144119024, -1.3142624891952028,
+    -1.3268217187264544, -1.3241815278066194, -1.3175630955029949,
+    -1.3265404377522334, -1.339499636595708, -1.3364467962360889,
+    -1.32940819861003, -1.3388193882707713, -1.352220552183998,
+    -1.348710954312506, -1.3412068137525557, -1.351099572602278,
+    -1.3649918341805711, -1.3609737374616253, -1.3529507403121326,
+    -1.3633812937490446, -1.3778226360143508, -1.3732347973520893,
+    -1.364629729449574, -1.375664953763583, -1.3907244709485957,
+    -1.3854936679469392, -1.3762308021563674, -1.3879510952945717,
+    -1.4037120248117934, -1.3977497143506918, -1.3877372754799548,
+    -1.4002404649753446, -1.4168043293641202, -1.4100020537180824,
+    -1.3991273400848427, -1.4125341128323885, -1.430026497843237,
+    -1.4222494293277226, -1.4103719280040121, -1.4248335531468337,
+    -1.4434123640740353, -1.434490003233339, -1.4214314200422007,
+    -1.4371410343332787, -1.4570086258405959, -1.4467210012902367,
+    -1.432250383052783, -1.4494600111859413, -1.4708815972432416,
+    -1.4589380770576916, -1.4427488103591348, -1.461796013363052,
+    -1.4851287099607218, -1.471134108266242, -1.4528068192545078,
+    -1.474158340804919, -1.499899173596124, -1.4832967646369584,
+    -1.4622362993881128, -1.4865636243973674, -1.515433596015677,
+    -1.4954031748634335, -1.4707243986822236, -1.4990440226467712,
+    -1.5321464922231034, -1.507406950825692, -1.477709805447741,
+    -1.5116684766919786, -1.5508176235227205, -1.519201950087276,
+    -1.482075862797442, -1.5246075024650443, -1.573106088802335,
+    -1.5304995396596865, -1.4812423931371876, -1.538383033192563,
+    -1.6032652554139861, -1.5402705825658778, -1.4676335125621867,
+    -1.5552816397364817, -1.6563420450479887, -1.5424430327085104,
+    -1.4058877193808355, -1.597217015812041, -1.8457971340853485,
+    -1.3696460600125424, -6.579376611463682e-14,
+}};
+Table_ptr const ugg_table_saw_256 = (Table_ptr) &saw_256_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_32_data = {1025, {
+    0.0, 0.1959095975429011, 0.3891920974694353,
+    0.5772828322885788, 0.7577402289934665, 0.928302996254285,
+    1.0869422300197167, 1.2319069892202121, 1.361762093482626,
+    1.4754171326152514, 1.5721459454398456, 1.651596114722583,
+    1.7137883262202762, 1.759105743592521, 1.7882738474837632,
+    1.8023314670877923, 1.8025939872013852, 1.7906099352657108,
+    1.7681123344317395, 1.7369663448702641, 1.699114802500912,
+    1.6565232997996013, 1.6111264368228215, 1.5647768032266554,
+    1.5191981366763028, 1.475943943997649, 1.4363626744579774,
+    1.4015703065971017, 1.372430958915791, 1.3495458689796802,
+    1.3332508139974533, 1.3236217776329644, 1.3204884114294408,
+    1.3234546029535967, 1.3319252540094983, 1.3451381973954013,
+    1.3622000448180571, 1.3821246654846946, 1.4038729468128706,
+    1.426392486330557, 1.44865590632846, 1.4696965678186131,
+    1.4886405840955486, 1.504734191689538, 1.5173657216899286,
+    1.5260816204133405, 1.5305961877280203, 1.5307949262391665,
+    1.5267316171670453, 1.518619451517567, 1.5068167409505697,
+    1.4918079052195339, 1.4741805767497167, 1.4545997735120675,
+    1.4337801657514615, 1.4124574985810225, 1.3913602305660568,
+    1.3711824091520977, 1.3525587293983534, 1.3360426164095136,
+    1.322088038613011, 1.3110356039729725, 1.3031033203971782,
+    1.2983822214465486, 1.2968368756634383, 1.2983106190167641,
+    1.3025351814606818, 1.3091442262592816, 1.3176901896806765,
+    1.3276637031744778, 1.3385148034704957, 1.3496750903175307,
+    1.3605799777971446, 1.3706902030958763, 1.379511804947589,
+    1.38661386023205, 1.3916433680316629, 1.394336791570637,
+    1.3945279049955233, 1.3921517385395765, 1.3872445666187905,
+    1.3799400331549125, 1.370461651387204, 1.3591120464543103,
+    1.3462594234751442, 1.3323218378098411, 1.3177499145492526,
+    1.3030087089081397, 1.288559416924323, 1.2748416365565347,
+    1.2622568438006063, 1.2511536886390897, 1.2418156342109903,
+    1.2344513630023886, 1.2291882601990067, 1.2260691611461905,
+    1.2250524219453585, 1.2260152444865269, 1.2287600644891854,
+    1.233023697942403, 1.238488841806213, 1.2447974424825958,
+    1.251565383201204, 1.258397901106716, 1.2649051276310843,
+    1.2707171519411677, 1.275498036236916, 1.2789582619525646,
+    1.2808651552161152, 1.2810509252991098, 1.279418047725241,
+    1.2759418302676822, 1.2706701110503507, 1.2637201490743655,
+    1.255272874476285, 1.2455647646699681, 1.234877699580564,
+    1.2235272213033044, 1.2118496781832928, 1.2001887686912174,
+    1.188882015501948, 1.1782476945991114, 1.1685727185506118,
+    1.1601019286100427, 1.1530291889797104, 1.1474906010210284,
+    1.1435600685233445, 1.1412473508312673, 1.1404986424154009,
+    1.1411996191821656, 1.143180797235419, 1.146224962512329,
+    1.1500763529765556, 1.1544512116724952, 1.1590492811838564,
+    1.1635657795269032, 1.1677033851877472, 1.1711837651168506,
+    1.1737582035434606, 1.1752169303048654, 1.1753968032059383,
+    1.1741870673849362, 1.1715329929562763, 1.1674372771806958,
+    1.1619591857098936, 1.1552114956124844, 1.1473553875043114,
+    1.1385935119507709, 1.129161523453817, 1.1193184312636324,
+    1.109336157947896, 1.0994887226676249, 1.0900414756272345,
+    1.0812408030149936, 1.0733046984015888, 1.066414558113263,
+    1.0607085062077475, 1.0562764915223568, 1.0531573274125916,
+    1.0513377671419302, 1.050753627497616, 1.051292893242999,
+    1.0528006585733134, 1.055085691747272, 1.057928348168518,
+    1.0610895076546103, 1.0643201752579143, 1.0673713630640336,
+    1.0700038635874278, 1.071997533814495, 1.0731597321230864,
+    1.073332587178569, 1.072398826893557, 1.070285954610834,
+    1.0669686264249676, 1.0624691553219123, 1.056856141743969,
+    1.0502413033804832, 1.0427746466007017, 1.0346381853091902,
+    1.02603846771041, 1.0171982154716126, 1.0083474114624191,
+    0.999714190509823, 0.9915158918565914, 0.9839506222173521,
+    0.9771896550051934, 0.9713709554890704, 0.9665940748521007,
+    0.9629166002797428, 0.9603522855763831, 0.9588709198944052,
+    0.9583999236107925, 0.9588275928921102, 0.9600078506733969,
+    0.9617663040975987, 0.9639073591161922, 0.9662221037911729,
+    0.9684966443027035, 0.97052056272919, 0.9720951638010356,
+    0.9730411889959859, 0.9732056999948483, 0.9724678686211093,
+    0.9707434554781452, 0.9679878127274337, 0.9641973056723434,
+    0.9594091106604358, 0.9536994108063939, 0.9471800736569667,
+    0.9399939537319671, 0.9323090156127819, 0.9243115178988441,
+    0.9161985332320797, 0.9081701034128606, 0.9004213405544315,
+    0.8931347848731256, 0.8864733171987071, 0.8805739001968333,
+    0.8755423876561274, 0.8714495974421025, 0.8683287926408332,
+    0.8661746590617144, 0.8649438078862455, 0.8645567721860073,
+    0.8649014076441878, 0.8658375533749709, 0.8672027603463474,
+    0.8688188544251193, 0.8704990700060878, 0.8720554697090432,
+    0.8733063564531209, 0.8740833866273446, 0.8742381068918884,
+    0.8736476617452581, 0.8722194533386778, 0.8698945776966753,
+    0.8666499107822442, 0.8624987717491105, 0.8574901471084384,
+    0.8517065161756862, 0.8452603728335517, 0.8382895892189516,
+    0.8309518114607016, 0.823418114354506, 0.815866169473147,
+    0.808473198649517, 0.8014089914209077, 0.7948292606938335,
+    0.7888695958201718, 0.7836402471273882, 0.7792219417686926,
+    0.77566288895095, 0.7729770848472837, 0.7711439757179998,
+    0.7701094840046644, 0.7697883485493566, 0.770067678727209,
+    0.7708115751672565, 0.7718666286974489, 0.7730680757584997,
+    0.7742463640527122, 0.7752338675358006, 0.7758714855390972,
+    0.7760148669352864, 0.7755400165310518, 0.774348066587225,
+    0.7723690304665293, 0.7695643965039332, 0.7659284666311665,
+    0.7614883942112848, 0.7563029269710972, 0.7504599118302617,
+    0.7440726668195058, 0.7372753692697324, 0.730217647335282,
+    0.7230585922337511, 0.7159604301916214, 0.709082105177962,
+    0.7025730256636873, 0.6965672208297267, 0.6911781342241138,
+    0.6864942565707102, 0.6825757653410496, 0.6794522981959871,
+    0.677121942110392, 0.6755514717169319, 0.6746778210565387,
+    0.6744107244486008, 0.6746364164940459, 0.6752222400817365,
+    0.6760219762773182, 0.6768816824789968, 0.6776458062702173,
+    0.678163332688421, 0.6782937224984105, 0.6779124084670934,
+    0.6769156351677407, 0.6752244547237218, 0.672787725037567,
+    0.669583997064086, 0.6656222219753669, 0.6609412558687721,
+    0.6556081871344209, 0.6497155578560406, 0.6433775938548383,
+    0.6367255965132648, 0.6299026818401198, 0.6230580771168488,
+    0.616341201951657, 0.6098957680520054, 0.603854130252465,
+    0.5983321104141719, 0.5934244962137853, 0.5892013893725462,
+    0.5857055436544293, 0.5829507933617606, 0.5809216296582126,
+    0.5795739365765545, 0.5788368528198858, 0.5786156812420058,
+    0.5787957269289241, 0.5792469086980815, 0.5798289589858485,
+    0.5803970046563554, 0.5808073070891732, 0.5809229345144293,
+    0.5806191431389028, 0.5797882559692534, 0.5783438488676619,
+    0.5762240814264674, 0.5733940445887665, 0.569847036195395,
+    0.5656047182409, 0.5607161538822056, 0.5552557664147532,
+    0.5493203047730287, 0.5430249389654533, 0.5364986427004538,
+    0.5298790479868801, 0.5233069766368869, 0.5169208655964967,
+    0.5108513064349826, 0.5052159140357818, 0.5001147257877493,
+    0.4956263109473345, 0.4918047412092676, 0.48867753903718286,
+    0.48624468134534826, 0.48447869423763407, 0.48332583136012314,
+    0.4827082857130723, 0.4825273441773299, 0.4826673571314812,
+    0.4830003638096968, 0.4833911887090909, 0.4837028063771255,
+    0.48380176197858116, 0.4835634335231761, 0.4828769285623445,
+    0.4816494232369966, 0.47980977415815046, 0.4773112628149885,
+    0.4741333668588648, 0.4702824913247632, 0.46579163408602525,
+    0.46071900196130955, 0.4551456352421618, 0.449172137358229,
+    0.4429146414171462, 0.43650017507903366, 0.43006160849525643,
+    0.42373238595943036, 0.4176412498789277, 0.41190716538667554,
+    0.40663464541002003, 0.4019096596542642, 0.39779628740963535,
+    0.39433424429980823, 0.39153737824909896, 0.3893931914409652,
+    0.3878634044000762, 0.38688553716176854, 0.38637544242025607,
+    0.38623068814744643, 0.386334653914965, 0.3865611773335206,
+    0.3867795657288841, 0.38685977422541623, 0.3866775453379144,
+    0.38611930720006765, 0.3850866375833013, 0.3835001184682757,
+    0.38130243041025735, 0.37846056630724495, 0.37496707922479056,
+    0.37084031726095684, 0.3661236385298124, 0.36088363961719255,
+    0.3552074697294741, 0.34919933868549896, 0.3429763584832667,
+    0.33666388417079274, 0.3303905391519522, 0.3242831221121788,
+    0.3184615969964931, 0.31303436376242555, 0.30809399612643884,
+    0.3037136136944523, 0.29994403047288776, 0.296811790811493,
+    0.29431816856477655, 0.29243916707499007, 0.2911265179880718,
+    0.29030963747922583, 0.28989846074202996, 0.28978704106887143,
+    0.28985776987663436, 0.2899860497839038, 0.2900452352700062,
+    0.28991164522293844, 0.2894694492025627, 0.2886152345908871,
+    0.2872620747480636, 0.28534293831653607, 0.28281330611419253,
+    0.27965289358195294, 0.2758664122493773, 0.27148334174618466,
+    0.2665567230121531, 0.26116102199718594, 0.25538914977376354,
+    0.24934875816355534, 0.24315795840492904, 0.23694063294459594,
+    0.2308215262435883, 0.22492130893213486, 0.2193518104074694,
+    0.2142116080250196, 0.20958214667193184, 0.20552454131026415,
+    0.20207718788165158, 0.19925427585777672, 0.19704525997520572,
+    0.19541531072497803, 0.1943067244778801, 0.19364123624356072,
+    0.19332314247946844, 0.193243109485128, 0.1932825159921173,
+    0.1933181576464712, 0.19322712699608985, 0.1928916758884792,
+    0.1922038681097586, 0.19106983860848814, 0.18941349140291625,
+    0.18717949063740652, 0.1843354273427641, 0.1808730771510336,
+    0.17680870022241746, 0.172182372535505, 0.1670563759743587,
+    0.16151271180551813, 0.1556498367092843, 0.14957875115033212,
+    0.14341859533822607, 0.13729192733825918, 0.13131987029087483,
+    0.12561732070063447, 0.120288407172433, 0.11542237891216485,
+    0.11109008617489062, 0.10734119131800451, 0.10420222013422181,
+    0.1016755298477073, 0.09973923387415738, 0.0983480856069298,
+    0.09743528559117164, 0.09691513998293891, 0.0966864645989376,
+    0.09663659946916742, 0.09664587476694138, 0.09659235125409543,
+    0.09635664764002913, 0.0958266639310995, 0.09490201406867307,
+    0.09349799274870767, 0.09154891982116899, 0.0890107303494256,
+    0.08586270829028497, 0.08210829565198914, 0.0777749455599544,
+    0.07291302546284507, 0.06759381425163395, 0.06190667285916971,
+    0.05595550054484817, 0.049854617260711866, 0.043724235129965934,
+    0.03768569825493005, 0.0318566791713967, 0.026346521923644835,
+    0.02125191588529591, 0.016653071329132872, 0.012610547873960225,
+    0.009162861095098106, 0.0063249617989881695, 0.004087647948637287,
+    0.0024179323486679966, 0.0012603514138027285, 0.0005391631445972654,
+    0.0001613472888009104, 2.028896303451344e-05, -5.513951706391496e-17,
+    -2.0288963033533893e-05, -0.00016134728880134094, -0.0005391631445972101,
+    -0.0012603514138022883, -0.0024179323486680296, -0.004087647948636688,
+    -0.00632496179898781, -0.009162861095097952, -0.012610547873959987,
+    -0.016653071329132747, -0.0212519158852955, -0.026346521923644586,
+    -0.031856679171396535, -0.037685698254929685, -0.04372423512996516,
+    -0.0498546172607104, -0.0559555005448482, -0.061906672859169024,
+    -0.06759381425163438, -0.07291302546284527, -0.07777494555995333,
+    -0.08210829565198914, -0.08586270829028386, -0.08901073034942555,
+    -0.09154891982116829, -0.0934979927487067, -0.09490201406867269,
+    -0.09582666393110031, -0.09635664764002987, -0.09659235125409574,
+    -0.09664587476694125, -0.09663659946916714, -0.09668646459893686,
+    -0.09691513998293877, -0.0974352855911715, -0.09834808560692929,
+    -0.09973923387415648, -0.10167552984770531, -0.10420222013422206,
+    -0.10734119131800345, -0.11109008617489075, -0.11542237891216463,
+    -0.12028840717243207, -0.12561732070063336, -0.13131987029087522,
+    -0.1372919273382577, -0.14341859533822576, -0.14957875115033037,
+    -0.15564983670928356, -0.16151271180551882, -0.1670563759743584,
+    -0.17218237253550467, -0.17680870022241665, -0.18087307715103265,
+    -0.18433542734276384, -0.18717949063740602, -0.18941349140291552,
+    -0.19106983860848809, -0.19220386810975892, -0.1928916758884781,
+    -0.19322712699609024, -0.1933181576464704, -0.19328251599211735,
+    -0.1932431094851281, -0.1933231424794678, -0.19364123624356142,
+    -0.19430672447788033, -0.19541531072497814, -0.1970452599752054,
+    -0.19925427585777694, -0.2020771878816521, -0.2055245413102649,
+    -0.20958214667193215, -0.21421160802501954, -0.21935181040746934,
+    -0.2249213089321347, -0.23082152624358765, -0.23694063294459644,
+    -0.24315795840492765, -0.24934875816355556, -0.25538914977376315,
+    -0.2611610219971851, -0.26655672301215283, -0.27148334174618494,
+    -0.2758664122493774, -0.2796528935819528, -0.28281330611419236,
+    -0.28534293831653673, -0.2872620747480637, -0.28861523459088745,
+    -0.2894694492025644, -0.28991164522293855, -0.2900452352700056,
+    -0.28998604978390397, -0.28985776987663237, -0.289787041068871,
+    -0.2898984607420304, -0.29030963747922534, -0.29112651798807215,
+    -0.29243916707498935, -0.2943181685647764, -0.2968117908114946,
+    -0.2999440304728887, -0.303713613694452, -0.3080939961264379,
+    -0.313034363762424, -0.31846159699649246, -0.324283122112179,
+    -0.3303905391519515, -0.33666388417079274, -0.3429763584832664,
+    -0.34919933868550057, -0.3552074697294746, -0.3608836396171931,
+    -0.36612363852981195, -0.3708403172609556, -0.37496707922478995,
+    -0.3784605663072438, -0.38130243041025624, -0.38350011846827614,
+    -0.3850866375833016, -0.3861193072000682, -0.3866775453379138,
+    -0.38685977422541634, -0.38677956572888483, -0.38656117733352047,
+    -0.38633465391496485, -0.3862306881474466, -0.3863754424202569,
+    -0.38688553716176893, -0.38786340440007666, -0.38939319144096507,
+    -0.39153737824909834, -0.39433424429980724, -0.39779628740963546,
+    -0.401909659654263, -0.4066346454100197, -0.41190716538667516,
+    -0.41764124987892676, -0.4237323859594288, -0.4300616084952578,
+    -0.43650017507903177, -0.4429146414171457, -0.44917213735822625,
+    -0.45514563524216206, -0.4607190019613091, -0.46579163408602486,
+    -0.47028249132476196, -0.47413336685886515, -0.477311262814988,
+    -0.4798097741581506, -0.4816494232369982, -0.4828769285623451,
+    -0.48356343352317616, -0.4838017619785806, -0.48370280637712754,
+    -0.4833911887090901, -0.4830003638096972, -0.4826673571314795,
+    -0.48252734417732907, -0.48270828571307284, -0.4833258313601234,
+    -0.48447869423763607, -0.4862446813453504, -0.4886775390371829,
+    -0.4918047412092679, -0.4956263109473359, -0.5001147257877478,
+    -0.5052159140357827, -0.5108513064349798, -0.516920865596496,
+    -0.5233069766368852, -0.5298790479868795, -0.5364986427004581,
+    -0.5430249389654537, -0.5493203047730277, -0.5552557664147519,
+    -0.5607161538822054, -0.5656047182408983, -0.569847036195397,
+    -0.5733940445887655, -0.5762240814264666, -0.5783438488676622,
+    -0.579788255969254, -0.5806191431389042, -0.5809229345144309,
+    -0.5808073070891736, -0.5803970046563551, -0.579828958985849,
+    -0.579246908698081, -0.5787957269289247, -0.5786156812420054,
+    -0.5788368528198856, -0.5795739365765553, -0.5809216296582124,
+    -0.5829507933617599, -0.5857055436544298, -0.5892013893725454,
+    -0.5934244962137849, -0.5983321104141739, -0.6038541302524647,
+    -0.6098957680520048, -0.6163412019516581, -0.6230580771168492,
+    -0.6299026818401193, -0.6367255965132645, -0.643377593854839,
+    -0.6497155578560411, -0.6556081871344207, -0.6609412558687721,
+    -0.6656222219753677, -0.6695839970640869, -0.6727877250375668,
+    -0.6752244547237225, -0.6769156351677391, -0.6779124084670937,
+    -0.6782937224984097, -0.6781633326884221, -0.6776458062702165,
+    -0.6768816824789964, -0.6760219762773179, -0.6752222400817355,
+    -0.6746364164940473, -0.6744107244486012, -0.674677821056539,
+    -0.6755514717169315, -0.6771219421103932, -0.6794522981959874,
+    -0.6825757653410499, -0.6864942565707083, -0.6911781342241131,
+    -0.6965672208297256, -0.7025730256636865, -0.7090821051779603,
+    -0.7159604301916214, -0.7230585922337525, -0.7302176473352824,
+    -0.7372753692697316, -0.7440726668195061, -0.7504599118302596,
+    -0.7563029269710967, -0.7614883942112836, -0.7659284666311661,
+    -0.7695643965039325, -0.7723690304665279, -0.7743480665872249,
+    -0.7755400165310508, -0.7760148669352868, -0.7758714855390969,
+    -0.7752338675357999, -0.7742463640527126, -0.7730680757585001,
+    -0.7718666286974495, -0.7708115751672586, -0.7700676787272084,
+    -0.7697883485493567, -0.7701094840046643, -0.7711439757179982,
+    -0.7729770848472827, -0.7756628889509495, -0.779221941768693,
+    -0.783640247127387, -0.7888695958201717, -0.7948292606938335,
+    -0.8014089914209092, -0.8084731986495168, -0.8158661694731469,
+    -0.8234181143545048, -0.8309518114607013, -0.8382895892189509,
+    -0.8452603728335517, -0.8517065161756879, -0.8574901471084357,
+    -0.8624987717491085, -0.8666499107822435, -0.8698945776966739,
+    -0.872219453338677, -0.8736476617452589, -0.8742381068918872,
+    -0.8740833866273446, -0.8733063564531216, -0.8720554697090439,
+    -0.8704990700060883, -0.8688188544251181, -0.8672027603463472,
+    -0.86583755337497, -0.8649014076441888, -0.8645567721860073,
+    -0.8649438078862446, -0.8661746590617141, -0.868328792640833,
+    -0.8714495974421014, -0.8755423876561276, -0.8805739001968321,
+    -0.8864733171987073, -0.8931347848731245, -0.900421340554431,
+    -0.90817010341286, -0.9161985332320788, -0.9243115178988437,
+    -0.9323090156127802, -0.9399939537319685, -0.9471800736569652,
+    -0.9536994108063939, -0.959409110660434, -0.9641973056723445,
+    -0.9679878127274343, -0.9707434554781474, -0.9724678686211097,
+    -0.9732056999948475, -0.9730411889959849, -0.9720951638010331,
+    -0.9705205627291904, -0.9684966443027031, -0.9662221037911748,
+    -0.9639073591161934, -0.9617663040975988, -0.9600078506733969,
+    -0.9588275928921111, -0.9583999236107917, -0.9588709198944066,
+    -0.9603522855763827, -0.962916600279743, -0.9665940748521006,
+    -0.9713709554890693, -0.9771896550051935, -0.9839506222173513,
+    -0.9915158918565901, -0.9997141905098221, -1.0083474114624191,
+    -1.0171982154716148, -1.0260384677104097, -1.0346381853091902,
+    -1.042774646600701, -1.0502413033804854, -1.0568561417439681,
+    -1.0624691553219119, -1.066968626424966, -1.070285954610835,
+    -1.0723988268935571, -1.0733325871785688, -1.0731597321230872,
+    -1.0719975338144954, -1.0700038635874294, -1.0673713630640336,
+    -1.0643201752579152, -1.06108950765461, -1.0579283481685187,
+    -1.0550856917472733, -1.0528006585733118, -1.0512928932429983,
+    -1.0507536274976148, -1.0513377671419297, -1.0531573274125938,
+    -1.0562764915223575, -1.0607085062077475, -1.0664145581132616,
+    -1.0733046984015886, -1.0812408030149923, -1.0900414756272336,
+    -1.0994887226676267, -1.1093361579478982, -1.1193184312636315,
+    -1.1291615234538184, -1.138593511950771, -1.1473553875043119,
+    -1.1552114956124835, -1.1619591857098912, -1.1674372771806965,
+    -1.171532992956276, -1.174187067384937, -1.175396803205938,
+    -1.1752169303048665, -1.173758203543459, -1.1711837651168489,
+    -1.1677033851877487, -1.1635657795269037, -1.1590492811838589,
+    -1.1544512116724936, -1.150076352976556, -1.1462249625123282,
+    -1.1431807972354198, -1.1411996191821652, -1.1404986424154013,
+    -1.1412473508312666, -1.1435600685233425, -1.1474906010210284,
+    -1.153029188979712, -1.1601019286100445, -1.16857271855061,
+    -1.1782476945991123, -1.1888820155019475, -1.2001887686912176,
+    -1.211849678183293, -1.223527221303304, -1.2348776995805628,
+    -1.2455647646699683, -1.2552728744762858, -1.2637201490743655,
+    -1.2706701110503509, -1.2759418302676808, -1.279418047725241,
+    -1.2810509252991082, -1.280865155216116, -1.2789582619525632,
+    -1.2754980362369162, -1.270717151941168, -1.264905127631087,
+    -1.2583979011067172, -1.2515653832012041, -1.2447974424825965,
+    -1.2384888418062132, -1.233023697942404, -1.2287600644891856,
+    -1.2260152444865282, -1.2250524219453587, -1.2260691611461918,
+    -1.2291882601990056, -1.2344513630023906, -1.2418156342109894,
+    -1.2511536886390888, -1.2622568438006045, -1.2748416365565343,
+    -1.288559416924322, -1.30300870890814, -1.317749914549252,
+    -1.332321837809841, -1.3462594234751433, -1.359112046454309,
+    -1.3704616513872034, -1.3799400331549123, -1.3872445666187905,
+    -1.3921517385395754, -1.3945279049955226, -1.3943367915706366,
+    -1.3916433680316653, -1.3866138602320492, -1.3795118049475892,
+    -1.370690203095876, -1.360579977797144, -1.3496750903175307,
+    -1.338514803470495, -1.3276637031744805, -1.3176901896806765,
+    -1.309144226259282, -1.3025351814606816, -1.2983106190167646,
+    -1.2968368756634399, -1.298382221446547, -1.3031033203971796,
+    -1.3110356039729727, -1.3220880386130094, -1.3360426164095118,
+    -1.352558729398353, -1.371182409152098, -1.391360230566058,
+    -1.4124574985810208, -1.4337801657514606, -1.4545997735120653,
+    -1.4741805767497145, -1.491807905219532, -1.5068167409505697,
+    -1.518619451517567, -1.5267316171670453, -1.5307949262391667,
+    -1.530596187728019, -1.52608162041334, -1.517365721689929,
+    -1.5047341916895398, -1.4886405840955483, -1.4696965678186138,
+    -1.4486559063284612, -1.4263924863305588, -1.4038729468128701,
+    -1.382124665484696, -1.3622000448180567, -1.3451381973954033,
+    -1.331925254009498, -1.323454602953597, -1.32048841142944,
+    -1.3236217776329633, -1.3332508139974524, -1.349545868979679,
+    -1.3724309589157908, -1.4015703065970988, -1.4363626744579754,
+    -1.475943943997649, -1.5191981366763017, -1.5647768032266527,
+    -1.6111264368228195, -1.6565232997995993, -1.6991148025009088,
+    -1.7369663448702628, -1.7681123344317382, -1.7906099352657132,
+    -1.802593987201383, -1.8023314670877932, -1.7882738474837636,
+    -1.7591057435925233, -1.713788326220276, -1.6515961147225866,
+    -1.5721459454398519, -1.475417132615254, -1.3617620934826327,
+    -1.231906989220218, -1.0869422300197253, -0.9283029962542827,
+    -0.7577402289934727, -0.577282832288586, -0.3891920974694471,
+    -0.19590959754290582, -8.873604007562057e-15,
+}};
+Table_ptr const ugg_table_saw_32 = (Table_ptr) &saw_32_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_4_data = {1025, {
+    0.0, 0.02454253755801078, 0.04907814544281685,
+    0.07359989705963108, 0.09810087196890059, 0.12257415895992255,
+    0.14701285911966067, 0.17141008889516712, 0.19575898314801765,
+    0.22005269819917223, 0.2442844148626796, 0.268447341466649,
+    0.2925347168599205, 0.3165398134028728, 0.340455939940817,
+    0.36427644475843324, 0.387994718513718, 0.4116041971499229,
+    0.4350983647839761, 0.45847075656989006, 0.48171496153567694,
+    0.5048246253923026, 0.5277934533132301, 0.5506152126831181,
+    0.5732837358142542, 0.5957929226293286, 0.6181367433091622,
+    0.6403092409040321, 0.6623045339072506, 0.6841168187896792,
+    0.7057403724938793, 0.7271695548866226, 0.7483988111685107,
+    0.7694226742394716, 0.7902357670189329, 0.8108328047194874,
+    0.8312085970729041, 0.8513580505073506, 0.8712761702747327,
+    0.8909580625270761, 0.9103989363409051, 0.9295941056886083,
+    0.9485389913557989, 0.9672291228037176, 0.9856601399757535,
+    1.0038277950471857, 1.0217279541172823, 1.0393565988429319,
+    1.0567098280129974, 1.0737838590626403, 1.090575029526867,
+    1.107079798432613, 1.1232947476286883, 1.139216583052957,
+    1.1548421359361583, 1.1701683639418008, 1.1851923522416077,
+    1.199911314526023, 1.2143225939493205, 1.2284236640088997,
+    1.242212129358385, 1.25568572655418, 1.2688423247351714,
+    1.2816799262353034, 1.2941966671287926, 1.3063908177077812,
+    1.3182607828922663, 1.329805102572179, 1.3410224518815308,
+    1.3519116414045678, 1.36247161731393, 1.3727014614408275,
+    1.3826003912773062, 1.3921677599106899, 1.4014030558903428,
+    1.4103059030269158, 1.4188760601242947, 1.4271134206444835,
+    1.435018012305714, 1.4425899966140951, 1.4498296683291576,
+    1.456737454863679, 1.4633139156182202, 1.469559741250829,
+    1.4754757528824103, 1.4810629012382868, 1.486322265726523,
+    1.4912550534536013, 1.495862598178093, 1.5001463592029762,
+    1.5041079202073138, 1.5077489880180082, 1.5110713913224063,
+    1.5140770793225409, 1.5167681203318377, 1.5191467003151435,
+    1.5212151213729594, 1.5229758001707954, 1.5244312663145905,
+    1.5255841606731713, 1.526437233648747, 1.5269933433964724,
+    1.5272554539941303, 1.5272266335630127, 1.5269100523411119,
+    1.5263089807097419, 1.525426787174756, 1.524266936303529,
+    1.5228329866189085, 1.5211285884513592, 1.519157481750539,
+    1.5169234938575744, 1.514430537239318, 1.5116826071858942,
+    1.5086837794728458, 1.5054382079892314, 1.5019501223330185,
+    1.4982238253751534, 1.4942636907936846, 1.490074160579349,
+    1.4856597425140305, 1.4810250076235176, 1.4761745876060033,
+    1.4711131722377722, 1.465845506757538, 1.460376389230901,
+    1.4547106678964004, 1.448853238494653, 1.4428090415820634,
+    1.436583059830612, 1.4301803153152173, 1.4236058667901854,
+    1.416864806956255, 1.4099622597197545, 1.4029033774453796,
+    1.3956933382041201, 1.3883373430178367, 1.3808406131020148,
+    1.3732083871082028, 1.3654459183676462, 1.357558472137625,
+    1.3495513228519982, 1.3414297513774471, 1.3331990422769193,
+    1.3248644810817456, 1.3164313515739134, 1.307904933079964,
+    1.2992904977779705, 1.290593308019042, 1.281818613664801,
+    1.2729716494422436, 1.2640576323174104, 1.2550817588892555,
+    1.2460492028051067, 1.2369651121990808, 1.2278346071548096,
+    1.2186627771938157, 1.2094546787908547, 1.2002153329175305,
+    1.1909497226154606, 1.1816627906002615, 1.1723594368975918,
+    1.1630445165124839, 1.1537228371331552, 1.1443991568704832,
+    1.1350781820343074, 1.125764564947675, 1.116462901800153,
+    1.107177730541286, 1.0979135288152562, 1.088674711937781,
+    1.0794656309162567, 1.0702905705141212, 1.0611537473603971,
+    1.0520593081053302, 1.0430113276230266, 1.0340138072619522,
+    1.0250706731441308, 1.0161857745138485, 1.0073628821366483,
+    0.998605686749352, 0.9899177975618315, 0.9813027408112147,
+    0.972763958369173, 0.9643048064029163, 0.9559285540904845,
+    0.9476383823908849, 0.9394373828696075, 0.9313285565799971,
+    0.9233148130009512, 0.9153989690313533, 0.9075837480416423,
+    0.8998717789828639, 0.8922655955535311, 0.8847676354245768,
+    0.877380239522654, 0.8701056513719965, 0.8629460164950339,
+    0.855903381871894, 0.8489796954589233, 0.8421768057662955,
+    0.8354964614947566, 0.8289403112315168, 0.8225099032052653,
+    0.8162066851002526, 0.8100320039293439, 0.8039871059659194,
+    0.7980731367344629, 0.7922911410596402, 0.7866420631736415,
+    0.7811267468815294, 0.7757459357842921, 0.7705002735592731,
+    0.7653903042976287, 0.7604164728984031, 0.7555791255188102,
+    0.7508785100802535, 0.7463147768296051, 0.7418879789552159,
+    0.7375980732571106, 0.7334449208707833, 0.7294282880439837,
+    0.7255478469658513, 0.7218031766477296, 0.7181937638549567,
+    0.7147190040889079, 0.7113782026185342, 0.708170575560613,
+    0.7050952510079029, 0.7021512702043624, 0.6993375887665779,
+    0.6966530779505071, 0.6940965259626306, 0.6916666393145727,
+    0.689362044220238, 0.6871812880344736, 0.6851228407322629,
+    0.6831850964274151, 0.6813663749297133, 0.6796649233394478,
+    0.6780789176782522, 0.6766064645551362, 0.6752456028665896,
+    0.673994305529623, 0.6728504812465794, 0.6718119763005501,
+    0.6708765763802025, 0.6700420084328192, 0.669305942544327,
+    0.6686659938450902, 0.6681197244402242, 0.6676646453631734,
+    0.6672982185512931, 0.6670178588421544, 0.6668209359892965,
+    0.6667047766961253, 0.6666666666666666, 0.6667038526718614,
+    0.666813544630093, 0.6669929177006293, 0.6672391143886554,
+    0.6675492466605729, 0.6679203980682376, 0.6683496258808008,
+    0.6688339632228305, 0.6693704212173711, 0.6699559911326183,
+    0.6705876465308729, 0.6712623454184488, 0.6719770323952073,
+    0.6727286408023982, 0.6735140948674891, 0.674330311844669,
+    0.6751742041497242, 0.6760426814879846, 0.6769326529740474,
+    0.6778410292419977, 0.6787647245448512, 0.6797006588419503,
+    0.6806457598730682, 0.6815969652179693, 0.6825512243402019,
+    0.683505500613903, 0.6844567733324127, 0.6854020396975055,
+    0.6863383167880668, 0.6872626435070552, 0.6881720825056037,
+    0.6890637220831407, 0.6899346780624149, 0.6907820956383408,
+    0.6916031511995887, 0.6923950541218697, 0.6931550485318861,
+    0.6938804150409317, 0.6945684724471568, 0.6952165794055284,
+    0.6958221360645411, 0.6963825856687551, 0.6968954161262666,
+    0.6973581615402288, 0.6977684037035807, 0.6981237735561543,
+    0.6984219526033604, 0.6986606742956809, 0.698837725368219,
+    0.6989509471395846, 0.6989982367694234, 0.6989775484739238,
+    0.6988868946986596, 0.6987243472481617, 0.6984880383716345,
+    0.6981761618042651, 0.6977869737636022, 0.6973187939005078,
+    0.696770006204217, 0.6961390598610766, 0.6954244700665457,
+    0.6946248187900962, 0.6937387554926605, 0.6927649977963162,
+    0.6917023321059258, 0.6905496141824725, 0.6893057696678835,
+    0.6879697945611367, 0.6865407556455033, 0.6850177908667912,
+    0.6834001096624958, 0.6816869932417947, 0.6798777948163427,
+    0.6779719397818809, 0.6759689258506681, 0.6738683231348109,
+    0.6716697741805719, 0.6693729939537751, 0.6669777697764753,
+    0.6644839612150506, 0.6618914999199538, 0.6592003894173443,
+    0.6564107048528897, 0.6535225926880268, 0.6505362703490261,
+    0.6474520258292059, 0.6442702172447026, 0.6409912723442035,
+    0.6376156879730907, 0.6341440294924822, 0.6305769301536568,
+    0.6269150904284087, 0.6231592772958746, 0.6193103234864332,
+    0.6153691266832676, 0.6113366486822487, 0.6072139145107787,
+    0.6030020115063004, 0.5987020883551682, 0.5943153540926174,
+    0.589843077064602, 0.5852865838522608, 0.5806472581598358,
+    0.5759265396668476, 0.5711259228453937, 0.5662469557434149,
+    0.5612912387348409, 0.5562604232374971, 0.551156210399713,
+    0.5459803497565767, 0.5407346378567806, 0.5354209168610604,
+    0.5300410731131971, 0.5245970356846164, 0.5190907748935853,
+    0.5135243008000757, 0.5078996616773154, 0.5022189424611244,
+    0.4964842631780938, 0.49069777735370346, 0.4848616704014928,
+    0.47897815799437016, 0.4730494844192135, 0.4670779209158631,
+    0.46106576400167, 0.455015333782722, 0.44892897225292394,
+    0.44280904158206347, 0.43665792239405193, 0.43047801203648733,
+    0.4242717228427174, 0.4180414803875856, 0.4117897217380148,
+    0.40551889369963273, 0.399231451060589, 0.3929298548337699,
+    0.38661657049855813, 0.38029406624334294, 0.3739648112099242,
+    0.3676312737410062, 0.3612959196319274, 0.3549612103877945,
+    0.348629601487184, 0.34230354065354274, 0.33598546613545194,
+    0.3296778049968695, 0.32338297141849637, 0.31710336501136566,
+    0.310841369143785, 0.3045993492827055, 0.2983796513506274,
+    0.29218460009910213, 0.28601649749989627, 0.2798776211548769,
+    0.27377022272563767, 0.26769652638390373, 0.26165872728370804,
+    0.2556589900563429, 0.2496994473290464, 0.24378219826839864,
+    0.23790930714935235, 0.23208280195082734, 0.22630467297877638,
+    0.22057687151759453, 0.21490130851075148, 0.20927985327147605,
+    0.20371433222433075, 0.19820652767846542, 0.1927581766333416,
+    0.18737096961767546, 0.18204654956234423, 0.17678651070796073,
+    0.17159239754780625, 0.16646570380679154, 0.16140787145707564,
+    0.15642028977096914, 0.15150429441170032, 0.1466611665626198,
+    0.14189213209537047, 0.13719836077754585, 0.13258096552031262,
+    0.12804100166646432, 0.1235794663193312, 0.11919729771295404,
+    0.11489537462389815, 0.11067451582505491, 0.1065354795817538,
+    0.1024789631904734, 0.09850560256042143, 0.09461597183821319,
+    0.0908105830758606, 0.08708988594224493, 0.08345426747822823,
+    0.07990405189551841, 0.07643950041938219, 0.07306081117526836,
+    0.06976811911937306, 0.06656149601315325, 0.06344095044176098,
+    0.06040642787634709, 0.05745781078015019, 0.0545949187582595,
+    0.05181750875091151, 0.049125275270150454, 0.046517850679655914,
+    0.043994805517511615, 0.04155564886165772, 0.03919982873775213,
+    0.03692673256912002, 0.03473568766846358, 0.032625961770958944,
+    0.03059676360835445, 0.028647243523644284, 0.026776494125878736,
+    0.024983550984632147, 0.02326739336363473, 0.021626944993044045,
+    0.02006107487980391, 0.018568598155520005, 0.01714827696125354,
+    0.01579882136860808, 0.014518890336463391, 0.013307092702690232,
+    0.012161988210147051, 0.011082088566251563, 0.010065858535381916,
+    0.00911171706335609, 0.00821803843320773, 0.007383153451455932,
+    0.006605350664054321, 0.005882877601177838, 0.005213942049990816,
+    0.004596713354516252, 0.004029323741720908, 0.003509869672896071,
+    0.0030364132194141136, 0.0026069834619156934, 0.0022195779119650177,
+    0.0018721639552093244, 0.0015626803150449592, 0.0012890385357984813,
+    0.0010491244844057918, 0.000840799869565742, 0.0006619037773274022,
+    0.0005102542220736667, 0.0003836497118316351, 0.0002798708268541214,
+    0.00019668181039289578, 0.0001318321705763431, 8.305829231222e-05,
+    4.808505810600938e-05, 2.4627476702565598e-05, 1.0392318438526976e-05,
+    3.0797561957045944e-06, 3.85010834566199e-07, -2.465190328815662e-32,
+    -3.85010834566199e-07, -3.0797561957045944e-06, -1.0392318438530446e-05,
+    -2.462747670256213e-05, -4.808505810600938e-05, -8.305829231221307e-05,
+    -0.00013183217057632923, -0.00019668181039288885, -0.00027987082685412834,
+    -0.00038364971183162816, -0.0005102542220736667, -0.0006619037773274161,
+    -0.000840799869565742, -0.0010491244844057779, -0.0012890385357984813,
+    -0.0015626803150449592, -0.0018721639552093244, -0.002219577911965004,
+    -0.0026069834619156657, -0.003036413219414058, -0.003509869672896057,
+    -0.004029323741720936, -0.004596713354516224, -0.005213942049990816,
+    -0.0058828776011778106, -0.006605350664054266, -0.007383153451455904,
+    -0.008218038433207647, -0.009111717063356034, -0.01006585853538186,
+    -0.011082088566251508, -0.012161988210146996, -0.013307092702690176,
+    -0.014518890336463336, -0.01579882136860805, -0.017148276961253428,
+    -0.018568598155519977, -0.020061074879803825, -0.021626944993044017,
+    -0.023267393363634647, -0.02498355098463209, -0.02677649412587868,
+    -0.0286472435236442, -0.030596763608354338, -0.03262596177095889,
+    -0.034735687668463466, -0.036926732569119824, -0.039199828737751935,
+    -0.041555648861657635, -0.04399480551751159, -0.046517850679655776,
+    -0.04912527527015034, -0.0518175087509114, -0.054594918758259336,
+    -0.05745781078015008, -0.06040642787634698, -0.06344095044176085,
+    -0.06656149601315312, -0.06976811911937292, -0.07306081117526822,
+    -0.07643950041938216, -0.07990405189551819, -0.0834542674782281,
+    -0.08708988594224476, -0.0908105830758604, -0.09461597183821308,
+    -0.09850560256042129, -0.10247896319047323, -0.10653547958175366,
+    -0.11067451582505478, -0.11489537462389798, -0.1191972977129539,
+    -0.12357946631933103, -0.12804100166646415, -0.13258096552031243,
+    -0.13719836077754566, -0.14189213209537027, -0.14666116656261965,
+    -0.15150429441170019, -0.15642028977096892, -0.1614078714570754,
+    -0.16646570380679132, -0.17159239754780603, -0.17678651070796045,
+    -0.182046549562344, -0.18737096961767524, -0.1927581766333414,
+    -0.19820652767846517, -0.2037143322243306, -0.2092798532714758,
+    -0.21490130851075123, -0.22057687151759428, -0.2263046729787762,
+    -0.23208280195082706, -0.23790930714935213, -0.24378219826839842,
+    -0.24969944732904617, -0.2556589900563426, -0.26165872728370787,
+    -0.2676965263839035, -0.27377022272563734, -0.27987762115487674,
+    -0.2860164974998959, -0.29218460009910174, -0.29837965135062705,
+    -0.30459934928270527, -0.3108413691437849, -0.3171033650113655,
+    -0.32338297141849603, -0.3296778049968693, -0.33598546613545166,
+    -0.34230354065354246, -0.34862960148718386, -0.35496121038779427,
+    -0.361295919631927, -0.3676312737410058, -0.37396481120992403,
+    -0.3802940662433429, -0.386616570498558, -0.3929298548337697,
+    -0.3992314510605888, -0.40551889369963234, -0.4117897217380145,
+    -0.41804148038758526, -0.4242717228427172, -0.43047801203648695,
+    -0.43665792239405155, -0.4428090415820634, -0.44892897225292394,
+    -0.4550153337827219, -0.46106576400166976, -0.46707792091586287,
+    -0.4730494844192133, -0.4789781579943698, -0.48486167040149253,
+    -0.4906977773537033, -0.4964842631780933, -0.5022189424611239,
+    -0.5078996616773149, -0.5135243008000749, -0.5190907748935861,
+    -0.5245970356846161, -0.5300410731131969, -0.5354209168610594,
+    -0.5407346378567811, -0.5459803497565765, -0.5511562103997129,
+    -0.5562604232374959, -0.5612912387348411, -0.5662469557434144,
+    -0.5711259228453929, -0.5759265396668485, -0.5806472581598359,
+    -0.5852865838522606, -0.589843077064601, -0.5943153540926178,
+    -0.5987020883551681, -0.6030020115063003, -0.6072139145107776,
+    -0.6113366486822481, -0.6153691266832672, -0.6193103234864328,
+    -0.6231592772958755, -0.6269150904284087, -0.6305769301536566,
+    -0.6341440294924814, -0.6376156879730912, -0.6409912723442035,
+    -0.6442702172447025, -0.6474520258292048, -0.6505362703490256,
+    -0.6535225926880264, -0.6564107048528891, -0.659200389417345,
+    -0.661891499919954, -0.6644839612150505, -0.6669777697764745,
+    -0.6693729939537756, -0.6716697741805719, -0.6738683231348109,
+    -0.6759689258506671, -0.6779719397818804, -0.6798777948163424,
+    -0.6816869932417944, -0.6834001096624966, -0.6850177908667913,
+    -0.686540755645503, -0.6879697945611363, -0.6893057696678836,
+    -0.6905496141824725, -0.6917023321059252, -0.6927649977963157,
+    -0.6937387554926605, -0.6946248187900959, -0.6954244700665457,
+    -0.6961390598610772, -0.6967700062042175, -0.6973187939005077,
+    -0.6977869737636019, -0.6981761618042652, -0.6984880383716344,
+    -0.6987243472481615, -0.6988868946986599, -0.6989775484739238,
+    -0.6989982367694232, -0.6989509471395847, -0.6988377253682196,
+    -0.6986606742956812, -0.6984219526033602, -0.698123773556154,
+    -0.697768403703581, -0.6973581615402288, -0.6968954161262665,
+    -0.6963825856687553, -0.695822136064541, -0.6952165794055283,
+    -0.6945684724471566, -0.6938804150409321, -0.6931550485318864,
+    -0.6923950541218697, -0.6916031511995885, -0.690782095638341,
+    -0.6899346780624149, -0.6890637220831406, -0.6881720825056039,
+    -0.687262643507055, -0.6863383167880667, -0.6854020396975052,
+    -0.684456773332413, -0.6835055006139031, -0.6825512243402018,
+    -0.6815969652179692, -0.6806457598730683, -0.6797006588419504,
+    -0.6787647245448512, -0.6778410292419981, -0.6769326529740474,
+    -0.6760426814879845, -0.6751742041497241, -0.6743303118446691,
+    -0.6735140948674894, -0.6727286408023985, -0.6719770323952073,
+    -0.6712623454184488, -0.670587646530873, -0.6699559911326182,
+    -0.6693704212173711, -0.6688339632228305, -0.6683496258808009,
+    -0.6679203980682374, -0.6675492466605729, -0.6672391143886552,
+    -0.6669929177006294, -0.6668135446300931, -0.6667038526718614,
+    -0.6666666666666667, -0.6667047766961253, -0.6668209359892963,
+    -0.6670178588421545, -0.6672982185512931, -0.6676646453631734,
+    -0.6681197244402242, -0.6686659938450902, -0.669305942544327,
+    -0.6700420084328192, -0.6708765763802025, -0.67181197630055,
+    -0.6728504812465793, -0.673994305529623, -0.6752456028665896,
+    -0.6766064645551362, -0.6780789176782522, -0.6796649233394477,
+    -0.6813663749297132, -0.683185096427415, -0.6851228407322628,
+    -0.6871812880344735, -0.6893620442202376, -0.6916666393145726,
+    -0.6940965259626306, -0.6966530779505071, -0.6993375887665777,
+    -0.7021512702043624, -0.7050952510079026, -0.7081705755606129,
+    -0.7113782026185338, -0.7147190040889075, -0.7181937638549565,
+    -0.7218031766477294, -0.7255478469658511, -0.7294282880439833,
+    -0.7334449208707832, -0.7375980732571108, -0.741887978955216,
+    -0.7463147768296048, -0.7508785100802531, -0.7555791255188099,
+    -0.7604164728984031, -0.7653903042976284, -0.7705002735592728,
+    -0.7757459357842916, -0.7811267468815295, -0.7866420631736413,
+    -0.7922911410596396, -0.7980731367344628, -0.8039871059659194,
+    -0.8100320039293434, -0.8162066851002523, -0.8225099032052651,
+    -0.8289403112315163, -0.8354964614947562, -0.8421768057662952,
+    -0.848979695458923, -0.8559033818718937, -0.862946016495034,
+    -0.8701056513719966, -0.8773802395226538, -0.8847676354245764,
+    -0.8922655955535305, -0.8998717789828636, -0.9075837480416419,
+    -0.9153989690313531, -0.9233148130009506, -0.9313285565799972,
+    -0.9394373828696073, -0.9476383823908849, -0.9559285540904842,
+    -0.9643048064029165, -0.9727639583691723, -0.9813027408112144,
+    -0.9899177975618312, -0.9986056867493516, -1.0073628821366478,
+    -1.0161857745138483, -1.0250706731441308, -1.0340138072619522,
+    -1.0430113276230262, -1.0520593081053295, -1.0611537473603971,
+    -1.0702905705141208, -1.0794656309162562, -1.0886747119377809,
+    -1.0979135288152557, -1.1071777305412855, -1.1164629018001522,
+    -1.1257645649476746, -1.1350781820343072, -1.1443991568704828,
+    -1.153722837133155, -1.1630445165124839, -1.1723594368975914,
+    -1.1816627906002604, -1.1909497226154604, -1.2002153329175302,
+    -1.2094546787908542, -1.2186627771938152, -1.2278346071548094,
+    -1.2369651121990808, -1.2460492028051058, -1.2550817588892553,
+    -1.26405763231741, -1.272971649442244, -1.2818186136648004,
+    -1.2905933080190424, -1.29929049777797, -1.3079049330799641,
+    -1.3164313515739128, -1.324864481081745, -1.3331990422769193,
+    -1.3414297513774462, -1.3495513228519975, -1.3575584721376248,
+    -1.3654459183676464, -1.3732083871082021, -1.380840613102015,
+    -1.388337343017836, -1.3956933382041201, -1.4029033774453792,
+    -1.4099622597197536, -1.416864806956255, -1.4236058667901845,
+    -1.430180315315217, -1.4365830598306115, -1.4428090415820634,
+    -1.4488532384946522, -1.4547106678964006, -1.4603763892309007,
+    -1.4658455067575382, -1.4711131722377722, -1.4761745876060028,
+    -1.4810250076235176, -1.48565974251403, -1.490074160579349,
+    -1.4942636907936842, -1.4982238253751534, -1.501950122333018,
+    -1.5054382079892314, -1.5086837794728458, -1.5116826071858944,
+    -1.5144305372393183, -1.516923493857574, -1.5191574817505389,
+    -1.521128588451359, -1.5228329866189085, -1.5242669363035288,
+    -1.525426787174756, -1.526308980709742, -1.5269100523411119,
+    -1.527226633563013, -1.52725545399413, -1.5269933433964724,
+    -1.5264372336487466, -1.5255841606731715, -1.5244312663145907,
+    -1.5229758001707958, -1.5212151213729592, -1.5191467003151435,
+    -1.5167681203318377, -1.5140770793225409, -1.5110713913224065,
+    -1.5077489880180086, -1.5041079202073142, -1.500146359202976,
+    -1.495862598178093, -1.4912550534536018, -1.4863222657265234,
+    -1.4810629012382868, -1.4754757528824105, -1.4695597412508297,
+    -1.46331391561822, -1.4567374548636791, -1.4498296683291578,
+    -1.4425899966140958, -1.4350180123057137, -1.4271134206444838,
+    -1.4188760601242958, -1.410305903026917, -1.401403055890343,
+    -1.3921677599106903, -1.382600391277307, -1.3727014614408273,
+    -1.3624716173139302, -1.3519116414045684, -1.341022451881532,
+    -1.3298051025721789, -1.3182607828922668, -1.3063908177077823,
+    -1.2941966671287937, -1.2816799262353036, -1.2688423247351721,
+    -1.2556857265541812, -1.2422121293583848, -1.2284236640089001,
+    -1.214322593949321, -1.1999113145260243, -1.1851923522416075,
+    -1.1701683639418012, -1.1548421359361596, -1.1392165830529566,
+    -1.1232947476286888, -1.1070797984326137, -1.0905750295268684,
+    -1.0737838590626398, -1.056709828012998, -1.0393565988429323,
+    -1.021727954117284, -1.0038277950471852, -0.9856601399757543,
+    -0.9672291228037193, -0.9485389913557984, -0.929594105688609,
+    -0.9103989363409059, -0.8909580625270777, -0.8712761702747325,
+    -0.8513580505073512, -0.8312085970729047, -0.8108328047194893,
+    -0.7902357670189326, -0.7694226742394725, -0.7483988111685126,
+    -0.7271695548866224, -0.70574037249388, -0.68411681878968,
+    -0.6623045339072525, -0.6403092409040317, -0.6181367433091629,
+    -0.5957929226293295, -0.5732837358142562, -0.5506152126831177,
+    -0.527793453313231, -0.5048246253923045, -0.48171496153567656,
+    -0.4584707565698909, -0.435098364783977, -0.41160419714992513,
+    -0.3879947185137176, -0.36427644475843407, -0.340455939940818,
+    -0.31653981340287496, -0.29253471685992016, -0.26844734146664995,
+    -0.24428441486268182, -0.22005269819917186, -0.19575898314801854,
+    -0.17141008889516812, -0.1470128591196629, -0.12257415895992221,
+    -0.09810087196890152, -0.0735998970596321, -0.04907814544281914,
+    -0.024542537558010495, -9.797174393178826e-16,
+}};
+Table_ptr const ugg_table_saw_4 = (Table_ptr) &saw_4_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_64_data = {1025, {
+    0.0, 0.38927155791501394, 0.7583611423519722,
+    1.0889571785203687, 1.3662824766832384, 1.5803701996304262,
+    1.7268166802689868, 1.8069382418944264, 1.827329442503719,
+    1.798889652792106, 1.7354450112754025, 1.6521362981203385,
+    1.5637650651158075, 1.4832882228319846, 1.4206260673739517,
+    1.3819041947036406, 1.3691920400690543, 1.3807375614627933,
+    1.4116370247006154, 1.4548285315601843, 1.5022638958131467,
+    1.5460994474127694, 1.5797533378904258, 1.598703156106356,
+    1.6009389089115897, 1.5870366215384135, 1.5598699580451894,
+    1.524024356758117, 1.4850141745778196, 1.4484239243562127,
+    1.4190978115580097, 1.4004878215551417, 1.3942422767923421,
+    1.4000786270470789, 1.415941969038584, 1.4384104556185835,
+    1.4632758724962205, 1.4862064884570168, 1.503392268293854,
+    1.5120800358847208, 1.5109264902651853, 1.5001266707773955,
+    1.4813099078290624, 1.457229361483449, 1.4313000732474583,
+    1.407060107600113, 1.3876373753072488, 1.3753004128191602,
+    1.37115584718383, 1.3750311913896012, 1.3855528172199598,
+    1.400399814667359, 1.4166892366491135, 1.4314304921000711,
+    1.4419787235159414, 1.4464197075588237, 1.443831386264863,
+    1.4343873866683068, 1.4192925760407569, 1.4005660372743813,
+    1.3807090676138676, 1.3623117149461292, 1.3476588098885665,
+    1.338394587158171, 1.3352943774959343, 1.338174332764048,
+    1.345948533537272, 1.3568204594537543, 1.3685760341182818,
+    1.3789311637797461, 1.3858798526521126, 1.3879904125669227,
+    1.3846065498712685, 1.3759256101738309, 1.3629455046811974,
+    1.3472918480751326, 1.3309545871131012, 1.3159762857594335,
+    1.304140444738845, 1.296707004388745, 1.2942338779187412,
+    1.296509408681029, 1.302603275700652, 1.3110252829584088,
+    1.319965401534902, 1.3275767641235074, 1.3322576972393165,
+    1.3328900272096542, 1.3289984863603654, 1.3208087869762186,
+    1.3091977852881393, 1.2955456628018973, 1.2815146989132045,
+    1.268789821551256, 1.2588211807218994, 1.252607843053277,
+    1.2505546546583628, 1.2524225523155017, 1.2573779962964322,
+    1.2641320218082925, 1.2711459714430398, 1.2768712812374436,
+    1.2799861453647803, 1.2795930709562426, 1.275347966835938,
+    1.2675023796250047, 1.2568540520280627, 1.244615024209879,
+    1.2322188875775224, 1.2210976784846357, 1.2124629805254794,
+    1.2071245522995957, 1.2053734961669629, 1.2069466781418827,
+    1.211076435802442, 1.2166165382409138, 1.222223885731464,
+    1.2265672771432543, 1.228530917670236, 1.227381671169272,
+    1.222875096708041, 1.2152850530112869, 1.2053535638442148,
+    1.1941698631301694, 1.1829982125685727, 1.1730816037070921,
+    1.165451722935885, 1.1607741383737282, 1.1592518493086834,
+    1.1606010750162201, 1.1641019147371747, 1.1687150292074087,
+    1.1732455318635162, 1.1765283331612633, 1.1776062710898696,
+    1.17587387185161, 1.1711652237347325, 1.1637732955664568,
+    1.1543986928960528, 1.144036666750184, 1.1338205160936812,
+    1.1248459513956415, 1.118003569986116, 1.1138449906588783,
+    1.1125027056418804, 1.1136752226871363, 1.116678924808974,
+    1.1205578426566416, 1.124233780372916, 1.1266732799541344,
+    1.1270456271367122, 1.1248477967052053, 1.1199775981413878,
+    1.112744447990329, 1.1038168795734247, 1.094115603431773,
+    1.0846691681008056, 1.0764547975497898, 1.0702489851541526,
+    1.066510639280721, 1.0653143200454616, 1.0663432255176506,
+    1.0689423156271716, 1.0722227386808618, 1.0752009606414343,
+    1.076950863891079, 1.0767453368565685, 1.0741657482508244,
+    1.0691628629780163, 1.062060383818224, 1.0535011984368023,
+    1.0443451983231378, 1.0355348696126605, 1.0279496270660666,
+    1.0222713676580981, 1.018881762922351, 1.0178067255988619,
+    1.0187160879498625, 1.0209779743592182, 1.0237589629088437,
+    1.026154193906924, 1.0273271468187932, 1.0266375259751157,
+    1.0237377348448569, 1.0186234329518637, 1.0116308604002986,
+    1.0033818582556397, 0.9946855340433607, 0.9864120920741333,
+    0.979358474071188, 0.9741265269067747, 0.9710322955985288,
+    0.9700600860586788, 0.9708679399540853, 0.972843206892066,
+    0.9751992169111431, 0.977097825432304, 0.9777787665648559,
+    0.9766758762089276, 0.9735024414640875, 0.9682928331820381,
+    0.9613944079166058, 0.9534113586259734, 0.9451095616192345,
+    0.9372973819469261, 0.9307009650590015, 0.9258532316857221,
+    0.9230135241714758, 0.9221299992980978, 0.9228501919931144,
+    0.9245777258750763, 0.9265660707842268, 0.9280346280245771,
+    0.9282891122412974, 0.9268276846325192, 0.9234166319331764,
+    0.9181241969548621, 0.9113076905319726, 0.9035562355967008,
+    0.8955982968589971, 0.8881884922399105, 0.8819912552296106,
+    0.8774792660619057, 0.8748621613660128, 0.8740562579146,
+    0.8746996378690773, 0.8762099344881713, 0.8778756104072291,
+    0.8789664381164253, 0.8788460445216633, 0.8770691897447209,
+    0.8734489246550593, 0.8680835122875348, 0.8613392601465474,
+    0.853792219854728, 0.846138016889669, 0.8390839102803008,
+    0.8332398167546907, 0.8290250762864866, 0.826605197797905,
+    0.8258681130865052, 0.8264433231594179, 0.8277606986606185,
+    0.8291396166315581, 0.8298945107211411, 0.8294404794913265,
+    0.82738269726174, 0.8235759718630236, 0.8181454773642651,
+    0.8114657232523186, 0.8041012678482544, 0.7967185487006028,
+    0.7899825878548592, 0.7844545701518006, 0.7805060570506979,
+    0.7782629387947481, 0.7775875684246715, 0.778101591505947,
+    0.7792457056368953, 0.780366922203163, 0.7808197267597613,
+    0.7800654773714699, 0.7777547459246095, 0.7737800249973883,
+    0.768290860103555, 0.7616692990038543, 0.7544696717988951,
+    0.7473321838393386, 0.7408837803717154, 0.7356416238828509,
+    0.7319340347295188, 0.7298509719053227, 0.7292315136173385,
+    0.7296900578149654, 0.7306769906795576, 0.7315642869069842,
+    0.7317427189622975, 0.7307156379775048, 0.7281748991540951,
+    0.724047332808289, 0.7185047611372039, 0.7119362128495417,
+    0.7048868172092162, 0.69797296737063, 0.6917869474790179,
+    0.6868057717987415, 0.6833182585996928, 0.6813814802226063,
+    0.6808131484294724, 0.6812209251224518, 0.6820639553369278,
+    0.682736979371834, 0.6826639509296458, 0.6813866888339778,
+    0.6786349266645649, 0.6743670575873763, 0.6687754387913067,
+    0.6622556099359915, 0.6553443428863345, 0.6486362186593442,
+    0.6426916897080402, 0.6379508361933397, 0.6346660806521378,
+    0.6328641422092103, 0.6323429582292259, 0.6327038866922504,
+    0.6334140646107325, 0.6338891742475076, 0.6335837682524738,
+    0.6320751978568092, 0.6291282365137941, 0.624730523745813,
+    0.6190934944965379, 0.6126188018468944, 0.6058355589479717,
+    0.5993182002576114, 0.5935977069640284, 0.5890799097110752,
+    0.5859834326666498, 0.5843067626205652, 0.5838293979112318,
+    0.5841467584367607, 0.5847333354658101, 0.5850242297713804,
+    0.5845024324198691, 0.582778368656685, 0.5796494722962102,
+    0.5751306853212658, 0.5694512955936365, 0.5630187328835474,
+    0.5563550346503535, 0.5500158840038052, 0.5445047706699258,
+    0.5401955293856676, 0.5372751679820916, 0.5357157241401654,
+    0.5352793814215325, 0.535555931562227, 0.5360266863127482,
+    0.536144885856799, 0.5354201438249121, 0.5334938918881571,
+    0.5301942217999166, 0.5255617411177664, 0.5198425582049879,
+    0.513449594368619, 0.5068983006611726, 0.5007267824646123,
+    0.4954127046721812, 0.4912998041664317, 0.4885453109708168,
+    0.48709631681956983, 0.48669863880345593, 0.48693670270416667,
+    0.48729819179239164, 0.48725340817724455, 0.4863370576866316,
+    0.4842198353797677, 0.48075880245657604, 0.4760188514770649,
+    0.47026204028534613, 0.4639065408364331, 0.4574616300726264,
+    0.4514488252304129, 0.44632137190582366, 0.44239450996822016,
+    0.43979724232997686, 0.4384529826054003, 0.4380919811932798,
+    0.4382935189419467, 0.4385512717901284, 0.4383516948249316,
+    0.43725329526395496, 0.4349545615722233, 0.4313401006623014,
+    0.4264979262967248, 0.4207053119044713, 0.41438547764032546,
+    0.40804187458593777, 0.402180266574039, 0.3972306649282304,
+    0.39348116167160874, 0.3910338389786746, 0.3897894998489635,
+    0.38946350075932695, 0.38963016265572903, 0.38978883398493464,
+    0.3894413565797053, 0.3881689518747382, 0.38569666448065165,
+    0.38193544948971, 0.37699546379233534, 0.37116858053235335,
+    0.36488289942016183, 0.35863633997356265, 0.3529196153979961,
+    0.3481404991041202, 0.3445610685318702, 0.34225758137732376,
+    0.341109124766911, 0.34081672398095536, 0.34094989323788116,
+    0.34101338308337725, 0.3405237782878023, 0.3390841027043969,
+    0.3364449207970181, 0.3325425341292194, 0.3275084258930358,
+    0.32164855602954445, 0.3153957652838997, 0.30924268988663367,
+    0.3036655812425958, 0.2990508076420062, 0.29563537750558916,
+    0.2934706371802399, 0.2924147016421047, 0.2921547310475702,
+    0.2922555574768948, 0.29222710586979855, 0.2916001665460621,
+    0.2899988070566134, 0.2871982513394776, 0.2831593175777291,
+    0.27803414037551744, 0.2721423446163966, 0.2659214007846875,
+    0.2598588703457593, 0.25441703200042165, 0.24996153794747283,
+    0.2467051077004943, 0.24467492753213366, 0.2437087501077157,
+    0.24348025042112645, 0.2435496769761522, 0.2434319385310981,
+    0.2426715873578446, 0.240913111485868, 0.23795569012723575,
+    0.23378398122737898, 0.22857022266951915, 0.22264736416137515,
+    0.2164574196106461, 0.210483049446174, 0.20517296023628678,
+    0.200872648930533, 0.19777117826989718, 0.19587218056071615,
+    0.19499353552862922, 0.19479573508053302, 0.19483451863482806,
+    0.19462962090885522, 0.1937389963955185, 0.1918270521119189,
+    0.18871635909108792, 0.18441487646019217, 0.1791145121920208,
+    0.17316127521451238, 0.16700165983358264, 0.16111356829982623,
+    0.15593245586315585, 0.151784109018028, 0.1488344314661551,
+    0.14706397541374722, 0.14627112690041552, 0.1461034252384729,
+    0.14611215262015345, 0.1458217410962588, 0.1448032637995076,
+    0.1427406563231363, 0.1394794469341978, 0.1350504843539185,
+    0.12966501939019123, 0.12368192364639462, 0.11755213088919796,
+    0.11174890026219142, 0.10669468350942779, 0.10269589469907747,
+    0.09989565214808815, 0.09825177935790806, 0.09754344558639855,
+    0.09740540112890318, 0.0973845011579621, 0.09700977294499924,
+    0.09586519495785938, 0.09365394401176093, 0.09024419100665579,
+    0.08568938129547374, 0.0802198805878438, 0.07420729174454435,
+    0.06810696837833825, 0.062387616200496376, 0.05745886331722082,
+    0.053607989484686966, 0.05095558474731399, 0.04943697988255772,
+    0.04881230745329431, 0.04870362863961473, 0.04865338070618731,
+    0.048195108458161065, 0.04692554837400665, 0.044566928439505105,
+    0.04100986129751464, 0.03633020877449154, 0.030777318360367043,
+    0.02473545530233529, 0.018664394410663254, 0.01302835404871104,
+    0.008224254190579273, 0.004520383200612616, 0.0020149485006506996,
+    0.0006209133585055126, 7.946044557808765e-05, -2.1461429063614677e-16,
+    -7.946044557751652e-05, -0.0006209133585058661, -0.002014948500650809,
+    -0.004520383200611981, -0.008224254190579032, -0.013028354048709638,
+    -0.018664394410662328, -0.024735455302335084, -0.030777318360366915,
+    -0.036330208774491224, -0.041009861297517686, -0.044566928439504105,
+    -0.04692554837400671, -0.04819510845816045, -0.04865338070618711,
+    -0.04870362863961289, -0.048812307453294596, -0.04943697988255781,
+    -0.05095558474731397, -0.05360798948468702, -0.05745886331721958,
+    -0.062387616200496473, -0.06810696837833678, -0.07420729174454364,
+    -0.08021988058784361, -0.08568938129547303, -0.09024419100665616,
+    -0.09365394401176257, -0.09586519495785958, -0.09700977294499928,
+    -0.09738450115796403, -0.09740540112890303, -0.09754344558639733,
+    -0.09825177935790765, -0.09989565214808784, -0.10269589469907656,
+    -0.106694683509427, -0.11174890026218884, -0.11755213088919805,
+    -0.12368192364639571, -0.12966501939019018, -0.13505048435391853,
+    -0.13947944693419767, -0.14274065632313462, -0.14480326379950698,
+    -0.14582174109625726, -0.14611215262015276, -0.1461034252384696,
+    -0.14627112690041477, -0.14706397541374766, -0.14883443146615408,
+    -0.15178410901802802, -0.1559324558631556, -0.16111356829982548,
+    -0.16700165983358242, -0.17316127521451183, -0.1791145121920198,
+    -0.18441487646019206, -0.18871635909108803, -0.19182705211191992,
+    -0.1937389963955189, -0.19462962090885522, -0.1948345186348294,
+    -0.19479573508053324, -0.1949935355286273, -0.1958721805607165,
+    -0.1977711782698982, -0.20087264893053441, -0.20517296023628645,
+    -0.21048304944617446, -0.2164574196106469, -0.2226473641613759,
+    -0.22857022266951932, -0.2337839812273778, -0.2379556901272362,
+    -0.2409131114858684, -0.24267158735784466, -0.24343193853109932,
+    -0.2435496769761517, -0.24348025042112717, -0.2437087501077152,
+    -0.24467492753213407, -0.24670510770049406, -0.24996153794747386,
+    -0.2544170320004203, -0.2598588703457592, -0.2659214007846875,
+    -0.272142344616396, -0.2780341403755178, -0.283159317577729,
+    -0.28719825133947985, -0.2899988070566131, -0.291600166546063,
+    -0.29222710586979933, -0.29225555747689247, -0.29215473104756773,
+    -0.29241470164210487, -0.2934706371802397, -0.29563537750558905,
+    -0.29905080764200737, -0.30366558124259485, -0.30924268988663617,
+    -0.31539576528390006, -0.3216485560295434, -0.32750842589303547,
+    -0.3325425341292183, -0.3364449207970175, -0.3390841027043974,
+    -0.34052377828780234, -0.341013383083377, -0.34094989323788144,
+    -0.34081672398095625, -0.3411091247669122, -0.3422575813773239,
+    -0.3445610685318703, -0.34814049910411876, -0.35291961539799593,
+    -0.35863633997356076, -0.3648828994201599, -0.3711685805323543,
+    -0.37699546379233523, -0.38193544948970826, -0.3856966644806512,
+    -0.3881689518747388, -0.38944135657970574, -0.3897888339849342,
+    -0.3896301626557287, -0.38946350075932723, -0.3897894998489652,
+    -0.3910338389786757, -0.39348116167160824, -0.3972306649282311,
+    -0.40218026657403855, -0.40804187458593716, -0.41438547764032513,
+    -0.42070531190447036, -0.4264979262967278, -0.4313401006623009,
+    -0.4349545615722231, -0.4372532952639538, -0.43835169482493186,
+    -0.4385512717901281, -0.43829351894194624, -0.43809198119327913,
+    -0.4384529826053996, -0.43979724232997625, -0.4423945099682195,
+    -0.4463213719058226, -0.45144882523041374, -0.45746163007262575,
+    -0.46390654083643396, -0.47026204028534857, -0.4760188514770652,
+    -0.4807588024565763, -0.4842198353797667, -0.48633705768663715,
+    -0.4872534081772432, -0.48729819179239164, -0.4869367027041649,
+    -0.486698638803455, -0.4870963168195696, -0.4885453109708172,
+    -0.4912998041664339, -0.49541270467218357, -0.5007267824646122,
+    -0.5068983006611726, -0.513449594368621, -0.5198425582049866,
+    -0.5255617411177682, -0.5301942217999133, -0.5334938918881574,
+    -0.53542014382491, -0.536144885856798, -0.5360266863127557,
+    -0.5355559315622276, -0.5352793814215313, -0.5357157241401659,
+    -0.5372751679820925, -0.5401955293856665, -0.5445047706699276,
+    -0.5500158840038041, -0.556355034650353, -0.5630187328835473,
+    -0.5694512955936367, -0.5751306853212671, -0.57964947229621,
+    -0.5827783686566848, -0.5845024324198682, -0.5850242297713818,
+    -0.584733335465808, -0.5841467584367626, -0.5838293979112322,
+    -0.5843067626205658, -0.5859834326666511, -0.5890799097110744,
+    -0.5935977069640284, -0.5993182002576118, -0.6058355589479701,
+    -0.6126188018468934, -0.6190934944965393, -0.6247305237458132,
+    -0.6291282365137937, -0.6320751978568102, -0.6335837682524746,
+    -0.6338891742475076, -0.6334140646107327, -0.632703886692252,
+    -0.6323429582292264, -0.6328641422092106, -0.6346660806521387,
+    -0.6379508361933408, -0.6426916897080409, -0.6486362186593434,
+    -0.6553443428863364, -0.6622556099359905, -0.6687754387913071,
+    -0.6743670575873753, -0.6786349266645663, -0.6813866888339768,
+    -0.6826639509296473, -0.6827369793718351, -0.6820639553369261,
+    -0.6812209251224532, -0.6808131484294746, -0.6813814802226053,
+    -0.6833182585996923, -0.686805771798743, -0.6917869474790186,
+    -0.6979729673706302, -0.7048868172092139, -0.7119362128495414,
+    -0.7185047611372023, -0.7240473328082885, -0.7281748991540925,
+    -0.7307156379775052, -0.7317427189622986, -0.7315642869069834,
+    -0.7306769906795567, -0.7296900578149678, -0.7292315136173371,
+    -0.7298509719053223, -0.7319340347295189, -0.7356416238828501,
+    -0.7408837803717141, -0.7473321838393371, -0.7544696717988942,
+    -0.7616692990038538, -0.7682908601035562, -0.7737800249973884,
+    -0.7777547459246094, -0.7800654773714693, -0.7808197267597614,
+    -0.7803669222031651, -0.7792457056368974, -0.7781015915059466,
+    -0.7775875684246708, -0.7782629387947478, -0.7805060570506949,
+    -0.7844545701518006, -0.7899825878548583, -0.7967185487006034,
+    -0.8041012678482533, -0.811465723252318, -0.8181454773642638,
+    -0.8235759718630244, -0.8273826972617396, -0.8294404794913256,
+    -0.8298945107211414, -0.8291396166315579, -0.8277606986606186,
+    -0.8264433231594186, -0.825868113086507, -0.826605197797902,
+    -0.8290250762864843, -0.8332398167546907, -0.8390839102802988,
+    -0.8461380168896687, -0.8537922198547285, -0.8613392601465454,
+    -0.8680835122875346, -0.8734489246550614, -0.8770691897447226,
+    -0.878846044521663, -0.8789664381164245, -0.8778756104072287,
+    -0.8762099344881699, -0.8746996378690775, -0.8740562579146,
+    -0.8748621613660109, -0.8774792660619055, -0.8819912552296101,
+    -0.8881884922399108, -0.8955982968589947, -0.9035562355966995,
+    -0.9113076905319741, -0.9181241969548615, -0.9234166319331759,
+    -0.9268276846325191, -0.9282891122412968, -0.9280346280245771,
+    -0.9265660707842263, -0.9245777258750768, -0.9228501919931135,
+    -0.922129999298098, -0.9230135241714753, -0.9258532316857236,
+    -0.9307009650590007, -0.9372973819469288, -0.9451095616192343,
+    -0.9534113586259737, -0.9613944079166048, -0.9682928331820375,
+    -0.9735024414640884, -0.9766758762089276, -0.9777787665648565,
+    -0.9770978254323063, -0.9751992169111439, -0.9728432068920644,
+    -0.9708679399540857, -0.9700600860586769, -0.9710322955985299,
+    -0.9741265269067733, -0.9793584740711899, -0.9864120920741322,
+    -0.9946855340433587, -1.0033818582556382, -1.0116308604002995,
+    -1.018623432951862, -1.023737734844854, -1.026637525975116,
+    -1.0273271468187963, -1.0261541939069247, -1.0237589629088457,
+    -1.0209779743592196, -1.0187160879498658, -1.0178067255988619,
+    -1.0188817629223499, -1.0222713676580975, -1.0279496270660655,
+    -1.0355348696126605, -1.0443451983231378, -1.0535011984368037,
+    -1.0620603838182245, -1.0691628629780185, -1.074165748250825,
+    -1.0767453368565685, -1.0769508638910779, -1.0752009606414348,
+    -1.0722227386808634, -1.0689423156271685, -1.0663432255176504,
+    -1.0653143200454591, -1.0665106392807202, -1.0702489851541546,
+    -1.0764547975497902, -1.084669168100806, -1.0941156034317716,
+    -1.1038168795734247, -1.1127444479903292, -1.1199775981413873,
+    -1.1248477967052082, -1.1270456271367157, -1.1266732799541352,
+    -1.1242337803729174, -1.1205578426566443, -1.1166789248089746,
+    -1.113675222687134, -1.11250270564188, -1.1138449906588794,
+    -1.1180035699861155, -1.1248459513956437, -1.1338205160936814,
+    -1.1440366667501856, -1.1543986928960503, -1.1637732955664561,
+    -1.1711652237347323, -1.1758738718516097, -1.1776062710898718,
+    -1.1765283331612597, -1.1732455318635142, -1.1687150292074082,
+    -1.1641019147371763, -1.1606010750162192, -1.1592518493086843,
+    -1.160774138373727, -1.1654517229358834, -1.1730816037070926,
+    -1.1829982125685727, -1.19416986313017, -1.2053535638442159,
+    -1.2152850530112878, -1.2228750967080413, -1.227381671169272,
+    -1.2285309176702366, -1.2265672771432552, -1.2222238857314633,
+    -1.2166165382409175, -1.2110764358024422, -1.2069466781418847,
+    -1.2053734961669629, -1.207124552299593, -1.2124629805254792,
+    -1.221097678484634, -1.2322188875775222, -1.244615024209876,
+    -1.2568540520280627, -1.2675023796250042, -1.2753479668359426,
+    -1.2795930709562444, -1.2799861453647812, -1.2768712812374436,
+    -1.2711459714430398, -1.2641320218082908, -1.2573779962964322,
+    -1.2524225523155037, -1.2505546546583604, -1.2526078430532774,
+    -1.2588211807218974, -1.268789821551257, -1.281514698913203,
+    -1.295545662801896, -1.309197785288139, -1.32080878697622,
+    -1.3289984863603639, -1.3328900272096567, -1.3322576972393163,
+    -1.3275767641235081, -1.319965401534902, -1.311025282958409,
+    -1.3026032757006496, -1.296509408681028, -1.2942338779187414,
+    -1.296707004388745, -1.3041404447388438, -1.3159762857594326,
+    -1.330954587113101, -1.3472918480751312, -1.3629455046811958,
+    -1.3759256101738302, -1.3846065498712679, -1.3879904125669227,
+    -1.3858798526521074, -1.3789311637797477, -1.3685760341182822,
+    -1.3568204594537545, -1.3459485335372716, -1.3381743327640507,
+    -1.3352943774959365, -1.33839458715817, -1.3476588098885651,
+    -1.3623117149461286, -1.3807090676138642, -1.4005660372743793,
+    -1.4192925760407562, -1.4343873866683077, -1.4438313862648624,
+    -1.4464197075588232, -1.4419787235159418, -1.4314304921000727,
+    -1.4166892366491133, -1.4003998146673586, -1.3855528172199616,
+    -1.3750311913896016, -1.3711558471838328, -1.3753004128191602,
+    -1.3876373753072475, -1.4070601076001101, -1.431300073247457,
+    -1.4572293614834493, -1.48130990782906, -1.5001266707773955,
+    -1.5109264902651858, -1.5120800358847197, -1.503392268293854,
+    -1.4862064884570179, -1.4632758724962207, -1.4384104556185853,
+    -1.4159419690385844, -1.4000786270470797, -1.39424227679234,
+    -1.4004878215551402, -1.4190978115580086, -1.4484239243562107,
+    -1.4850141745778185, -1.5240243567581135, -1.559869958045189,
+    -1.5870366215384089, -1.60093890891159, -1.5987031561063538,
+    -1.5797533378904296, -1.5460994474127732, -1.5022638958131476,
+    -1.4548285315601868, -1.4116370247006165, -1.380737561462797,
+    -1.3691920400690512, -1.3819041947036403, -1.4206260673739495,
+    -1.4832882228319844, -1.563765065115801, -1.6521362981203354,
+    -1.735445011275402, -1.798889652792103, -1.827329442503718,
+    -1.8069382418944293, -1.7268166802689933, -1.5803701996304238,
+    -1.3662824766832473, -1.0889571785203804, -0.7583611423519924,
+    -0.3892715579150241, -1.7317979433851823e-14,
+}};
+Table_ptr const ugg_table_saw_64 = (Table_ptr) &saw_64_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[1025];
+} saw_8_data = {1025, {
+    0.0, 0.04907953134615004, 0.09811195475074677,
+    0.14705023851883356, 0.1958475033024108, 0.24445709790862719,
+    0.292832674670477, 0.34092826423558775, 0.38869834962989136,
+    0.4360979394544794, 0.4830826400757449, 0.5296087266710008,
+    0.5756332129941465, 0.6211139197286076, 0.6660095412977088,
+    0.7102797110058368, 0.7538850643872141, 0.796787300642823,
+    0.8389492420499698, 0.8803348912331938, 0.9209094861896365,
+    0.9606395529666404, 0.9994929558942003, 1.037438945279935,
+    1.0744482024794921, 1.110492882260708, 1.1455466523854239,
+    1.179584730338589, 1.2125839171401498, 1.2445226281812158,
+    1.2753809210321092, 1.3051405201761055, 1.3337848386289815,
+    1.3612989964108375, 1.3876698358431176, 1.412885933650195,
+    1.4369376098514355, 1.4598169334361357, 1.4815177248203057,
+    1.5020355550907503, 1.5213677420484215, 1.5395133430694683,
+    1.5564731448088085, 1.5722496497774032, 1.5868470598306685,
+    1.6002712566116328, 1.6125297789985131, 1.6236317976123393,
+    1.6335880864460588, 1.6424109916822494, 1.6501143977720667,
+    1.6567136908534268, 1.6622257195915886, 1.6666687535302944,
+    1.6700624390464205, 1.6724277530056646, 1.6737869542211667,
+    1.6741635328210973, 1.6735821576351468, 1.67206862171351,
+    1.6696497860953723, 1.6663535219470487, 1.662208651192824,
+    1.6572448857641555, 1.6514927655952492, 1.644983595495086,
+    1.6377493810277621, 1.6298227635345026, 1.6212369544319298,
+    1.6120256689220778, 1.6022230592502908, 1.591863647647469,
+    1.5809822590931917, 1.5696139540359868, 1.5577939612065081,
+    1.5455576106585394, 1.5329402671716674, 1.5199772641480596,
+    1.506703838134134, 1.4931550640959759, 1.4793657915751428,
+    1.4653705818490417, 1.4512036462173443, 1.4368987855329218,
+    1.42248933109259, 1.4080080869994795, 1.3934872741052033,
+    1.3789584756360713, 1.3644525846035358, 1.3499997530947174,
+    1.3356293435344138, 1.3213698820052926, 1.3072490137081703,
+    1.293293460639268, 1.2795289815562207, 1.2659803342993405,
+    1.252671240529259, 1.2396243529365747, 1.2268612249735462,
+    1.2144022831521997, 1.2022668019474736, 1.1904728813382326,
+    1.179037427013128, 1.1679761332624143, 1.157303468570937,
+    1.1470326639216006, 1.1371757038127537, 1.1277433199870324,
+    1.1187449878633908, 1.1101889256582467, 1.1020820961759412,
+    1.0944302112430557, 1.0872377387555596, 1.080507912302275,
+    1.0742427433227824, 1.0684430357526453, 1.0631084031036955,
+    1.0582372879221689, 1.053826983562629, 1.0498736582109742,
+    1.0463723810853185, 1.0433171507392356, 1.0407009253877295,
+    1.0385156551723773, 1.0367523162783734, 1.0354009468127072,
+    1.034450684349419, 1.0338898050448366, 1.0337057642228662,
+    1.0338852383278383, 1.0344141681400638, 1.0352778031471719,
+    1.036460746962461, 1.0379470036799057, 1.0397200250541345,
+    1.0417627583926306, 1.0440576950465816, 1.0465869193862705,
+    1.049332158146601, 1.0522748300283178, 1.0553960954407144,
+    1.0586769062721106, 1.0620980555751063, 1.0656402270546306,
+    1.0692840442480227, 1.0730101192878811, 1.076799101140133,
+    1.0806317232117393, 1.0844888502246264, 1.0883515242548683,
+    1.092201009838738, 1.096018838050116, 1.0997868494567524,
+    1.1034872358661374, 1.107102580775127, 1.110615898441082,
+    1.1140106714960383, 1.1172708870293326, 1.1203810710682012,
+    1.1233263213900462, 1.1260923386044244, 1.128665455447247,
+    1.131032664234254, 1.1331816424254617, 1.1351007762570309,
+    1.1367791824018245, 1.1382067276247638, 1.1393740464040485,
+    1.1402725564942449, 1.1408944724122365, 1.1412328168320347,
+    1.1412814298794463, 1.1410349763225935, 1.1404889506592517,
+    1.1396396801069106, 1.1384843255063728, 1.1370208801545365,
+    1.1352481665867902, 1.1331658313341562, 1.1307743376849255,
+    1.1280749564850507, 1.1250697550159674, 1.1217615839928163,
+    1.1181540627301882, 1.1142515625265663, 1.110059188322499,
+    1.105582758691292, 1.100828784224561, 1.0958044443783943,
+    1.0905175628491075, 1.0849765815505952, 1.0791905332681628,
+    1.073169013066359, 1.0669221485308007, 1.060460568926227,
+    1.0537953733550762, 1.0469380980026854, 1.0399006825568669,
+    1.032695435890958, 1.0253350011006703, 1.0178323199859736,
+    1.0102005970699945, 1.0024532632474132, 0.9946039391551076,
+    0.9866663983578606, 0.9786545304417621, 0.9705823041075536,
+    0.9624637303555461, 0.9543128258529145, 0.9461435765731234,
+    0.9379699017959895, 0.9298056185554201, 0.9216644066201992,
+    0.9135597740913508, 0.9055050236975231, 0.8975132198676364,
+    0.8895971566575853, 0.881769326605225, 0.874041890585086,
+    0.8664266487313768, 0.8589350124947372, 0.8515779778950262,
+    0.8443661000290646, 0.8373094688888031, 0.8304176865417876,
+    0.8236998457221155, 0.8171645098762865, 0.810819694704471,
+    0.8046728512337779, 0.7987308504560595, 0.7929999695587493,
+    0.7874858797730548, 0.7821936358597076, 0.777127667248247,
+    0.7722917708416277, 0.7676891054937129, 0.7633221881630107,
+    0.7591928917418092, 0.7553024445556975, 0.7516514315243183,
+    0.7482397969700997, 0.7450668490576828, 0.7421312658427702,
+    0.7394311029052368, 0.7369638025374985, 0.7347262044554274,
+    0.732714557995453, 0.7309245357579844, 0.7293512486538642,
+    0.7279892623073035, 0.7268326147655876, 0.7258748354628312,
+    0.7251089653822068, 0.7245275783583514, 0.7241228034591076,
+    0.7238863483833605, 0.7238095238095238, 0.7238832686271648,
+    0.7240981759824049, 0.7244445200660392, 0.7249122835718139,
+    0.7254911857509995, 0.7261707109882601, 0.7269401378228977,
+    0.7277885683388193, 0.7287049578460193, 0.729678144776039,
+    0.7306968807137062, 0.7317498604875077, 0.7328257522411826,
+    0.7339132274095622, 0.7350009905223008, 0.7360778087599529,
+    0.7371325411878549, 0.7381541675944441, 0.7391318168620055,
+    0.7400547947993757, 0.7409126113678343, 0.7416950072332731,
+    0.7423919795797834, 0.7429938071219556, 0.7434910742555432,
+    0.7438746942885986, 0.7441359316977999, 0.7442664233574307,
+    0.7442581986913179, 0.7441036987010181, 0.7437957938265969,
+    0.7433278005995427, 0.7426934970505898, 0.7418871368385912,
+    0.7409034620699713, 0.7397377147817832, 0.7383856470649126,
+    0.7368435298075402, 0.7351081600426052, 0.7331768668866164,
+    0.731047516060845, 0.7287185129895624, 0.7261888044736753,
+    0.7234578789417339, 0.7205257652839442, 0.7173930302783956,
+    0.714060774622296, 0.7105306275845156, 0.7068047402992033,
+    0.7028857777236502, 0.6987769092868855, 0.6944817982587586,
+    0.690004589872402, 0.6853498982360474, 0.6805227920731252,
+    0.6755287793324309, 0.6703737907128758, 0.6650641621499519,
+    0.659606616313524, 0.6540082431689159, 0.6482764796554435,
+    0.6424190885386419, 0.6364441364943135, 0.6303599714842955,
+    0.6241751994854409, 0.6178986606347322, 0.6115394048547377,
+    0.6051066670246913, 0.5986098417634367, 0.5920584578912169,
+    0.5854621526378827, 0.5788306456655067, 0.572173712973612,
+    0.56550116075532, 0.5588227992725531, 0.5521484168182023,
+    0.5454877538326649, 0.5388504772415388, 0.5322461550804899,
+    0.5256842314722885, 0.5191740020199398, 0.5127245896785018,
+    0.5063449211667699, 0.5000437039783904, 0.4938294040502411,
+    0.4877102241440084, 0.4816940829948917, 0.47578859527919437,
+    0.470001052450273, 0.4643384044899526, 0.4588072426199441,
+    0.45341378301523666, 0.4481638515586702, 0.44306286967311814,
+    0.43811584126477476, 0.4333273408081083, 0.4287015025999506,
+    0.42424201120712396, 0.4199520931288251, 0.4158345096917729,
+    0.4118915511929209, 0.40812503230120334, 0.40453628872655306,
+    0.4011261751610712, 0.39789506449396217, 0.3948428482985098,
+    0.39196893858611326, 0.38927227081909843, 0.38675130817080683,
+    0.38440404701826353, 0.38222802364953995, 0.3802203221648824,
+    0.37837758354757545, 0.37669601587760115, 0.3751714056582073,
+    0.3737991302227455, 0.3725741711863674, 0.37149112890460345,
+    0.37054423789828606, 0.3697273832019121, 0.3690341175902321,
+    0.3684576796356859, 0.36799101254728744, 0.3676267837396304,
+    0.3673574050789343, 0.36717505375140846, 0.36707169369774534,
+    0.36703909755619923, 0.3670688690555401, 0.36715246579812605,
+    0.36728122237248295, 0.3674463737340465, 0.3676390787921747,
+    0.36785044414115065, 0.36807154787264595, 0.36829346340706626,
+    0.36850728328126087, 0.36870414283036623, 0.36887524370193114,
+    0.369011877141065, 0.3691054469860674, 0.36914749231487953,
+    0.36912970968374065, 0.36904397490060276, 0.3688823642772046,
+    0.36863717530515777, 0.36830094670303104, 0.36786647778313714,
+    0.367326847088629, 0.3666754302534809, 0.3659059170400709,
+    0.3650123275112972, 0.36398902729649485, 0.36283074191287523,
+    0.3615325701067156, 0.3600899961811783, 0.3584989012803058,
+    0.35675557360154997, 0.3548567175119977, 0.3527994615463945,
+    0.35058136526798733, 0.34820042497622344, 0.3456550782483829,
+    0.34294420730525366, 0.3400671411940781, 0.33702365678506163,
+    0.33381397858086925, 0.3304387773415832, 0.32689916753074194,
+    0.32319670359108177, 0.3193333750616981, 0.31531160055130414,
+    0.311134220585247, 0.3068044893468609, 0.3023260653365574,
+    0.2977030009748819, 0.29293973117844496, 0.2880410609403186,
+    0.2830121519489789, 0.27785850828241265, 0.27258596121629525,
+    0.2672006531874653, 0.2617090209560228, 0.2561177780114464,
+    0.2504338962700223, 0.2446645871126655, 0.23881728181387557,
+    0.23289961141409316, 0.2269193860891234, 0.22088457407150697,
+    0.21480328017986927, 0.2086837240131855, 0.2025342178677546,
+    0.19636314443528596, 0.19017893434104569, 0.18399004358134213,
+    0.17780493091982563, 0.17163203530212856, 0.16547975334825124,
+    0.15935641698184883, 0.1532702712551257, 0.14722945242751245,
+    0.14124196635553815, 0.13531566725047633, 0.12945823685929664,
+    0.12367716412332, 0.11797972536765892, 0.11237296507309967,
+    0.10686367728050179, 0.10145838767610678, 0.09616333640431901,
+    0.0909844616525757, 0.08592738405088059, 0.08099739192639831,
+    0.07619942745124837, 0.07153807371926402, 0.06701754278503641,
+    0.06264166469601098, 0.0584138775457934, 0.05433721857412953,
+    0.05041431633626542, 0.04664738396158663, 0.043038213518571566,
+    0.03958817150018892, 0.03629819544093427, 0.03316879167372448,
+    0.030200034231895503, 0.02739156489854211, 0.024742594402430665,
+    0.022251904756735705, 0.019917852733840904, 0.017738374466494705,
+    0.015710991162652677, 0.013832815918446706, 0.012100561610841748,
+    0.01051054984873151, 0.009058720958461247, 0.007740644977065489,
+    0.006551533623890091, 0.005486253218703496, 0.004539338511957772,
+    0.0037050073904581066, 0.0029771764194452127, 0.002349477179891993,
+    0.0018152733577706665, 0.0013676785400683344, 0.0009995746705035655,
+    0.0007036311161735878, 0.00047232429477046117, 0.0002979578105565747,
+    0.0001726830459475269, 8.852015439346841e-05, 3.7379399172643435e-05,
+    1.108278184590479e-05, 1.385903332864688e-06, 0.0,
+    -1.3859033328664228e-06, -1.1082781845903056e-05, -3.7379399172639965e-05,
+    -8.852015439347188e-05, -0.0001726830459475269, -0.00029795781055656084,
+    -0.0004723242947704473, -0.0007036311161735809, -0.0009995746705035655,
+    -0.0013676785400683206, -0.0018152733577706665, -0.002349477179891979,
+    -0.0029771764194452127, -0.003705007390457732, -0.0045393385119574525,
+    -0.005486253218703135, -0.006551533623890354, -0.007740644977065753,
+    -0.00905872095846147, -0.010510549848731413, -0.012100561610841679,
+    -0.013832815918446664, -0.015710991162652593, -0.017738374466494664,
+    -0.01991785273384057, -0.022251904756735358, -0.024742594402430332,
+    -0.027391564898542192, -0.030200034231895573, -0.03316879167372434,
+    -0.03629819544093413, -0.039588171500188785, -0.04303821351857143,
+    -0.04664738396158648, -0.050414316336265266, -0.054337218574129154,
+    -0.058413877545793094, -0.06264166469601064, -0.0670175427850364,
+    -0.07153807371926393, -0.0761994274512482, -0.08099739192639817,
+    -0.08592738405088036, -0.09098446165257547, -0.09616333640431883,
+    -0.10145838767610652, -0.10686367728050143, -0.11237296507309931,
+    -0.11797972536765866, -0.12367716412331989, -0.1294582368592964,
+    -0.1353156672504761, -0.14124196635553793, -0.14722945242751218,
+    -0.15327027125512543, -0.15935641698184855, -0.165479753348251,
+    -0.17163203530212837, -0.1778049309198255, -0.18399004358134174,
+    -0.19017893434104544, -0.19636314443528552, -0.20253421786775436,
+    -0.20868372401318525, -0.214803280179869, -0.22088457407150675,
+    -0.22691938608912315, -0.23289961141409293, -0.23881728181387551,
+    -0.2446645871126655, -0.2504338962700219, -0.25611777801144603,
+    -0.26170902095602233, -0.2672006531874651, -0.27258596121629497,
+    -0.27785850828241243, -0.28301215194897866, -0.28804106094031845,
+    -0.2929397311784451, -0.29770300097488195, -0.3023260653365578,
+    -0.30680448934686066, -0.3111342205852468, -0.31531160055130336,
+    -0.3193333750616977, -0.32319670359108127, -0.3268991675307418,
+    -0.3304387773415831, -0.3338139785808692, -0.33702365678506185,
+    -0.3400671411940783, -0.34294420730525416, -0.34565507824838276,
+    -0.3482004249762232, -0.3505813652679866, -0.3527994615463942,
+    -0.3548567175119974, -0.35675557360154986, -0.3584989012803058,
+    -0.3600899961811783, -0.36153257010671574, -0.3628307419128756,
+    -0.3639890272964953, -0.36501232751129686, -0.3659059170400707,
+    -0.36667543025348037, -0.3673268470886289, -0.36786647778313697,
+    -0.36830094670303093, -0.36863717530515777, -0.3688823642772046,
+    -0.3690439749006031, -0.3691297096837411, -0.3691474923148799,
+    -0.369105446986067, -0.36901187714106465, -0.3688752437019308,
+    -0.36870414283036634, -0.3685072832812609, -0.36829346340706626,
+    -0.368071547872646, -0.36785044414115053, -0.3676390787921749,
+    -0.3674463737340467, -0.3672812223724833, -0.36715246579812566,
+    -0.3670688690555397, -0.36703909755619946, -0.36707169369774556,
+    -0.36717505375140863, -0.3673574050789343, -0.3676267837396304,
+    -0.36799101254728744, -0.368457679635686, -0.3690341175902322,
+    -0.3697273832019123, -0.3705442378982855, -0.37149112890460284,
+    -0.372574171186367, -0.3737991302227454, -0.3751714056582083,
+    -0.3766960158776008, -0.3783775835475754, -0.38022032216488183,
+    -0.38222802364954067, -0.38440404701826325, -0.38675130817080694,
+    -0.3892722708190973, -0.39196893858611337, -0.3948428482985089,
+    -0.3978950644939619, -0.4011261751610724, -0.40453628872655323,
+    -0.4081250323012031, -0.41189155119292004, -0.4158345096917735,
+    -0.41995209312882475, -0.4242420112071239, -0.4287015025999492,
+    -0.4333273408081078, -0.43811584126477376, -0.4430628696731179,
+    -0.4481638515586716, -0.4534137830152367, -0.4588072426199438,
+    -0.4643384044899517, -0.4700010524502736, -0.4757885952791939,
+    -0.4816940829948916, -0.48771022414400683, -0.49382940405024056,
+    -0.5000437039783894, -0.5063449211667692, -0.5127245896785029,
+    -0.51917400201994, -0.5256842314722882, -0.5322461550804887,
+    -0.5388504772415391, -0.5454877538326645, -0.5521484168182024,
+    -0.5588227992725515, -0.5655011607553193, -0.5721737129736112,
+    -0.5788306456655059, -0.585462152637884, -0.5920584578912171,
+    -0.598609841763436, -0.6051066670246898, -0.6115394048547375,
+    -0.6178986606347316, -0.6241751994854402, -0.6303599714842947,
+    -0.6364441364943135, -0.6424190885386413, -0.6482764796554432,
+    -0.6540082431689168, -0.6596066163135246, -0.6650641621499513,
+    -0.6703737907128745, -0.6755287793324305, -0.6805227920731247,
+    -0.6853498982360471, -0.6900045898724029, -0.6944817982587587,
+    -0.6987769092868852, -0.7028857777236501, -0.7068047402992041,
+    -0.7105306275845157, -0.7140607746222958, -0.7173930302783944,
+    -0.7205257652839439, -0.7234578789417336, -0.7261888044736753,
+    -0.728718512989563, -0.731047516060845, -0.7331768668866165,
+    -0.7351081600426048, -0.7368435298075406, -0.7383856470649124,
+    -0.7397377147817833, -0.7409034620699706, -0.7418871368385909,
+    -0.7426934970505897, -0.7433278005995428, -0.7437957938265973,
+    -0.7441036987010179, -0.7442581986913182, -0.7442664233574305,
+    -0.7441359316977999, -0.7438746942885983, -0.7434910742555434,
+    -0.7429938071219554, -0.742391979579783, -0.7416950072332728,
+    -0.7409126113678342, -0.7400547947993764, -0.7391318168620057,
+    -0.7381541675944444, -0.7371325411878552, -0.7360778087599524,
+    -0.7350009905223006, -0.7339132274095622, -0.7328257522411825,
+    -0.7317498604875076, -0.7306968807137063, -0.7296781447760392,
+    -0.7287049578460191, -0.7277885683388193, -0.726940137822898,
+    -0.7261707109882604, -0.7254911857509991, -0.7249122835718136,
+    -0.7244445200660392, -0.7240981759824054, -0.7238832686271646,
+    -0.7238095238095239, -0.7238863483833607, -0.724122803459107,
+    -0.7245275783583516, -0.725108965382207, -0.7258748354628316,
+    -0.726832614765587, -0.7279892623073033, -0.7293512486538642,
+    -0.730924535757985, -0.7327145579954527, -0.7347262044554269,
+    -0.7369638025374985, -0.7394311029052364, -0.7421312658427702,
+    -0.7450668490576832, -0.7482397969701006, -0.7516514315243175,
+    -0.755302444555697, -0.7591928917418088, -0.7633221881630108,
+    -0.7676891054937128, -0.7722917708416271, -0.7771276672482469,
+    -0.7821936358597068, -0.7874858797730542, -0.7929999695587489,
+    -0.7987308504560597, -0.8046728512337772, -0.810819694704471,
+    -0.8171645098762862, -0.8236998457221156, -0.830417686541787,
+    -0.8373094688888022, -0.8443661000290636, -0.8515779778950255,
+    -0.8589350124947371, -0.8664266487313772, -0.8740418905850864,
+    -0.8817693266052241, -0.8895971566575847, -0.8975132198676359,
+    -0.905505023697523, -0.9135597740913509, -0.9216644066201987,
+    -0.9298056185554194, -0.9379699017959899, -0.9461435765731229,
+    -0.9543128258529138, -0.9624637303555454, -0.9705823041075536,
+    -0.978654530441762, -0.9866663983578605, -0.9946039391551076,
+    -1.0024532632474128, -1.0102005970699937, -1.0178323199859727,
+    -1.0253350011006703, -1.0326954358909577, -1.0399006825568669,
+    -1.0469380980026852, -1.0537953733550758, -1.060460568926227,
+    -1.0669221485308, -1.0731690130663596, -1.079190533268163,
+    -1.084976581550595, -1.0905175628491068, -1.095804444378395,
+    -1.1008287842245608, -1.1055827586912919, -1.1100591883224984,
+    -1.1142515625265665, -1.1181540627301882, -1.1217615839928161,
+    -1.125069755015968, -1.1280749564850512, -1.130774337684925,
+    -1.133165831334156, -1.1352481665867906, -1.1370208801545365,
+    -1.1384843255063724, -1.1396396801069097, -1.1404889506592522,
+    -1.141034976322594, -1.1412814298794465, -1.1412328168320354,
+    -1.140894472412237, -1.1402725564942446, -1.1393740464040476,
+    -1.1382067276247636, -1.136779182401825, -1.1351007762570309,
+    -1.1331816424254617, -1.1310326642342543, -1.1286654554472473,
+    -1.126092338604424, -1.1233263213900464, -1.1203810710682018,
+    -1.1172708870293329, -1.1140106714960385, -1.1106158984410823,
+    -1.1071025807751274, -1.1034872358661372, -1.0997868494567524,
+    -1.0960188380501166, -1.0922010098387391, -1.0883515242548687,
+    -1.0844888502246268, -1.0806317232117393, -1.0767991011401332,
+    -1.0730101192878807, -1.0692840442480223, -1.0656402270546312,
+    -1.0620980555751065, -1.0586769062721109, -1.0553960954407147,
+    -1.0522748300283182, -1.0493321581466009, -1.04658691938627,
+    -1.0440576950465816, -1.0417627583926314, -1.0397200250541352,
+    -1.0379470036799052, -1.036460746962461, -1.0352778031471712,
+    -1.0344141681400638, -1.0338852383278376, -1.0337057642228664,
+    -1.0338898050448362, -1.0344506843494188, -1.0354009468127074,
+    -1.0367523162783743, -1.0385156551723778, -1.0407009253877286,
+    -1.0433171507392358, -1.0463723810853183, -1.0498736582109747,
+    -1.0538269835626284, -1.0582372879221689, -1.0631084031036948,
+    -1.0684430357526447, -1.0742427433227824, -1.0805079123022754,
+    -1.08723773875556, -1.0944302112430548, -1.1020820961759408,
+    -1.110188925658246, -1.1187449878633908, -1.1277433199870315,
+    -1.1371757038127532, -1.1470326639216, -1.1573034685709365,
+    -1.1679761332624143, -1.179037427013128, -1.1904728813382324,
+    -1.2022668019474723, -1.2144022831521992, -1.2268612249735453,
+    -1.2396243529365747, -1.2526712405292577, -1.2659803342993399,
+    -1.2795289815562196, -1.2932934606392676, -1.3072490137081696,
+    -1.3213698820052928, -1.3356293435344133, -1.349999753094716,
+    -1.3644525846035351, -1.3789584756360704, -1.3934872741052031,
+    -1.4080080869994789, -1.422489331092589, -1.4368987855329207,
+    -1.4512036462173434, -1.4653705818490412, -1.4793657915751428,
+    -1.4931550640959759, -1.5067038381341342, -1.5199772641480587,
+    -1.5329402671716668, -1.5455576106585391, -1.5577939612065073,
+    -1.5696139540359866, -1.5809822590931912, -1.5918636476474688,
+    -1.6022230592502908, -1.6120256689220775, -1.6212369544319296,
+    -1.6298227635345022, -1.6377493810277621, -1.644983595495086,
+    -1.6514927655952496, -1.6572448857641553, -1.6622086511928236,
+    -1.6663535219470482, -1.6696497860953718, -1.67206862171351,
+    -1.6735821576351468, -1.674163532821098, -1.6737869542211667,
+    -1.6724277530056644, -1.6700624390464207, -1.6666687535302938,
+    -1.6622257195915884, -1.656713690853427, -1.6501143977720674,
+    -1.6424109916822491, -1.6335880864460592, -1.6236317976123393,
+    -1.612529778998514, -1.6002712566116324, -1.586847059830669,
+    -1.5722496497774046, -1.5564731448088083, -1.5395133430694692,
+    -1.5213677420484224, -1.5020355550907518, -1.4815177248203053,
+    -1.4598169334361364, -1.436937609851436, -1.4128859336501973,
+    -1.3876698358431172, -1.3612989964108388, -1.3337848386289837,
+    -1.305140520176106, -1.2753809210321105, -1.2445226281812172,
+    -1.2125839171401527, -1.1795847303385885, -1.1455466523854245,
+    -1.1104928822607092, -1.074448202479495, -1.037438945279935,
+    -0.9994929558942017, -0.9606395529666435, -0.9209094861896363,
+    -0.8803348912331954, -0.8389492420499718, -0.7967873006428269,
+    -0.7538850643872139, -0.7102797110058383, -0.6660095412977102,
+    -0.6211139197286107, -0.5756332129941459, -0.529608726671003,
+    -0.48308264007574914, -0.43609793945447983, -0.38869834962989364,
+    -0.34092826423558975, -0.2928326746704809, -0.24445709790862652,
+    -0.19584750330241213, -0.1470502385188355, -0.09811195475075069,
+    -0.04907953134615003, -1.959434878635765e-15,
+}};
+Table_ptr const ugg_table_saw_8 = (Table_ptr) &saw_8_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[513];
+} sawtooth_data = {513, {
+    0.0, 0.24455458389121287, 0.48385512631364325,
+    0.7128457178722138, 0.9268578243008518, 1.121782185413286,
+    1.2942157604610494, 1.4415773243207575, 1.562186839014158,
+    1.6553054736762767, 1.721135034192748, 1.7607774955896818,
+    1.7761572084726407, 1.769910081401298, 1.7452455384019625,
+    1.705788241956252, 1.6554074003193524, 1.5980419067560048,
+    1.5375295711303314, 1.4774483068312059, 1.4209763550095846,
+    1.3707775098206079, 1.32891591592329, 1.2968034193229556,
+    1.2751807502662058, 1.2641320922738546, 1.2631309340873533,
+    1.271113595725441, 1.2865755408583743, 1.3076845967698656,
+    1.3324045452993902, 1.358622249765428, 1.3842715507185408,
+    1.4074475845403513, 1.4265059218547784, 1.4401419393595194,
+    1.4474470672961977, 1.4479399236239223, 1.4415717774043542,
+    1.428707198757554, 1.4100820746294416, 1.3867423290851655,
+    1.3599676250759543, 1.3311849964068059, 1.3018777345637504,
+    1.2734949228457348, 1.2473667749920376, 1.2246304190346513,
+    1.2061700064040255, 1.1925740710687982, 1.1841119730388794,
+    1.180730100345179, 1.182067341336321, 1.1874882409043601,
+    1.1961312808572713, 1.2069689282453133, 1.2188755167619012,
+    1.2306986926472827, 1.2413300803727458, 1.2497710022156818,
+    1.2551895024752124, 1.256965551047323, 1.2547220906541505,
+    1.2483404968942104, 1.2379599846524907, 1.2239614603529014,
+    1.20693723039894, 1.187648779823499, 1.1669754870271354,
+    1.145857605820155, 1.1252371018301512, 1.1059999665593083,
+    1.0889234519979112, 1.0746312874495647, 1.0635593853432685,
+    1.0559338512166287, 1.051762328973263, 1.0508388847090042,
+    1.0527618111985957, 1.056962969429039, 1.0627466179401655,
+    1.0693351528990944, 1.0759188205272847, 1.0817062869364154,
+    1.0859729654322061, 1.0881042031409893, 1.0876308015377771,
+    1.084254863301231, 1.0778645868673438, 1.0685373300427765,
+    1.0565309914855374, 1.042264469326278, 1.0262886070753563,
+    1.0092495899791003, 0.9918471784697337, 0.9747904359830619,
+    0.9587537125136373, 0.9443355794513559, 0.9320231824387075,
+    0.922164103889606, 0.9149473306833124, 0.910394337571672,
+    0.9083606600591608, 0.9085476815252644, 0.9105237378628166,
+    0.9137530863177217, 0.917630826425345, 0.9215215263888202,
+    0.9247991164203837, 0.9268855709934785, 0.9272860147467723,
+    0.9256181427762498, 0.921634227491043, 0.9152344659433866,
+    0.9064709726643311, 0.8955423088362575, 0.8827790227675494,
+    0.8686212233612502, 0.8535896846157862, 0.8382523569331292,
+    0.8231884183127166, 0.808952121204853, 0.7960386731314177,
+    0.784854234065551, 0.7756918322848771, 0.7687146118496662,
+    0.76394735422172, 0.7612766937659763, 0.7604599047323505,
+    0.7611416093622572, 0.7628772752958924, 0.7651619645344063,
+    0.7674624899227908, 0.7692509461578424, 0.7700375209771934,
+    0.7694005607809883, 0.7670120577966312, 0.7626570297622276,
+    0.7562456580372596, 0.7478175107235053, 0.7375376746931745,
+    0.725685123322495, 0.7126341241428785, 0.6988299133605339,
+    0.6847602067331018, 0.6709243582974457, 0.6578021059793229,
+    0.6458238494359612, 0.6353442913754245, 0.6266210472672489,
+    0.6197995048546862, 0.6149048151004183, 0.6118414455579737,
+    0.6104002539804462, 0.6102725737134, 0.6110703718387448,
+    0.6123511724546206, 0.613646153150791, 0.6144896395340081,
+    0.6144481510493085, 0.6131471948255991, 0.6102941592018072,
+    0.6056959144600993, 0.5992700684475493, 0.5910492274710792,
+    0.5811780526693984, 0.5699033514685018, 0.557557874799749,
+    0.5445388769316601, 0.5312828124439737, 0.5182377748717136,
+    0.5058354102502184, 0.494464058947869, 0.48444479030100474,
+    0.4760118029382268, 0.4692983818912196, 0.4643292497273585,
+    0.4610197454395709, 0.45918183705240395, 0.4585365485503302,
+    0.4587319851846213, 0.45936579789642196, 0.4600106584832876,
+    0.4602411384830673, 0.4596603070957339, 0.4579243910291439,
+    0.4547639696083866, 0.45000040313301426, 0.4435564968125875,
+    0.4354607673066262, 0.425845080951227, 0.41493584698935515,
+    0.4030393497318557, 0.3905221657396187, 0.37778791352619306,
+    0.36525180551105557, 0.35331460159000816, 0.3423375931283019,
+    0.33262017407878997, 0.32438138724781446, 0.31774657941522133,
+    0.31273997526973246, 0.30928360739359173, 0.3072026412196318,
+    0.3062367348760555, 0.30605669895288573, 0.306285393690039,
+    0.3065215410842066, 0.306364952846463, 0.30544159267312637,
+    0.3034269076883611, 0.30006597778450994, 0.29518923547781023,
+    0.28872278979651894, 0.28069272786738686, 0.2712231458846013,
+    0.26052805337046014, 0.2488976766013331, 0.23668003502572776,
+    0.22425895688306927, 0.21202991900485968, 0.20037522753900747,
+    0.18964009313080316, 0.18011109389735805, 0.17199836636383625,
+    0.16542262818014436, 0.16040783184676768, 0.156879894997428,
+    0.15467157217080602, 0.15353314923381606, 0.15314827861603994,
+    0.1531539538538143, 0.15316336545151643, 0.15279020260122217,
+    0.15167287776322588, 0.14949715878243927, 0.14601579544500998,
+    0.14106391762546805, 0.1345692484275791, 0.12655650125941842,
+    0.11714569421665672, 0.10654449569801298, 0.09503508809208439,
+    0.08295637841190723, 0.07068267462208053, 0.058600166087787134,
+    0.04708268245233495, 0.036468248931939805, 0.027037904867022497,
+    0.01899810966232916, 0.012467834959387775, 0.007471148128068928,
+    0.003935748309746785, 0.0016975437732964574, 0.0005109815088989366,
+    6.448035882382018e-05, 2.6453765467339116e-16, -6.448035882381809e-05,
+    -0.000510981508898931, -0.0016975437732963932, -0.003935748309746733,
+    -0.00747114812806884, -0.012467834959387677, -0.01899810966232886,
+    -0.02703790486702204, -0.03646824893193995, -0.0470826824523347,
+    -0.05860016608778694, -0.07068267462208033, -0.08295637841190635,
+    -0.09503508809208472, -0.10654449569801275, -0.11714569421665653,
+    -0.12655650125941822, -0.13456924842757845, -0.14106391762546722,
+    -0.1460157954450099, -0.14949715878243902, -0.15167287776322533,
+    -0.15279020260122178, -0.153163365451516, -0.15315395385381445,
+    -0.1531482786160393, -0.15353314923381572, -0.15467157217080568,
+    -0.15687989499742802, -0.16040783184676707, -0.1654226281801439,
+    -0.17199836636383597, -0.18011109389735783, -0.18964009313080288,
+    -0.20037522753900755, -0.2120299190048595, -0.22425895688306915,
+    -0.23668003502572726, -0.24889767660133355, -0.26052805337046014,
+    -0.27122314588460084, -0.2806927278673867, -0.2887227897965187,
+    -0.2951892354778112, -0.30006597778451083, -0.3034269076883616,
+    -0.3054415926731262, -0.3063649528464632, -0.30652154108420654,
+    -0.3062853936900393, -0.30605669895288734, -0.30623673487605496,
+    -0.30720264121963037, -0.3092836073935916, -0.31273997526973235,
+    -0.3177465794152224, -0.3243813872478148, -0.33262017407878913,
+    -0.34233759312830153, -0.35331460159000777, -0.36525180551105535,
+    -0.3777879135261928, -0.3905221657396184, -0.4030393497318553,
+    -0.4149358469893543, -0.42584508095122703, -0.43546076730662553,
+    -0.44355649681258646, -0.45000040313301387, -0.4547639696083863,
+    -0.4579243910291428, -0.4596603070957326, -0.4602411384830667,
+    -0.46001065848328687, -0.4593657978964213, -0.45873198518462305,
+    -0.45853654855033055, -0.45918183705240523, -0.46101974543957125,
+    -0.46432924972735756, -0.46929838189121925, -0.4760118029382279,
+    -0.4844447903010042, -0.4944640589478678, -0.505835410250216,
+    -0.5182377748717124, -0.5312828124439766, -0.5445388769316593,
+    -0.5575578747997495, -0.5699033514685035, -0.5811780526693974,
+    -0.5910492274710802, -0.5992700684475513, -0.6056959144600988,
+    -0.6102941592018072, -0.6131471948255987, -0.6144481510493089,
+    -0.6144896395340089, -0.6136461531507912, -0.6123511724546213,
+    -0.6110703718387438, -0.6102725737133997, -0.610400253980446,
+    -0.6118414455579738, -0.6149048151004183, -0.6197995048546864,
+    -0.6266210472672495, -0.6353442913754248, -0.6458238494359614,
+    -0.6578021059793222, -0.6709243582974447, -0.684760206733101,
+    -0.6988299133605336, -0.7126341241428777, -0.725685123322494,
+    -0.7375376746931738, -0.7478175107235044, -0.7562456580372611,
+    -0.762657029762228, -0.7670120577966298, -0.769400560780988,
+    -0.7700375209771917, -0.7692509461578421, -0.767462489922791,
+    -0.7651619645344065, -0.7628772752958922, -0.761141609362258,
+    -0.7604599047323508, -0.761276693765975, -0.7639473542217196,
+    -0.7687146118496654, -0.7756918322848769, -0.7848542340655505,
+    -0.7960386731314181, -0.8089521212048527, -0.823188418312718,
+    -0.8382523569331275, -0.8535896846157852, -0.86862122336125,
+    -0.8827790227675493, -0.8955423088362572, -0.9064709726643313,
+    -0.9152344659433854, -0.9216342274910432, -0.9256181427762494,
+    -0.9272860147467723, -0.926885570993479, -0.9247991164203827,
+    -0.9215215263888198, -0.9176308264253445, -0.9137530863177222,
+    -0.9105237378628166, -0.9085476815252652, -0.9083606600591619,
+    -0.9103943375716715, -0.9149473306833111, -0.9221641038896056,
+    -0.9320231824387077, -0.9443355794513564, -0.9587537125136376,
+    -0.9747904359830613, -0.9918471784697339, -1.0092495899790992,
+    -1.026288607075355, -1.042264469326278, -1.0565309914855374,
+    -1.0685373300427763, -1.0778645868673435, -1.0842548633012306,
+    -1.0876308015377776, -1.0881042031409904, -1.0859729654322068,
+    -1.0817062869364158, -1.0759188205272847, -1.0693351528990935,
+    -1.0627466179401643, -1.0569629694290403, -1.0527618111985957,
+    -1.0508388847090042, -1.051762328973262, -1.0559338512166303,
+    -1.0635593853432692, -1.0746312874495652, -1.0889234519979099,
+    -1.1059999665593083, -1.1252371018301504, -1.1458576058201542,
+    -1.166975487027136, -1.1876487798235005, -1.20693723039894,
+    -1.2239614603529014, -1.2379599846524905, -1.2483404968942098,
+    -1.2547220906541527, -1.2569655510473212, -1.2551895024752118,
+    -1.2497710022156823, -1.2413300803727458, -1.2306986926472827,
+    -1.2188755167619019, -1.2069689282453135, -1.1961312808572722,
+    -1.1874882409043601, -1.1820673413363216, -1.1807301003451784,
+    -1.1841119730388796, -1.1925740710687978, -1.2061700064040257,
+    -1.224630419034651, -1.2473667749920372, -1.2734949228457337,
+    -1.3018777345637496, -1.3311849964068045, -1.3599676250759531,
+    -1.3867423290851646, -1.4100820746294414, -1.4287071987575537,
+    -1.441571777404355, -1.4479399236239214, -1.4474470672961977,
+    -1.4401419393595198, -1.426505921854779, -1.4074475845403518,
+    -1.3842715507185424, -1.3586222497654286, -1.3324045452993898,
+    -1.307684596769866, -1.286575540858374, -1.2711135957254407,
+    -1.2631309340873518, -1.264132092273855, -1.2751807502662047,
+    -1.2968034193229552, -1.3289159159232882, -1.370777509820607,
+    -1.4209763550095826, -1.4774483068312034, -1.53752957113033,
+    -1.598041906756003, -1.6554074003193502, -1.705788241956251,
+    -1.7452455384019632, -1.7699100814012974, -1.776157208472642,
+    -1.760777495589682, -1.7211350341927478, -1.6553054736762782,
+    -1.5621868390141582, -1.4415773243207597, -1.2942157604610496,
+    -1.1217821854132923, -0.9268578243008572, -0.7128457178722206,
+    -0.48385512631364724, -0.24455458389121962, -5.427662505936195e-15,
+}};
+Table_ptr const ugg_table_sawtooth = (Table_ptr) &sawtooth_data;
+
+UGG_ALIGNED static const struct {
+    int len;
+    sample data[513];
+} sine_data = {513, {
+    0.0, 0.012271538285719925, 0.024541228522912288,
+    0.03680722294135883, 0.049067674327418015, 0.06132073630220858,
+    0.07356456359966743, 0.0857973123444399, 0.0980171403295606,
+    0.11022220729388306, 0.1224106751992162, 0.13458070850712617,
+    0.14673047445536175, 0.15885814333386145, 0.17096188876030122,
+    0.18303988795514095, 0.19509032201612825, 0.20711137619221856,
+    0.2191012401568698, 0.2310581082806711, 0.24298017990326387,
+    0.25486565960451457, 0.26671275747489837, 0.27851968938505306,
+    0.29028467725446233, 0.3020059493192281, 0.3136817403988915,
+    0.3253102921622629, 0.33688985339222005, 0.34841868024943456,
+    0.3598950365349881, 0.37131719395183754, 0.3826834323650898,
+    0.3939920400610481, 0.40524131400498986, 0.41642956009763715,
+    0.4275550934302821, 0.43861623853852766, 0.44961132965460654,
+    0.46053871095824, 0.47139673682599764, 0.4821837720791227,
+    0.49289819222978404, 0.5035383837257176, 0.5141027441932217,
+    0.524589682678469, 0.5349976198870972, 0.5453249884220465,
+    0.5555702330196022, 0.5657318107836131, 0.5758081914178453,
+    0.5857978574564389, 0.5956993044924334, 0.6055110414043255,
+    0.6152315905806268, 0.6248594881423863, 0.6343932841636455,
+    0.6438315428897914, 0.6531728429537768, 0.6624157775901718,
+    0.6715589548470183, 0.680600997795453, 0.6895405447370668,
+    0.6983762494089729, 0.7071067811865475, 0.7157308252838186,
+    0.7242470829514669, 0.7326542716724128, 0.7409511253549591,
+    0.7491363945234593, 0.7572088465064845, 0.765167265622459,
+    0.773010453362737, 0.7807372285720944, 0.7883464276266062,
+    0.7958369046088835, 0.8032075314806448, 0.8104571982525948,
+    0.8175848131515837, 0.8245893027850253, 0.8314696123025452,
+    0.838224705554838, 0.844853565249707, 0.8513551931052652,
+    0.8577286100002721, 0.8639728561215867, 0.8700869911087113,
+    0.8760700941954066, 0.8819212643483549, 0.8876396204028539,
+    0.8932243011955153, 0.8986744656939538, 0.9039892931234433,
+    0.9091679830905223, 0.9142097557035307, 0.9191138516900578,
+    0.9238795325112867, 0.9285060804732155, 0.9329927988347388,
+    0.937339011912575, 0.9415440651830208, 0.9456073253805213,
+    0.9495281805930367, 0.9533060403541938, 0.9569403357322089,
+    0.9604305194155658, 0.9637760657954398, 0.9669764710448521,
+    0.970031253194544, 0.9729399522055601, 0.9757021300385286,
+    0.9783173707196277, 0.9807852804032304, 0.9831054874312163,
+    0.9852776423889412, 0.9873014181578584, 0.989176509964781,
+    0.99090263542778, 0.99247953459871, 0.9939069700023561,
+    0.9951847266721968, 0.996312612182778, 0.9972904566786902,
+    0.9981181129001492, 0.9987954562051724, 0.9993223845883495,
+    0.9996988186962042, 0.9999247018391445, 1.0,
+    0.9999247018391445, 0.9996988186962042, 0.9993223845883495,
+    0.9987954562051724, 0.9981181129001492, 0.9972904566786902,
+    0.996312612182778, 0.9951847266721969, 0.9939069700023561,
+    0.99247953459871, 0.99090263542778, 0.989176509964781,
+    0.9873014181578584, 0.9852776423889412, 0.9831054874312163,
+    0.9807852804032304, 0.9783173707196277, 0.9757021300385286,
+    0.9729399522055602, 0.970031253194544, 0.9669764710448521,
+    0.9637760657954398, 0.9604305194155659, 0.9569403357322089,
+    0.9533060403541939, 0.9495281805930367, 0.9456073253805214,
+    0.9415440651830208, 0.937339011912575, 0.9329927988347388,
+    0.9285060804732156, 0.9238795325112867, 0.9191138516900578,
+    0.9142097557035307, 0.9091679830905225, 0.9039892931234434,
+    0.8986744656939539, 0.8932243011955152, 0.8876396204028539,
+    0.881921264348355, 0.8760700941954066, 0.8700869911087115,
+    0.8639728561215868, 0.8577286100002721, 0.8513551931052652,
+    0.8448535652497072, 0.8382247055548382, 0.8314696123025455,
+    0.8245893027850252, 0.8175848131515837, 0.8104571982525948,
+    0.8032075314806449, 0.7958369046088836, 0.7883464276266063,
+    0.7807372285720946, 0.7730104533627371, 0.7651672656224591,
+    0.7572088465064847, 0.7491363945234593, 0.740951125354959,
+    0.7326542716724128, 0.7242470829514669, 0.7157308252838187,
+    0.7071067811865476, 0.6983762494089729, 0.689540544737067,
+    0.6806009977954532, 0.6715589548470186, 0.662415777590172,
+    0.6531728429537766, 0.6438315428897914, 0.6343932841636455,
+    0.6248594881423863, 0.6152315905806269, 0.6055110414043257,
+    0.5956993044924335, 0.585797857456439, 0.5758081914178454,
+    0.5657318107836135, 0.5555702330196022, 0.5453249884220464,
+    0.5349976198870972, 0.524589682678469, 0.5141027441932218,
+    0.5035383837257177, 0.49289819222978415, 0.4821837720791229,
+    0.47139673682599786, 0.4605387109582402, 0.4496113296546069,
+    0.43861623853852755, 0.42755509343028203, 0.41642956009763715,
+    0.4052413140049899, 0.39399204006104815, 0.3826834323650899,
+    0.3713171939518377, 0.35989503653498833, 0.3484186802494348,
+    0.33688985339222033, 0.32531029216226326, 0.3136817403988914,
+    0.30200594931922803, 0.2902846772544624, 0.27851968938505317,
+    0.2667127574748985, 0.2548656596045147, 0.24298017990326407,
+    0.23105810828067133, 0.21910124015687005, 0.20711137619221884,
+    0.1950903220161286, 0.1830398879551409, 0.17096188876030122,
+    0.15885814333386147, 0.1467304744553618, 0.13458070850712628,
+    0.12241067519921635, 0.11022220729388324, 0.09801714032956083,
+    0.08579731234444016, 0.07356456359966773, 0.06132073630220849,
+    0.049067674327417966, 0.03680722294135883, 0.024541228522912326,
+    0.012271538285720007, 1.2246467991473532e-16, -0.012271538285719762,
+    -0.02454122852291208, -0.03680722294135858, -0.049067674327417724,
+    -0.061320736302208245, -0.0735645635996675, -0.08579731234443992,
+    -0.09801714032956059, -0.110222207293883, -0.1224106751992161,
+    -0.13458070850712606, -0.14673047445536158, -0.15885814333386122,
+    -0.17096188876030097, -0.18303988795514065, -0.19509032201612836,
+    -0.2071113761922186, -0.2191012401568698, -0.23105810828067108,
+    -0.24298017990326382, -0.25486565960451446, -0.26671275747489825,
+    -0.2785196893850529, -0.2902846772544621, -0.3020059493192278,
+    -0.3136817403988912, -0.325310292162263, -0.3368898533922201,
+    -0.34841868024943456, -0.3598950365349881, -0.37131719395183743,
+    -0.38268343236508967, -0.39399204006104793, -0.4052413140049897,
+    -0.41642956009763693, -0.4275550934302818, -0.4386162385385273,
+    -0.44961132965460665, -0.46053871095824006, -0.47139673682599764,
+    -0.48218377207912266, -0.4928981922297839, -0.5035383837257175,
+    -0.5141027441932216, -0.5245896826784687, -0.5349976198870969,
+    -0.5453249884220461, -0.555570233019602, -0.5657318107836132,
+    -0.5758081914178453, -0.5857978574564389, -0.5956993044924332,
+    -0.6055110414043254, -0.6152315905806267, -0.6248594881423862,
+    -0.6343932841636453, -0.6438315428897913, -0.6531728429537765,
+    -0.6624157775901718, -0.6715589548470184, -0.680600997795453,
+    -0.6895405447370668, -0.6983762494089728, -0.7071067811865475,
+    -0.7157308252838185, -0.7242470829514668, -0.7326542716724126,
+    -0.7409511253549589, -0.749136394523459, -0.7572088465064842,
+    -0.765167265622459, -0.7730104533627367, -0.7807372285720944,
+    -0.7883464276266059, -0.7958369046088835, -0.803207531480645,
+    -0.8104571982525947, -0.8175848131515838, -0.8245893027850251,
+    -0.8314696123025452, -0.8382247055548379, -0.844853565249707,
+    -0.8513551931052649, -0.857728610000272, -0.8639728561215865,
+    -0.8700869911087113, -0.8760700941954067, -0.8819212643483549,
+    -0.887639620402854, -0.8932243011955152, -0.8986744656939538,
+    -0.9039892931234431, -0.9091679830905224, -0.9142097557035305,
+    -0.9191138516900577, -0.9238795325112865, -0.9285060804732155,
+    -0.932992798834739, -0.9373390119125748, -0.9415440651830208,
+    -0.9456073253805212, -0.9495281805930367, -0.9533060403541938,
+    -0.9569403357322088, -0.9604305194155657, -0.9637760657954398,
+    -0.9669764710448522, -0.970031253194544, -0.9729399522055602,
+    -0.9757021300385285, -0.9783173707196277, -0.9807852804032303,
+    -0.9831054874312163, -0.9852776423889411, -0.9873014181578583,
+    -0.9891765099647809, -0.99090263542778, -0.9924795345987101,
+    -0.9939069700023561, -0.9951847266721969, -0.996312612182778,
+    -0.9972904566786902, -0.9981181129001492, -0.9987954562051724,
+    -0.9993223845883494, -0.9996988186962042, -0.9999247018391445,
+    -1.0, -0.9999247018391445, -0.9996988186962042,
+    -0.9993223845883495, -0.9987954562051724, -0.9981181129001492,
+    -0.9972904566786902, -0.996312612182778, -0.9951847266721969,
+    -0.9939069700023561, -0.9924795345987101, -0.99090263542778,
+    -0.9891765099647809, -0.9873014181578584, -0.9852776423889412,
+    -0.9831054874312164, -0.9807852804032304, -0.9783173707196278,
+    -0.9757021300385286, -0.9729399522055603, -0.970031253194544,
+    -0.9669764710448523, -0.96377606579544, -0.9604305194155658,
+    -0.9569403357322089, -0.9533060403541939, -0.9495281805930368,
+    -0.9456073253805213, -0.9415440651830209, -0.937339011912575,
+    -0.9329927988347391, -0.9285060804732156, -0.9238795325112866,
+    -0.9191138516900579, -0.9142097557035306, -0.9091679830905225,
+    -0.9039892931234433, -0.898674465693954, -0.8932243011955153,
+    -0.8876396204028542, -0.881921264348355, -0.8760700941954069,
+    -0.8700869911087115, -0.8639728561215866, -0.8577286100002722,
+    -0.8513551931052651, -0.8448535652497072, -0.838224705554838,
+    -0.8314696123025455, -0.8245893027850253, -0.817584813151584,
+    -0.8104571982525949, -0.8032075314806453, -0.7958369046088837,
+    -0.7883464276266061, -0.7807372285720946, -0.7730104533627369,
+    -0.7651672656224592, -0.7572088465064846, -0.7491363945234596,
+    -0.7409511253549591, -0.7326542716724131, -0.724247082951467,
+    -0.715730825283819, -0.7071067811865477, -0.6983762494089727,
+    -0.6895405447370672, -0.680600997795453, -0.6715589548470187,
+    -0.6624157775901718, -0.6531728429537771, -0.6438315428897915,
+    -0.6343932841636459, -0.6248594881423865, -0.6152315905806274,
+    -0.6055110414043257, -0.5956993044924332, -0.5857978574564391,
+    -0.5758081914178452, -0.5657318107836136, -0.5555702330196022,
+    -0.5453249884220468, -0.5349976198870973, -0.5245896826784694,
+    -0.5141027441932219, -0.5035383837257181, -0.49289819222978426,
+    -0.4821837720791226, -0.4713967368259979, -0.46053871095823995,
+    -0.449611329654607, -0.43861623853852766, -0.42755509343028253,
+    -0.41642956009763726, -0.4052413140049904, -0.39399204006104827,
+    -0.3826834323650904, -0.3713171939518378, -0.359895036534988,
+    -0.3484186802494349, -0.33688985339222, -0.32531029216226337,
+    -0.3136817403988915, -0.3020059493192286, -0.2902846772544625,
+    -0.27851968938505367, -0.2667127574748986, -0.2548656596045144,
+    -0.24298017990326418, -0.231058108280671, -0.21910124015687016,
+    -0.20711137619221853, -0.19509032201612872, -0.183039887955141,
+    -0.17096188876030177, -0.15885814333386158, -0.1467304744553624,
+    -0.13458070850712642, -0.12241067519921603, -0.11022220729388336,
+    -0.0980171403295605, -0.08579731234444028, -0.07356456359966741,
+    -0.06132073630220906, -0.04906767432741809, -0.036807222941359394,
+    -0.024541228522912448, -0.012271538285720572, -2.4492935982947064e-16,
+}};
+Table_ptr const ugg_table_sine = (Table_ptr) &sine_data;
+
+static const Mipmap saw_mipmap = {9,
+    {256, 128, 64, 32, 16, 8, 4, 2, 1},
+    {(Table_ptr) &saw_256_data,
+     (Table_ptr) &saw_128_data,
+     (Table_ptr) &saw_64_data,
+     (Table_ptr) &saw_32_data,
+     (Table_ptr) &saw_16_data,
+     (Table_ptr) &saw_8_data,
+     (Table_ptr) &saw_4_data,
+     (Table_ptr) &saw_2_data,
+     (Table_ptr) &saw_1_data}
+};
+Mipmap_ptr const ugg_mipmap_saw = (Mipmap_ptr) &saw_mipmap;
@@ -0,0 +1,31 @@
+// ugg_tables.h -- tables computed by ugtables.py, generated automatically,
+// do not edit
+
+#ifndef UGG_TABLES_H
+#define UGG_TABLES_H
+
+// These tables and mipmaps are READ-ONLY: they point to const data, so do
+// not tblput on them. To change a table, copy it into one from table_create.
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+extern Table_ptr const ugg_table_saw_1;  // 1024 samples
+extern Table_ptr const ugg_table_saw_128;  // 1024 samples
+extern Table_ptr const ugg_table_saw_16;  // 1024 samples
+extern Table_ptr const ugg_table_saw_2;  // 1024 samples
+extern Table_ptr const ugg_table_saw_256;  // 1024 samples
+extern Table_ptr const ugg_table_saw_32;  // 1024 samples
+extern Table_ptr const ugg_table_saw_4;  // 1024 samples
+extern Table_ptr const ugg_table_saw_64;  // 1024 samples
+extern Table_ptr const ugg_table_saw_8;  // 1024 samples
+extern Table_ptr const ugg_table_sawtooth;  // 512 samples
+extern Table_ptr const ugg_table_sine;  // 512 samples
+extern Mipmap_ptr const ugg_mipmap_saw;  // 9 levels
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,194 @@
+// parallel.cpp -- run a patch on several threads
+//
+// Roger B. Dannenberg
+
+#include <algorithm>
+#include <unordered_map>
+#include "ugen.h"
+#include "parallel.h"
+
+#define SPINS_BEFORE_YIELD 1000
+#define SPINS_BEFORE_SLEEP 10000  // idle workers, see work()
+#define WAIT_COST 1  // in ugens (see list scheduling in parallel.h)
+
+
+// call in spin loops, counting spins
+//
+static inline void spin(int &spins)
+{
+    if (++spins > SPINS_BEFORE_YIELD) {
+        std::this_thread::yield();
+    }
+}
+
+
+Ugen_parallel_schedule::Ugen_parallel_schedule(int threads_)
+{
+    threads = threads_ < 1 ? 1 : threads_;
+    thread_of = NULL;
+    done = NULL;
+    block.store(0);
+    busy.store(0);
+    sleepers.store(0);
+    workers.resize(threads);
+    for (int t = 1; t < threads; t++) {
+        pool.push_back(std::thread(&Ugen_parallel_schedule::work, this, t));
+    }
+}
+
+
+Ugen_parallel_schedule::~Ugen_parallel_schedule()
+{
+    start(-1);  // quit
+    for (std::thread &thread : pool) {
+        thread.join();
+    }
+    delete [] thread_of;
+    delete [] done;
+}
+
+
+void Ugen_parallel_schedule::build(Ugen_ptr *outs, int n)
+{
+    Ugen_schedule::build(outs, n);
+    delete [] thread_of;
+    delete [] done;
+    thread_of = new int[len];
+    done = new std::atomic<long>[len];
+    for (Worker &worker : workers) {
+        worker.tasks.clear();
+        worker.waits.clear();
+    }
+    for (int i = 0; i < len; i++) {
+        thread_of[i] = 0;
+        done[i].store(0);  // stamps are block_num + 1, see compute()
+    }
+    if (pulls) {  // run() uses Ugen_schedule::run, see parallel.h
+        return;
+    }
+    std::unordered_map<Ugen_ptr, int> index;
+    std::vector<long> finish(len);  // when ugens[i] is computed
+    std::vector<long> available(threads, 0);  // when each thread is free
+    std::vector<Ugen_ptr> inputs;
+    for (int i = 0; i < len; i++) {
+        Ugen_ptr ugen = ugens[i];
+        index[ugen] = i;
+        inputs.resize(ugen->get_inputs(NULL));
+        ugen->get_inputs(inputs.data());
+        // list scheduling: the thread where ugen can start first
+        int best = 0;
+        long best_start = 0;
+        for (int t = 0; t < threads; t++) {
+            long start = available[t];
+            for (Ugen_ptr input : inputs) {
+                int j = index[input];
+                long ready = finish[j] + (thread_of[j] == t ? 0 : WAIT_COST);
+                if (ready > start) start = ready;
+            }
+            if (t == 0 || start < best_start) {
+                best = t;
+                best_start = start;
+            }
+        }
+        thread_of[i] = best;
+        finish[i] = best_start + 1;
+        available[best] = finish[i];
+        Worker &worker = workers[best];
+        Task task = {ugen, &done[i], (int) worker.waits.size(), 0};
+        for (Ugen_ptr input : inputs) {
+            int j = index[input];
+            if (thread_of[j] != best &&  // (an input can be read twice)
+                std::find(worker.waits.begin() + task.waits,
+                          worker.waits.end(), &done[j]) ==
+                worker.waits.end()) {
+                worker.waits.push_back(&done[j]);
+                task.num_waits++;
+            }
+        }
+        worker.tasks.push_back(task);
+    }
+}
+
+
+// compute block_num of the ugens of thread t. Stamps are block_num +
+// 1, so that 0 means that no block has been computed and block 0 can
+// be computed.
+//
+void Ugen_parallel_schedule::compute(int t, long block_num)
+{
+    Worker &worker = workers[t];
+    for (Task &task : worker.tasks) {
+        for (int w = task.waits; w < task.waits + task.num_waits; w++) {
+            int spins = 0;
+            while (worker.waits[w]->load(std::memory_order_acquire) <=
+                   block_num) {
+                spin(spins);
+            }
+        }
+        task.ugen->block_count = block_num;
+        task.ugen->compute();
+        task.done->store(block_num + 1, std::memory_order_release);
+    }
+}
+
+
+// set block to next (block_num + 1, or -1 to quit) and wake the
+// workers that sleep. This locks sleep_lock only if some worker is
+// asleep, i.e. it gave up spinning after a long time without blocks.
+//
+void Ugen_parallel_schedule::start(long next)
+{
+    // seq_cst: either a worker that goes to sleep sees the new block,
+    // or this sees that it sleeps (see work())
+    block.store(next);
+    if (sleepers.load() > 0) {
+        std::lock_guard<std::mutex> lock(sleep_lock);
+        wake.notify_all();
+    }
+}
+
+
+// the loop of worker thread t: compute each new block. Between blocks
+// the worker spins, yields, and after SPINS_BEFORE_SLEEP spins sleeps
+// until start() wakes it, so idle schedules do not use the CPU.
+//
+void Ugen_parallel_schedule::work(int t)
+{
+    long previous = 0;  // block + 1 of the last block computed
+    while (true) {
+        long next;
+        int spins = 0;
+        while ((next = block.load(std::memory_order_acquire)) == previous) {
+            if (spins < SPINS_BEFORE_SLEEP) {
+                spin(spins);
+                continue;
+            }
+            std::unique_lock<std::mutex> lock(sleep_lock);
+            sleepers.fetch_add(1);
+            wake.wait(lock, [&] { return block.load() != previous; });
+            sleepers.fetch_sub(1);
+        }
+        if (next < 0) {
+            return;
+        }
+        compute(t, next - 1);
+        previous = next;
+        busy.fetch_sub(1, std::memory_order_acq_rel);
+    }
+}
+
+
+void Ugen_parallel_schedule::run(long block_num)
+{
+    if (pulls || threads == 1) {
+        Ugen_schedule::run(block_num);
+        return;
+    }
+    busy.store(threads - 1, std::memory_order_relaxed);
+    start(block_num + 1);
+    compute(0, block_num);
+    int spins = 0;
+    while (busy.load(std::memory_order_acquire) > 0) {
+        spin(spins);
+    }
+}
@@ -0,0 +1,81 @@
+// parallel.h -- run a patch on several threads
+//
+// Roger B. Dannenberg
+//
+// A Ugen_parallel_schedule is a Ugen_schedule (see schedule.h) that
+// divides the ugens among a fixed number of threads: the thread that
+// calls run() and threads - 1 worker threads, which are started by the
+// constructor and wait for each block. build() sorts the ugens as
+// Ugen_schedule does and then assigns them to threads once, by list
+// scheduling: in execution order, each ugen goes to the thread where
+// it can start first, counting one unit of time to compute a ugen and
+// one more to wait for an input computed by another thread. So
+// independent subgraphs, such as separate voices, run on different
+// threads, and a chain of ugens stays on one thread.
+//
+// Each thread computes its ugens in execution order. Before computing
+// a ugen, it waits for the inputs that other threads compute: every
+// ugen has an atomic stamp, the number of the last block it computed
+// plus one (0 before the first block). Threads spin (yielding after a
+// while) instead of taking locks, so the audio thread does not block
+// on a mutex. run() returns when every thread has finished the block.
+// Between blocks, workers that have spun for a while sleep on a
+// condition variable, so a schedule that is not running does not keep
+// threads - 1 cores busy; run() wakes them (taking a lock only if a
+// worker is asleep).
+//
+// The result does not depend on the number of threads or on timing:
+// each ugen computes a block once, after its inputs, exactly as with
+// Ugen_schedule, so the output is the same, sample for sample. Ugens
+// that pull their inputs with run() (see schedule.h) cannot be
+// computed safely on several threads, so if there are any, the
+// schedule runs on the calling thread only.
+
+#ifndef PARALLEL_H
+#define PARALLEL_H
+
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+#include "schedule.h"
+
+class Ugen_parallel_schedule : public Ugen_schedule {
+  public:
+    // threads is the number of threads, including the caller of run()
+    Ugen_parallel_schedule(int threads);
+    ~Ugen_parallel_schedule();
+    void build(Ugen_ptr *outs, int n);
+    // compute block block_num, which must be greater than the last
+    // one. Call build() only between calls to run(), e.g. from the
+    // thread that calls run().
+    void run(long block_num);
+    int threads;
+    int *thread_of;  // thread_of[i] computes ugens[i]
+
+  private:
+    struct Task {
+        Ugen_ptr ugen;
+        std::atomic<long> *done;  // this ugen's stamp
+        int waits;  // index in waits of the stamps of inputs ...
+        int num_waits;  // ... that other threads compute
+    };
+    struct Worker {
+        std::vector<Task> tasks;
+        std::vector<std::atomic<long> *> waits;
+    };
+    void compute(int t, long block_num);
+    void start(long next);
+    void work(int t);
+    std::vector<Worker> workers;  // one for each thread
+    std::vector<std::thread> pool;  // threads 1 to threads - 1
+    std::atomic<long> *done;  // stamps of ugens, by schedule index
+    std::atomic<long> block;  // the block to compute + 1, -1 to quit
+    std::atomic<int> busy;  // threads still computing the block
+    std::atomic<int> sleepers;  // workers waiting on wake
+    std::mutex sleep_lock;  // for wake
+    std::condition_variable wake;  // signaled by start()
+};
+
+#endif
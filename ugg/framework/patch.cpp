@@ -0,0 +1,54 @@
+// patch.cpp -- the test patch played by uggtest and rendered by uggrender
+//
+// Roger B. Dannenberg
+
+#include "ugen.h"
+#include "osci.h"
+#include "decay.h"
+#include "add.h"
+#include "mult.h"
+#include "tone.h"
+#include "ugg_tables.h"
+#include "patch.h"
+
+Table_ptr SINETABLE;
+
+
+// make running sum of tones of freq. Tone (see ugtone.py) computes
+// Mult_aa_a(Osci_ccc_a(...), Decay_cc_a(...)) in one ugen. Only the
+// next Add reads the running sum, so the sum can be computed in place.
+//
+static void add_tone(Ugen_ptr &sum, float freq, sample gain,
+                     Table_ptr sawtooth)
+{
+    Tone_ccccc_a *tone = new Tone_ccccc_a(freq, 0.0, sawtooth,
+                                          1.0F * gain, PATCH_SECONDS - 1);
+    if (sum) {
+        sum = new Add_aa_a_inplace(sum, tone);
+    } else {
+        sum = tone;
+    }
+}
+
+
+void patch_create(Ugen_ptr *left, Ugen_ptr *right)
+{
+    int i;
+
+    // the tables are computed by the generator (see ugg/ugtables.py)
+    SINETABLE = ugg_table_sine;
+    Table_ptr sawtooth = ugg_table_sawtooth;
+
+    const int nfreqs = 4;
+    float freqs[nfreqs] = {166, 220, 247.5, 185.625};
+
+    Ugen *left_sum = NULL;
+    Ugen *right_sum = NULL;
+
+    for (i = 0; i < nfreqs; i++) {
+        add_tone(left_sum, freqs[i] / 2, 0.125, sawtooth);
+        add_tone(right_sum, freqs[i] / 2 + 2, 0.125, sawtooth);
+    }
+    *left = left_sum;
+    *right = right_sum;
+}
@@ -0,0 +1,10 @@
+// patch.h -- the test patch played by uggtest and rendered by uggrender
+//
+// Roger B. Dannenberg
+
+#define PATCH_SECONDS 6
+
+// build the test patch (sums of decaying sawtooth tones), setting
+// *left and *right to the ugens that compute the left and right
+// channels. Also initializes SINETABLE.
+void patch_create(Ugen_ptr *left, Ugen_ptr *right);
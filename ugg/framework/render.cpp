@@ -0,0 +1,173 @@
+// render.cpp -- render ugens offline, as fast as possible, to a file
+//
+// Roger B. Dannenberg
+
+#include <chrono>
+#include "string.h"
+#include "ugen.h"
+#include "render.h"
+
+#define RENDER_BUFFER_FRAMES 65536
+
+
+Render_file::Render_file()
+{
+    file = NULL;
+    format = RENDER_NONE;
+    channels = 0;
+    buffer = NULL;
+    buffer_len = 0;
+    buffer_used = 0;
+    frames = 0;
+    failed = false;
+}
+
+
+Render_file::~Render_file()
+{
+    close();
+}
+
+
+static void put_u32(unsigned char *p, unsigned long x)
+{
+    p[0] = x & 0xFF;
+    p[1] = (x >> 8) & 0xFF;
+    p[2] = (x >> 16) & 0xFF;
+    p[3] = (x >> 24) & 0xFF;
+}
+
+
+static void put_u16(unsigned char *p, unsigned int x)
+{
+    p[0] = x & 0xFF;
+    p[1] = (x >> 8) & 0xFF;
+}
+
+
+// write a WAV header for 32-bit float samples. The sizes are not
+// known until close(), which writes the header again. Returns false
+// if the header cannot be written.
+//
+static bool write_wav_header(FILE *file, int channels, long frames)
+{
+    unsigned char h[44];
+    unsigned long data_bytes = frames * channels * 4;
+    memcpy(h, "RIFF", 4);
+    put_u32(h + 4, 36 + data_bytes);
+    memcpy(h + 8, "WAVEfmt ", 8);
+    put_u32(h + 16, 16);  // size of fmt chunk
+    put_u16(h + 20, 3);  // WAVE_FORMAT_IEEE_FLOAT
+    put_u16(h + 22, channels);
+    put_u32(h + 24, (unsigned long) AR);
+    put_u32(h + 28, (unsigned long) AR * channels * 4);  // bytes/second
+    put_u16(h + 32, channels * 4);  // bytes/frame
+    put_u16(h + 34, 32);  // bits/sample
+    memcpy(h + 36, "data", 4);
+    put_u32(h + 40, data_bytes);
+    return fwrite(h, sizeof(h), 1, file) == 1;
+}
+
+
+bool Render_file::open(const char *path, int format_, int channels_)
+{
+    close();
+    format = format_;
+    channels = channels_;
+    frames = 0;
+    failed = false;
+    if (format == RENDER_NONE) {
+        return true;
+    }
+    file = fopen(path, "wb");
+    if (!file) {
+        return false;
+    }
+    if (format == RENDER_WAV && !write_wav_header(file, channels, 0)) {
+        failed = true;
+    }
+    buffer_len = RENDER_BUFFER_FRAMES * channels;
+    buffer = (float *) malloc(buffer_len * sizeof(float));
+    buffer_used = 0;
+    return true;
+}
+
+
+void Render_file::write_block(sample **blocks)
+{
+    frames += BL;
+    if (!file) {
+        return;
+    }
+    if (buffer_used + BL * channels > buffer_len) {
+        flush();
+    }
+    float *out = buffer + buffer_used;
+    for (int i = 0; i < BL; i++) {
+        for (int c = 0; c < channels; c++) {
+            *out++ = (float) blocks[c][i];
+        }
+    }
+    buffer_used += BL * channels;
+}
+
+
+void Render_file::flush()
+{
+    if (fwrite(buffer, sizeof(float), buffer_used, file) !=
+        (size_t) buffer_used) {
+        failed = true;
+    }
+    buffer_used = 0;
+}
+
+
+bool Render_file::close()
+{
+    if (file) {
+        flush();
+        if (format == RENDER_WAV &&
+            (fseek(file, 0, SEEK_SET) != 0 ||
+             !write_wav_header(file, channels, frames))) {
+            failed = true;
+        }
+        if (fclose(file) != 0) {
+            failed = true;
+        }
+        file = NULL;
+    }
+    if (buffer) {
+        free(buffer);
+        buffer = NULL;
+    }
+    return !failed;
+}
+
+
+double render(Ugen_ptr *outs, int channels, long blocks, Render_file *file,
+              Ugen_schedule *schedule)
+{
+    sample **block = new sample *[channels];
+    auto start = std::chrono::steady_clock::now();
+    for (long b = 0; b < blocks; b++) {
+        if (schedule) {
+            schedule->run(ugg_block_count);
+        }
+        for (int c = 0; c < channels; c++) {
+            if (!schedule) {
+                outs[c]->run(ugg_block_count);
+            }
+            block[c] = outs[c]->get_outs();
+        }
+        ugg_block_count++;
+        if (file) {
+            file->write_block(block);
+        }
+    }
+    if (file) {
+        file->close();
+    }
+    auto stop = std::chrono::steady_clock::now();
+    delete [] block;
+    return std::chrono::duration<double>(stop - start).count();
+}
@@ -0,0 +1,55 @@
+// render.h -- render ugens offline, as fast as possible, to a file
+//
+// Roger B. Dannenberg
+
+#ifndef RENDER_H
+#define RENDER_H
+
+#include "stdio.h"
+#include "schedule.h"
+
+#define RENDER_NONE 0  // compute but do not write samples
+#define RENDER_WAV 1   // 32-bit float WAV file
+#define RENDER_RAW 2   // interleaved 32-bit floats, no header
+
+// Render_file writes interleaved 32-bit float frames, one block at a
+// time. Frames are collected in a large buffer and written with one
+// fwrite when it is full, so writing costs little compared to
+// computing the samples.
+//
+class Render_file {
+  public:
+    Render_file();
+    ~Render_file();
+    // open path for writing format with channels channels; returns
+    // false if the file cannot be opened. With RENDER_NONE, no file
+    // is opened (path can be NULL).
+    bool open(const char *path, int format, int channels);
+    // write BL frames: channel c is in blocks[c]
+    void write_block(sample **blocks);
+    // flush the buffer and, for WAV, complete the header; returns
+    // false if any write, seek or close failed (see failed)
+    bool close();
+    long frames;  // number of frames written
+    bool failed;  // a write, seek or close failed, e.g. the disk is full
+
+  private:
+    void flush();
+    FILE *file;
+    int format;
+    int channels;
+    float *buffer;
+    long buffer_len;  // in floats
+    long buffer_used;
+};
+
+
+// compute blocks blocks of the ugens in outs (one per channel) and
+// write them to file (if not NULL), which is closed at the end (check
+// file->failed). If schedule is not NULL, it must have been built from
+// outs and it computes the ugens (see schedule.h); otherwise the outs
+// are run, pulling their inputs. Returns the elapsed time in seconds.
+double render(Ugen_ptr *outs, int channels, long blocks, Render_file *file,
+              Ugen_schedule *schedule = NULL);
+
+#endif
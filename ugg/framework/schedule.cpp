@@ -0,0 +1,208 @@
+// schedule.cpp -- run a patch in a precomputed order
+//
+// Roger B. Dannenberg
+
+#include <algorithm>
+#include <vector>
+#include <unordered_map>
+#include <unordered_set>
+#include "stdint.h"
+#include "stdio.h"
+#include "assert.h"
+#include "ugen.h"
+#include "schedule.h"
+
+
+Ugen_schedule::Ugen_schedule(bool share_buffers_)
+{
+    ugens = NULL;
+    len = 0;
+    pool_len = 0;
+    share_buffers = share_buffers_;
+    pulls = false;
+    pool_memory = NULL;
+}
+
+
+Ugen_schedule::~Ugen_schedule()
+{
+    delete [] ugens;
+    free(pool_memory);
+}
+
+
+// append ugen to order after its inputs (depth first). A ugen that is
+// visited again while its inputs are being visited is in a cycle,
+// which run() cannot compute either; the cycle is broken there.
+//
+static void visit(Ugen_ptr ugen, std::vector<Ugen_ptr> &order,
+                  std::unordered_set<Ugen_ptr> &visited, bool *pulls)
+{
+    if (!visited.insert(ugen).second) {
+        return;
+    }
+    int n = ugen->get_inputs(NULL);
+    if (n < 0) {
+        *pulls = true;
+    } else if (n > 0) {
+        std::vector<Ugen_ptr> inputs(n);
+        ugen->get_inputs(inputs.data());
+        for (int i = 0; i < n; i++) {
+            visit(inputs[i], order, visited, pulls);
+        }
+    }
+    order.push_back(ugen);
+}
+
+
+void Ugen_schedule::build(Ugen_ptr *outs, int n)
+{
+    std::vector<Ugen_ptr> order;
+    std::unordered_set<Ugen_ptr> visited;
+    pulls = false;
+    for (int i = 0; i < n; i++) {
+        visit(outs[i], order, visited, &pulls);
+    }
+    delete [] ugens;
+    len = (int) order.size();
+    ugens = new Ugen_ptr[len];
+    for (int i = 0; i < len; i++) {
+        ugens[i] = order[i];
+        Ugen_outa *ugen = dynamic_cast<Ugen_outa *>(ugens[i]);
+        if (ugen) {
+            ugen->outs = ugen->buffer;
+        }
+    }
+    check_inplace(outs, n);
+    free(pool_memory);
+    pool_memory = NULL;
+    pool_len = 0;
+    if (share_buffers && !pulls) {
+        assign_buffers(outs, n);
+    }
+}
+
+
+// an in-place ugen (see get_inplace_input in ugen.h) overwrites its
+// input, so the input must not be read by another ugen or be one of
+// the outputs of the patch
+//
+void Ugen_schedule::check_inplace(Ugen_ptr *outs, int n)
+{
+    std::unordered_map<Ugen_ptr, Ugen_ptr> reader;  // of each input
+    for (int i = 0; i < n; i++) {
+        reader[outs[i]] = NULL;  // read by the caller
+    }
+    for (int i = 0; i < len; i++) {
+        int num_inputs = ugens[i]->get_inputs(NULL);
+        std::vector<Ugen_ptr> inputs(num_inputs > 0 ? num_inputs : 0);
+        ugens[i]->get_inputs(inputs.data());
+        for (Ugen_ptr input : inputs) {
+            auto found = reader.find(input);
+            if (found == reader.end()) {
+                reader[input] = ugens[i];
+            } else if (found->second != ugens[i]) {
+                found->second = NULL;  // more than one reader
+            }
+        }
+    }
+    for (int i = 0; i < len; i++) {
+        Ugen_ptr input = ugens[i]->get_inplace_input();
+        if (input && reader[input] != ugens[i]) {
+            fprintf(stderr, "Ugen_schedule: an in-place ugen's input "
+                            "is also read elsewhere\n");
+            assert(false);
+        }
+    }
+}
+
+
+// share blocks among the outputs of the ugens (see schedule.h) by
+// linear scan over the schedule
+//
+void Ugen_schedule::assign_buffers(Ugen_ptr *outs, int n)
+{
+    std::unordered_map<Ugen_ptr, int> index;
+    for (int i = 0; i < len; i++) {
+        index[ugens[i]] = i;
+    }
+    // last_use[i] is the index of the last ugen that reads ugens[i]
+    std::vector<int> last_use(len, -1);
+    std::vector<std::vector<int>> inputs(len);
+    for (int i = 0; i < len; i++) {
+        std::vector<Ugen_ptr> in(ugens[i]->get_inputs(NULL));
+        ugens[i]->get_inputs(in.data());
+        for (Ugen_ptr input : in) {
+            int j = index[input];
+            inputs[i].push_back(j);
+            last_use[j] = i;
+        }
+    }
+    for (int i = 0; i < n; i++) {
+        last_use[index[outs[i]]] = len;  // never dead
+    }
+    // an in-place ugen writes the block of its input, which belongs to
+    // owner[i], and the block lives until the last use of either
+    std::vector<int> owner(len);
+    for (int i = 0; i < len; i++) {
+        Ugen_ptr input = ugens[i]->get_inplace_input();
+        owner[i] = input ? owner[index[input]] : i;
+        int &live = last_use[owner[i]];
+        live = std::max(live, last_use[i]);
+    }
+    std::vector<int> block_of(len, -1);
+    std::vector<int> free_blocks;  // a stack
+    for (int i = 0; i < len; i++) {
+        Ugen_outa *ugen = dynamic_cast<Ugen_outa *>(ugens[i]);
+        if (ugen && !ugen->fixed_outs && owner[i] == i &&
+            last_use[i] < len) {
+            if (free_blocks.empty()) {
+                block_of[i] = pool_len++;
+            } else {
+                block_of[i] = free_blocks.back();
+                free_blocks.pop_back();
+            }
+        }
+        // free the blocks that are dead after ugens[i] (the output of
+        // ugens[i] cannot share a block with its inputs, unless it is
+        // in-place)
+        for (int j : inputs[i]) {
+            int o = owner[j];
+            if (last_use[o] == i && block_of[o] >= 0 &&
+                std::find(free_blocks.begin(), free_blocks.end(),
+                          block_of[o]) == free_blocks.end()) {
+                free_blocks.push_back(block_of[o]);
+            }
+        }
+    }
+    if (pool_len == 0) {
+        return;
+    }
+    pool_memory = malloc(pool_len * BL * sizeof(sample) + UGG_ALIGN);
+    sample *pool = (sample *) (((uintptr_t) pool_memory + UGG_ALIGN - 1) &
+                               ~(uintptr_t) (UGG_ALIGN - 1));
+    for (int i = 0; i < len; i++) {
+        if (block_of[i] >= 0) {
+            ((Ugen_outa *) ugens[i])->outs = pool + block_of[i] * BL;
+        }
+    }
+}
+
+
+void Ugen_schedule::run(long block_num)
+{
+    if (pulls) {
+        for (int i = 0; i < len; i++) {
+            Ugen_ptr ugen = ugens[i];
+            if (ugen->block_count < block_num) {
+                ugen->block_count = block_num;
+                ugen->compute();
+            }
+        }
+    } else {
+        for (int i = 0; i < len; i++) {
+            ugens[i]->block_count = block_num;
+            ugens[i]->compute();
+        }
+    }
+}
@@ -0,0 +1,64 @@
+// schedule.h -- run a patch in a precomputed order
+//
+// Roger B. Dannenberg
+//
+// Calling run(block_num) on the outputs of a patch pulls the samples
+// through the graph: each ugen checks each of its inputs every block
+// and runs it, recursively, if it has not computed block_num yet. A
+// Ugen_schedule sorts the ugens once instead, so that every ugen comes
+// after its inputs, and then computes a block by calling compute() on
+// each ugen in a flat array, with no recursion and no input checks:
+//
+//     Ugen_schedule schedule;
+//     schedule.build(outs, 2);  // and again whenever the patch changes
+//     ...
+//     schedule.run(ugg_block_count++);  // every block
+//
+// Ugens that do not report their inputs (get_inputs() returns -1, see
+// ugen.h) are computed with run(), which pulls their inputs as before.
+// If there are any such ugens, run() checks the block_count of each
+// ugen in the schedule, so a ugen they pulled is not computed twice.
+//
+// Each audio rate ugen normally writes its own buffer (see Ugen_outa
+// in ugen.h), so a patch of N ugens touches N buffers every block,
+// although most outputs are dead once their consumers have run. A
+// schedule made with Ugen_schedule(true) also assigns the outputs to a
+// small pool of shared blocks, as registers are allocated: a ugen's
+// output lives from its position in the schedule to the last ugen that
+// reads it, and then its block is reused, most recently freed first,
+// so the blocks are likely to be in the cache. The outputs of the
+// patch (outs in build()), ugens with fixed_outs, and every ugen if
+// some ugens pull their inputs keep their own buffers. With shared
+// buffers, only read the outputs of the patch after run(), do not run
+// the ugens in any other way, and do not use them after the schedule
+// is destroyed. This works only when the ugens are computed in order
+// on one thread, so Ugen_parallel_schedule does not share buffers.
+// An in-place ugen (see get_inplace_input in ugen.h) shares the block
+// of its input, which then lives until both are dead. build() checks
+// that nothing else reads the input of an in-place ugen.
+
+#ifndef SCHEDULE_H
+#define SCHEDULE_H
+
+class Ugen_schedule {
+  public:
+    Ugen_schedule(bool share_buffers = false);
+    virtual ~Ugen_schedule();
+    // find the ugens that outs (n of them) depend on and sort them,
+    // inputs first. Call again whenever the patch changes.
+    virtual void build(Ugen_ptr *outs, int n);
+    // compute block block_num of every ugen in the schedule
+    virtual void run(long block_num);
+    Ugen_ptr *ugens;  // in execution order
+    int len;
+    int pool_len;  // number of shared blocks
+
+  protected:
+    void check_inplace(Ugen_ptr *outs, int n);
+    void assign_buffers(Ugen_ptr *outs, int n);
+    bool share_buffers;
+    bool pulls;  // some ugens run their own inputs
+    void *pool_memory;
+};
+
+#endif
@@ -0,0 +1,205 @@
+// tables.cpp -- tables shared between ugens and between processes
+//
+// Roger B. Dannenberg
+
+#include <mutex>
+#include <vector>
+#include "stddef.h"
+#include "stdint.h"
+#include "stdio.h"
+#include "string.h"
+#include "stdlib.h"
+#include "assert.h"
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define UGG_MAP_TABLES
+#endif
+#include "ugen.h"
+#include "tables.h"
+
+struct Shared_table {
+    Table_ptr table;
+    uint64_t hash;
+    long bytes;  // size of the mapping, or 0 if table is malloc'ed
+    int refs;  // number of table_share calls not yet released
+};
+
+static std::mutex shared_lock;  // protects shared_tables
+static std::vector<Shared_table> shared_tables;
+
+
+static uint64_t fnv1a(uint64_t hash, const void *data, size_t n)
+{
+    const unsigned char *p = (const unsigned char *) data;
+    for (size_t i = 0; i < n; i++) {
+        hash ^= p[i];
+        hash *= 1099511628211ULL;
+    }
+    return hash;
+}
+
+
+// hash of the length and samples (not of padding, which is not set)
+static uint64_t table_hash(Table_ptr table)
+{
+    uint64_t hash = fnv1a(14695981039346656037ULL, &table->len,
+                          sizeof(table->len));
+    return fnv1a(hash, table->data, table->len * sizeof(sample));
+}
+
+
+static bool same_table(Table_ptr a, Table_ptr b)
+{
+    return a->len == b->len &&
+           memcmp(a->data, b->data, a->len * sizeof(sample)) == 0;
+}
+
+
+#ifdef UGG_MAP_TABLES
+// is st a file or directory of this user that no one else can write?
+static bool is_private(const struct stat *st)
+{
+    return st->st_uid == getuid() && (st->st_mode & (S_IWGRP | S_IWOTH)) == 0;
+}
+
+
+// put the directory for table files in dir (n bytes): UGG_TABLE_DIR,
+// or by default ugg-tables-<uid> in /dev/shm (or /tmp), which is
+// created with mode 0700. Return false if the directory is not a
+// private directory of this user.
+static bool table_dir(char *dir, size_t n)
+{
+    const char *env = getenv("UGG_TABLE_DIR");
+    struct stat st;
+    if (env && *env) {
+        snprintf(dir, n, "%s", env);
+    } else {
+        const char *base = "/tmp";
+        if (stat("/dev/shm", &st) == 0 && S_ISDIR(st.st_mode)) {
+            base = "/dev/shm";
+        }
+        snprintf(dir, n, "%s/ugg-tables-%ld", base, (long) getuid());
+        mkdir(dir, 0700);  // fails if it exists, which is checked below
+    }
+    return lstat(dir, &st) == 0 && S_ISDIR(st.st_mode) && is_private(&st);
+}
+
+
+// write table (bytes long) to path, under a new temporary name (from
+// mkstemp, so no existing file or link is followed) that is renamed
+// when the file is complete
+static bool write_table(const char *path, Table_ptr table, long bytes)
+{
+    char temp[1100];
+    snprintf(temp, sizeof(temp), "%s.XXXXXX", path);
+    int fd = mkstemp(temp);  // mode 0600
+    if (fd < 0) return false;
+    bool ok = write(fd, table, bytes) == bytes;
+    ok = close(fd) == 0 && ok;
+    if (!ok || rename(temp, path) != 0) {
+        unlink(temp);
+        return false;
+    }
+    return true;
+}
+
+
+// map the file with the contents of table read-only, writing it first
+// if no process has, and return the mapped table, or NULL if the file
+// cannot be written or mapped, is not a private file of this user or
+// has different contents
+static Table_ptr map_table(Table_ptr table, uint64_t hash, long bytes)
+{
+    char dir[1000];
+    if (!table_dir(dir, sizeof(dir))) return NULL;
+    char path[1024];
+    snprintf(path, sizeof(path), "%s/ugg-table-%016llx-%d-%d", dir,
+             (unsigned long long) hash, table->len, (int) sizeof(sample));
+    int fd = open(path, O_RDONLY | O_NOFOLLOW);
+    if (fd < 0) {
+        if (!write_table(path, table, bytes)) return NULL;
+        fd = open(path, O_RDONLY | O_NOFOLLOW);
+        if (fd < 0) return NULL;
+    }
+    void *p = MAP_FAILED;
+    struct stat st;
+    if (fstat(fd, &st) == 0 && S_ISREG(st.st_mode) && is_private(&st) &&
+        st.st_size == bytes) {
+        p = mmap(NULL, bytes, PROT_READ, MAP_SHARED, fd, 0);
+    }
+    close(fd);  // the mapping stays
+    if (p == MAP_FAILED) return NULL;
+    if (!same_table((Table_ptr) p, table)) {  // another table, same hash
+        munmap(p, bytes);
+        return NULL;
+    }
+    return (Table_ptr) p;
+}
+
+
+static void unmap_table(Table_ptr table, long bytes)
+{
+    munmap(table, bytes);
+}
+#else
+static Table_ptr map_table(Table_ptr table, uint64_t hash, long bytes)
+{
+    (void) table; (void) hash; (void) bytes;
+    return NULL;  // only shared within the process
+}
+
+
+static void unmap_table(Table_ptr table, long bytes)
+{
+    (void) table; (void) bytes;
+}
+#endif
+
+
+Table_ptr table_share(Table_ptr table)
+{
+    uint64_t hash = table_hash(table);
+    std::lock_guard<std::mutex> lock(shared_lock);
+    for (Shared_table &s : shared_tables) {
+        if (s.hash == hash && same_table(s.table, table)) {
+            s.refs++;
+            free(table);
+            return s.table;
+        }
+    }
+    // the samples and the file do not need the padding of Table
+    long bytes = offsetof(Table, data) + table->len * sizeof(sample);
+    Shared_table s = {table, hash, 0, 1};
+    Table_ptr mapped = map_table(table, hash, bytes);
+    if (mapped) {
+        free(table);
+        s.table = mapped;
+        s.bytes = bytes;
+    }
+    shared_tables.push_back(s);
+    return s.table;
+}
+
+
+void table_release(Table_ptr table)
+{
+    std::lock_guard<std::mutex> lock(shared_lock);
+    for (size_t i = 0; i < shared_tables.size(); i++) {
+        Shared_table &s = shared_tables[i];
+        if (s.table == table) {
+            if (--s.refs == 0) {
+                if (s.bytes) {
+                    unmap_table(table, s.bytes);
+                } else {
+                    free(table);
+                }
+                shared_tables.erase(shared_tables.begin() + i);
+            }
+            return;
+        }
+    }
+    assert(false);  // table is not from table_share
+}
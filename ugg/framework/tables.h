@@ -0,0 +1,59 @@
+// tables.h -- tables shared between ugens and between processes
+//
+// Roger B. Dannenberg
+//
+// table_create (see ugen.h) allocates a private table, so every
+// instrument that loads the same wavetable or sample has its own copy.
+// table_share registers a filled table instead and returns a read-only
+// table with the same contents that is shared by every user of
+// identical tables:
+//
+//     Table_ptr table = table_create(len);
+//     ... tblput(table, i, x) for i = 0 to len ...
+//     table = table_share(table);  // frees the private table
+//     ... use table (tblget, table_len) but do not tblput ...
+//     table_release(table);  // when no ugen uses table any more
+//
+// Tables are found by a hash (FNV-1a) of their length and samples, and
+// then compared, so different tables are never merged. The samples
+// are kept in a file named by the hash in UGG_TABLE_DIR (an
+// environment variable, default ugg-tables-<uid> in /dev/shm if it
+// exists, else in /tmp, made with mode 0700), which is mapped
+// read-only into memory. Other processes of the same user that share
+// the same table map the same file, so a table is in memory once,
+// however many engines use it. Files are written under a temporary
+// name (from mkstemp) and renamed, so a process never maps a partly
+// written table, and a file is only mapped if it is a regular file of
+// this user that no one else can write, in such a directory.
+//
+// Files are not removed when the last user releases the table, so a
+// later process finds them again. /dev/shm is cleared when the system
+// restarts; to free the memory sooner (or to clean up /tmp), remove
+// the directory when no engine is running, e.g.
+//     rm -r /dev/shm/ugg-tables-$(id -u)
+// If the file cannot be written or mapped (and on Windows), the table
+// is only shared within the process.
+//
+// table_share and table_release may be called from any thread, but
+// not from the audio thread: they may write files. Tables from
+// table_share must only be freed with table_release.
+
+#ifndef TABLES_H
+#define TABLES_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// return a shared table with the same contents as table, which was
+// made by table_create and is freed
+Table_ptr table_share(Table_ptr table);
+
+// release a table returned by table_share
+void table_release(Table_ptr table);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
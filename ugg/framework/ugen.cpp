@@ -9,13 +9,32 @@ long ugg_block_count = 1;
 Table *table_create(int len)
 {
     // actual array size will be len + 1
-    long bytes = sizeof(Table) + (len - 1) * sizeof(float);
+    long bytes = sizeof(Table) + (len - 1) * sizeof(sample);
     Table *table = (Table *) malloc(bytes);
     table->len = len + 1;
     return table;
 }
 
 
+Mipmap *mipmap_create()
+{
+    Mipmap *mipmap = (Mipmap *) malloc(sizeof(Mipmap));
+    mipmap->levels = 0;
+    return mipmap;
+}
+
+
+void mipmap_add(Mipmap *mipmap, Table_ptr table, int harmonics)
+{
+    assert(mipmap->levels < MIPMAP_MAX_LEVELS);
+    assert(mipmap->levels == 0 ||
+           table_len(table) == mipmap_len(mipmap));
+    mipmap->harmonics[mipmap->levels] = harmonics;
+    mipmap->tables[mipmap->levels] = table;
+    mipmap->levels++;
+}
+
+
 double uniform()
 {
     return ((double) rand()) / RAND_MAX;
@@ -29,6 +48,8 @@ Ugen::Ugen()
 
 Ugen_outa::Ugen_outa()
 {
+    outs = buffer;
+    fixed_outs = false;
 }
 
 
@@ -41,7 +62,7 @@ sample *Ugen_outa::get_outs()
 sample Ugen_outa::get_out()
 {
     assert(false);
-    return NULL;
+    return 0;
 }
 
 
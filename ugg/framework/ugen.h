@@ -1,21 +1,91 @@
 // ugen.h -- base for unit generators
+//
+// The part before the Ugen class is C, so that C programs can use the
+// kernels generated in <name>_kernels.h (see gen_kernel in Ugen.py).
+
+#ifndef UGEN_H
+#define UGEN_H
 
 #include "stdlib.h"
 #include "math.h"
 
+// The sample rate, block length and sample type can be set when
+// compiling, e.g. -DBL=64 -DUGG_SAMPLE=double. The build profiles in
+// the generated CMakeLists.txt (see cmake.py) do this.
+#ifndef AR
 #define AR 44100.0
+#endif
 #define AR_RECIP (1.0 / AR)
+#ifndef BL
 #define BL 32
+#endif
+#define BL_RECIP (1.0 / BL)
 #define BR (AR / BL)
 #define BR_RECIP (BL / AR)
 
-typedef float sample;
+#ifndef UGG_SAMPLE
+#define UGG_SAMPLE float
+#endif
+typedef UGG_SAMPLE sample;
+
+// used by code generated with UGG_FISSION (see gen_fission_loops in
+// Ugen.py): sample arrays are aligned to UGG_ALIGN bytes, pointers to
+// them do not alias other arrays, and UGG_VECTORIZE marks loops with
+// no dependencies between iterations
+#define UGG_ALIGN 32
+#if defined(__cplusplus)
+#define UGG_ALIGNED alignas(UGG_ALIGN)
+#elif __STDC_VERSION__ >= 201112L
+#define UGG_ALIGNED _Alignas(UGG_ALIGN)
+#else
+#define UGG_ALIGNED
+#endif
+#if defined(__GNUC__) || defined(__clang__)
+#define UGG_RESTRICT __restrict__
+#define UGG_ASSUME_ALIGNED(p) ((sample *) __builtin_assume_aligned(p, UGG_ALIGN))
+#elif defined(_MSC_VER)
+#define UGG_RESTRICT __restrict
+#define UGG_ASSUME_ALIGNED(p) (p)
+#else
+#define UGG_RESTRICT
+#define UGG_ASSUME_ALIGNED(p) (p)
+#endif
+// generated compute() methods are declared UGG_RESTRICT_THIS: the
+// members of a ugen are not accessed through its outs or inputs, so
+// they can stay in registers while outs (a pointer) is written
+#if defined(__GNUC__) || defined(__clang__)
+#define UGG_RESTRICT_THIS __restrict__
+#else
+#define UGG_RESTRICT_THIS
+#endif
+#if defined(__clang__)
+#define UGG_VECTORIZE _Pragma("clang loop vectorize(enable)")
+#elif defined(__GNUC__)
+#define UGG_VECTORIZE _Pragma("GCC ivdep")
+#else
+#define UGG_VECTORIZE
+#endif
 
 typedef struct {
     int len; // actual number of samples in data
     sample data[2];
 } Table, *Table_ptr;
 
+// a waveform as tables with fewer and fewer harmonics, e.g. one per
+// octave, so that an oscillator can use a table with no harmonics
+// above the Nyquist frequency (see mipmap_table). The tables have the
+// same length.
+#define MIPMAP_MAX_LEVELS 16
+typedef struct {
+    int levels;
+    int harmonics[MIPMAP_MAX_LEVELS];  // highest harmonic of each table
+    Table_ptr tables[MIPMAP_MAX_LEVELS];  // most harmonics first
+} Mipmap, *Mipmap_ptr;
+
+
+#ifdef __cplusplus
+extern "C" {
+#endif
 
 extern Table_ptr SINETABLE;
 
@@ -23,15 +93,27 @@ extern long ugg_block_count;
 
 
 // create table of length len, not including the extra
-// sample at the end
+// sample at the end (see table_share in tables.h to share it)
 Table *table_create(int len);
+
+// create a mipmap with no levels. Add tables with mipmap_add, most
+// harmonics first; the mipmap does not own them.
+Mipmap *mipmap_create(void);
+void mipmap_add(Mipmap *mipmap, Table_ptr table, int harmonics);
+
+double uniform(void);
+
+#ifdef __cplusplus
+}
+#endif
+
 #define tblget(table, index) ((table)->data[index])
 #define tblput(table, index, value) ((table)->data[index] = (value))
 // table is stored with redundant last element to facilitate
 // interpolation, so effective len is actual len - 1:
 #define table_len(table) ((table)->len - 1)
 
-inline double phase_wrap(double phase, int len)
+static inline double phase_wrap(double phase, int len)
 {
     double p = phase;
     double n = len;
@@ -41,14 +123,44 @@ inline double phase_wrap(double phase, int len)
 
 //#define phase_wrap fmod
 
+// the table of mipmap to use at hz: the first with no harmonics at or
+// above the Nyquist frequency, or the last if none is
+static inline Table_ptr mipmap_table(Mipmap_ptr mipmap, double hz)
+{
+    int level = 0;
+    double top = fabs(hz) / (AR * 0.5);  // harmonics must be below 1 / top
+    while (level < mipmap->levels - 1 &&
+           mipmap->harmonics[level] * top >= 1) {
+        level++;
+    }
+    return mipmap->tables[level];
+}
+
+#define mipmap_len(mipmap) table_len((mipmap)->tables[0])
+
+
+#ifdef __cplusplus
 
 class Ugen {
   public:
     Ugen();
+    virtual ~Ugen() {}
     long block_count;
     virtual sample *get_outs() = 0;
     virtual sample get_out() = 0;
     virtual void run(long block_num) = 0;
+    // for Ugen_schedule (see schedule.h): store the ugens that this
+    // ugen reads in inputs (unless it is NULL) and return how many
+    // there are. Generated ugens also have compute(), which computes
+    // the next block assuming the inputs are already computed. The
+    // defaults adapt other ugens: -1 means the inputs are not known,
+    // and compute() calls run(), which runs the inputs as needed.
+    virtual int get_inputs(Ugen **inputs) { (void) inputs; return -1; }
+    virtual void compute() { run(block_count); }
+    // an in-place ugen (e.g. Mult_aa_a_inplace, see generate_variant
+    // in Ugen.py) writes its output over the outs of an input, which
+    // no other ugen may read; this returns that input, or NULL
+    virtual Ugen *get_inplace_input() { return NULL; }
 };
 
 typedef Ugen *Ugen_ptr;
@@ -58,7 +170,12 @@ class Ugen_outa : public Ugen {
     Ugen_outa();
     virtual sample *get_outs();
     virtual sample get_out();
-    sample outs[BL];
+    // the output: buffer, or a block shared with other ugens that a
+    // Ugen_schedule assigns (see schedule.h). Set fixed_outs if outs
+    // must stay buffer, e.g. because the caller writes it.
+    sample *outs;
+    UGG_ALIGNED sample buffer[BL];
+    bool fixed_outs;
 };
 
 class Ugen_outb : public Ugen {
@@ -69,5 +186,6 @@ class Ugen_outb : public Ugen {
     sample out;
 };
 
+#endif
 
-double uniform();
+#endif
@@ -0,0 +1,185 @@
+// ugg_capi.cpp -- C interface to ugens in a shared library
+//
+// Roger B. Dannenberg
+
+#include "ugen.h"
+#include "schedule.h"
+#include "parallel.h"
+#include "tables.h"
+#include "ugg_capi.h"
+
+
+class Ugen_input_a : public Ugen_outa {
+  public:
+    Ugen_input_a() {
+        block_count = 0;
+        fixed_outs = true;  // the caller writes outs
+        for (int i = 0; i < BL; i++) outs[i] = 0;
+    }
+    void run(long block_num) { block_count = block_num; }
+    int get_inputs(Ugen **inputs) { (void) inputs; return 0; }
+    void compute() { }
+};
+
+
+class Ugen_input_b : public Ugen_outb {
+  public:
+    Ugen_input_b() {
+        block_count = 0;
+        out = 0;
+    }
+    void run(long block_num) { block_count = block_num; }
+    int get_inputs(Ugen **inputs) { (void) inputs; return 0; }
+    void compute() { }
+};
+
+
+void ugg_run(Ugen *ugen, long block_num)
+{
+    if (ugen->block_count < block_num) {
+        ugen->run(block_num);
+    }
+}
+
+
+long ugg_next_block()
+{
+    return ugg_block_count++;
+}
+
+
+sample *ugg_get_outs(Ugen *ugen)
+{
+    return ugen->get_outs();
+}
+
+
+sample ugg_get_out(Ugen *ugen)
+{
+    return ugen->get_out();
+}
+
+
+void ugg_destroy(Ugen *ugen)
+{
+    delete ugen;
+}
+
+
+int ugg_block_len()
+{
+    return BL;
+}
+
+
+int ugg_sample_size()
+{
+    return sizeof(sample);
+}
+
+
+double ugg_sample_rate()
+{
+    return AR;
+}
+
+
+Table_ptr ugg_table_create(int len)
+{
+    return table_create(len);
+}
+
+
+sample *ugg_table_data(Table_ptr table)
+{
+    return table->data;
+}
+
+
+void ugg_table_destroy(Table_ptr table)
+{
+    free(table);
+}
+
+
+Table_ptr ugg_table_share(Table_ptr table)
+{
+    return table_share(table);
+}
+
+
+void ugg_table_release(Table_ptr table)
+{
+    table_release(table);
+}
+
+
+Mipmap_ptr ugg_mipmap_create()
+{
+    return mipmap_create();
+}
+
+
+void ugg_mipmap_add(Mipmap_ptr mipmap, Table_ptr table, int harmonics)
+{
+    mipmap_add(mipmap, table, harmonics);
+}
+
+
+void ugg_mipmap_destroy(Mipmap_ptr mipmap)
+{
+    free(mipmap);
+}
+
+
+Ugen *ugg_input_a_create()
+{
+    return new Ugen_input_a();
+}
+
+
+Ugen *ugg_input_b_create()
+{
+    return new Ugen_input_b();
+}
+
+
+void ugg_input_b_set(Ugen *ugen, sample value)
+{
+    ((Ugen_input_b *) ugen)->out = value;
+}
+
+
+Ugen_schedule *ugg_schedule_create(Ugen **outs, int n)
+{
+    Ugen_schedule *schedule = new Ugen_schedule();
+    schedule->build(outs, n);
+    return schedule;
+}
+
+
+Ugen_schedule *ugg_parallel_schedule_create(Ugen **outs, int n,
+                                            int threads)
+{
+    Ugen_schedule *schedule = new Ugen_parallel_schedule(threads);
+    schedule->build(outs, n);
+    return schedule;
+}
+
+
+void ugg_schedule_run(Ugen_schedule *schedule, long block_num)
+{
+    schedule->run(block_num);
+}
+
+
+int ugg_schedule_len(Ugen_schedule *schedule)
+{
+    return schedule->len;
+}
+
+
+void ugg_schedule_destroy(Ugen_schedule *schedule)
+{
+    delete schedule;
+}
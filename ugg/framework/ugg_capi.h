@@ -0,0 +1,57 @@
+// ugg_capi.h -- C interface to ugens in a shared library
+//
+// Roger B. Dannenberg
+//
+// The generator writes <Class>_create(parameters) and
+// <Class>_set_<param>(ugen, value) for each variant (see gen_c_api in
+// Ugen.py). These functions work on any ugen, so they are written
+// once here. ugg_get_outs returns the address of the outs[BL] array of
+// the ugen, which stays valid until the ugen is destroyed, so a caller
+// (e.g. ugglib.py) can read the output without copying it.
+//
+// Input ugens connect the caller to ugen inputs: the caller writes
+// the BL samples of an audio rate input directly into the array
+// returned by ugg_get_outs, and sets a block rate input with
+// ugg_input_b_set. Running an input ugen does nothing.
+//
+// A schedule computes the ugens that some output ugens depend on in a
+// precomputed order (see schedule.h), on one thread or, if created
+// with ugg_parallel_schedule_create, on several (see parallel.h).
+// Create it again after changing the patch.
+
+extern "C" {
+    // compute block block_num of ugen (and of its inputs, if needed)
+    void ugg_run(Ugen *ugen, long block_num);
+    // return the next block number and advance ugg_block_count
+    long ugg_next_block();
+    sample *ugg_get_outs(Ugen *ugen);  // audio rate output
+    sample ugg_get_out(Ugen *ugen);  // block rate output
+    void ugg_destroy(Ugen *ugen);
+
+    int ugg_block_len();
+    int ugg_sample_size();  // sizeof(sample)
+    double ugg_sample_rate();
+
+    Table_ptr ugg_table_create(int len);
+    sample *ugg_table_data(Table_ptr table);  // len + 1 samples
+    void ugg_table_destroy(Table_ptr table);
+    // see tables.h: table is freed, and the result is read-only
+    Table_ptr ugg_table_share(Table_ptr table);
+    void ugg_table_release(Table_ptr table);
+
+    // see Mipmap in ugen.h: the mipmap does not own its tables
+    Mipmap_ptr ugg_mipmap_create();
+    void ugg_mipmap_add(Mipmap_ptr mipmap, Table_ptr table, int harmonics);
+    void ugg_mipmap_destroy(Mipmap_ptr mipmap);
+
+    Ugen *ugg_input_a_create();
+    Ugen *ugg_input_b_create();
+    void ugg_input_b_set(Ugen *ugen, sample value);
+
+    Ugen_schedule *ugg_schedule_create(Ugen **outs, int n);
+    Ugen_schedule *ugg_parallel_schedule_create(Ugen **outs, int n,
+                                                int threads);
+    void ugg_schedule_run(Ugen_schedule *schedule, long block_num);
+    int ugg_schedule_len(Ugen_schedule *schedule);  // number of ugens
+    void ugg_schedule_destroy(Ugen_schedule *schedule);
+}
@@ -0,0 +1,99 @@
+// uggrender.cpp -- render the test patch offline, without an audio device
+//
+// Roger B. Dannenberg
+//
+// usage: uggrender [-d seconds] [-f wav|raw|none] [-p] [-t threads] [-b]
+//                  [output-file]
+//
+// Computes the same patch as uggtest, as fast as possible, writes it
+// to output-file (default uggrender.wav) and reports how many times
+// faster than real time it ran. With -f none, samples are computed
+// but not written. If the file cannot be written, uggrender exits
+// with status 1. The patch is computed with a Ugen_schedule (see
+// schedule.h), or with -p, by running the outputs, which pull their
+// inputs, as uggtest does. With -t, the schedule runs on threads
+// threads (see parallel.h). With -b, ugens share output buffers (see
+// schedule.h; not with -t).
+
+#include "stdio.h"
+#include "string.h"
+#include "ugen.h"
+#include "patch.h"
+#include "render.h"
+#include "parallel.h"
+
+
+static void usage()
+{
+    fprintf(stderr, "usage: uggrender [-d seconds] [-f wav|raw|none] [-p] "
+                    "[-t threads] [-b] [output-file]\n");
+    exit(1);
+}
+
+
+int main(int argc, char *argv[])
+{
+    double seconds = PATCH_SECONDS;
+    int format = RENDER_WAV;
+    const char *path = "uggrender.wav";
+    bool pull = false;
+    int threads = 1;
+    bool share = false;
+
+    for (int i = 1; i < argc; i++) {
+        if (strcmp(argv[i], "-d") == 0 && i + 1 < argc) {
+            seconds = atof(argv[++i]);
+        } else if (strcmp(argv[i], "-f") == 0 && i + 1 < argc) {
+            const char *f = argv[++i];
+            if (strcmp(f, "wav") == 0) format = RENDER_WAV;
+            else if (strcmp(f, "raw") == 0) format = RENDER_RAW;
+            else if (strcmp(f, "none") == 0) format = RENDER_NONE;
+            else usage();
+        } else if (strcmp(argv[i], "-p") == 0) {
+            pull = true;
+        } else if (strcmp(argv[i], "-t") == 0 && i + 1 < argc) {
+            threads = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-b") == 0) {
+            share = true;
+        } else if (argv[i][0] == '-') {
+            usage();
+        } else {
+            path = argv[i];
+        }
+    }
+
+    Ugen_ptr outs[2];
+    patch_create(&outs[0], &outs[1]);
+    Ugen_schedule *schedule;
+    if (threads > 1) {
+        schedule = new Ugen_parallel_schedule(threads);
+    } else {
+        schedule = new Ugen_schedule(share);
+    }
+    schedule->build(outs, 2);
+    if (share) {
+        printf("%d ugens share %d buffers\n", schedule->len,
+               schedule->pool_len);
+    }
+
+    Render_file file;
+    if (!file.open(path, format, 2)) {
+        fprintf(stderr, "uggrender: cannot open %s\n", path);
+        return 1;
+    }
+    long blocks = (long) (seconds * AR / BL + 0.5);
+    double elapsed = render(outs, 2, blocks, &file,
+                            pull ? NULL : schedule);
+    if (file.failed) {
+        fprintf(stderr, "uggrender: cannot write %s\n", path);
+        return 1;
+    }
+    double audio_seconds = blocks * BL / AR;
+    printf("rendered %g s of audio (%ld blocks) in %g s: "
+           "%.1f times real time\n", audio_seconds, blocks, elapsed,
+           audio_seconds / elapsed);
+    if (format != RENDER_NONE) {
+        printf("wrote %s\n", path);
+    }
+    return 0;
+}
@@ -0,0 +1,142 @@
+// uggscale.cpp -- measure how a parallel schedule scales with threads
+//
+// Roger B. Dannenberg
+//
+// usage: uggscale [-v voices] [-t max-threads] [-d seconds]
+//
+// Builds a dense patch of independent voices (default 64), each a
+// sawtooth oscillator with vibrato and a decay envelope (8 ugens),
+// mixed to two channels by trees of Add_aa_a, and computes it as fast
+// as possible with a Ugen_parallel_schedule (see parallel.h) of 1, 2,
+// ... max-threads threads (default: the number of cores). Prints the
+// real-time factor and the speedup over one thread for each, and
+// checks that every run computes the same samples as one thread.
+
+#include "stdio.h"
+#include "string.h"
+#include <chrono>
+#include <thread>
+#include <vector>
+#include "ugen.h"
+#include "osci.h"
+#include "decay.h"
+#include "add.h"
+#include "mult.h"
+#include "parallel.h"
+#include "ugg_tables.h"
+
+Table_ptr SINETABLE;
+
+
+static void usage()
+{
+    fprintf(stderr, "usage: uggscale [-v voices] [-t max-threads] "
+                    "[-d seconds]\n");
+    exit(1);
+}
+
+
+// each ugen in a voice has one reader, so Mult and Add are in place
+//
+static Ugen_ptr make_voice(double hz, sample gain, double seconds,
+                           Table_ptr sawtooth)
+{
+    // nearly constant for seconds: a long decay
+    Ugen_ptr depth = new Decay_cc_a(3.0F, 1000 * seconds);
+    Ugen_ptr center = new Decay_cc_a((sample) hz, 1000 * seconds);
+    Ugen_ptr lfo = new Osci_ccc_a(5.0 + hz / 1000, 0.0, SINETABLE);
+    Ugen_ptr vibrato = new Add_aa_a_inplace(center,
+                                            new Mult_aa_a_inplace(lfo, depth));
+    Ugen_ptr osc = new Osci_acc_a(vibrato, 0.0, sawtooth);
+    return new Mult_aa_a_inplace(osc, new Decay_cc_a(gain, (sample) seconds));
+}
+
+
+// sum ugens with a balanced tree of Add_aa_a (in place: each ugen has
+// one reader)
+//
+static Ugen_ptr mix(std::vector<Ugen_ptr> ugens)
+{
+    while (ugens.size() > 1) {
+        std::vector<Ugen_ptr> sums;
+        for (size_t i = 0; i + 1 < ugens.size(); i += 2) {
+            sums.push_back(new Add_aa_a_inplace(ugens[i], ugens[i + 1]));
+        }
+        if (ugens.size() % 2) {
+            sums.push_back(ugens.back());
+        }
+        ugens = sums;
+    }
+    return ugens[0];
+}
+
+
+static void make_patch(Ugen_ptr *outs, int voices, double seconds,
+                       Table_ptr sawtooth)
+{
+    std::vector<Ugen_ptr> left, right;
+    for (int v = 0; v < voices; v++) {
+        Ugen_ptr voice = make_voice(110.0 * (1 + v % 12 / 12.0) * (1 + v / 12),
+                                    1.0F / voices, seconds, sawtooth);
+        (v % 2 ? right : left).push_back(voice);
+    }
+    outs[0] = mix(left);
+    outs[1] = mix(right.empty() ? left : right);
+}
+
+
+int main(int argc, char *argv[])
+{
+    int voices = 64;
+    int max_threads = std::thread::hardware_concurrency();
+    double seconds = 10;
+
+    for (int i = 1; i < argc; i++) {
+        if (strcmp(argv[i], "-v") == 0 && i + 1 < argc) {
+            voices = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-t") == 0 && i + 1 < argc) {
+            max_threads = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-d") == 0 && i + 1 < argc) {
+            seconds = atof(argv[++i]);
+        } else {
+            usage();
+        }
+    }
+    if (voices < 1) usage();
+    if (max_threads < 1) max_threads = 1;
+
+    SINETABLE = ugg_table_sine;
+    Table_ptr sawtooth = ugg_table_sawtooth;
+
+    long blocks = (long) (seconds * AR / BL + 0.5);
+    double audio_seconds = blocks * BL / AR;
+    std::vector<sample> reference;  // output of 1 thread
+    double time1 = 0;
+    printf("%d voices, %g s of audio\n", voices, audio_seconds);
+    printf("%8s%12s%10s%8s\n", "threads", "x real", "speedup", "same");
+    for (int threads = 1; threads <= max_threads; threads++) {
+        Ugen_ptr outs[2];  // a new patch, so every run starts the same
+        make_patch(outs, voices, seconds, sawtooth);
+        Ugen_parallel_schedule schedule(threads);
+        schedule.build(outs, 2);
+        std::vector<sample> result(blocks * BL * 2);
+        sample *out = result.data();
+        auto start = std::chrono::steady_clock::now();
+        for (long b = 0; b < blocks; b++) {
+            schedule.run(ugg_block_count++);
+            for (int c = 0; c < 2; c++) {
+                memcpy(out, outs[c]->get_outs(), BL * sizeof(sample));
+                out += BL;
+            }
+        }
+        auto stop = std::chrono::steady_clock::now();
+        double elapsed = std::chrono::duration<double>(stop - start).count();
+        if (threads == 1) {
+            reference = result;
+            time1 = elapsed;
+        }
+        printf("%8d%12.1f%10.2f%8s\n", threads, audio_seconds / elapsed,
+               time1 / elapsed, result == reference ? "yes" : "NO");
+    }
+    return 0;
+}
@@ -7,10 +7,7 @@
 #include "assert.h"
 #include "portaudio.h"
 #include "ugen.h"
-#include "osci.h"
-#include "decay.h"
-#include "add.h"
-#include "mult.h"
+#include "patch.h"
 
 
 /*
@@ -19,15 +16,10 @@
 #endif
 */
 
-#define NUM_SECONDS 6
-#define NUM_SAW_HARMONICS 20
+#define NUM_SECONDS PATCH_SECONDS
 
 using namespace std; 
 
-#define TABLE_SIZE 512
-
-Table_ptr SINETABLE;
-
 Ugen *left_ugen = NULL;
 Ugen *right_ugen = NULL;
 
@@ -60,21 +52,6 @@ static int ugg_callback(const void *inputBuffer, void *outputBuffer,
     return paContinue;
 }
 
-// make running sum of tones of freq
-//
-void add_tone(Ugen_ptr &sum, float freq, sample gain, Table_ptr sawtooth)
-{
-    Osci_ccc_a *osc = new Osci_ccc_a(freq, 0.0, sawtooth);
-    Decay_cc_a *decay = new Decay_cc_a(1.0F * gain, NUM_SECONDS - 1);
-    Mult_aa_a *mult = new Mult_aa_a(osc, decay);
-    if (sum) {
-        *sum = Add_aa_a(sum, mult);
-    } else {
-        sum = mult;
-    }
-}
-
-
 /*******************************************************************/
 
 int main(void)
@@ -87,40 +64,9 @@ int main(void)
     PaMacCoreStreamInfo macInfo;
 #endif
 */
-    int i, h;
-
     srand(time(0)); // randomize seed
 
-    SINETABLE = table_create(TABLE_SIZE);
-    /* initialise sinusoidal wavetable */
-    for (i = 0; i <= TABLE_SIZE; i++) {
-        tblput(SINETABLE, i, (sample) sin(((double) i / (double) TABLE_SIZE) * M_PI * 2.0));
-    }
-
-    Table_ptr sawtooth = table_create(TABLE_SIZE);
-    for (i = 0; i <= TABLE_SIZE; i++) {
-        sample y = 0;
-        for (h = 1; h <= NUM_SAW_HARMONICS; h++) {
-            y += (sample) sin(((double) (i * h) / (double) TABLE_SIZE) * M_PI * 2.0) / (sample) h;
-        }
-        tblput(sawtooth, i, y);
-    }
-    for (i = 0; i <= TABLE_SIZE; i++) {
-        printf("sawtooth[%d] = %f\n", i, tblget(sawtooth, i));
-    }
-
-    const int nfreqs = 4;
-    float freqs[nfreqs] = {166, 220, 247.5, 185.625};
-
-    Ugen *left_sum = NULL;
-    Ugen *right_sum = NULL;
-
-    for (i = 0; i < nfreqs; i++) {
-        add_tone(left_sum, freqs[i] / 2, 0.125, sawtooth);
-        add_tone(right_sum, freqs[i] / 2 + 2, 0.125, sawtooth);
-    }
-    left_ugen = left_sum;
-    right_ugen = right_sum;
+    patch_create(&left_ugen, &right_ugen);
 
     err = Pa_Initialize();
     if (err != paNoError) goto error;
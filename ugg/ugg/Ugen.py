@@ -40,11 +40,32 @@
 #             if (param->block_count < block_num)
 #                 param->run(block_num);
 
+import atexit
+import contextlib
+import hashlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import ugglog as log
+import ugtables
+from uggstats import Stats, write_report
 from cmake import *
 
 
+UGG_VERSION = "13"  # change when generated code changes for the same input
 UGG_INDENT = 2
 UGG_STATE = "ugg_state"
+UGG_CSE = True  # merge and share common subexpressions in ugg_write
+UGG_SIMPLIFY = True  # fold constants and simplify before code emission
+UGG_EXACT_FLOAT = False  # only allow simplifications that are exact in IEEE
+UGG_CACHE = True  # reuse code for variants that have not changed
+UGG_CACHE_DIR = ".ugg_cache/"  # where the cache is kept, within CODE_PATH
+UGG_JOBS = 1  # number of processes generating variants (see ugg_build)
+UGG_CAPI = True  # generate extern "C" functions for each variant (gen_c_api)
+UGG_FISSION = False  # split AR loops into serial and vectorizable loops
+UGG_KERNELS = True  # also generate plain C kernels (see gen_kernel)
 SAMPLE_TYPE = "float"
 
 def isfloat(typespec):
@@ -61,6 +82,16 @@ def error(*args):
 
 CODE_PATH = "../code/"
 
+# graph_version is incremented whenever an existing Ugen graph is
+# modified (parameters replaced, Next() called, etc.) so that cached
+# topological sorts (see Ugen.get_ugen_list) can be invalidated
+graph_version = 0
+
+def graph_changed():
+    global graph_version
+    graph_version += 1
+
+
 def ug_indent(depth):
     if depth == 1:
         depth = 0
@@ -81,6 +112,13 @@ def zipper(ugen):
     ugen.interpolate_ok = False
     return ugen
 
+# keep IEEE float behavior of an expression exactly as written, e.g.
+# do not replace x / y by x * (1 / y): write exact(x / y)
+#
+def exact(ugen):
+    ugen.exact = True
+    return ugen
+
 
 class Ugen:
     def __init__(self, value=None, typespec="sample"):
@@ -89,28 +127,31 @@ class Ugen:
             self.value = value
             self.typespec = typespec
         self.parameters = []
-        self.visited = False
+        self.ugen_list = None  # cached result of get_ugen_list()
+        self.ugen_list_version = None
         self.upsample = False
         self.interpolate_ok = True
         self.output_rate = False
         self.rate = None
         self.name = None
         self.details = "" # how did we get our rate?
+        self.exact = False # only exact simplifications allowed?
+        self.member = True # is a Param or CR Var needed as a member?
 
     def copy(self):
-        new = Ugen(self.value)
+        new = Ugen(self.value, self.typespec)
         self.copy_fields_to(new)
         return new
 
     def copy_fields_to(self, dest):
         dest.parameters = self.parameters.copy()
-        dest.visited = self.visited
         dest.upsample = self.upsample
         dest.interpolate_ok = self.interpolate_ok
         dest.output_rate = self.output_rate
         dest.rate = self.rate
         dest.name = self.name
         dest.details = self.details
+        dest.exact = self.exact
         return dest
 
     def update_refs(self, m):
@@ -120,10 +161,25 @@ class Ugen:
             # replace each parameter with a mapped version. If the mapping
             #    is already done for some reason, default to existing value
             p[i] = m.get(p[i], p[i])
+        graph_changed()
 
     def __str__(self):
         return "<Ugen " + str(self.value) + ">"
 
+    def __repr__(self):  # print lists of ugens the same way every time
+        return str(self)
+
+    # key used to find common subexpressions: two ugens with equal keys
+    # compute the same value (parameters must already be merged, so
+    # parameters are compared by identity). Ugens with names or state
+    # (Param, Var, First, Upsample) return None and are never merged.
+    def cse_key(self):
+        if type(self) == Ugen:  # a constant
+            return ("const", type(self.value), self.value, self.typespec)
+        return (type(self), getattr(self, "op", None), self.typespec,
+                self.rate, self.interpolate_ok, self.output_rate) + \
+               tuple(id(p) for p in self.parameters)
+
     def __add__(self, right):
         return Uadd(self, right)
 
@@ -184,14 +240,38 @@ class Ugen:
     def gen_code(self):
         return str(self.value)
 
-    def get_ugen_list(self):
-#        print("ENTER get_ugen_list of: " + str(self))
-        ugens = self.get_ugen_list2(1)
-        for ugen in ugens:
-            ugen.visited = False
-        return ugens
-
-    # when we recursively find all ugens, we need to get the things 
+    # return a topologically sorted list of ugens, with dependent ugens
+    # later in the list. The list is computed by an iterative depth-first
+    # walk (so deep graphs do not hit the recursion limit) and cached on
+    # this ugen until the graph changes (see graph_changed()). Set trace
+    # to print the order in which ugens are visited.
+    def get_ugen_list(self, trace=False):
+        if self.ugen_list is not None and \
+           self.ugen_list_version == graph_version and not trace:
+            return list(self.ugen_list)
+        ugens = []
+        visited = {self}
+        stack = [(self, iter(self.get_all_parameters()))]
+        while stack:
+            ugen, params = stack[-1]
+            for param in params:
+                if param not in visited:
+                    visited.add(param)
+                    if trace:
+                        ug_indent(len(stack) + 1)
+                        log.graph("get_ugen_list visits", param)
+                    stack.append((param, iter(param.get_all_parameters())))
+                    break
+            else:  # all parameters are done, so ugen goes next in the list
+                stack.pop()
+                ugens.append(ugen)
+        if trace:
+            print_ugens("get_ugen_list returns", ugens)
+        self.ugen_list = ugens
+        self.ugen_list_version = graph_version
+        return list(ugens)
+
+    # when we find all ugens, we need to get the things 
     # this Ugen depends upon. Normally, this is everything in 
     # parameters, which is created by all Ugen subclasses for 
     # convenience, but in one case, class State, the ugen also 
@@ -202,24 +282,24 @@ class Ugen:
     def get_all_parameters(self):
         return self.parameters
 
-    # recursive helper function - returns topologically sorted list
-    # of ugens, with dependent ugens later in the list
-    def get_ugen_list2(self, depth):
-        ug_indent(depth)
-        print("get_ugen_list2 called", self)
-        ugens = []
-        self.visited = True
-        for ugen in self.get_all_parameters():
-            if not ugen.visited:
-                new_ugens = ugen.get_ugen_list2(depth + 1)
-                ugens = ugens + new_ugens
-        ugens.append(self)
-        ug_indent(depth)
-        print("get_ugen_list2 returns", end="")
-        for u in ugens:
-            print(u, end="")
-        print()
-        return ugens
+    # return a simpler ugen that computes the same value, or self. Called
+    # by simplify_ugens after parameters have been simplified.
+    def simplify(self):
+        return self
+
+    # new is a simplified replacement for self: give it the same rate
+    # and flags so that code generation treats it the same way
+    def replaced_by(self, new):
+        new.rate = self.rate
+        new.interpolate_ok = self.interpolate_ok
+        new.output_rate = self.output_rate
+        new.exact = self.exact
+        new.details = "simplified"
+        return new
+
+    # true if no flags prevent replacing self by one of its parameters
+    def is_plain(self):
+        return self.interpolate_ok and not self.output_rate
 
     def use_output_rate(self):
         self.output_rate = True
@@ -252,9 +332,16 @@ class Ugen:
             self.details = details
         return self.rate
 
-    def gen_declarations(self):
+    # if the ugen needs a member variable, return its type (as written
+    # before the name, e.g. "double " or "Ugen *") and name, else None
+    def member_declaration(self):
         return None
 
+    def gen_declarations(self):
+        decl = self.member_declaration()
+        if decl:
+            print("    ", decl[0], decl[1], ";", sep="", file=context.hdrf)
+
     def gen_update_input(self):
         return None
 
@@ -287,23 +374,93 @@ class Ugen:
 
 
 # given a Ugen, constant, or string, produce a Ugen
-#     strings denote a variable: look it up in ugg_vars
+#     strings denote a variable: look it up in context.vars
 #     constants are converted to Ugen(constant)
 def coerce_to_ugen(value, op):
     orig = value
     if type(value) == int or type(value) == float:
         value = Ugen(value)
-        print("coerce_to_ugen value", orig, "becomes", str(value))
+        if log.graph.debug:
+            log.graph("coerce_to_ugen value", orig, "becomes", str(value))
     elif type(value) == str:
-        value = ugg_vars[value]
+        value = context.vars[value]
     if not isinstance(value, Ugen):
         error("types not compatible with ", op)
     return value
 
 
+# ---------- support for simplification (constant folding) ----------
+
+def is_number(ugen):
+    return type(ugen) == Ugen and type(ugen.value) in (int, float)
+
+
+# true if ugen is computed as a C int (int literals or "int" typespec)
+def is_int_typed(ugen):
+    if type(ugen) == Ugen:
+        return type(ugen.value) == int
+    return ugen.typespec == "int"
+
+
+# true if c is the literal value, and replacing c op other by other does
+# not change the type of the expression, e.g. int_var * 1.0 is double
+def is_identity(c, other, value):
+    return is_number(c) and c.value == value and \
+           (type(c.value) == int or not is_int_typed(other))
+
+
+# make a constant with rate CR (simplification runs after find_rate)
+def constant(value, typespec="sample"):
+    c = Ugen(value, typespec)
+    c.rate = CR
+    c.details = "folded constant"
+    return c
+
+
+# apply fn to the arguments as C would, returning None if the result
+# is not a valid C constant (overflow, division by zero, NaN, ...)
+def fold(fn, *args):
+    try:
+        value = fn(*args)
+    except (ArithmeticError, ValueError):
+        return None
+    if type(value) == int:
+        return value if -2**31 <= value < 2**31 else None
+    return value if math.isfinite(value) else None
+
+
+def c_divide(a, b):
+    if type(a) == int and type(b) == int:  # C truncates toward zero
+        q = abs(a) // abs(b)
+        return q if (a < 0) == (b < 0) else -q
+    return a / b
+
+
+BINARY_FOLDS = {"+": lambda a, b: a + b,
+                "-": lambda a, b: a - b,
+                "*": lambda a, b: a * b,
+                "/": c_divide,
+                "<": lambda a, b: int(a < b)}
+
+def fold_binary(op, a, b):
+    if op not in BINARY_FOLDS:
+        return None
+    return fold(BINARY_FOLDS[op], a, b)
+
+
+# folds of C math functions: EXACT folds give the same result as C
+# on every platform, others depend on the accuracy of libm
+EXACT_UNARY_FOLDS = {"fabs": lambda x: float(abs(x)),
+                     "int": int}
+UNARY_FOLDS = {"tanh": math.tanh}
+EXACT_FN2_FOLDS = {"fmax": lambda x, y: float(max(x, y)),
+                   "fmin": lambda x, y: float(min(x, y)),
+                   "fmod": math.fmod}
+FN2_FOLDS = {"pow": math.pow}
+
+
 class Cond (Ugen):
     def __init__(self, test, left, right):
-        global ugg_vars
         super().__init__()
         right = coerce_to_ugen(right, "Cond")
         self.parameters.append(test)
@@ -322,6 +479,17 @@ class Cond (Ugen):
         new = Cond(self.parameters[0], self.left, self.right)
         return self.copy_fields_to(new)
 
+    def update_refs(self, m):
+        super().update_refs(m)
+        self.left = self.parameters[1]
+        self.right = self.parameters[2]
+
+    def simplify(self):
+        test = self.parameters[0]
+        if is_number(test) and self.is_plain():
+            return self.left if test.value else self.right
+        return self
+
     def __str__(self):
         return "<Cond>"
 
@@ -346,7 +514,6 @@ class Cond (Ugen):
         
 class Ubinary (Ugen):
     def __init__(self, op, left, right):
-        global ugg_vars
         super().__init__()
         self.op = op
         right = coerce_to_ugen(right, op)
@@ -388,6 +555,53 @@ class Ubinary (Ugen):
     def __str__(self):
         return "<" + self.op + ">"
 
+    def cse_key(self):
+        key = super().cse_key()
+        if self.op in ("+", "*"):  # commutative, so operand order is moot
+            key = key[0 : -2] + tuple(sorted(key[-2 : ]))
+        return key
+
+    def simplify(self):
+        left = self.parameters[0]
+        right = self.parameters[1]
+        if is_number(left) and is_number(right):
+            value = fold_binary(self.op, left.value, right.value)
+            if value is not None:
+                return self.replaced_by(constant(value, self.typespec))
+        exact = self.exact or UGG_EXACT_FLOAT
+        if self.is_plain():
+            if self.op == "*" and is_identity(right, left, 1):
+                return left
+            if self.op == "*" and is_identity(left, right, 1):
+                return right
+            if self.op == "/" and is_identity(right, left, 1):
+                return left
+            if self.op == "-" and is_identity(right, left, 0):
+                return left
+            # x + 0 is not exact: -0.0 + 0 is +0.0
+            if self.op == "+" and is_identity(right, left, 0) and \
+               (not exact or is_int_typed(left)):
+                return left
+            if self.op == "+" and is_identity(left, right, 0) and \
+               (not exact or is_int_typed(right)):
+                return right
+        # division by a CR value inside run() becomes multiplication
+        # by a reciprocal that is computed once
+        if self.op == "/" and self.rate in (AR, BR) and right.rate == CR \
+           and not (is_int_typed(left) and is_int_typed(right)):
+            if is_number(right):
+                if right.value != 0 and \
+                   (not exact or math.frexp(right.value)[0] in (0.5, -0.5)):
+                    recip = fold_binary("/", 1.0, right.value)
+                    if recip is not None:
+                        return self.replaced_by(Umul(left, constant(recip)))
+            elif not exact:
+                recip = Udiv(constant(1.0), right)
+                recip.rate = CR
+                recip.details = "reciprocal of CR divisor"
+                return self.replaced_by(Umul(left, recip))
+        return self
+
     def print_subtree(self, depth):
         self.print_self(depth, "op" + self.op)
         depth += 1
@@ -413,18 +627,32 @@ class Ubinary (Ugen):
 
 class Uunary (Ugen):
     def __init__(self, op, param, typespec=None):
-        global ugg_vars
         super().__init__()
         self.op = op
         self.typespec = typespec if typespec else param.typespec
         self.parameters.append(coerce_to_ugen(param, op))
 
     def copy(self):
-        return self.copy_fields_to(Uunary(self.op, self.parameters[0]))
+        return self.copy_fields_to(Uunary(self.op, self.parameters[0],
+                                          self.typespec))
 
     def __str__(self):
         return "<" + self.op + ">"
 
+    def simplify(self):
+        param = self.parameters[0]
+        if is_number(param) and (self.op in EXACT_UNARY_FOLDS or
+                                 (self.op in UNARY_FOLDS and not
+                                  (self.exact or UGG_EXACT_FLOAT))):
+            fn = EXACT_UNARY_FOLDS.get(self.op) or UNARY_FOLDS[self.op]
+            value = fold(fn, param.value)
+            if value is not None:
+                return self.replaced_by(constant(value, self.typespec))
+        if self.op == "table_len" and table_values(param) is not None:
+            return self.replaced_by(constant(len(table_values(param)) - 1,
+                                             "int"))
+        return self
+
     def print_subtree(self, depth):
         self.print_self(depth, "unary " + self.op)
         depth += 1
@@ -443,7 +671,6 @@ class Uunary (Ugen):
 
 class Ufn2 (Ugen):
     def __init__(self, op, p1, p2, typespec=None):
-        global ugg_vars
         super().__init__()
         self.op = op
         p1 = coerce_to_ugen(p1, op)
@@ -455,12 +682,24 @@ class Ufn2 (Ugen):
                          p1.typespec)
 
     def copy(self):
-        return self.copy_fields_to(Ufn2(self.op, self.parameters[0], 
-                                        self.parameters[1]))
+        return self.copy_fields_to(Ufn2(self.op, self.parameters[0],
+                                        self.parameters[1], self.typespec))
 
     def __str__(self):
         return "<" + self.op + ">"
 
+    def simplify(self):
+        p1 = self.parameters[0]
+        p2 = self.parameters[1]
+        if is_number(p1) and is_number(p2) and \
+           (self.op in EXACT_FN2_FOLDS or
+            (self.op in FN2_FOLDS and not (self.exact or UGG_EXACT_FLOAT))):
+            fn = EXACT_FN2_FOLDS.get(self.op) or FN2_FOLDS[self.op]
+            value = fold(fn, p1.value, p2.value)
+            if value is not None:
+                return self.replaced_by(constant(value, self.typespec))
+        return self
+
     def print_subtree(self, depth):
         self.print_self(depth, "function " + self.op)
         depth += 1
@@ -488,13 +727,12 @@ class Ufn2 (Ugen):
 
 class Usubscript (Ugen):
     def __init__(self, table, index):
-        global ugg_vars
         super().__init__()
         self.table = table
         if type(index) == int or type(index) == float:
             index = Ugen(index)
         elif type(index) == str:
-            index = ugg_vars[index]
+            index = context.vars[index]
         elif not isinstance(index, Ugen):
             error("types not compatible with " + op)
         self.index = index
@@ -506,6 +744,11 @@ class Usubscript (Ugen):
         new = Usubscript(self.table, self.index)
         return self.copy_fields_to(new)
 
+    def update_refs(self, m):
+        super().update_refs(m)
+        self.table = self.parameters[0]
+        self.index = self.parameters[1]
+
     def __str__(self):
         return "<Subscript " + str(self.table) + ">"
 
@@ -570,10 +813,62 @@ class Utable_len(Uunary):
         super().__init__("table_len", table, "int")
 
 
+# the table of a mipmap (see Mipmap in ugen.h) to use at frequency hz.
+# Computed at the rate of hz, so use a BR or CR hz to choose the table
+# outside the loop.
+#
+class Umipmap_table(Ufn2):
+    def __init__(self, mipmap, hz):
+        super().__init__("mipmap_table", mipmap, hz, "Table_ptr")
+
+
+# the length of the tables of a mipmap
+#
+class Umipmap_len(Uunary):
+    def __init__(self, mipmap):
+        super().__init__("mipmap_len", mipmap, "int")
+
+
+# a table computed by the generator (see ugtables.py), e.g.
+# Utable("sine"). It is a constant (ugg_table_sine in ugg_tables.h),
+# not a parameter or member, and its Utable_len is a number.
+#
+def Utable(name):
+    if name not in ugtables.TABLES:
+        error("no table named " + name + " (see ugtables.py)")
+    return Ugen(ugtables.table_symbol(name), "Table_ptr")
+
+
+# does the graph of out (or of the actions of params) use a Utable?
+#
+def uses_tables(params, out):
+    exprs = [out] + [action[1] for param in params
+                     for action in param.actions]
+    return any(table_values(u) is not None
+               for expr in exprs for u in expr.get_ugen_list())
+
+
+# the values of a Utable, or None if ugen is not one
+#
+def table_values(ugen):
+    if type(ugen) != Ugen or ugen.typespec != "Table_ptr":
+        return None
+    for name, values in ugtables.TABLES.items():
+        if ugtables.table_symbol(name) == ugen.value:
+            return values
+    return None
+
+
 class Uint (Uunary):
     def __init__(self, param):
         super().__init__("int", param, "int")
 
+    def copy(self):
+        return self.copy_fields_to(Uint(self.parameters[0]))
+
+    def gen_code(self):  # a C cast, so that kernels are C
+        return "((int) " + self.parameters[0].gen_code() + ")"
+
 
 class Ufmodf (Ufn2):
     def __init__(self, p1, p2):
@@ -634,11 +929,13 @@ def FILTER(*params):
 
 # given a Param and a rate, compute the type
 def typespec_for_rate(param, rate):
-    print("typespec_for_rate", param.name, param.typespec, rate)
+    if log.graph.debug:
+        log.graph("typespec_for_rate", param.name, param.typespec, rate)
     if param.typespec == "float" or param.typespec == "sample":
         return RATE_TO_TYPE[rate]
     elif rate == CR:
-        print("typespec returns", param.typespec)
+        if log.graph.debug:
+            log.graph("typespec returns", param.typespec)
         return param.typespec + " "
     elif param.typespec == "double":
         return RATE_TO_TYPE[rate] # double treated like float here
@@ -655,7 +952,8 @@ class Param (Ugen):
         self.rate = CR
         self.typespec = typespec;
         self.actions = []
-        print("Param __init__", typespec, self.typespec)
+        if log.graph.debug:
+            log.graph("Param __init__", typespec, self.typespec)
 
     def copy(self):
         new = self.copy_fields_to(Param(self.name))
@@ -665,6 +963,9 @@ class Param (Ugen):
     def __str__(self):
         return "<Param " + self.name + ">"
 
+    def cse_key(self):
+        return None
+
     def print_subtree(self, depth):
         self.print_self(depth, "parameter " + self.name)
 
@@ -674,54 +975,65 @@ class Param (Ugen):
     def gen_code(self):
         if self.rate == AR:
             return self.name + "_samps[i]"
-        elif self.rate == BR:
+        elif self.rate == BR and not context.kernel:
             return self.name + "->get_out()"
         else:
             return self.name
 
-    def gen_declarations(self):
+    def member_declaration(self):
         # default for parameters is float type, but if the rate
         # is AR or BR, the parameter is a Ugen *. If the rate is
         # CR, there can be another user-provided type in typespec.
-        typespec = typespec_for_rate(self, self.rate)
-        print("    ", typespec, self.name, ";", sep="", file=hdrf)
+        if not self.member:
+            return None
+        return (typespec_for_rate(self, self.rate), self.name)
 
     def gen_update_input(self):
         if self.rate == CR:
             return
         print("    if (", self.name, "->block_count < block_num) {", sep="",
-              file=srcf)
-        print("        ", self.name, "->run(block_num);", sep="", file=srcf)
-        print("    }", file=srcf)
+              file=context.srcf)
+        print("        ", self.name, "->run(block_num);", sep="", file=context.srcf)
+        print("    }", file=context.srcf)
 
     def gen_brate_code(self):
-        if self.rate == AR:
+        if context.kernel:  # inputs are parameters of the kernel
+            return
+        elif self.rate == AR and UGG_FISSION and not context.inplace:
+            # (see gen_fission_loops; an in-place output overlaps inputs)
+            print("    sample *UGG_RESTRICT ", self.name,
+                  "_samps = UGG_ASSUME_ALIGNED(", self.name,
+                  "->get_outs());", sep="", file=context.srcf)
+        elif self.rate == AR:
             print("    sample *", self.name, "_samps = ",
-                  self.name, "->get_outs();", sep="", file=srcf)
+                  self.name, "->get_outs();", sep="", file=context.srcf)
 
     def gen_constructor(self):
-        print("    this->", self.name, " = ", self.name, ";", 
-              sep="", file=srcf)
+        if not self.member or (context.kernel and self.rate != CR):
+            return
+        print("    ", "s->" if context.kernel else "this->", self.name,
+              " = ", self.name, ";", sep="", file=context.srcf)
 
 
 class Var (Ugen):
     def __init__(self, name, value, typespec=None):
-        global ugg_vars
         super().__init__()
         self.op = "var"
         self.name = name
-        self.parameters = [coerce_to_ugen(value, "Var initialization")]
+        value = coerce_to_ugen(value, "Var initialization")
+        self.parameters = [value]
         self.typespec = typespec if typespec else value.typespec
         assert(type(self.typespec) == str)
-        print("in Var, name", name, "typespec", self.typespec)
-        ugg_vars[name] = self
-        ugg_ordered_vars.append(self)
+        if log.graph.debug:
+            log.graph("in Var, name", name, "typespec", self.typespec)
+        context.vars[name] = self
 
 
     def found_rate(self, details):
         # DEBUG:
-        if self.name == "oscval" or self.name == "osc_index":
-            print("found_rate for", self.name, ":", self.rate, details)
+        if log.graph.debug and \
+           (self.name == "oscval" or self.name == "osc_index"):
+            log.graph("found_rate for", self.name, ":", self.rate, details)
 
     def copy(self):
         return self.copy_fields_to(Var(self.name, self.parameters[0],
@@ -730,6 +1042,9 @@ class Var (Ugen):
     def __str__(self):
         return "<Var " + self.name + ">"
 
+    def cse_key(self):
+        return None
+
     def print_subtree(self, depth):
         self.print_self(depth, "Var: " + self.name)
         if depth == 1:
@@ -737,34 +1052,37 @@ class Var (Ugen):
         elif self not in to_be_printed and self not in printed:
             to_be_printed.append(self)
 
-    def gen_declarations(self):
-        if self.rate == CR:
-            print("    ", self.typespec, " ", self.name, ";", 
-                  sep="", file=hdrf)
+    def member_declaration(self):
+        if self.rate == CR and self.member:
+            return (self.typespec + " ", self.name)
+        return None
 
     def gen_constructor(self):
         if self.rate == CR:
-            print("    ", self.name, " = ",
-                  self.parameters[0].gen_code(), ";", sep="", file=srcf)
+            # a CR Var that is only used in the constructor is a local
+            typespec = "" if self.member else self.typespec + " "
+            print("    ", typespec, self.name, " = ",
+                  self.parameters[0].gen_code(), ";", sep="", file=context.srcf)
 
     def gen_brate_code(self):
         if self.rate == BR:
             print("    ", self.typespec, " ", self.name, " = ",
-                  self.parameters[0].gen_code(), ";", sep="", file=srcf)
+                  self.parameters[0].gen_code(), ";", sep="", file=context.srcf)
 
     def gen_arate_code(self):
         if self.rate == AR:
             print("        ", self.typespec, " ", self.name, " = ",
-                  self.parameters[0].gen_code(), ";", sep="", file=srcf)
+                  self.parameters[0].gen_code(), ";", sep="", file=context.srcf)
 
     def gen_code(self):
+        if self in context.vectors:
+            return self.name + "_v[i]"
         return self.name
 
 
 class First (Var):
     def __init__(self, name, value, typespec=None):
-        super().__init__(name, value)
-        self.typespec = typespec if typespec else value.typespec
+        super().__init__(name, value, typespec)
         self.rest = None
 
     def copy(self):
@@ -776,7 +1094,7 @@ class First (Var):
 
     def update_refs(self, old_to_new):
         super().update_refs(old_to_new)
-        self.rest = old_to_new[self.rest]
+        self.rest = old_to_new.get(self.rest, self.rest)
 
     def __str__(self):
         return "<State " + self.name + ">"
@@ -799,12 +1117,12 @@ class First (Var):
                   "to finish the definition")
         return self.parameters + [self.rest]
 
-    def gen_declarations(self):
-        print("    ", self.typespec, " ", self.name, ";", sep="", file=hdrf)
+    def member_declaration(self):
+        return (self.typespec + " ", self.name)
 
     def gen_constructor(self):
         print("    ", self.name, " = ",
-              self.parameters[0].gen_code(), ";", sep="", file=srcf)
+              self.parameters[0].gen_code(), ";", sep="", file=context.srcf)
 
     def gen_brate_code(self):  # overrides Var.gen_brate_code
         return
@@ -816,34 +1134,34 @@ class First (Var):
         if self.rate != AR:
             return None
         print("        ", self.typespec, " ", self.name, "_next = ", 
-              self.rest.gen_code(), ";", sep="", file=srcf)
+              self.rest.gen_code(), ";", sep="", file=context.srcf)
 
     def gen_next_state_br(self):
         if self.rate != BR:
             return None
         print("    ", self.typespec, " ", self.name, "_next = ",
-              self.rest.gen_code(), ";", sep="", file=srcf)
+              self.rest.gen_code(), ";", sep="", file=context.srcf)
 
     def update_arate_state(self):
         if self.rate != AR:
             return None
         print("        ", self.name, " = ", self.name, "_next;", 
-              sep="", file=srcf)
+              sep="", file=context.srcf)
 
     def update_state_br(self):
         if self.rate != BR:
             return None
         print("    ", self.name, " = ", self.name, "_next;", 
-              sep="", file=srcf)
+              sep="", file=context.srcf)
 
 
 def Next(var, defn):
-    global ugg_vars
     if type(var) == str:
-        var = ugg_vars[var]
+        var = context.vars[var]
     if not isinstance(var, First):
         error(str(var) + " in Next should be an instance of First.")
     var.rest = defn
+    graph_changed()
 
 
 # special First that forces rate to be AR, e.g. to count samples
@@ -853,12 +1171,9 @@ class FirstAR (First):
         self.output_rate = AR
 
 
-tempnum = 0
-
 def make_temp_name():
-    global tempnum
-    tempnum += 1
-    return "t" + str(tempnum)
+    context.tempnum += 1
+    return "t" + str(context.tempnum)
 
 
 class Upsample (Uunary):
@@ -873,23 +1188,28 @@ class Upsample (Uunary):
     def __str__(self):
         return "<Upsample " + self.name + ">"
 
+    def cse_key(self):
+        return None
+
     def gen_upsample_prep(self):
         print("    sample ", self.name, "_step = (", 
               self.parameters[0].gen_code(), " - ", self.gen_code(), 
-              ") * BR_RECIP;", sep="", file=srcf)
+              ") * BL_RECIP;", sep="", file=context.srcf)
 
     def gen_code(self):
+        if self in context.vectors:
+            return self.name + "_v[i]"
         return self.name + "_arate"
 
-    def gen_declarations(self):
-        print("    sample ", self.name, "_arate;", sep="", file=hdrf)
+    def member_declaration(self):
+        return ("sample ", self.name + "_arate")
 
     def gen_constructor(self):
-        print("    ", self.name, "_arate = 0;", sep="", file=srcf)
+        print("    ", self.name, "_arate = 0;", sep="", file=context.srcf)
 
     def gen_upsample_update(self):
         print("            ", self.name, "_arate += ", self.name, "_step;",
-              sep="", file=srcf)
+              sep="", file=context.srcf)
 
 # ---------
 
@@ -898,25 +1218,179 @@ RATE_TO_TYPE = {'a': "Ugen *", 'b': "Ugen *", 'c': "sample "}
 
 AR = Ugen("AR")
 
+# all state of the ugen being generated, from ugg_begin to ugg_end.
+# Keeping it in one object, rather than in module globals, makes the
+# generation of each ugen and each variant independent of the others,
+# so they can be generated in separate processes (see ugg_build).
+#
+class UggContext:
+    def __init__(self, name):
+        self.name = name
+        self.vars = {}  # mapping from strings to Var objects
+        self.variations = {}  # maps rate strings to (create name, rate)
+        self.manifest = []  # description of each variant, see ugg_write
+        self.tempnum = 0  # used by make_temp_name
+        self.cache = load_cache(name) if name and UGG_CACHE else {}
+        self.new_cache = {}  # the cache entries for variants written now
+        self.hdrf = io.StringIO()  # code is written here, then saved
+        self.srcf = io.StringIO()  #    by ugg_end
+        # ugens whose values are read from arrays (see gen_fission_loops)
+        self.vectors = set()
+        self.kernelf = io.StringIO()  # C kernels (see gen_kernel)
+        self.kernel = False  # true while C kernels are generated
+        # the input overwritten by the in-place variant being generated
+        self.inplace = None
+        # does some variant use a Utable (declared in ugg_tables.h)?
+        self.tables = False
+        self.stats = Stats(name)  # times and counts (see uggstats.py)
+
+    # return what was generated: a dictionary with the name, the
+    # source files for cmake, and a list of (path, text) to be saved
+    def outputs(self):
+        name = self.name.lower()
+        includes = '#include "ugen.h"\n'
+        if self.tables:
+            includes += '#include "ugg_tables.h"\n'
+        src = "// " + name + " implementations\n\n" + includes + \
+              '#include "' + name + '.h"\n' + self.srcf.getvalue()
+        kernel = "/* " + name + " kernels: plain C, generated " + \
+                 "automatically, do not edit */\n\n#ifndef " + \
+                 name.upper() + "_KERNELS_H\n#define " + name.upper() + \
+                 "_KERNELS_H\n\n" + includes + self.kernelf.getvalue()
+        files = [(CODE_PATH + name + ".h", self.hdrf.getvalue()),
+                 (CODE_PATH + name + ".cpp", src),
+                 (CODE_PATH + name + ".json",
+                  json.dumps({"name": self.name, "variants": self.manifest},
+                             indent=1))]
+        if UGG_KERNELS:
+            files.append((CODE_PATH + name + "_kernels.h",
+                          kernel + "\n#endif\n"))
+        if UGG_CACHE:
+            files.append((cache_path(self.name),
+                          json.dumps(self.new_cache, indent=1,
+                                     sort_keys=True)))
+        return {"name": self.name, "files": files,
+                "sources": [name + ".h", name + ".cpp"],
+                "stats": self.stats.as_dict()}
+
+
+# the context for Vars and temps made outside of ugg_begin/ugg_end
+context = UggContext(None)
+
+# if not None, ugg_end appends outputs here instead of saving them
+ugg_collected = None
+
+
 def ugg_begin(name):
-    global ugg_name, ugg_vars, ugg_ordered_vars
-    global AR, variations, hdrf, srcf
-    ugg_name = name
-    ugg_vars = {}  # mapping from strings to Var objects
-    ugg_ordered_vars = []
-    variations = {}
+    global context
+    ugg_end()  # in case the previous ugen was written without ugg_generate
+    context = UggContext(name)
     name = name.lower()
+    print("//", name, "declarations\n", file=context.hdrf)
 
-    hdrf = open(CODE_PATH + name + ".h", "w")
-    print("//", name, "declarations\n", file=hdrf)
 
-    srcf = open(CODE_PATH + name + ".cpp", "w")
-    print("//", name, "implementations\n", file=srcf)
-    print('#include "ugen.h"', file=srcf)
-    print('#include "', name, '.h"', sep="", file=srcf)
+# finish the ugen started by ugg_begin and save its code
+#
+def ugg_end():
+    global context
+    if context.name is None:
+        return
+    output = context.outputs()
+    context = UggContext(None)
+    if ugg_collected is not None:
+        ugg_collected.append(output)
+    else:
+        save_output(output)
+
+atexit.register(ugg_end)
 
+
+# save files from UggContext.outputs(). Files (and the cache) are only
+# rewritten if their contents changed, so that unchanged ugens do not
+# get new modification times and are not recompiled. The stats of the
+# ugen are appended to ugg_stats.
+#
+def save_output(output):
+    stats = Stats.from_dict(output["stats"])
+    with stats.phase("save"):
+        for path, text in output["files"]:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if write_if_changed(path, text):
+                stats.count("files_written")
     set_source_path(CODE_PATH)
-    add_source_files(name + ".h", name + ".cpp")
+    add_source_files(*output["sources"])
+    ugg_stats.append(stats.as_dict())
+
+
+# Stats.as_dict() of every ugen saved so far, see ugg_write_stats
+ugg_stats = []
+
+
+# write ugg_stats, with the options and total wall time of the run, as
+# JSON to path (see uggstats.py)
+#
+def ugg_write_stats(path, **info):
+    write_report(path, ugg_stats, version=UGG_VERSION,
+                 options=ugg_options(), **info)
+
+
+def cache_path(name):
+    return CODE_PATH + UGG_CACHE_DIR + name.lower() + ".json"
+
+
+# the cache maps variant keys (see variant_key) to the code written
+# for the variant, so unchanged variants do not need to be generated
+#
+def load_cache(name):
+    try:
+        with open(cache_path(name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# describe ugens (a topologically sorted list) in a string that is
+# the same for any graph that generates the same code, and different
+# for graphs that do not. A Utable is described by a hash of its
+# values, not only by its name, since simplify folds its length into
+# the code.
+#
+def ugens_signature(ugens):
+    index = {}
+    for i in range(len(ugens)):
+        index[ugens[i]] = i
+    lines = []
+    for ugen in ugens:
+        value = getattr(ugen, "value", None) if type(ugen) == Ugen else None
+        values = table_values(ugen)
+        if values is not None:
+            value = (value, hashlib.sha256(values.tobytes()).hexdigest())
+        lines.append(repr((type(ugen).__name__, getattr(ugen, "op", None),
+                           type(value).__name__, value, ugen.name,
+                           ugen.typespec, ugen.interpolate_ok,
+                           ugen.output_rate, ugen.exact,
+                           [index[p] for p in ugen.get_all_parameters()])))
+    return "\n".join(lines)
+
+
+# compute a stable hash of everything that determines the code of a
+# variant: the Ugen graph and parameters, the rates, the generator
+# version and code generation options
+#
+def variant_key(rates, params, out, rate, inplace=None):
+    h = hashlib.sha256()
+    options = (UGG_VERSION, SAMPLE_TYPE, UGG_CSE, UGG_SIMPLIFY,
+               UGG_EXACT_FLOAT, UGG_CAPI, UGG_FISSION, UGG_KERNELS,
+               context.tempnum,
+               context.name, rates, rate, inplace)
+    h.update(repr(options).encode())
+    h.update(ugens_signature(out.get_ugen_list()).encode())
+    for param in params:
+        h.update(repr((param.name, param.typespec)).encode())
+        for action in param.actions:
+            h.update(repr(action[0].name).encode())
+            h.update(ugens_signature(action[1].get_ugen_list()).encode())
+    return h.hexdigest()
 
 
 def print_ugens(heading, ugens):
@@ -944,117 +1418,527 @@ def copy_ugens(ugens, out):
     return new, old_to_new[out]
 
 
-def ugg_write(rates, params, out, rate):
-    global ugg_name, variations, hdrf, srcf
+# replace ugens by simpler equivalents (see Ugen.simplify), folding
+# constants bottom-up. Expressions marked with exact() and all of
+# their parameters only get simplifications that are exact in IEEE
+# arithmetic. ugens must be in topological order and have rates.
+# Returns the new ugen list and out.
+#
+def simplify_ugens(ugens, out):
+    for ugen in reversed(ugens):  # propagate exact() to parameters
+        if ugen.exact:
+            for parm in ugen.get_all_parameters():
+                parm.exact = True
+    simpler = {}  # maps ugen to its simplified replacement
+    for ugen in ugens:
+        ugen.update_refs(simpler)
+        new = ugen.simplify()
+        if new is not ugen and new.rate == ugen.rate:
+            if log.passes.info:
+                log.passes("simplified", str(ugen), "to", str(new))
+            simpler[ugen] = new
+    if not simpler:
+        return ugens, out
+    for ugen in ugens:  # First.rest can refer to later ugens
+        ugen.update_refs(simpler)
+    out = simpler.get(out, out)
+    return out.get_ugen_list(), out
+
+
+# simplify a copy of expr, e.g. to see how an expression will be
+# emitted. Returns the simplified expression.
+#
+def simplify_expr(expr):
+    ugens, out = copy_ugens(expr.get_ugen_list(), expr)
+    ugens, out = simplify_ugens(ugens, out)
+    return out
 
-    print("#### ugg_write", ugg_name, rates, params, rate)
-    name = ugg_name
-    if len(params) > 0:
-        name += "_"
-    for i in range(len(params)):
-        name += rates[i]
-        params[i].rate = rates[i]
 
-    # make topological sort of calculation tree
-    ugens = out.get_ugen_list()
-    # find ugens to upsample
+# merge ugens that compute the same value (see Ugen.cse_key) so that
+# every distinct subexpression is represented by a single node. ugens
+# must be in topological order; returns the surviving ugens and out.
+#
+def merge_common_subexpressions(ugens, out):
+    canonical = {}  # maps cse_key to the surviving ugen
+    merged = {}  # maps a merged ugen to its surviving replacement
+    survivors = []
     for ugen in ugens:
-        if not isinstance(ugen, Param):
-            ugen.rate = None
-        ugen.upsample = False
+        ugen.update_refs(merged)
+        key = ugen.cse_key()
+        if key is not None and key in canonical:
+            merged[ugen] = canonical[key]
+            if log.passes.info:
+                log.passes("merged", str(ugen), "into", str(canonical[key]))
+            continue
+        if key is not None:
+            canonical[key] = ugen
+        survivors.append(ugen)
+    if merged:
+        for ugen in survivors:  # First.rest can refer to later ugens
+            ugen.update_refs(merged)
+    return survivors, merged.get(out, out)
+
+
+# replace a reference from consumer (parameter i of get_all_parameters(),
+# or the output of the whole ugen if consumer is None) with ugen.
+# Returns the (possibly new) output.
+#
+def replace_reference(consumer, i, ugen, out):
+    if consumer is None:
+        out = ugen
+    elif i == len(consumer.parameters):  # must be First.rest
+        consumer.rest = ugen
+    else:
+        consumer.parameters[i] = ugen
+        consumer.update_refs({})  # refresh Cond and Usubscript fields
+    graph_changed()
+    return out
+
+
+# after merging, an expression used by more than one consumer would
+# still be emitted inline (and computed) once per use. Compute it once
+# in a temp Var at the expression's rate instead: CR temps are members
+# set in the constructor, BR temps are computed before the loop, and
+# AR temps are computed once per sample. Returns the new out.
+#
+def share_common_subexpressions(ugens, out):
+    refs = {}  # maps expression to list of (consumer, parameter index)
     for ugen in ugens:
-        ugen.find_rate(rate)
-    # find ugens that need to be upsampled
-    ugens, out = copy_ugens(ugens, out)  # also sets ugg_map
+        parameters = ugen.get_all_parameters()
+        for i in range(len(parameters)):
+            parm = parameters[i]
+            if type(parm) == Ugen or parm.cse_key() is None:
+                continue  # constants and named ugens are already cheap
+            if isinstance(ugen, Cond) and i > 0:
+                continue  # only evaluated conditionally, do not hoist
+            if isinstance(ugen, First) and i == 0 and parm.rate != CR:
+                continue  # initialization is computed in the constructor
+            refs.setdefault(parm, []).append((ugen, i))
+    if type(out) != Ugen and out.cse_key() is not None:
+        refs.setdefault(out, []).append((None, 0))
 
     for ugen in ugens:
-        for i in range(len(ugen.parameters)):
-            parm = ugen.parameters[i]
+        uses = refs.get(ugen, [])
+        if len(uses) < 2:
+            continue
+        # if a plain Var already holds this value, use it as the temp
+        temp = None
+        for consumer, i in uses:
+            if type(consumer) == Var and consumer.rate == ugen.rate and \
+               consumer.typespec == ugen.typespec:
+                temp = consumer
+                break
+        if not temp:
+            temp = Var(make_temp_name(), ugen, ugen.typespec)
+            temp.rate = ugen.rate
+            if log.passes.info:
+                log.passes("created variable", str(temp), "for shared",
+                           str(ugen))
+        for consumer, i in uses:
+            if consumer is not temp:
+                out = replace_reference(consumer, i, temp, out)
+    return out
+
+
+# liveness: a Param or CR Var only needs to be a member of the generated
+# class if its value is used after the constructor returns, i.e. in
+# run() or in a set_ method. Mark the others with member = False so
+# that they are not declared or stored (CR Vars used in the constructor
+# become locals there). Non-CR Params (pointers to input ugens), states
+# and Upsamples are always members. ugens should be in topological
+# order; params are the original (not copied) Params of this variant.
+# Returns the names of the ugens that are not members.
+#
+def mark_members(ugens, out, params):
+    live = set()  # ugens used in run()
+    live_names = set()  # names used in set_ methods
+    stack = [out]
+    for ugen in ugens:
+        if isinstance(ugen, First):
+            stack.append(ugen.rest)  # evaluated in run()
+    while stack:
+        ugen = stack.pop()
+        if ugen in live:
+            continue
+        live.add(ugen)
+        if isinstance(ugen, Var) and ugen.rate == CR:
+            continue  # definition is evaluated in the constructor
+        if isinstance(ugen, First):
+            continue  # rest is already a root, initialization is not run
+        stack.extend(ugen.parameters)
+    for param in params:
+        for action in param.actions:
+            stack = [action[1]]
+            while stack:
+                ugen = stack.pop()
+                if isinstance(ugen, (Var, Param)):
+                    if ugen.name != param.name:  # set_ parameter shadows it
+                        live_names.add(ugen.name)
+                else:
+                    stack.extend(ugen.parameters)
+    dead = []
+    for ugen in ugens:
+        if (isinstance(ugen, Param) and ugen.rate == CR) or \
+           (type(ugen) == Var and ugen.rate == CR):
+            ugen.member = ugen in live or ugen.name in live_names
+            if not ugen.member:
+                dead.append(ugen.name)
+    return dead
+
+
+# code motion: every expression is computed at the slowest rate its
+# operands allow (its rate from find_rate), but an expression used by a
+# faster consumer would be emitted inline and computed at the consumer's
+# rate. Move such expressions out:
+#   CR expressions used in run() go into a temp Var that is a member
+#       computed in the constructor.
+#   BR expressions used by AR consumers are computed once per block,
+#       either as an Upsample (interpolated) or, if interpolation is not
+#       ok, as a BR temp Var computed before the loop.
+# Constants, Params, Vars and states are already computed at their own
+# rate and are not moved. Returns a list of strings describing the
+# moves, which ugg_write prints so you can check the inner loops.
+#
+def move_code(ugens):
+    moves = []
+    for ugen in ugens:
+        parameters = ugen.get_all_parameters()
+        for i in range(len(parameters)):
+            parm = parameters[i]
+            if isinstance(ugen, First) and i == 0:
+                continue  # initialization is computed in the constructor
             if parm.rate == BR and ugen.rate == AR:
-                print("need upsample for", str(parm))
                 if parm.interpolate_ok:
                     if not parm.upsample:
                         parm.upsample = Upsample(parm)
                         if not parm.name:
                             parm.name = make_temp_name()
                         parm.upsample.name = parm.name
-                        print("created upsample for", str(parm))
-                    ugen.parameters[i] = parm.upsample
-                    print("replaced (A) parameter", i, "in", str(ugen), "with",
-                          str(parm.upsample))
+                        moves.append("upsampled " + str(parm) + " as " +
+                                     parm.upsample.gen_code())
+                    replace_reference(ugen, i, parm.upsample, None)
                 elif not isinstance(parm, Var):
                     # capture computation in a var at brate, access at arate
                     if not parm.upsample:
                         parm.upsample = Var(make_temp_name(), parm)
                         parm.upsample.rate = BR
-                        print("created variable for", str(parm))
-                    ugen.parameters[i] = parm.upsample
-                    print("replaced (B) parameter", i, "in", str(ugen), "with",
-                          str(parm.upsample))
+                        moves.append("moved " + str(parm) + " from loop " +
+                                     "to block rate as " + parm.upsample.name)
+                    replace_reference(ugen, i, parm.upsample, None)
             # CR expressions that are computed and used in run()
             # should be saved in a temp. If the CR expression is
             # a Var or Param, there's no need for a copy of it.
-            # If the CR expression is parameter 0 (initialization) 
-            # of First (state), then do not create a temp variable. 
-            elif parm.rate == CR and ugen.rate == AR and \
+            elif parm.rate == CR and ugen.rate in (AR, BR) and \
                  type(parm) != Ugen and not isinstance(parm, Var) \
-                 and not isinstance(parm, Param) \
-                 and not (i == 0 and isinstance(ugen, First)):
+                 and not isinstance(parm, Param):
                 if not parm.upsample:
                     parm.upsample = Var(make_temp_name(), parm)
                     parm.upsample.rate = CR
-                    print("created variable for", str(parm))
-                ugen.parameters[i] = parm.upsample
-                print("replaced (C) parameter", i, "=", parm, "in", str(ugen), \
-                      "with", str(parm.upsample))
-
+                    moves.append("moved " + str(parm) + " from " +
+                                 ("loop" if ugen.rate == AR else "block rate")
+                                 + " to constructor as " +
+                                 parm.upsample.name)
+                replace_reference(ugen, i, parm.upsample, None)
+    return moves
+
+
+# write the class for one variant of the current ugen. If the variant
+# is in the cache, or in generated (a dictionary from variant_key to
+# the result of generate_variant, see ugg_write_all), the code is not
+# generated again. The variant is described in context.manifest, which
+# is saved in CODE_PATH/<name>.json for tools such as ugperf.py: the
+# class name, parameter rates, output rate and constructor parameters,
+# and for in-place variants (see generate_variant), the input that is
+# overwritten.
+#
+def ugg_write(rates, params, out, rate, inplace=None, generated=None):
+    if generated is None:
+        generated = {}
+    if log.emit.info:
+        log.emit("#### ugg_write", context.name, rates, params, rate,
+                 inplace or "")
+    rename_duplicates(params, out)
+    if uses_tables(params, out):
+        context.tables = True
+    stats = Stats()
+    with stats.phase("key"):
+        key = variant_key(rates, params, out, rate, inplace)
+    if key in context.cache:
+        if log.emit.info:
+            log.emit("#### unchanged, using cached code")
+        code = context.cache[key]
+        stats.count("cached")
+    elif key in generated:
+        printed, code, worker_stats = generated[key]
+        print(printed, end="")
+        stats.merge(Stats.from_dict(worker_stats))
+    else:
+        code = generate_variant(rates, params, out, rate, inplace, stats)
+    context.hdrf.write(code["hdr"])
+    context.srcf.write(code["src"])
+    context.kernelf.write(code.get("kernel", ""))
+    if not inplace:  # the Patch class uses the ordinary variants
+        context.variations["".join(rates)] = tuple(code["variation"])
+    variant = {
+            "class": code["variation"][0][: -len("_create")],
+            "rates": "".join(rates), "rate": code["variation"][1],
+            "params": [{"name": params[i].name, "rate": rates[i],
+                        "type": typespec_for_rate(params[i], rates[i]).strip()}
+                       for i in range(len(params))],
+            "set": [param.name for param in params if param.actions]}
+    if inplace:
+        variant["inplace"] = inplace
+    context.manifest.append(variant)
+    context.new_cache[key] = code
+    stats.name = code["variation"][0][: -len("_create")]
+    stats.count("bytes", len(code["hdr"]) + len(code["src"]))
+    context.stats.add_variant(stats)
+
+
+# give each Var (and First) used to compute out, or by the actions of
+# params, a name that no other Var or Param has. A ugen can then be
+# made by composing description functions, e.g. osci(...) * decay(...),
+# or calling one more than once: the second Var named x1 is renamed
+# x1_2, and so on. Names are changed in the original graph (not in the
+# copies made for variants) so that every variant and the set_
+# methods use the same names.
+#
+def rename_duplicates(params, out):
+    ugens = out.get_ugen_list()
+    for param in params:
+        for state, expr in param.actions:
+            ugens += [state] + expr.get_ugen_list()
+    names = set(param.name for param in params)
+    renamed = set()
+    for ugen in ugens:
+        if not isinstance(ugen, Var) or ugen in renamed:
+            continue
+        renamed.add(ugen)
+        if ugen.name in names:
+            n = 2
+            while ugen.name + "_" + str(n) in names:
+                n += 1
+            if log.passes.info:
+                log.passes("renamed", ugen.name, "to",
+                           ugen.name + "_" + str(n))
+            ugen.name += "_" + str(n)
+        names.add(ugen.name)
+
+
+# run the passes that prepare the graph of out for one variant: find
+# rates, copy, simplify, merge common subexpressions, move code to the
+# rate it needs, and find which Params and Vars are members. Params
+# must have their rates (from rates) already. name is the variant
+# name (without output rate) for reports. Returns the topologically
+# sorted list of ugens of the variant and the (copied) out. Copies and
+# temps are registered as Vars in context: see generate_variant.
+#
+def prepare_variant(name, params, out, rate, stats):
+    tempnum = context.tempnum
+    # make topological sort of calculation tree
+    with stats.phase("sort"):
+        ugens = out.get_ugen_list()
+    stats.count("nodes", len(ugens))
+    # find ugens to upsample
+    with stats.phase("find_rate"):
+        for ugen in ugens:
+            if not isinstance(ugen, Param):
+                ugen.rate = None
+            ugen.upsample = False
+        for ugen in ugens:
+            ugen.find_rate(rate)
+    # find ugens that need to be upsampled
+    with stats.phase("copy"):
+        ugens, out = copy_ugens(ugens, out)  # also sets ugg_map
+    if UGG_SIMPLIFY:
+        with stats.phase("simplify"):
+            ugens, out = simplify_ugens(ugens, out)
+    if UGG_CSE:
+        with stats.phase("cse"):
+            ugens, out = merge_common_subexpressions(ugens, out)
+
+    with stats.phase("move_code"):
+        moves = move_code(ugens)
+    stats.count("moves", len(moves))
+    if moves and log.passes.info:
+        log.passes("code motion for", name + "_" + out.rate + ":")
+        for move in moves:
+            log.passes("    ", move, sep="")
 
     # now that we've added Upsample ugens, recompute
-    ugens = out.get_ugen_list()
+    with stats.phase("sort"):
+        ugens = out.get_ugen_list()
+    if UGG_CSE:
+        with stats.phase("cse"):
+            out = share_common_subexpressions(ugens, out)
+        with stats.phase("sort"):
+            ugens = out.get_ugen_list()
+
+    with stats.phase("liveness"):
+        dead = mark_members(ugens, out, params)
+    stats.count("dead", len(dead))
+    if dead and log.passes.info:
+        log.passes("not members of", name + "_" + out.rate + ":", *dead)
 
 #    print_ugens("ugens including Upsample", ugens)
+    stats.count("nodes_emitted", len(ugens))
+    stats.count("upsamples", sum(isinstance(u, Upsample) for u in ugens))
+    stats.count("temps", context.tempnum - tempnum)
+    return ugens, out
+
+
+# generate the class for one variant. Returns a dictionary with the
+# header ("hdr") and implementation ("src") code, and the entry for
+# context.variations ("variation"). The time of each phase and the
+# number of nodes, temps, etc. are recorded in stats.
+#
+# If inplace is the name of an AR parameter, the class is an in-place
+# variant, <name>_inplace: it writes its output over the samples of
+# that input, and its outs points to them, so no other ugen may read
+# the input (its fan-out must be one). Generated code reads sample i
+# of an input only to compute sample i of the output, so this is safe.
+# In-place variants have no C kernel: kernel inputs must not overlap
+# the output.
+#
+def generate_variant(rates, params, out, rate, inplace=None, stats=None):
+    stats = stats or Stats()
+    # copies and temps made here are registered as Vars, but they only
+    # belong to this variant: restore the registry when we are done.
+    # Temp names start from the same number in every variant so that
+    # the code does not depend on which other variants are generated.
+    saved = (context.vars.copy(), context.tempnum, context.hdrf,
+             context.srcf)
+    context.hdrf = io.StringIO()
+    context.srcf = io.StringIO()
+    name = context.name
+    if len(params) > 0:
+        name += "_"
+    for i in range(len(params)):
+        name += rates[i]
+        params[i].rate = rates[i]
+
+    ugens, out = prepare_variant(name, params, out, rate, stats)
 
-    print("*************************")
-    out.print_tree()
-    print("*************************")
+    if log.emit.info:
+        with stats.phase("print_tree"):
+            log.emit("*************************")
+            out.print_tree()
+            log.emit("*************************")
+
+    stats.start("emit")
 
     name += "_" + out.rate
-    ratestring = "".join(rates)  # make one string to be hashable
-    variations[ratestring] = (name + "_create", out.rate)
+    if inplace:
+        name += "_inplace"
+    variation = (name + "_create", out.rate)
     print("class ", name, " : public Ugen_out", out.rate, " {", 
-          sep="", file=hdrf)
+          sep="", file=context.hdrf)
 
     # declare member variables
     for ugen in ugens:
         ugen.gen_declarations()
 
     # generate constructor
-    print("\n  public:", file=hdrf)
-    print("    ", name, "(", sep="", end="", file=hdrf)
-    print("\n", name, "::", name, "(", sep="", end="", file=srcf)
+    print("\n  public:", file=context.hdrf)
+    print("    ", name, "(", sep="", end="", file=context.hdrf)
+    print("\n", name, "::", name, "(", sep="", end="", file=context.srcf)
     need_comma = False
     for i in range(len(params)):
         if need_comma:
-            print(", ", sep="", end="", file=hdrf)
-            print(", ", sep="", end="", file=srcf)
+            print(", ", sep="", end="", file=context.hdrf)
+            print(", ", sep="", end="", file=context.srcf)
         param_typespec = typespec_for_rate(params[i], rates[i])
-        print(param_typespec, params[i].name, sep="", end="", file=hdrf)
-        print(param_typespec, params[i].name, sep="", end="", file=srcf)
+        print(param_typespec, params[i].name, sep="", end="", file=context.hdrf)
+        print(param_typespec, params[i].name, sep="", end="", file=context.srcf)
         need_comma = True
-    print(");", file=hdrf)
-    print(")\n{\n    block_count = 0;", file=srcf)
+    print(");", file=context.hdrf)
+    print(")\n{\n    block_count = 0;", file=context.srcf)
     for ugen in ugens:
         ugen.gen_constructor()
-    print("}", file=srcf)
+    print("}", file=context.srcf)
 
-    # generate run() method
-    print("    void run(long block_num);", file=hdrf)
-    print("\nvoid ", name, "::run(long block_num)\n{", file=srcf, sep="")
+    # generate run() method: run inputs, then compute()
+    print("    void run(long block_num);", file=context.hdrf)
+    print("\nvoid ", name, "::run(long block_num)\n{", file=context.srcf, sep="")
     # update inputs
     for ugen in ugens:
         ugen.gen_update_input()
-    print("    block_count = block_num;", file=srcf)
+    print("    block_count = block_num;", file=context.srcf)
+    print("    ", name, "::compute();", sep="", file=context.srcf)
+    print("}", file=context.srcf)
+
+    # generate compute() method, which assumes inputs have been run
+    # (see Ugen_schedule in schedule.h)
+    print("    void compute() UGG_RESTRICT_THIS;", file=context.hdrf)
+    print("\nvoid ", name, "::compute() UGG_RESTRICT_THIS\n{",
+          file=context.srcf, sep="")
+    if log.emit.debug:
+        for count, ugen in enumerate(ugens, 1):
+            log.emit("Ugens[" + str(count) + "] =", ugen,
+                     "".join(str(p) for p in ugen.parameters))
+    if inplace:
+        print("    sample *outs = this->outs = ", inplace, "->get_outs();",
+              sep="", file=context.srcf)
+    elif out.rate == AR:
+        # outs can point to a shared block (see schedule.h)
+        print("    sample *outs = ",
+              "UGG_ASSUME_ALIGNED(this->outs)" if UGG_FISSION else
+              "this->outs", ";", sep="", file=context.srcf)
+    context.inplace = inplace
+    gen_run_body(ugens, out)
+    context.inplace = None
+    print("}", file=context.srcf)
+
+    # generate get_inputs() method: the AR and BR inputs
+    inputs = [u for u in ugens if isinstance(u, Param) and u.rate != CR]
+    print("    int get_inputs(Ugen **inputs);", file=context.hdrf)
+    print("\nint ", name, "::get_inputs(Ugen **inputs)\n{", sep="",
+          file=context.srcf)
+    if inputs:
+        print("    if (inputs) {", file=context.srcf)
+        for i, param in enumerate(inputs):
+            print("        inputs[", i, "] = ", param.name, ";", sep="",
+                  file=context.srcf)
+        print("    }", file=context.srcf)
+    else:
+        print("    (void) inputs;", file=context.srcf)
+    print("    return ", len(inputs), ";\n}", sep="", file=context.srcf)
+    if inplace:
+        print("    Ugen *get_inplace_input();", file=context.hdrf)
+        print("\nUgen *", name, "::get_inplace_input()\n{\n    return ",
+              inplace, ";\n}", sep="", file=context.srcf)
 
+    # now write update actions
+    # when a "constant" parameter is updated, change the state 
+    # variables to new values
+    for param in params:
+        if param.actions:
+            print("    void set_", param.name, "(sample ",
+                  param.name, ");", sep="", file=context.hdrf)
+            print("void ", name, "::set_", param.name, "(sample ",
+                  param.name, ") {", sep="", file=context.srcf)
+            for action in param.actions:
+                statevar = action[0]
+                newval = action[1]
+                print("    ", statevar.name, " = ",
+                      newval.gen_code(), ";", sep="", file=context.srcf)
+            print("}", file=context.srcf)
+    print("};\n", file=context.hdrf)
+    if UGG_CAPI:
+        gen_c_api(name, rates, params)
+    code = {"hdr": context.hdrf.getvalue(), "src": context.srcf.getvalue(),
+            "variation": variation}
+    if UGG_KERNELS and not inplace:
+        code["kernel"] = gen_kernel(name, rates, params, ugens, out)
+    stats.stop("emit")
+    context.vars, context.tempnum, context.hdrf, context.srcf = saved
+    return code
+
+
+# generate the code that computes a block, after inputs have been run:
+# the body of run(), or of the process function of a kernel
+#
+def gen_run_body(ugens, out):
     #   get pointers to samples for AR inputs
     for ugen in ugens:
         ugen.gen_brate_code()
@@ -1064,33 +1948,22 @@ def ugg_write(rates, params, out, rate):
 
     #   generate inner loop of run() method if rate is AR
     if out.rate == AR:
-        print("    for (int i = 0; i < BL; i++) {", file=srcf)
         # currently, we only generate code for Vars, and we do so
         # in the order of Var creation -- user is expected to 
         # order Var declarations so that Vars are defined before use
-        count = 1
-        for ugen in ugens:
-            print("Ugens[" + str(count) + "] =", ugen, end=" ")
-            for p in ugen.parameters:
-                print(p, end="")
-            print()
-            count += 1
-        for ugen in ugens:
-            ugen.gen_arate_code()
-        print("        outs[i] = ", out.gen_code(), ";", sep="", file=srcf)
-        #   generate next state values
-        for ugen in ugens:
-            ugen.gen_next_arate_state()
-        #   generate BR updates
-        for ugen in ugens:
-            ugen.gen_upsample_update()
-        #   generate state updates
-        for ugen in ugens:
-            ugen.update_arate_state()
-
-        print("    }", sep="", file=srcf)
+        if UGG_FISSION:
+            gen_fission_loops(ugens, out)
+        else:
+            print("    for (int i = 0; i < BL; i++) {", file=context.srcf)
+            for ugen in ugens:
+                ugen.gen_arate_code()
+            print("        ", output_sample(), " = ", out.gen_code(), ";",
+                  sep="", file=context.srcf)
+            gen_state_updates(ugens)
+            print("    }", sep="", file=context.srcf)
     elif out.rate == BR:
-        print("    out = ", out.gen_code(), ";", sep="", file=srcf)
+        print("    ", "*out" if context.kernel else "out", " = ",
+              out.gen_code(), ";", sep="", file=context.srcf)
 
     # generate next state values
     for ugen in ugens:
@@ -1098,24 +1971,264 @@ def ugg_write(rates, params, out, rate):
     #   generate state updates
     for ugen in ugens:
         ugen.update_state_br()
-    print("}", file=srcf)
 
-    # now write update actions
-    # when a "constant" parameter is updated, change the state 
-    # variables to new values
+
+# where sample i of the output goes: the outs member, or the out
+# parameter of a kernel
+#
+def output_sample():
+    return "out[i]" if context.kernel else "outs[i]"
+
+
+# generate the end of the body of the AR loop: next state values, BR
+# updates and state updates
+#
+def gen_state_updates(ugens):
+    for ugen in ugens:
+        ugen.gen_next_arate_state()
+    for ugen in ugens:
+        ugen.gen_upsample_update()
+    for ugen in ugens:
+        ugen.update_arate_state()
+
+
+# the Vars, Firsts and Upsamples whose names appear in the code for
+# the AR expression ugen (expressions without names are written inline)
+#
+def named_inputs(ugen):
+    found = set()
+    visited = set()
+    stack = list(ugen.parameters)
+    while stack:
+        u = stack.pop()
+        if u.rate != AR or isinstance(u, Param) or u in visited:
+            continue
+        visited.add(u)
+        if isinstance(u, (Var, Upsample)):
+            found.add(u)
+        else:
+            stack.extend(u.parameters)
+    return found
+
+
+# generate the AR loop of run() as two loops, so that compilers can
+# vectorize the second one (UGG_FISSION). The first (serial) loop
+# computes the AR states (Firsts and Upsamples) and the Vars needed
+# for their next values, saving the values used later in local arrays
+# <name>_v. The second loop has no state: it computes the other Vars
+# and outs[i], reading states from the arrays. If there are no
+# states, there is only the second loop. The code computes exactly
+# what the single loop computes.
+#
+def gen_fission_loops(ugens, out):
+    states = [u for u in ugens if u.rate == AR and
+              isinstance(u, (First, Upsample))]
+    # AR Vars needed to compute the next states go in the serial loop
+    serial = set(states)
+    visited = set(states)
+    stack = [f.rest for f in states if isinstance(f, First)]
+    while stack:
+        u = stack.pop()
+        if u.rate == AR and u not in visited and not isinstance(u, Param):
+            visited.add(u)
+            if isinstance(u, Var):
+                serial.add(u)
+            stack.extend(u.parameters)
+    stateless = [u for u in ugens if u.rate == AR and
+                 isinstance(u, Var) and u not in serial]
+    vectors = set()  # serial values that the second loop uses
+    for u in stateless:
+        vectors.update(v for v in named_inputs(u) if v in serial)
+    if isinstance(out, (Var, Upsample)):
+        vectors.update([out] if out in serial else [])
+    else:
+        vectors.update(v for v in named_inputs(out) if v in serial)
+    # when the output is a state or a serial Var, and there is nothing
+    # else to compute, write outs[i] in the serial loop
+    out_in_serial = out in serial and not stateless
+    if out_in_serial:
+        vectors.discard(out)
+    if states:
+        for u in ugens:
+            if u in vectors:
+                typespec = "sample" if isinstance(u, Upsample) \
+                           else u.typespec
+                print("    UGG_ALIGNED ", typespec, " ", u.name, "_v[BL];",
+                      sep="", file=context.srcf)
+        print("    for (int i = 0; i < BL; i++) {", file=context.srcf)
+        for u in ugens:
+            if u in serial:
+                u.gen_arate_code()
+        for u in ugens:
+            if u in vectors:
+                print("        ", u.name, "_v[i] = ", u.gen_code(), ";",
+                      sep="", file=context.srcf)
+        if out_in_serial:
+            print("        ", output_sample(), " = ", out.gen_code(), ";",
+                  sep="", file=context.srcf)
+        gen_state_updates(ugens)
+        print("    }", sep="", file=context.srcf)
+    if not out_in_serial:
+        context.vectors = vectors
+        print("    UGG_VECTORIZE", file=context.srcf)
+        print("    for (int i = 0; i < BL; i++) {", file=context.srcf)
+        for u in stateless:
+            u.gen_arate_code()
+        print("        ", output_sample(), " = ", out.gen_code(), ";",
+              sep="", file=context.srcf)
+        print("    }", sep="", file=context.srcf)
+        context.vectors = set()
+
+
+# generate a plain C kernel for the variant class name, returning the
+# code. The kernel has no classes or virtual functions: the members of
+# the class are in a struct, <name>_state, which <name>_init
+# initializes, and <name>_process(state, inputs..., out) computes one
+# block. The caller runs inputs first (as in a static schedule): AR
+# inputs are pointers to BL samples, BR inputs are samples, and out
+# is BL samples (AR) or one sample (BR). Inputs must not overlap out.
+# <name>_set_<param>(state, value) does what set_<param> does.
+#
+# The code is made by the same methods that make the class, with
+# context.kernel set. Members are copied to local variables with the
+# same names, so the code can use them as the class uses members;
+# states are copied back to the struct at the end.
+#
+def gen_kernel(name, rates, params, ugens, out):
+    saved = (context.srcf, context.kernel)
+    context.srcf = io.StringIO()
+    context.kernel = True
+    f = context.srcf
+    members = [u for u in ugens if u.member_declaration() and
+               not (isinstance(u, Param) and u.rate != CR)]
+    decls = [u.member_declaration() for u in members]
+
+    print("\ntypedef struct {", file=f)
+    for typespec, member in decls:
+        print("    ", typespec, member, ";", sep="", file=f)
+    if not decls:
+        print("    int unused;  /* C structs cannot be empty */", file=f)
+    print("} ", name, "_state;", sep="", file=f)
+
+    print("\nstatic inline void ", name, "_init(", name, "_state *s",
+          "".join(", " + typespec_for_rate(p, CR) + p.name
+                  for p in params if p.rate == CR),
+          ")\n{", sep="", file=f)
+    if not decls:
+        print("    (void) s;", file=f)
+    for u, (typespec, member) in zip(members, decls):
+        if not isinstance(u, Param):
+            print("    ", typespec, member, ";", sep="", file=f)
+    for ugen in ugens:
+        ugen.gen_constructor()
+    for u, (typespec, member) in zip(members, decls):
+        if not isinstance(u, Param):
+            print("    s->", member, " = ", member, ";", sep="", file=f)
+    print("}", file=f)
+
+    inputs = ""
+    for p in params:
+        if p.rate == AR:
+            inputs += ", const sample *UGG_RESTRICT " + p.name + "_samps"
+        elif p.rate == BR:
+            inputs += ", sample " + p.name
+    print("\nstatic inline void ", name, "_process(", name, "_state *s",
+          inputs, ", sample *UGG_RESTRICT out)\n{", sep="", file=f)
+    if not decls:
+        print("    (void) s;", file=f)
+    for typespec, member in decls:
+        print("    ", typespec, member, " = s->", member, ";", sep="", file=f)
+    gen_run_body(ugens, out)
+    for u, (typespec, member) in zip(members, decls):
+        if isinstance(u, (First, Upsample)):
+            print("    s->", member, " = ", member, ";", sep="", file=f)
+    print("}", file=f)
+
     for param in params:
         if param.actions:
-            print("    void set_", param.name, "(sample ",
-                  param.name, ");", sep="", file=hdrf)
-            print("void ", name, "::set_", param.name, "(sample ",
-                  param.name, ") {", sep="", file=srcf)
-            for action in param.actions:
-                statevar = action[0]
-                newval = action[1]
-                print("    ", statevar.name, " = ",
-                      newval.gen_code(), ";", sep="", file=srcf)
-            print("}", file=srcf)
-    print("};\n", file=hdrf)
+            print("\nstatic inline void ", name, "_set_", param.name, "(",
+                  name, "_state *s, sample ", param.name, ")\n{",
+                  sep="", file=f)
+            for state, expr in param.actions:
+                used = set(u.name for u in expr.get_ugen_list()
+                           if isinstance(u, (Param, Var)))
+                for typespec, member in decls:
+                    if member in used and member != param.name:
+                        print("    ", typespec, member, " = s->", member,
+                              ";", sep="", file=f)
+                print("    s->", state.name, " = ", expr.gen_code(), ";",
+                      sep="", file=f)
+            print("}", file=f)
+    code = f.getvalue()
+    context.srcf, context.kernel = saved
+    return code
+
+
+# generate a C interface to the variant class name, so it can be used
+# from a shared library (e.g. by ugglib.py): <name>_create(parameters)
+# returns a new instance, and <name>_set_<param>(ugen, value) calls
+# set_<param>. Running, reading outputs and deleting instances work
+# the same for all ugens (see ugg_capi.h).
+#
+def gen_c_api(name, rates, params):
+    decl = "extern \"C\" Ugen *" + name + "_create(" + \
+           ", ".join(typespec_for_rate(params[i], rates[i]) + params[i].name
+                     for i in range(len(params))) + ")"
+    print(decl + ";", file=context.hdrf)
+    print("\n" + decl + "\n{", file=context.srcf)
+    print("    return new ", name, "(",
+          ", ".join(param.name for param in params), ");\n}",
+          sep="", file=context.srcf)
+    for param in params:
+        if param.actions:
+            decl = "extern \"C\" void " + name + "_set_" + param.name + \
+                   "(Ugen *ugen, sample " + param.name + ")"
+            print(decl + ";", file=context.hdrf)
+            print("\n" + decl + "\n{", file=context.srcf)
+            print("    ((", name, " *) ugen)->set_", param.name, "(",
+                  param.name, ");\n}", sep="", file=context.srcf)
+    print(file=context.hdrf)
+
+
+# generate_variant for variants[i] in a worker process of ugg_write_all:
+# returns the printed output, the code and the stats
+#
+def variant_worker(i):
+    rates, params, out, rate, inplace = pending_variants[i]
+    printed = io.StringIO()
+    stats = Stats()
+    with contextlib.redirect_stdout(printed):
+        code = generate_variant(rates, params, out, rate, inplace, stats)
+    return printed.getvalue(), code, stats.as_dict()
+
+
+# write all variants, a list of (rates, params, out, rate, inplace). With
+# UGG_JOBS > 1, variants that are not cached are generated in parallel
+# by forked worker processes (which share the Ugen graph with this
+# process). The results, including printed output, are identical to
+# calling ugg_write for each variant in order.
+#
+def ugg_write_all(variants):
+    global pending_variants
+    generated = {}
+    for v in variants:
+        rename_duplicates(v[1], v[2])
+    keys = [variant_key(*v) for v in variants]
+    todo = [i for i in range(len(variants)) if keys[i] not in context.cache]
+    context.stats.count("variants", len(variants))
+    context.stats.count("generated", len(todo))
+    if UGG_JOBS > 1 and len(todo) > 1 and \
+       "fork" in multiprocessing.get_all_start_methods():
+        pending_variants = variants
+        mp = multiprocessing.get_context("fork")
+        with context.stats.phase("parallel"):
+            with mp.Pool(min(UGG_JOBS, len(todo))) as pool:
+                results = pool.map(variant_worker, todo)
+        pending_variants = None
+        for i, result in zip(todo, results):
+            generated[keys[i]] = result
+    for v in variants:
+        ugg_write(*v, generated=generated)
 
 
 # prates represents all parameter rates. Determine possible output
@@ -1129,12 +2242,14 @@ def filter_rates_from_params(prates):
     for rates in prates:
         if AR in rates: arate = AR
         if BR in rates: brate = BR
-    print("filter_rates_from_params", arate + brate)
+    if log.rates.debug:
+        log.rates("filter_rates_from_params", arate + brate)
     return arate + brate # concatenate maybe "a" and maybe "b"
 
 
 def make_rate_combinations(rates, commutative):
-    print("mrc", rates, commutative)
+    if log.rates.debug:
+        log.rates("mrc", rates, commutative)
     param_rates = rates[0 : -1]
     output_type = rates[-1]
     if output_type[0] == 'g':
@@ -1144,7 +2259,8 @@ def make_rate_combinations(rates, commutative):
         rates = param_rates + [filter_rates_from_params(param_rates)]
 
     result = make_all_combinations(rates, commutative)
-    print("mrc2", output_type, rates, commutative, result)
+    if log.rates.debug:
+        log.rates("mrc2", output_type, rates, commutative, result)
 
     # If this is a filter, output rate was marked "f", and output
     # should be the max of any input rate
@@ -1154,7 +2270,8 @@ def make_rate_combinations(rates, commutative):
     # of inputs, and therefore inputs cannot all be CR.
     final = []
     if output_type[0] == FR:
-        print("result", result)
+        if log.rates.debug:
+            log.rates("result", result)
         for r in result:
             out_rate = max(r[0 : -1])
             actual_out_rate = r[-1]
@@ -1167,26 +2284,43 @@ def make_rate_combinations(rates, commutative):
             actual_out_rate = r[-1]
             if min_out_rate >= actual_out_rate:
                 final.append(r)
-            print("mrcloop", min_out_rate, actual_out_rate, final)
-    print("make_rate_combinations", rates, commutative, final)
+            if log.rates.debug:
+                log.rates("mrcloop", min_out_rate, actual_out_rate, final)
+    if log.rates.debug:
+        log.rates("make_rate_combinations", rates, commutative, final)
     return final        
 
 
+# return every list with one rate from each element of rates, e.g.
+# ["ab", "c"] gives [["a", "c"], ["b", "c"]]. If commutative, rates
+# must be in order, e.g. ["ab", "ab"] does not give ["b", "a"].
+# Combinations are built from the last rate to the first, and are
+# stored reversed so that rates can be appended without copying when
+# there is only one choice, so ugens with many parameters are fast.
+#
 def make_all_combinations(rates, commutative):
-    print("make_all_combinations", rates)
-    first = rates[0]  # e.g. "AB"
-    all = [[r] for r in first]
-    result = all
-    if len(rates) > 1:
-        rest = make_all_combinations(rates[1:], commutative)
-        # for each element in all, splice each element in rest
-        print("all", all, "rest", rest)
+    if log.rates.debug:
+        for i in range(len(rates)):
+            log.rates("make_all_combinations", rates[i:])
+    result = [[r] for r in rates[-1]]
+    for first in reversed(rates[:-1]):  # e.g. "AB"
+        # for each rate in first, splice each combination in result
+        if log.rates.debug:
+            log.rates("all", [[r] for r in first],
+                      "rest", [r[::-1] for r in result])
+        if len(first) == 1 and not commutative:
+            for r in result:
+                r.append(first)
+            continue
+        rest = result
         result = []
-        for r1 in all:
+        for r1 in first:
             for r in rest:
-                if commutative and r1[0] > r[0][0]:
+                if commutative and r1 > r[-1]:
                     continue
-                result.append(r1 + r)
+                result.append(r + [r1])
+    for r in result:
+        r.reverse()
     return result
 
 
@@ -1194,53 +2328,133 @@ def make_all_combinations(rates, commutative):
 
 
 # [AR+BR, AR+BR+CR], [pa, pb], pa * pb)
-def ugg_generate(rates, parms, expr, commutative=False):
-    global variations
-    print("ugg_generate", rates, parms, expr, commutative)
-    rates = make_rate_combinations(rates, commutative)
+# With inplace=True, each variant with an AR output also gets an
+# in-place variant that overwrites its first AR input (see
+# generate_variant), for ugens like Mult and Add whose input is often
+# read by nothing else.
+#
+def ugg_generate(rates, parms, expr, commutative=False, inplace=False):
+    if log.rates.debug:
+        log.rates("ugg_generate", rates, parms, expr, commutative)
+    with context.stats.phase("combinations"):
+        rates = make_rate_combinations(rates, commutative)
+    variants = []
     for r in rates:
-        ugg_write(r[0 : -1], parms, expr, r[-1])
+        variants.append((r[0 : -1], parms, expr, r[-1], None))
+        ar_params = [parms[i].name for i in range(len(parms))
+                     if r[i] == AR]
+        # the output is as fast as the fastest input (see find_rate),
+        # e.g. AR for Mult_ab, where r[-1] is BR
+        if inplace and min(r) == AR and ar_params:
+            variants.append((r[0 : -1], parms, expr, r[-1], ar_params[0]))
+    with context.stats.phase("write"):
+        ugg_write_all(variants)
+    if log.patch.info:
+        print_patch_class(parms, commutative)
+    ugg_end()
+
+
+# print the declaration of the Python Patch class for the current ugen
+#
+def print_patch_class(parms, commutative):
     # now generate declaration for Python
-    print("*********************************************")
-    print(ugg_name, "_implementations = ", repr(variations), sep="")
-    print("class", ugg_name, "(Patch):")
-    print("    def __init__(", end="")
+    log.patch("*********************************************")
+    log.patch(context.name, "_implementations = ", repr(context.variations),
+              sep="")
+    log.patch("class", context.name, "(Patch):")
+    log.patch("    def __init__(", end="")
     for i in range(len(parms)):
-        print("p", str(i + 1), ", ", sep="", end="")
-    print("name=None):")
+        log.patch("p", str(i + 1), ", ", sep="", end="")
+    log.patch("name=None):")
     if commutative:  # assume two parameters if commutative
-        print("        # assumes at least one parameter is a Patch")
-        print("        # sort by Patch")
-        print("        if not isinstance(p1, Patch):")
-        print("            temp = p1")
-        print("            p1 = p2")
-        print("            p2 = p1")
-        print("        elif not isinstance(p2, Patch):")
-        print("            if p1.rate == BR:")
-        print("                temp = p1")
-        print("                p1 = p2")
-        print("                p2 = p1")
-        print("        rates = p1.rate + p2.rate")
+        log.patch("        # assumes at least one parameter is a Patch")
+        log.patch("        # sort by Patch")
+        log.patch("        if not isinstance(p1, Patch):")
+        log.patch("            temp = p1")
+        log.patch("            p1 = p2")
+        log.patch("            p2 = p1")
+        log.patch("        elif not isinstance(p2, Patch):")
+        log.patch("            if p1.rate == BR:")
+        log.patch("                temp = p1")
+        log.patch("                p1 = p2")
+        log.patch("                p2 = p1")
+        log.patch("        rates = p1.rate + p2.rate")
     else:
-        print("        rates = ")
+        log.patch("        rates = ")
         need_plus = False
         for i in range(len(parms)):
-            print(" + " if need_plus else "", "p", str(i + 1), ".rate",
-                  sep="", end="")
+            log.patch(" + " if need_plus else "", "p", str(i + 1), ".rate",
+                      sep="", end="")
             need_plus = True
-        print()
-    print("        # find matching implementation")
-    print("        impl = ", ugg_name, "_implementations[rates]", sep="")
+        log.patch()
+    log.patch("        # find matching implementation")
+    log.patch("        impl = ", context.name, "_implementations[rates]",
+              sep="")
     for i in range(len(parms)):
-        print("        if isinstance(p", str(i + 1), ", Patch):", sep="")
-        print("            self.insert_patch(p", str(i + 1), ")", sep="")
-    print("        instr = impl[0](", end="")
+        log.patch("        if isinstance(p", str(i + 1), ", Patch):", sep="")
+        log.patch("            self.insert_patch(p", str(i + 1), ")", sep="")
+    log.patch("        instr = impl[0](", end="")
     for i in range(len(parms)):
-        print("p", str(i + 1), ", ", sep="", end="")
-    print("audio_space_zone)")
-    print("        super().__init__(instr, 1, impl[1], name)")
-    hdrf.close()
-    srcf.close()
+        log.patch("p", str(i + 1), ", ", sep="", end="")
+    log.patch("audio_space_zone)")
+    log.patch("        super().__init__(instr, 1, impl[1], name)")
+
+
+# code generation options, so worker processes can use the same ones
+#
+def ugg_options():
+    return {name: value for name, value in globals().items()
+            if name.startswith("UGG_") or name in ("CODE_PATH",
+                                                    "SAMPLE_TYPE")}
+
+
+def build_worker_init(options, log_levels):
+    log.set_levels(log_levels)
+    globals().update(options)
+    globals()["UGG_JOBS"] = 1  # worker processes cannot have workers
+
+
+# run generator (a function such as ug_osci that calls ugg_begin and
+# ugg_generate) and return what it printed and the outputs to save
+#
+def build_worker(generator):
+    global ugg_collected
+    ugg_collected = []
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        generator()
+        ugg_end()
+    outputs = ugg_collected
+    ugg_collected = None
+    return printed.getvalue(), outputs
+
+
+# run each of generators (functions such as ug_osci that call
+# ugg_begin and ugg_generate) using up to jobs processes (default is
+# the number of cores), then save the results in order. Output files
+# and printed output are the same as calling each generator in turn.
+# With only one generator, its variants are generated in parallel.
+#
+def ugg_build(generators, jobs=None):
+    global UGG_JOBS
+    ugg_end()
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(generators) > 1:
+        mp = multiprocessing.get_context(
+                 "fork" if "fork" in multiprocessing.get_all_start_methods()
+                 else "spawn")
+        with mp.Pool(min(jobs, len(generators)), build_worker_init,
+                     (ugg_options(), log.get_levels())) as pool:
+            results = pool.map(build_worker, generators)
+    else:
+        saved_jobs = UGG_JOBS
+        UGG_JOBS = jobs
+        results = [build_worker(generator) for generator in generators]
+        UGG_JOBS = saved_jobs
+    for printed, outputs in results:
+        print(printed, end="")
+        for output in outputs:
+            save_output(output)
 
 
 AR = 'a'
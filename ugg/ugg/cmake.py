@@ -3,10 +3,26 @@
 # Roger B. Dannenberg
 # Jun 2018
 
+import io
+
 
 source_path = None
 source_files = []
 
+# build profiles: a ugens_<name> library is built with each block
+# length and sample type (see ugtune.py). These libraries are only
+# built when asked for, e.g. make ugens_bl64_double.
+PROFILE_BLOCK_LENGTHS = [8, 16, 32, 64, 128]
+PROFILE_SAMPLE_TYPES = ["float", "double"]
+
+
+# return the build profiles as (name, block length, sample type)
+#
+def profiles():
+    return [("bl" + str(bl) + "_" + sample, bl, sample)
+            for sample in PROFILE_SAMPLE_TYPES
+            for bl in PROFILE_BLOCK_LENGTHS]
+
 def set_source_path(path):
     global source_path
     source_path = path
@@ -17,15 +33,52 @@ def add_source_files(*filenames):
     for f in filenames:
         source_files.append(f)
 
+# write text to path, but only if the file does not already contain
+# exactly text, so that unchanged files keep their modification times
+# and build systems do not recompile them
+#
+def write_if_changed(path, text):
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, "w") as f:
+        f.write(text)
+    return True
+
+
 def write_cmake_file():
-    cmf = open(source_path + "CMakeLists.txt", "w")
+    cmf = io.StringIO()
     print("# CMakeLists.txt\n# generated automatically, do not edit", \
           file=cmf)
-    print("\ncmake_minimum_required(VERSION 2.6)\n", file=cmf)
+    print("\ncmake_minimum_required(VERSION 3.5)\n", file=cmf)
     print("project(ugens)\n\nset(CODE_FILES ../framework/ugen.cpp", \
           "../framework/ugen.h", file=cmf)
+    print("               ../framework/tables.cpp ../framework/tables.h",
+          file=cmf)
     for i in range(0, len(source_files), 2):
         print("              ", source_files[i], source_files[i + 1], \
               file=cmf)
     print("   )\n\ninclude_directories(../framework)", file=cmf)
     print("add_library(ugens_static STATIC ${CODE_FILES})", file=cmf)
+    # shared library with a C interface, e.g. for ugglib.py
+    print("\nadd_library(ugens SHARED ${CODE_FILES}\n           ", \
+          "../framework/ugg_capi.cpp ../framework/ugg_capi.h\n           ",
+          "../framework/schedule.cpp ../framework/schedule.h\n           ",
+          "../framework/parallel.cpp ../framework/parallel.h)", file=cmf)
+    print("find_package(Threads REQUIRED)", file=cmf)
+    print("target_link_libraries(ugens Threads::Threads)", file=cmf)
+    print("\n# build profiles", file=cmf)
+    names = [p[0] for p in profiles()]
+    print("set(UGG_PROFILES", file=cmf)
+    for i in range(0, len(names), 5):
+        print("   ", *names[i : i + 5], file=cmf)
+    print("   )", file=cmf)
+    for name, bl, sample in profiles():
+        print("add_library(ugens_" + name,
+              "STATIC EXCLUDE_FROM_ALL ${CODE_FILES})", file=cmf)
+        print("target_compile_definitions(ugens_" + name, "PUBLIC",
+              "BL=" + str(bl), "UGG_SAMPLE=" + sample + ")", file=cmf)
+    write_if_changed(source_path + "CMakeLists.txt", cmf.getvalue())
@@ -0,0 +1,224 @@
+# ugbench.py -- benchmark the unit generator generator on large graphs
+#
+# Roger B. Dannenberg
+#
+# usage: python3 ugbench.py [--graphs chain,fanin,...] [--sizes 10,100,...]
+#                           [--repeat N] [--out FILE] [--baseline FILE]
+#                           [--threshold FRACTION]
+#
+# Each benchmark builds a synthetic ugen description of about size
+# nodes with the usual DSL (Param, Var, First/Next, arithmetic, Cond,
+# subscripts), then times ugg_generate for it, end to end and for each
+# phase (see uggstats.py). Code is written to a temporary directory and
+# the variant cache is not used, so every variant is generated. Each
+# graph has one AR or BR input, so it has two variants.
+#
+# Results are written as JSON to --out (default ugbench.json). If the
+# baseline (default: the previous contents of --out) has results for
+# the same graph and size, each time is compared to it, and times that
+# grew by more than --threshold are reported as regressions (and the
+# exit status is 1).
+#
+# Graphs are built from Vars so that no single expression is deeply
+# nested: gen_code() and print_subtree() recurse on expressions.
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from Ugen import *
+import Ugen  # the module, not the class, so we can set its options
+import ugglog
+
+
+# a chain of Vars, each computed from the previous one
+#
+def chain(size):
+    px = Param("x")
+    py = Param("y")
+    v = px
+    for i in range(size // 4):
+        v = Var("v" + str(i), v * 0.5 + py)
+    return ARGEN(AR+BR, CR), [px, py], v
+
+
+# a sum of size // 4 terms, added in pairs
+#
+def fanin(size):
+    px = Param("x")
+    terms = [Var("l" + str(i), px * (i + 1)) for i in range(size // 4 + 1)]
+    n = 0
+    while len(terms) > 1:
+        pairs = []
+        for i in range(0, len(terms) - 1, 2):
+            pairs.append(Var("s" + str(n), terms[i] + terms[i + 1]))
+            n += 1
+        terms = pairs + terms[len(terms) - len(terms) % 2:]
+    return ARGEN(AR+BR), [px], terms[0]
+
+
+# a cascade of one-pole filters: each state depends on its previous
+# value and on the previous filter in the cascade
+#
+def recurrence(size):
+    px = Param("x")
+    pcoef = Param("coef")
+    v = px
+    for i in range(size // 6):
+        state = First("s" + str(i), 0)
+        Next(state, state * pcoef + v * (1 - pcoef))
+        v = state
+    return ARGEN(AR+BR, CR), [px, pcoef], v
+
+
+# a ugen with size // 3 parameters, one of them at audio rate
+#
+def params(size):
+    ps = [Param("p" + str(i)) for i in range(max(1, size // 3))]
+    v = ps[0]
+    for i in range(1, len(ps)):
+        v = Var("v" + str(i), v * ps[i])
+    return ARGEN(AR+BR, *[CR] * (len(ps) - 1)), ps, v
+
+
+# table lookups and conditionals: each step reads a table at an index
+# computed from the previous step and clips the result
+#
+def lookup(size):
+    px = Param("x")
+    plimit = Param("limit")
+    ptable = Param("table", "Table_ptr")
+    v = px
+    for i in range(size // 10):
+        index = Var("i" + str(i), Uint(Umax(v, 0) * 8.0), "int")
+        x = Var("x" + str(i), ptable[index])
+        v = Var("v" + str(i), Cond(x < plimit, x, plimit))
+    return ARGEN(AR+BR, CR, CR), [px, plimit, ptable], v
+
+
+GRAPHS = {"chain": chain, "fanin": fanin, "recurrence": recurrence,
+          "params": params, "lookup": lookup}
+
+SIZES = [10, 100, 1000, 10000, 100000]
+
+
+# build the named graph with about size nodes and generate its code,
+# returning the stats of the ugen (see uggstats.py) and the time to
+# build the graph and to generate
+#
+def run_one(graph, size):
+    start = time.perf_counter()
+    ugg_begin("Bench_" + graph)
+    rates, parms, expr = GRAPHS[graph](size)
+    built = time.perf_counter()
+    ugg_generate(rates, parms, expr)
+    done = time.perf_counter()
+    return Ugen.ugg_stats[-1], built - start, done - built
+
+
+def run(graph, size, repeat):
+    best = None
+    for i in range(repeat):
+        stats, build, generate = run_one(graph, size)
+        if best is None or generate < best["generate"]:
+            counts = stats["totals"]["counts"]
+            variants = stats["counts"]["variants"]
+            best = {"graph": graph, "size": size,
+                    "nodes": counts["nodes"] // variants,  # per variant
+                    "variants": variants,
+                    "bytes": counts.get("bytes", 0),
+                    "build": build, "generate": generate,
+                    "phases": dict(stats["times"],
+                                   **stats["totals"]["times"])}
+    return best
+
+
+def load_results(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# compare results with baseline results and return the list of
+# regressions (strings)
+#
+def compare(results, baseline, threshold):
+    old = {(r["graph"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        b = old.get((r["graph"], r["size"]))
+        if not b:
+            continue
+        for what in ["build", "generate"]:
+            ratio = r[what] / b[what] if b[what] > 0 else 1.0
+            # ignore tiny times, which are mostly noise
+            if ratio > 1 + threshold and r[what] - b[what] > 0.001:
+                regressions.append("{} {} {}: {:.4f}s -> {:.4f}s ({:.2f}x)"
+                                   .format(r["graph"], r["size"], what,
+                                           b[what], r[what], ratio))
+    return regressions
+
+
+def report(result):
+    print("{:<11}{:>8}{:>9}{:>4}{:>10.4f}{:>10.4f}{:>11.2f}".format(
+              result["graph"], result["size"], result["nodes"],
+              result["variants"], result["build"], result["generate"],
+              1e6 * result["generate"] / max(1, result["nodes"])))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="ugbench",
+                                     description="benchmark the generator")
+    parser.add_argument("--graphs", default=",".join(GRAPHS),
+                        help="graphs to build (default: all)")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="approximate numbers of nodes")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="report the best of this many runs")
+    parser.add_argument("--out", default="ugbench.json",
+                        help="where to write the results")
+    parser.add_argument("--baseline",
+                        help="results to compare to (default: --out)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="report times that grew by more than this")
+    args = parser.parse_args()
+    graphs = args.graphs.split(",")
+    for graph in graphs:
+        if graph not in GRAPHS:
+            parser.error("unknown graph " + repr(graph))
+    sizes = [int(s) for s in args.sizes.split(",")]
+    baseline = load_results(args.baseline or args.out)
+
+    ugglog.set_level(ugglog.OFF)
+    Ugen.UGG_CACHE = False
+    results = []
+    print("{:<11}{:>8}{:>9}{:>4}{:>10}{:>10}{:>11}".format(
+              "graph", "size", "nodes", "var", "build s", "gen s",
+              "us/node"))
+    with tempfile.TemporaryDirectory() as code_path:
+        Ugen.CODE_PATH = code_path + "/"
+        for graph in graphs:
+            for size in sizes:
+                results.append(run(graph, size, args.repeat))
+                report(results[-1])
+
+    with open(args.out, "w") as f:
+        json.dump({"version": UGG_VERSION,
+                   "python": platform.python_version(),
+                   "machine": platform.machine(),
+                   "results": results}, f, indent=1)
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print("REGRESSION:", regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
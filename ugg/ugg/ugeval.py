@@ -0,0 +1,348 @@
+# ugeval.py -- evaluate Ugen graphs with NumPy, without generating C++
+#
+# Roger B. Dannenberg
+#
+# An Evaluator runs one variant of a ugen, as the generated C++ class
+# would, one block at a time:
+#
+#     phz = Param("hz", "double")
+#     pphase = Param("phase", "double")
+#     ptable = Param("table", "Table_ptr")
+#     ev = Evaluator([AR, CR, CR], [phz, pphase, ptable],
+#                    osci(phz, pphase, ptable), AR,
+#                    phase=0.0, table=sine_table)
+#     block = ev.run(hz=hz_block)   # BL samples
+#     samples = ev.render(100, hz=440.0)  # 100 blocks
+#
+# Values of CR parameters are given when the Evaluator is created (as
+# for the C++ constructor). AR inputs are arrays of BL samples (or a
+# number for a constant input), and BR inputs are numbers. Tables are
+# NumPy arrays that include the extra sample at the end (see ugen.h);
+# a Utable (see ugtables.py) has the values computed by the generator.
+# Mipmaps are lists of (highest harmonic, table), most harmonics first.
+# set(name, value) does what the generated set_<name> method does.
+#
+# The graph goes through the same passes as for code generation (see
+# prepare_variant in Ugen.py), so the Evaluator computes what the
+# generated code computes. AR expressions are computed with NumPy for
+# the whole block, except for the expressions in a First/Next
+# recurrence, which are computed one sample at a time. Vars are
+# stored as their C types (sample is float32), but other arithmetic
+# is not always done at the precision C would use, so compare results
+# with the C++ output with a tolerance (about 1e-5 relative).
+
+import numpy as np
+from Ugen import *
+import Ugen  # the module, for context and prepare_variant
+from uggstats import Stats
+
+BL = 32
+SAMPLE_RATE = 44100.0
+
+# values of the macros in ugen.h used by generated code
+MACROS = {"AR": np.float64(SAMPLE_RATE),
+          "AR_RECIP": np.float64(1.0 / SAMPLE_RATE),
+          "BL": BL,
+          "BL_RECIP": np.float64(1.0 / BL),
+          "BR": np.float64(SAMPLE_RATE / BL),
+          "BR_RECIP": np.float64(BL / SAMPLE_RATE)}
+
+CTYPES = {"sample": np.float32, "float": np.float32,
+          "double": np.float64, "int": np.int32}
+
+
+# convert value as C would when assigning it to a typespec variable
+#
+def c_cast(value, typespec):
+    dtype = CTYPES.get(typespec.strip())
+    if dtype is None:  # e.g. Table_ptr
+        return value
+    if dtype == np.int32:
+        value = np.trunc(value)
+    if np.ndim(value) == 0:
+        return dtype(value)
+    return value.astype(dtype)
+
+
+def is_int(value):
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "iub"
+    return isinstance(value, (int, np.integer))
+
+
+def c_divide(a, b):
+    if is_int(a) and is_int(b):  # C truncates toward zero
+        q = np.abs(a) // np.abs(b)
+        return np.where((np.asarray(a) < 0) == (np.asarray(b) < 0), q, -q)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.true_divide(a, b)
+
+
+# see phase_wrap in ugen.h
+def phase_wrap(phase, n):
+    if np.ndim(phase) == 0:
+        while phase > n:
+            phase -= n
+        return phase
+    k = np.maximum(np.ceil((phase - n) / n), 0)
+    return phase - k * n
+
+
+def table_len(table):
+    return len(table) - 1
+
+
+# a mipmap is a list of (harmonics, table), most harmonics first (see
+# mipmap_table in ugen.h)
+def mipmap_table(mipmap, hz):
+    top = abs(float(hz)) / (SAMPLE_RATE * 0.5)
+    for harmonics, table in mipmap[:-1]:
+        if harmonics * top < 1:
+            return table
+    return mipmap[-1][1]
+
+
+def mipmap_len(mipmap):
+    return table_len(mipmap[0][1])
+
+
+def condition(test, left, right):
+    if np.ndim(test) == 0:
+        return left if test else right
+    return np.where(test != 0, left, right)
+
+
+def subscript(table, index):
+    return np.take(table, index, mode="clip")
+
+
+BINARY_OPS = {"+": np.add, "-": np.subtract, "*": np.multiply,
+              "/": c_divide,
+              "<": lambda a, b: np.int32(1) * np.less(a, b)}
+
+UNARY_OPS = {"int": lambda x: c_cast(x, "int"),
+             "fabs": np.abs,
+             "tanh": np.tanh,
+             "table_len": table_len,
+             "mipmap_len": mipmap_len}
+
+FN2_OPS = {"phase_wrap": phase_wrap,
+           "mipmap_table": mipmap_table,
+           "fmod": np.fmod,
+           "fmodf": lambda x, y: np.fmod(np.float32(x), np.float32(y)),
+           "fmax": np.fmax,
+           "fmin": np.fmin,
+           "pow": np.power}
+
+
+def is_constant(ugen):
+    return type(ugen) == Ugen.Ugen
+
+
+# the value of a constant as it is written in C: floats are doubles
+#
+def constant_value(ugen):
+    table = Ugen.table_values(ugen)
+    if table is not None:  # a Utable, rounded to samples as in C
+        return table.astype(np.float32)
+    if type(ugen.value) == str:
+        return MACROS[ugen.value]
+    if type(ugen.value) == float:
+        return np.float64(ugen.value)
+    return ugen.value
+
+
+# compute ugen (not a Param, First or Upsample) from the values of its
+# parameters, given by val(parameter)
+#
+def compute(ugen, val):
+    if is_constant(ugen):
+        return constant_value(ugen)
+    p = [val(parm) for parm in ugen.parameters]
+    if isinstance(ugen, Var):
+        return c_cast(p[0], ugen.typespec)
+    elif isinstance(ugen, Ubinary):
+        with np.errstate(all="ignore"):
+            return BINARY_OPS[ugen.op](p[0], p[1])
+    elif isinstance(ugen, Uunary):
+        return UNARY_OPS[ugen.op](p[0])
+    elif isinstance(ugen, Ufn2):
+        with np.errstate(all="ignore"):
+            return FN2_OPS[ugen.op](p[0], p[1])
+    elif isinstance(ugen, Usubscript):
+        return subscript(p[0], p[1])
+    elif isinstance(ugen, Cond):
+        return condition(p[0], p[1], p[2])
+    raise ValueError("ugeval cannot compute " + str(ugen))
+
+
+def at(value, i):
+    return value[i] if np.ndim(value) > 0 else value
+
+
+class Evaluator:
+    def __init__(self, rates, params, out, rate, name="Eval", **values):
+        self.originals = {p.name: p for p in params}
+        for i in range(len(params)):
+            params[i].rate = rates[i]
+        # as in generate_variant, copies and temps belong to this variant
+        context = Ugen.context
+        saved = (context.vars.copy(), context.tempnum)
+        Ugen.rename_duplicates(params, out)
+        self.ugens, self.out = Ugen.prepare_variant(
+                name + "_" + "".join(rates), params, out, rate, Stats())
+        context.vars, context.tempnum = saved
+        self.rate = self.out.rate
+        self.env = {}  # the current value of each ugen
+        self.named = {u.name: u for u in self.ugens
+                      if isinstance(u, (Param, Var)) and u.name}
+        # the Params of the variant (copies of params that are used)
+        self.params = {u.name: u for u in self.ugens if isinstance(u, Param)}
+        self.plan()
+
+        # constructor
+        for p in self.params.values():
+            if p.rate == CR:
+                value = values[p.name]
+                if p.typespec == "Table_ptr":
+                    value = np.asarray(value, dtype=np.float32)
+                elif p.typespec == "Mipmap_ptr":
+                    value = [(h, np.asarray(t, dtype=np.float32))
+                             for h, t in value]
+                self.env[p] = c_cast(value, p.typespec)
+        self.arate = {}  # the state of each Upsample
+        self.states = {}  # the state of each AR First
+        for u in self.ugens:
+            if isinstance(u, Param):
+                continue
+            elif isinstance(u, First):
+                value = c_cast(self.env[u.parameters[0]], u.typespec)
+                if u.rate == AR:
+                    self.states[u] = value
+                else:
+                    self.env[u] = value
+            elif isinstance(u, Upsample):
+                self.arate[u] = np.float32(0)
+            elif u.rate == CR:
+                self.env[u] = compute(u, self.env.__getitem__)
+
+    # divide the ugens into the steps of run(): BR ugens, Upsamples, AR
+    # ugens that do not depend on AR states (pre), AR ugens in the
+    # recurrence of some state (cycle), and the rest (post)
+    def plan(self):
+        ugens = [u for u in self.ugens if not isinstance(u, Param)]
+        self.br_ugens = [u for u in ugens
+                         if u.rate == BR and not isinstance(u, First)]
+        self.br_states = [u for u in ugens
+                          if u.rate == BR and isinstance(u, First)]
+        self.ar_states = [u for u in ugens
+                          if u.rate == AR and isinstance(u, First)]
+        self.upsamples = [u for u in ugens if isinstance(u, Upsample)]
+        # does ugen depend on an AR state in this sample? (A First can
+        # come after ugens that use it, in the definition of its rest.)
+        depends = {f: True for f in self.ar_states}
+        for u in self.ugens:
+            if not isinstance(u, First):
+                depends[u] = any(depends.get(p, False) for p in u.parameters)
+        needed = set()  # AR ugens needed to compute the next states
+        stack = [f.rest for f in self.ar_states]
+        while stack:
+            u = stack.pop()
+            if u in needed or u.rate != AR or isinstance(u, First):
+                continue
+            needed.add(u)
+            stack.extend(u.parameters)
+        ar_ugens = [u for u in ugens if u.rate == AR and
+                    not isinstance(u, (First, Upsample))]
+        self.pre = [u for u in ar_ugens if not depends[u]]
+        self.cycle = [u for u in ar_ugens if depends[u] and u in needed]
+        self.post = [u for u in ar_ugens if depends[u] and u not in needed]
+
+    # compute one block. inputs are the values of AR and BR parameters.
+    # Returns BL samples (AR output) or one sample (BR output).
+    def run(self, **inputs):
+        env = self.env
+        for p in self.params.values():
+            if p.rate == AR:
+                env[p] = np.broadcast_to(np.asarray(inputs[p.name],
+                                                    dtype=np.float32), (BL,))
+            elif p.rate == BR:
+                env[p] = np.float32(inputs[p.name])
+        for u in self.br_ugens:
+            env[u] = compute(u, env.__getitem__)
+        for u in self.upsamples:
+            arate = self.arate[u]
+            step = np.float32((env[u.parameters[0]] - arate) * (1.0 / BL))
+            ramp = np.cumsum(np.concatenate(([arate], np.full(BL, step))),
+                             dtype=np.float32)
+            env[u] = ramp[:BL]
+            self.arate[u] = ramp[BL]
+        for u in self.pre:
+            env[u] = compute(u, env.__getitem__)
+        if self.ar_states:
+            self.run_recurrence()
+        for u in self.post:
+            env[u] = compute(u, env.__getitem__)
+        out = env[self.out]
+        nexts = [c_cast(env[f.rest], f.typespec) for f in self.br_states]
+        for f, value in zip(self.br_states, nexts):
+            env[f] = value
+        if self.rate == AR:
+            return np.broadcast_to(c_cast(np.asarray(out), "sample"), (BL,))
+        return c_cast(out, "sample")
+
+    # compute the AR states and the ugens in their recurrences one
+    # sample at a time, leaving arrays of their values in env
+    def run_recurrence(self):
+        env = self.env
+        values = {u: [] for u in self.ar_states + self.cycle}
+        for i in range(BL):
+            local = dict(self.states)
+            val = lambda u: local[u] if u in local else at(env[u], i)
+            for u in self.cycle:
+                local[u] = compute(u, val)
+            for u in values:
+                values[u].append(local[u])
+            for f in self.ar_states:  # local still has the current states
+                self.states[f] = c_cast(val(f.rest), f.typespec)
+        for u in values:
+            env[u] = np.array(values[u])
+
+    # compute blocks blocks, returning the concatenated output. AR
+    # inputs can be numbers or arrays of blocks * BL samples, and BR
+    # inputs can be numbers or arrays of blocks values.
+    def render(self, blocks, **inputs):
+        outs = []
+        for b in range(blocks):
+            block_inputs = {}
+            for name, value in inputs.items():
+                if np.ndim(value) == 0:
+                    block_inputs[name] = value
+                elif self.originals[name].rate == AR:
+                    block_inputs[name] = value[b * BL : (b + 1) * BL]
+                else:
+                    block_inputs[name] = value[b]
+            outs.append(np.atleast_1d(self.run(**block_inputs)))
+        return np.concatenate(outs)
+
+    # like the generated set_<name> method: update the states that
+    # depend on the parameter
+    def set(self, name, value):
+        param = self.originals[name]
+        value = c_cast(value, param.typespec)
+        for state, expr in param.actions:
+            env = {}
+            for u in expr.get_ugen_list():
+                if u is param or \
+                   (isinstance(u, Param) and u.name == name):
+                    env[u] = value
+                elif isinstance(u, (Param, Var)):
+                    env[u] = self.env[self.named[u.name]]
+                else:
+                    env[u] = compute(u, env.__getitem__)
+            first = self.named[state.name]
+            new = c_cast(env[expr], first.typespec)
+            if first.rate == AR:
+                self.states[first] = new
+            else:
+                self.env[first] = new
@@ -0,0 +1,80 @@
+# ugg.py -- command line interface to the unit generator generator
+#
+# usage: python3 ugg.py [-v] [--log SPEC] build [-j JOBS] [--fission]
+#
+# build generates the ugen library into CODE_PATH (see Ugen.py), with
+# the tables defined in ugtables.py, and writes CMakeLists.txt for it.
+# Ugens are generated in parallel, one process per ugen (or per variant
+# if there is only one ugen), and the output is the same as generating
+# them one after another.
+#
+# The generator is silent unless -v (reports from each variant) or
+# -vv (everything) is given. --log sets levels for individual
+# channels, e.g. --log passes=debug,emit=info (see ugglog.py).
+# build --stats FILE writes the time spent in each phase of the
+# generator and counts of nodes, variants, temps, etc. (see uggstats.py).
+# build --fission generates code for SIMD (see gen_fission_loops in
+# Ugen.py).
+
+import argparse
+import time
+import Ugen
+import ugglog
+from Ugen import CODE_PATH, ugg_build, ugg_write_stats
+from ugosc import ug_osci, ug_oscm
+from ugenv import ug_decay
+from ugmath import ug_add, ug_mult
+from ugtone import ug_tone
+from ugtables import ugg_write_tables
+from cmake import write_cmake_file
+
+# the ugens in the library, in the order they are written to cmake
+UGEN_LIBRARY = [ug_osci, ug_decay, ug_add, ug_mult, ug_tone, ug_oscm]
+
+
+def build(args):
+    if args.no_cache:
+        Ugen.UGG_CACHE = False
+    if args.fission:
+        Ugen.UGG_FISSION = True
+    start = time.perf_counter()
+    ugg_build(UGEN_LIBRARY, args.jobs)
+    ugg_write_tables(CODE_PATH)
+    write_cmake_file()
+    if args.stats:
+        ugg_write_stats(args.stats, jobs=args.jobs,
+                        wall=time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="ugg",
+                                     description="unit generator generator")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="print what the generator does (-vv for more)")
+    parser.add_argument("--log", metavar="SPEC",
+                        help="log levels, e.g. passes=debug,emit=info")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("build", help="generate the ugen library")
+    p.add_argument("-j", "--jobs", type=int, default=None,
+                   help="number of processes (default: number of cores)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="generate every variant, even if unchanged")
+    p.add_argument("--fission", action="store_true",
+                   help="split audio rate loops so that compilers can "
+                        "vectorize the loops without state")
+    p.add_argument("--stats", metavar="FILE",
+                   help="write the time of each phase and counts to FILE "
+                        "as JSON, per ugen and per variant")
+    p.set_defaults(run=build)
+    args = parser.parse_args()
+    ugglog.set_verbosity(args.verbose)
+    if args.log:
+        try:
+            ugglog.configure(args.log)
+        except ValueError as e:
+            parser.error(str(e))
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+# ugglib.py -- run generated unit generators from Python
+#
+# Roger B. Dannenberg
+#
+# Loads the shared library built from the generated code (libugens,
+# see write_cmake_file in cmake.py) and the manifests written by the
+# generator (CODE_PATH/<name>.json), and makes a constructor for each
+# variant:
+#
+#     lib = Library()  # builds the library first if necessary
+#     table = lib.table(np.sin(np.arange(513) * 2 * np.pi / 512))
+#     hz = lib.input_a()
+#     osc = lib.Osci_acc_a(hz, 0.0, table)
+#     hz.outs[:] = 440.0
+#     lib.run(osc)  # compute the next block
+#     print(osc.outs)  # BL samples
+#
+# The outs of an audio rate ugen is a NumPy array that shares memory
+# with the outs[BL] array of the C++ object, so reading outputs and
+# writing inputs (with lib.input_a()) does not copy samples. The
+# contents change when the ugen runs, so copy outs if you want to keep
+# them. Block rate inputs are made with lib.input_b() and set with
+# set(value). Tables are NumPy arrays of len + 1 samples (including
+# the extra sample at the end, see ugen.h) that share memory with a
+# C++ Table. lib.table(values, shared=True) makes a read-only table
+# that identical tables, also in other processes, share (see tables.h).
+# lib.mipmap([(harmonics, table), ...]) makes a Mipmap (see ugen.h).
+#
+# Each Ugen keeps its inputs, so they are not destroyed before it is.
+# Parameters with set_<name> methods in C++ can be changed with
+# ugen.set_<name>(value). An in-place variant, e.g. Mult_aa_a_inplace,
+# writes its outs over the outs of an input, which nothing else may
+# read.
+#
+# lib.run(osc) pulls samples through the graph from osc. For a large
+# patch, lib.schedule(osc) sorts the ugens once, and its run() computes
+# them in that order (see schedule.h); lib.schedule(osc, threads=4)
+# computes them on 4 threads (see parallel.h). Make a new schedule
+# after changing the patch.
+
+import ctypes
+import glob
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+from Ugen import CODE_PATH
+
+BUILD_DIR = "build/"  # within CODE_PATH
+
+
+def library_path(code_path):
+    if sys.platform == "darwin":
+        name = "libugens.dylib"
+    elif sys.platform == "win32":
+        name = "ugens.dll"
+    else:
+        name = "libugens.so"
+    return os.path.join(code_path, BUILD_DIR, name)
+
+
+# build the shared library from the generated code with cmake,
+# returning its path
+#
+def build(code_path=CODE_PATH):
+    build_dir = os.path.join(code_path, BUILD_DIR)
+    subprocess.run(["cmake", "-S", code_path, "-B", build_dir,
+                    "-DCMAKE_BUILD_TYPE=Release"],
+                   check=True, stdout=subprocess.DEVNULL)
+    subprocess.run(["cmake", "--build", build_dir, "--target", "ugens"],
+                   check=True, stdout=subprocess.DEVNULL)
+    return library_path(code_path)
+
+
+class Ugen:
+    def __init__(self, lib, ptr, rate, inputs=()):
+        self.lib = lib
+        self.ptr = ptr
+        self.rate = rate
+        self.inputs = list(inputs)  # keep inputs alive
+        self.setters = {}  # C functions for set_<name>, by name
+        if rate == "a":
+            outs = lib.dll.ugg_get_outs(ptr)
+            self.outs = np.ctypeslib.as_array(outs, (lib.block_len,))
+
+    # the output of a block rate ugen
+    def get_out(self):
+        return self.lib.dll.ugg_get_out(self.ptr)
+
+    def run(self):
+        self.lib.run(self)
+
+    def __getattr__(self, attr):
+        setters = self.__dict__.get("setters", {})
+        if attr.startswith("set_") and attr[4:] in setters:
+            setter = setters[attr[4:]]
+            return lambda value: setter(self.ptr, value)
+        raise AttributeError(attr)
+
+    def __del__(self):
+        if self.ptr:
+            self.lib.dll.ugg_destroy(self.ptr)
+            self.ptr = None
+
+
+class Input_b(Ugen):
+    def set(self, value):
+        self.lib.dll.ugg_input_b_set(self.ptr, value)
+
+
+class Schedule:
+    def __init__(self, lib, ugens, threads=1):
+        self.lib = lib
+        self.ugens = list(ugens)  # keep ugens alive
+        outs = (ctypes.c_void_p * len(ugens))(*[u.ptr for u in ugens])
+        if threads > 1:
+            self.ptr = lib.dll.ugg_parallel_schedule_create(
+                    outs, len(ugens), threads)
+        else:
+            self.ptr = lib.dll.ugg_schedule_create(outs, len(ugens))
+        self.len = lib.dll.ugg_schedule_len(self.ptr)
+
+    # compute the next block of every ugen in the schedule
+    def run(self):
+        self.lib.dll.ugg_schedule_run(self.ptr, self.lib.dll.ugg_next_block())
+
+    def __del__(self):
+        if self.ptr:
+            self.lib.dll.ugg_schedule_destroy(self.ptr)
+            self.ptr = None
+
+
+class Table:
+    def __init__(self, lib, values, shared=False):
+        self.lib = lib
+        self.shared = shared
+        self.ptr = lib.dll.ugg_table_create(len(values) - 1)
+        data = lib.dll.ugg_table_data(self.ptr)
+        np.ctypeslib.as_array(data, (len(values),))[:] = values
+        if shared:
+            self.ptr = lib.dll.ugg_table_share(self.ptr)
+            data = lib.dll.ugg_table_data(self.ptr)
+        self.data = np.ctypeslib.as_array(data, (len(values),))
+        if shared:
+            self.data.flags.writeable = False
+
+    def __del__(self):
+        if self.ptr:
+            if self.shared:
+                self.lib.dll.ugg_table_release(self.ptr)
+            else:
+                self.lib.dll.ugg_table_destroy(self.ptr)
+            self.ptr = None
+
+
+class Mipmap:
+    def __init__(self, lib, levels):
+        self.lib = lib
+        self.tables = [table for harmonics, table in levels]  # keep alive
+        self.ptr = lib.dll.ugg_mipmap_create()
+        for harmonics, table in levels:
+            lib.dll.ugg_mipmap_add(self.ptr, table.ptr, harmonics)
+
+    def __del__(self):
+        if self.ptr:
+            self.lib.dll.ugg_mipmap_destroy(self.ptr)
+            self.ptr = None
+
+
+# a function that creates instances of variant (a manifest entry)
+#
+def make_constructor(lib, variant):
+    create = getattr(lib.dll, variant["class"] + "_create")
+    create.restype = ctypes.c_void_p
+    create.argtypes = [lib.ctype(p["type"]) for p in variant["params"]]
+
+    def constructor(*args):
+        if len(args) != len(variant["params"]):
+            raise TypeError(variant["class"] + " takes " +
+                            str(len(variant["params"])) + " arguments")
+        refs = (Ugen, Table, Mipmap)
+        ptrs = [arg.ptr if isinstance(arg, refs) else arg for arg in args]
+        ugen = Ugen(lib, create(*ptrs), variant["rate"],
+                    [arg for arg in args if isinstance(arg, refs)])
+        if "inplace" in variant:  # the output is written over the input
+            names = [p["name"] for p in variant["params"]]
+            ugen.outs = args[names.index(variant["inplace"])].outs
+        for name in variant.get("set", []):
+            setter = getattr(lib.dll, variant["class"] + "_set_" + name)
+            setter.argtypes = [ctypes.c_void_p, lib.sample]
+            ugen.setters[name] = setter
+        return ugen
+    constructor.__name__ = variant["class"]
+    return constructor
+
+
+class Library:
+    def __init__(self, path=None, code_path=CODE_PATH):
+        if path is None:
+            path = library_path(code_path)
+            if not os.path.exists(path):
+                path = build(code_path)
+        self.dll = ctypes.CDLL(path)
+        dll = self.dll
+        dll.ugg_sample_size.restype = ctypes.c_int
+        self.sample = ctypes.c_float if dll.ugg_sample_size() == 4 \
+                      else ctypes.c_double
+        sample_ptr = ctypes.POINTER(self.sample)
+        dll.ugg_block_len.restype = ctypes.c_int
+        self.block_len = dll.ugg_block_len()
+        dll.ugg_sample_rate.restype = ctypes.c_double
+        self.sample_rate = dll.ugg_sample_rate()
+        dll.ugg_run.argtypes = [ctypes.c_void_p, ctypes.c_long]
+        dll.ugg_next_block.restype = ctypes.c_long
+        dll.ugg_get_outs.argtypes = [ctypes.c_void_p]
+        dll.ugg_get_outs.restype = sample_ptr
+        dll.ugg_get_out.argtypes = [ctypes.c_void_p]
+        dll.ugg_get_out.restype = self.sample
+        dll.ugg_destroy.argtypes = [ctypes.c_void_p]
+        dll.ugg_table_create.argtypes = [ctypes.c_int]
+        dll.ugg_table_create.restype = ctypes.c_void_p
+        dll.ugg_table_data.argtypes = [ctypes.c_void_p]
+        dll.ugg_table_data.restype = sample_ptr
+        dll.ugg_table_destroy.argtypes = [ctypes.c_void_p]
+        dll.ugg_table_share.argtypes = [ctypes.c_void_p]
+        dll.ugg_table_share.restype = ctypes.c_void_p
+        dll.ugg_table_release.argtypes = [ctypes.c_void_p]
+        dll.ugg_mipmap_create.restype = ctypes.c_void_p
+        dll.ugg_mipmap_add.argtypes = [ctypes.c_void_p, ctypes.c_void_p,
+                                       ctypes.c_int]
+        dll.ugg_mipmap_destroy.argtypes = [ctypes.c_void_p]
+        dll.ugg_input_a_create.restype = ctypes.c_void_p
+        dll.ugg_input_b_create.restype = ctypes.c_void_p
+        dll.ugg_input_b_set.argtypes = [ctypes.c_void_p, self.sample]
+        dll.ugg_schedule_create.argtypes = [ctypes.POINTER(ctypes.c_void_p),
+                                            ctypes.c_int]
+        dll.ugg_schedule_create.restype = ctypes.c_void_p
+        dll.ugg_parallel_schedule_create.argtypes = [
+                ctypes.POINTER(ctypes.c_void_p), ctypes.c_int, ctypes.c_int]
+        dll.ugg_parallel_schedule_create.restype = ctypes.c_void_p
+        dll.ugg_schedule_run.argtypes = [ctypes.c_void_p, ctypes.c_long]
+        dll.ugg_schedule_len.argtypes = [ctypes.c_void_p]
+        dll.ugg_schedule_destroy.argtypes = [ctypes.c_void_p]
+        self.variants = {}
+        for manifest_path in sorted(glob.glob(os.path.join(code_path,
+                                                           "*.json"))):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            for variant in manifest["variants"]:
+                self.variants[variant["class"]] = variant
+                setattr(self, variant["class"],
+                        make_constructor(self, variant))
+
+    # the ctypes type for a constructor parameter declared as typespec
+    def ctype(self, typespec):
+        if typespec in ("Ugen *", "Table_ptr", "Mipmap_ptr"):
+            return ctypes.c_void_p
+        elif typespec == "sample":
+            return self.sample
+        elif typespec == "float":
+            return ctypes.c_float
+        elif typespec == "double":
+            return ctypes.c_double
+        elif typespec == "int":
+            return ctypes.c_int
+        raise ValueError("ugglib: unknown parameter type " + typespec)
+
+    def input_a(self):
+        return Ugen(self, self.dll.ugg_input_a_create(), "a")
+
+    def input_b(self):
+        return Input_b(self, self.dll.ugg_input_b_create(), "b")
+
+    # a table with values (len + 1 samples). A shared table is read-only
+    # and is in memory once for all identical tables, in this and other
+    # processes (see tables.h).
+    def table(self, values, shared=False):
+        return Table(self, values, shared)
+
+    # a mipmap (see ugen.h) from a list of (highest harmonic, Table),
+    # most harmonics first, for band-limited oscillators (Oscm_*)
+    def mipmap(self, levels):
+        return Mipmap(self, levels)
+
+    # compute the next block of each of ugens (and their inputs)
+    def run(self, *ugens):
+        block_num = self.dll.ugg_next_block()
+        for ugen in ugens:
+            self.dll.ugg_run(ugen.ptr, block_num)
+
+    # a Schedule that computes ugens (and their inputs) on threads
+    # threads
+    def schedule(self, *ugens, threads=1):
+        return Schedule(self, ugens, threads)
+
+    # run ugen for blocks blocks, returning a copy of its output
+    def render(self, ugen, blocks):
+        if ugen.rate == "a":
+            out = np.empty(blocks * self.block_len, dtype=ugen.outs.dtype)
+        else:
+            out = np.empty(blocks, dtype=np.dtype(self.sample))
+        for b in range(blocks):
+            self.run(ugen)
+            if ugen.rate == "a":
+                out[b * self.block_len : (b + 1) * self.block_len] = ugen.outs
+            else:
+                out[b] = ugen.get_out()
+        return out
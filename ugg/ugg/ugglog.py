@@ -0,0 +1,89 @@
+# ugglog.py -- logging for the unit generator generator
+#
+# Roger B. Dannenberg
+#
+# Output is divided into subsystems (channels), each with its own
+# level: OFF, INFO or DEBUG. Channels are module attributes, e.g.
+# ugglog.passes, and each has boolean attributes info and debug that
+# are only updated when levels change, so a disabled message costs one
+# attribute test at the call site:
+#
+#     if log.passes.info:
+#         log.passes("merged", str(ugen), "into", str(canonical[key]))
+#
+# Messages go to sys.stdout at the time of the call, so output can be
+# captured with contextlib.redirect_stdout (see Ugen.build_worker).
+# By default everything is OFF and the generator runs silently.
+#
+# Channels:
+#     graph -- constructing the Ugen graph (coercions, Params, Vars, types)
+#     rates -- enumerating the rate combinations (variants) to generate
+#     passes -- reports from simplification, CSE, code motion, liveness
+#     emit -- variants written or taken from the cache, expression trees
+#     patch -- the Python Patch class declaration for each ugen
+
+OFF = 0
+INFO = 1
+DEBUG = 2
+
+LEVEL_NAMES = {"off": OFF, "info": INFO, "debug": DEBUG}
+
+
+class Channel:
+    def __init__(self, name):
+        self.name = name
+        self.set_level(OFF)
+
+    def set_level(self, level):
+        self.level = level
+        self.info = level >= INFO
+        self.debug = level >= DEBUG
+
+    def __call__(self, *args, sep=" ", end="\n"):
+        print(*args, sep=sep, end=end)
+
+
+graph = Channel("graph")
+rates = Channel("rates")
+passes = Channel("passes")
+emit = Channel("emit")
+patch = Channel("patch")
+
+channels = {c.name: c for c in [graph, rates, passes, emit, patch]}
+
+
+# set the level of the named channels, or all channels if none are named
+#
+def set_level(level, *names):
+    for name in names or channels:
+        if name not in channels:
+            raise ValueError("unknown log channel " + repr(name))
+        channels[name].set_level(level)
+
+
+# -v gives INFO on every channel, -vv gives DEBUG (all of the output
+# the generator used to print unconditionally)
+#
+def set_verbosity(verbosity):
+    set_level(min(verbosity, DEBUG))
+
+
+# apply a specification like "passes=debug,emit=info" or "debug"
+#
+def configure(spec):
+    for item in spec.split(","):
+        name, _, level = item.rpartition("=")
+        if level.lower() not in LEVEL_NAMES:
+            raise ValueError("unknown log level " + repr(level))
+        set_level(LEVEL_NAMES[level.lower()], *([name] if name else []))
+
+
+# current levels, so worker processes can use the same ones
+#
+def get_levels():
+    return {name: c.level for name, c in channels.items()}
+
+
+def set_levels(levels):
+    for name, level in levels.items():
+        channels[name].set_level(level)
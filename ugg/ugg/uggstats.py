@@ -0,0 +1,102 @@
+# uggstats.py -- timing and counters for the unit generator generator
+#
+# Roger B. Dannenberg
+#
+# A Stats object records the wall time of named phases and named
+# counts for one ugen or one variant of a ugen:
+#
+#     with stats.phase("copy"):
+#         ugens, out = copy_ugens(ugens, out)
+#     stats.count("upsamples", n)
+#
+# stats.start(name) and stats.stop(name) can be used instead of phase()
+# when a phase does not fit in a with statement. Phases that run more
+# than once (e.g. "sort") accumulate. The Stats of a ugen holds the
+# Stats of each of its variants in variants, and as_dict() gives a
+# JSON-compatible summary, including totals over the variants, that
+# can be passed between processes.
+
+import json
+import time
+
+
+class Timer:
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.stats.start(self.name)
+
+    def __exit__(self, *exc):
+        self.stats.stop(self.name)
+        return False
+
+
+class Stats:
+    def __init__(self, name=None):
+        self.name = name
+        self.times = {}  # phase name -> seconds
+        self.counts = {}  # counter name -> count
+        self.variants = []  # Stats of each variant (for a ugen)
+        self.started = {}  # phase name -> start time of running phases
+
+    def phase(self, name):
+        return Timer(self, name)
+
+    def start(self, name):
+        self.started[name] = time.perf_counter()
+
+    def stop(self, name):
+        elapsed = time.perf_counter() - self.started.pop(name)
+        self.times[name] = self.times.get(name, 0.0) + elapsed
+
+    def count(self, name, n=1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def add_variant(self, stats):
+        self.variants.append(stats)
+
+    def as_dict(self):
+        d = {"name": self.name, "times": dict(self.times),
+             "counts": dict(self.counts)}
+        if self.variants:
+            variants = [v.as_dict() for v in self.variants]
+            totals = Stats("totals")
+            for v in self.variants:
+                totals.merge(v)
+            d["variants"] = variants
+            d["totals"] = totals.as_dict()
+            del d["totals"]["name"]
+        return d
+
+    def merge(self, stats):
+        for name, t in stats.times.items():
+            self.times[name] = self.times.get(name, 0.0) + t
+        for name, n in stats.counts.items():
+            self.count(name, n)
+
+    @staticmethod
+    def from_dict(d):
+        stats = Stats(d["name"])
+        stats.times = dict(d["times"])
+        stats.counts = dict(d["counts"])
+        stats.variants = [Stats.from_dict(v) for v in d.get("variants", [])]
+        return stats
+
+
+# write a report, a list of Stats.as_dict() for ugens, as JSON to path.
+# info is a dictionary of anything else to describe the run, e.g.
+# the version and options
+#
+def write_report(path, ugens, **info):
+    report = dict(info)
+    report["ugens"] = ugens
+    totals = Stats()
+    for ugen in ugens:
+        totals.merge(Stats.from_dict(ugen))
+        if "totals" in ugen:
+            totals.merge(Stats.from_dict(dict(ugen["totals"], name=None)))
+    report["totals"] = {"times": totals.times, "counts": totals.counts}
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
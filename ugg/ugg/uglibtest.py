@@ -0,0 +1,122 @@
+# uglibtest.py -- compare generated ugens with the Evaluator
+#
+# Roger B. Dannenberg
+#
+# Runs generated classes from the library (see ugglib.py) and checks
+# their output against ugeval.py. Generate the code first (ugtest.py),
+# then run: python3 uglibtest.py. Ugens that are only for testing are
+# generated and compiled (with CXX) in a temporary directory.
+
+import glob
+import os
+import subprocess
+import tempfile
+import numpy as np
+from Ugen import *
+import Ugen as ugg  # the module, for CODE_PATH
+from ugeval import Evaluator
+from ugglib import Library
+
+BLOCKS = 20
+CXX = "c++"
+FRAMEWORK_PATH = "../framework/"
+FRAMEWORK_FILES = ["ugen.cpp", "tables.cpp", "ugg_capi.cpp", "schedule.cpp",
+                   "parallel.cpp"]
+TOLERANCE = 1e-5  # relative, see ugeval.py
+
+
+def check(name, got, expected):
+    error = np.max(np.abs(got - expected)) / max(np.max(np.abs(expected)), 1)
+    assert error < TOLERANCE, name + ": error " + str(error)
+
+
+# an in-place variant with a BR input, e.g. Mult_ab_a_inplace, writes
+# over its AR input what Mult_ab_a writes to its own outs
+#
+def inplace_test(lib, name, expr):
+    rng = np.random.default_rng(1)
+    pa = Param("a")
+    pb = Param("b")
+    ev = Evaluator([AR, BR], [pa, pb], expr(pa, pb), AR)
+    a = lib.input_a()
+    b = lib.input_b()
+    ugen = getattr(lib, name + "_ab_a")(a, b)
+    a2 = lib.input_a()
+    inplace = getattr(lib, name + "_ab_a_inplace")(a2, b)
+    assert np.shares_memory(inplace.outs, a2.outs)
+    for i in range(BLOCKS):
+        samples = rng.uniform(-1, 1, lib.block_len).astype(a.outs.dtype)
+        a.outs[:] = samples
+        a2.outs[:] = samples  # overwritten by the last block
+        value = rng.uniform(-1, 1)
+        b.set(value)
+        lib.run(ugen, inplace)
+        expected = ev.run(a=samples, b=value)
+        check(name + "_ab_a block " + str(i), ugen.outs, expected)
+        check(name + "_ab_a_inplace block " + str(i), inplace.outs, expected)
+    print(name + "_ab_a_inplace ok")
+
+
+# generate ugens (with generator, e.g. ug_osci) in a temporary
+# directory and return a Library of their classes
+#
+def test_library(directory, generator):
+    saved = ugg.CODE_PATH
+    ugg.CODE_PATH = directory + "/"
+    try:
+        generator()
+    finally:
+        ugg.CODE_PATH = saved
+    path = os.path.join(directory, "libugens_test.so")
+    sources = glob.glob(os.path.join(directory, "*.cpp")) + \
+              [FRAMEWORK_PATH + f for f in FRAMEWORK_FILES]
+    subprocess.run([CXX, "-O2", "-fPIC", "-shared", "-pthread",
+                    "-I" + FRAMEWORK_PATH, "-o", path] + sources, check=True)
+    return Library(path, code_path=directory)
+
+
+# a ugen whose parameter x has two actions: set_x(x) sets down to 2x
+# and then up to x
+#
+def two_actions(px):
+    down = First("down", px * 2)
+    Next(down, down - 1)
+    up = First("up", px)
+    Next(up, up + 1)
+    down.use_output_rate()
+    up.use_output_rate()
+    px.update(down, px * 2)
+    px.update(up, px)
+    return up + down
+
+
+def ug_settest():
+    ugg_begin("Settest")
+    px = Param("x")
+    ugg_generate(ARGEN(CR), [px], two_actions(px))
+
+
+# set_x of Settest_c_a computes each action from x, not from the
+# value of the previous action
+#
+def set_test():
+    with tempfile.TemporaryDirectory() as directory:
+        lib = test_library(directory, ug_settest)
+        px = Param("x")
+        ev = Evaluator([CR], [px], two_actions(px), AR, x=1.0)
+        ugen = lib.Settest_c_a(1.0)
+        for i in range(BLOCKS):
+            if i == BLOCKS // 2:
+                ugen.set_x(3.0)
+                ev.set("x", 3.0)
+            lib.run(ugen)
+            check("Settest_c_a block " + str(i), ugen.outs, ev.run())
+        del ugen
+        del lib
+    print("Settest_c_a set_x ok")
+
+
+lib = Library()
+inplace_test(lib, "Mult", lambda a, b: a * b)
+inplace_test(lib, "Add", lambda a, b: a + b)
+set_test()
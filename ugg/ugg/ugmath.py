@@ -7,11 +7,13 @@ def ug_mult():
     ugg_begin("Mult")
     pa = Param("a")
     pb = Param("b")
-    ugg_generate(FILTER(AR+BR, AR+BR+CR), [pa, pb], pa * pb, commutative=True)
+    ugg_generate(FILTER(AR+BR, AR+BR+CR), [pa, pb], pa * pb, commutative=True,
+                 inplace=True)
 
 
 def ug_add():
     ugg_begin("Add")
     pa = Param("a")
     pb = Param("b")
-    ugg_generate(FILTER(AR+BR, AR+BR+CR), [pa, pb], pa + pb, commutative=True)
+    ugg_generate(FILTER(AR+BR, AR+BR+CR), [pa, pb], pa + pb, commutative=True,
+                 inplace=True)
@@ -2,17 +2,32 @@
 
 from Ugen import *
 
-def osci(phz, pphase, ptable):
-    table_len = Var("table_len", Utable_len(ptable), "int")
+# an interpolating oscillator that reads table, of length table_len
+def table_osc(phz, pphase, table, table_len):
+    table_len = Var("table_len", table_len, "int")
     phase_incr = phz *  table_len * Ugen("AR_RECIP")
     indexf = First("indexf", pphase * table_len)
     index = Var("index", Uint(indexf), "int")
-    x1 = Var("x1", ptable[index])
-    osc = x1 + (indexf - index) * (ptable[index + 1] - x1)
+    x1 = Var("x1", table[index])
+    osc = x1 + (indexf - index) * (table[index + 1] - x1)
     Next(indexf, Uphasewrap(indexf + phase_incr, table_len))
     indexf.use_output_rate()
-    phase_incr.use_non_interpolated() 
-    return osc 
+    phase_incr.use_non_interpolated()
+    return osc
+
+
+def osci(phz, pphase, ptable):
+    return table_osc(phz, pphase, ptable, Utable_len(ptable))
+
+
+# a band-limited oscillator: reads the table of pmipmap (see Mipmap in
+# ugen.h) that has no harmonics above the Nyquist frequency at phz.
+# The table is chosen at the rate of phz, once per block or once, and
+# the loop is the same as in osci.
+def oscm(phz, pphase, pmipmap):
+    table = Var("table", Umipmap_table(pmipmap, phz), "Table_ptr")
+    table.use_non_interpolated()  # a pointer: switch tables per block
+    return table_osc(phz, pphase, table, Umipmap_len(pmipmap))
 
 
 def ug_osci():
@@ -21,6 +36,17 @@ def ug_osci():
     pphase = Param("phase", "double")
     ptable = Param("table", "Table_ptr")
     rates = ARGEN(AR+BR+CR, CR, CR)
-    print("ug_osci", rates)
-    ugg_generate(rates, [phz, pphase, ptable], 
+    if log.rates.debug:
+        log.rates("ug_osci", rates)
+    ugg_generate(rates, [phz, pphase, ptable],
                  osci(phz, pphase, ptable))
+
+
+# no AR hz: the table would have to be chosen for each sample
+def ug_oscm():
+    ugg_begin("Oscm")
+    phz = Param("hz", "double")
+    pphase = Param("phase", "double")
+    pmipmap = Param("mipmap", "Mipmap_ptr")
+    ugg_generate(ARGEN(BR+CR, CR, CR), [phz, pphase, pmipmap],
+                 oscm(phz, pphase, pmipmap))
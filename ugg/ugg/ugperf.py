@@ -0,0 +1,281 @@
+# ugperf.py -- measure the speed of every generated unit generator
+#
+# Roger B. Dannenberg
+#
+# usage: python3 ugperf.py [--blocks N] [--only CLASS,...] [--input X]
+#                          [--cxx COMPILER] [--flags FLAGS]
+#                          [--out FILE] [--baseline FILE]
+#
+# The variants to measure are read from the manifests written by the
+# generator (CODE_PATH/<name>.json, see ugg_write). A C++ driver is
+# generated that constructs each variant with synthetic inputs: audio
+# and block rate inputs are ugens with constant output (their run()
+# does nothing, so only the variant is measured), constant sample
+# parameters are X (default 0.5), tables are a sine table and mipmaps
+# are the saw mipmap of ugtables.py. The input that an in-place variant
+# overwrites is refilled with X by its run(), so each block computes
+# the same thing (the refill is timed too). The driver is compiled with
+# the framework and the generated code (no PortAudio), and calls
+# run(block_num) N times (default one million) for each variant.
+#
+# Results are printed and written as JSON to --out (default
+# ugperf.json): ns per block, ns per sample, samples per second and
+# how many times faster than real time each variant runs. If there
+# is a baseline (default: the previous contents of --out), the ratio
+# of times is shown too.
+
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from Ugen import CODE_PATH
+
+FRAMEWORK_PATH = "../framework/"
+
+
+# return the variants (manifest entries) of all generated ugens, with
+# "ugen" set to the name of the ugen they are a variant of
+#
+def load_manifests(code_path):
+    variants = []
+    for path in sorted(glob.glob(os.path.join(code_path, "*.json"))):
+        with open(path) as f:
+            manifest = json.load(f)
+        for variant in manifest["variants"]:
+            variants.append(dict(variant, ugen=manifest["name"]))
+    return variants
+
+
+# C++ expression for the argument of a constructor parameter. If
+# inplace, the variant writes its output over this input.
+#
+def make_argument(param, inplace=False):
+    if inplace:
+        return "new Refill_a(INPUT)"
+    elif param["type"] == "Ugen *":
+        return "new Source_" + param["rate"] + "(INPUT)"
+    elif param["type"] == "Table_ptr":
+        return "SINETABLE"
+    elif param["type"] == "Mipmap_ptr":
+        return "ugg_mipmap_saw"
+    else:
+        return "(" + param["type"] + ") INPUT"
+
+
+DRIVER_HEAD = """\
+// ugperf_main.cpp -- generated by ugperf.py, do not edit
+
+#include <chrono>
+#include <stdio.h>
+#include <string.h>
+#include "ugen.h"
+#include "ugg_tables.h"
+"""
+
+DRIVER_BODY = """
+Table_ptr SINETABLE;
+sample INPUT;
+
+// inputs: constant output, and run() only updates block_count
+class Source_a : public Ugen_outa {
+  public:
+    Source_a(sample value) {
+        for (int i = 0; i < BL; i++) outs[i] = value;
+    }
+    void run(long block_num) { block_count = block_num; }
+};
+
+// input of in-place variants: run() restores the constant output
+class Refill_a : public Ugen_outa {
+  public:
+    sample value;
+    Refill_a(sample value) : value(value) { }
+    void run(long block_num) {
+        block_count = block_num;
+        for (int i = 0; i < BL; i++) outs[i] = value;
+    }
+};
+
+class Source_b : public Ugen_outb {
+  public:
+    Source_b(sample value) { out = value; }
+    void run(long block_num) { block_count = block_num; }
+};
+
+
+static void measure(const char *name, Ugen *ug, bool arate, long blocks)
+{
+    double sum = 0;  // use the output so it cannot be optimized away
+    long block = ugg_block_count + 1;
+    for (long i = 0; i < blocks / 100 + 1; i++) {  // warm up
+        ug->run(block++);
+    }
+    auto start = std::chrono::steady_clock::now();
+    for (long i = 0; i < blocks; i++) {
+        ug->run(block++);
+        sum += arate ? ug->get_outs()[0] : ug->get_out();
+    }
+    auto stop = std::chrono::steady_clock::now();
+    double ns = std::chrono::duration<double, std::nano>(stop - start).count();
+    printf("{\\"class\\": \\"%s\\", \\"blocks\\": %ld, \\"ns\\": %.0f, "
+           "\\"checksum\\": \\"%g\\"}\\n", name, blocks, ns, sum);
+    fflush(stdout);
+}
+
+"""
+
+DRIVER_MAIN = """
+int main(int argc, char *argv[])
+{
+    long blocks = atol(argv[1]);
+    INPUT = (sample) atof(argv[2]);
+    SINETABLE = table_create(1024);
+    for (int i = 0; i <= 1024; i++) {
+        tblput(SINETABLE, i, (sample) sin(i * M_PI * 2.0 / 1024));
+    }
+    printf("{\\"BL\\": %d, \\"AR\\": %g, \\"sample\\": %d}\\n",
+           BL, AR, (int) sizeof(sample));
+    for (int i = 0; i < (int) (sizeof(benches) / sizeof(benches[0])); i++) {
+        bool selected = (argc <= 3);
+        for (int j = 3; j < argc; j++) {
+            if (strcmp(argv[j], benches[i].name) == 0) selected = true;
+        }
+        if (selected) benches[i].bench(blocks);
+    }
+    return 0;
+}
+"""
+
+
+# return the source of a program that measures variants
+#
+def make_driver(variants):
+    src = DRIVER_HEAD
+    for ugen in sorted(set(v["ugen"] for v in variants)):
+        src += '#include "' + ugen.lower() + '.h"\n'
+    src += DRIVER_BODY
+    for v in variants:
+        args = ", ".join(make_argument(p, v.get("inplace") == p["name"])
+                         for p in v["params"])
+        src += ("static void bench_" + v["class"] + "(long blocks)\n{\n" +
+                "    measure(\"" + v["class"] + "\", new " + v["class"] +
+                "(" + args + "), " + str(v["rate"] == "a").lower() +
+                ", blocks);\n}\n\n")
+    src += "struct { const char *name; void (*bench)(long); } benches[] = {\n"
+    for v in variants:
+        src += '    {"' + v["class"] + '", bench_' + v["class"] + "},\n"
+    src += "};\n" + DRIVER_MAIN
+    return src
+
+
+# compile the driver with the framework and the generated code of the
+# ugens that are measured, returning the path of the program
+#
+def compile_driver(variants, build_dir, cxx, flags):
+    driver = os.path.join(build_dir, "ugperf_main.cpp")
+    with open(driver, "w") as f:
+        f.write(make_driver(variants))
+    program = os.path.join(build_dir, "ugperf")
+    sources = [driver, FRAMEWORK_PATH + "ugen.cpp",
+               CODE_PATH + "ugg_tables.cpp"] + \
+              [CODE_PATH + u.lower() + ".cpp"
+               for u in sorted(set(v["ugen"] for v in variants))]
+    command = [cxx] + flags.split() + ["-I" + FRAMEWORK_PATH, "-I" + CODE_PATH,
+                                       "-o", program] + sources + ["-lm"]
+    subprocess.run(command, check=True)
+    return program
+
+
+# run program and return the results for each variant
+#
+def run_driver(program, variants, blocks, input):
+    output = subprocess.run([program, str(blocks), str(input)] +
+                            [v["class"] for v in variants],
+                            check=True, capture_output=True, text=True).stdout
+    lines = [json.loads(line) for line in output.splitlines()]
+    config = lines[0]
+    by_class = {v["class"]: v for v in variants}
+    results = []
+    for line in lines[1:]:
+        v = by_class[line["class"]]
+        ns_per_block = line["ns"] / line["blocks"]
+        ns_per_sample = ns_per_block / config["BL"]
+        results.append({"class": v["class"], "ugen": v["ugen"],
+                        "rates": v["rates"], "rate": v["rate"],
+                        "blocks": line["blocks"],
+                        "ns_per_block": ns_per_block,
+                        "ns_per_sample": ns_per_sample,
+                        "samples_per_sec": 1e9 / ns_per_sample,
+                        "realtime": 1e9 / ns_per_sample / config["AR"],
+                        "checksum": line["checksum"]})
+    return config, results
+
+
+def load_results(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="ugperf",
+                                     description="measure generated ugens")
+    parser.add_argument("--blocks", type=int, default=1000000,
+                        help="number of blocks computed by each variant")
+    parser.add_argument("--only", help="classes to measure (default: all)")
+    parser.add_argument("--input", type=float, default=0.5,
+                        help="value of inputs and constant parameters")
+    parser.add_argument("--cxx", default=os.environ.get("CXX", "g++"),
+                        help="C++ compiler")
+    parser.add_argument("--flags", default="-O2", help="compiler flags")
+    parser.add_argument("--out", default="ugperf.json",
+                        help="where to write the results")
+    parser.add_argument("--baseline",
+                        help="results to compare to (default: --out)")
+    args = parser.parse_args()
+
+    variants = load_manifests(CODE_PATH)
+    if args.only:
+        only = args.only.split(",")
+        variants = [v for v in variants if v["class"] in only]
+        missing = set(only) - set(v["class"] for v in variants)
+        if missing:
+            parser.error("no such variant: " + ", ".join(sorted(missing)))
+    if not variants:
+        parser.error("no variants found in " + CODE_PATH +
+                     " (run ugg.py build first)")
+    baseline = load_results(args.baseline or args.out)
+    old = {r["class"]: r for r in baseline["results"]} if baseline else {}
+
+    with tempfile.TemporaryDirectory() as build_dir:
+        program = compile_driver(variants, build_dir, args.cxx, args.flags)
+        config, results = run_driver(program, variants, args.blocks,
+                                     args.input)
+
+    print("{:<20}{:>12}{:>12}{:>14}{:>10}{:>10}".format(
+              "class", "ns/block", "ns/sample", "samples/s", "x real",
+              "vs base"))
+    for r in results:
+        ratio = ""
+        if r["class"] in old:
+            ratio = "{:.2f}".format(r["ns_per_block"] /
+                                    old[r["class"]]["ns_per_block"])
+        print("{:<20}{:>12.2f}{:>12.3f}{:>14.4g}{:>10.0f}{:>10}".format(
+                  r["class"], r["ns_per_block"], r["ns_per_sample"],
+                  r["samples_per_sec"], r["realtime"], ratio))
+    with open(args.out, "w") as f:
+        json.dump({"compiler": args.cxx, "flags": args.flags,
+                   "machine": platform.machine(),
+                   "BL": config["BL"], "AR": config["AR"],
+                   "sample_bytes": config["sample"],
+                   "results": results}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
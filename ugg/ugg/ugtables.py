@@ -0,0 +1,159 @@
+# ugtables.py -- wavetables computed by the generator
+#
+# Roger B. Dannenberg
+#
+# Tables are computed once, when the ugen library is generated, with
+# NumPy, and written to CODE_PATH/ugg_tables.cpp as aligned static
+# const data, so programs do not compute them (with loops of sin()
+# calls) at startup:
+#
+#     table("sine", sine(512))
+#     table("sawtooth", harmonics(512, 1 / np.arange(1, 21)))
+#
+# defines Table_ptr ugg_table_sine and ugg_table_sawtooth, declared in
+# CODE_PATH/ugg_tables.h (include ugen.h first). C++ passes them to
+# ugens like any other table, and ugen descriptions can use them
+# directly with Utable("sine") (see Ugen.py). Values are computed in
+# double and rounded to sample by the compiler. As for table_create, a
+# table of length n has n + 1 samples: the last is a copy of the first,
+# for interpolation. The tables are read-only: they are Table_ptr, so
+# that they can be passed to ugens, but the data is const, so tblput
+# on them crashes. To change a table, copy it into one from
+# table_create.
+#
+# A mipmap (see Mipmap in ugen.h) is a waveform as tables with fewer
+# and fewer harmonics, for band-limited oscillators (see ugosc.py):
+#
+#     mipmap("saw", 1024, 1 / np.arange(1, 257))
+#
+# defines tables saw_256, saw_128, ... saw_1, with harmonics 1 to 256,
+# 1 to 128, ... 1, and Mipmap_ptr ugg_mipmap_saw.
+#
+# Tables must be defined before ugg_build or ugg_write_tables is
+# called. The tables below are always defined.
+
+import io
+import numpy as np
+from cmake import add_source_files, set_source_path, write_if_changed
+
+TABLE_SIZE = 512
+NUM_SAW_HARMONICS = 20
+MIPMAP_SIZE = 1024
+MIPMAP_HARMONICS = 256  # the most that MIPMAP_SIZE samples can hold
+
+TABLES = {}  # maps table names to values (NumPy arrays, len + 1 samples)
+MIPMAPS = {}  # maps mipmap names to lists of (harmonics, table name)
+MIPMAP_MAX_LEVELS = 16  # as in ugen.h
+
+
+# define the table name with values (len + 1 samples)
+#
+def table(name, values):
+    values = np.asarray(values, dtype=np.float64)
+    if not name.isidentifier():
+        raise ValueError("ugtables: table name is not a C identifier: " +
+                         name)
+    if values.ndim != 1 or len(values) < 2:
+        raise ValueError("ugtables: table " + name +
+                         " needs at least 2 samples")
+    TABLES[name] = values
+
+
+# one cycle of a sine, size samples plus the copy of the first
+#
+def sine(size):
+    return np.sin(np.arange(size + 1) / size * np.pi * 2.0)
+
+
+# one cycle of a sum of harmonics: amps[h - 1] is the amplitude of
+# harmonic h. Harmonics are computed for all samples at once.
+#
+def harmonics(size, amps):
+    amps = np.asarray(amps, dtype=np.float64)
+    h = np.arange(1, len(amps) + 1)
+    phases = np.outer(h, np.arange(size + 1)) / size * np.pi * 2.0
+    return amps @ np.sin(phases)
+
+
+# define the mipmap name of size samples with harmonic amplitudes amps
+# (see harmonics), with a table for each octave, down to one harmonic
+#
+def mipmap(name, size, amps):
+    levels = []
+    n = len(amps)
+    while n >= 1:
+        table(name + "_" + str(n), harmonics(size, amps[:n]))
+        levels.append((n, name + "_" + str(n)))
+        n //= 2
+    if len(levels) > MIPMAP_MAX_LEVELS:
+        raise ValueError("ugtables: mipmap " + name + " has more than " +
+                         str(MIPMAP_MAX_LEVELS) + " levels")
+    MIPMAPS[name] = levels
+
+
+table("sine", sine(TABLE_SIZE))
+table("sawtooth", harmonics(TABLE_SIZE,
+                            1 / np.arange(1, NUM_SAW_HARMONICS + 1)))
+mipmap("saw", MIPMAP_SIZE, 1 / np.arange(1, MIPMAP_HARMONICS + 1))
+
+
+# the C name of table name
+#
+def table_symbol(name):
+    return "ugg_table_" + name
+
+
+def mipmap_symbol(name):
+    return "ugg_mipmap_" + name
+
+
+# write the tables to ugg_tables.h and ugg_tables.cpp in path and add
+# them to the source files for cmake
+#
+def ugg_write_tables(path):
+    hdrf = io.StringIO()
+    print("// ugg_tables.h -- tables computed by ugtables.py, generated",
+          "automatically,\n// do not edit\n", file=hdrf)
+    print("#ifndef UGG_TABLES_H\n#define UGG_TABLES_H\n", file=hdrf)
+    print("// These tables and mipmaps are READ-ONLY: they point to const",
+          "data, so do\n// not tblput on them. To change a table, copy it",
+          "into one from table_create.\n", file=hdrf)
+    print('#ifdef __cplusplus\nextern "C" {\n#endif\n', file=hdrf)
+    for name in sorted(TABLES):
+        print("extern Table_ptr const ", table_symbol(name), ";  // ",
+              len(TABLES[name]) - 1, " samples", sep="", file=hdrf)
+    for name in sorted(MIPMAPS):
+        print("extern Mipmap_ptr const ", mipmap_symbol(name), ";  // ",
+              len(MIPMAPS[name]), " levels", sep="", file=hdrf)
+    print("\n#ifdef __cplusplus\n}\n#endif\n\n#endif", file=hdrf)
+
+    srcf = io.StringIO()
+    print("// ugg_tables.cpp -- tables computed by ugtables.py, generated",
+          "automatically,\n// do not edit\n", file=srcf)
+    print('#include "ugen.h"\n#include "ugg_tables.h"', file=srcf)
+    for name in sorted(TABLES):
+        values = TABLES[name]
+        # the same layout as Table, with all the samples
+        print("\nUGG_ALIGNED static const struct {\n    int len;\n",
+              "    sample data[", len(values), "];\n} ", name,
+              "_data = {", len(values), ", {", sep="", file=srcf)
+        for i in range(0, len(values), 3):
+            print("    ", ", ".join(repr(float(v)) for v in values[i : i + 3]),
+                  ",", sep="", file=srcf)
+        print("}};\nTable_ptr const ", table_symbol(name), " = (Table_ptr) &",
+              name, "_data;", sep="", file=srcf)
+    for name in sorted(MIPMAPS):
+        levels = MIPMAPS[name]
+        print("\nstatic const Mipmap ", name, "_mipmap = {", len(levels),
+              ",\n    {", ", ".join(str(h) for h, t in levels), "},", sep="",
+              file=srcf)
+        print("    {", ",\n     ".join("(Table_ptr) &" + t + "_data"
+                                    for h, t in levels), "}", sep="",
+              file=srcf)
+        print("};\nMipmap_ptr const ", mipmap_symbol(name),
+              " = (Mipmap_ptr) &", name, "_mipmap;", sep="", file=srcf)
+
+    write_if_changed(path + "ugg_tables.h", hdrf.getvalue())
+    write_if_changed(path + "ugg_tables.cpp", srcf.getvalue())
+    set_source_path(path)
+    add_source_files("ugg_tables.h", "ugg_tables.cpp")
@@ -14,7 +14,12 @@ from Ugen import *
 from ugosc import *
 from ugenv import *
 from ugmath import *
+from ugtone import *
+from ugtables import ugg_write_tables
 from cmake import write_cmake_file
+import ugglog
+
+ugglog.set_level(ugglog.DEBUG)  # show everything the generator does
 
 def math_test():
     ugg_begin("Math")
@@ -89,6 +94,9 @@ ug_osci()
 ug_decay()
 ug_add()
 ug_mult()
+ug_tone()
+ug_oscm()
+ugg_write_tables(CODE_PATH)
 write_cmake_file()
 
 # ugg_begin("Phasor")
@@ -113,3 +121,6 @@ expr = Ugen(100) + Ugen(200) + 5 + Param("input")
 expr.print_tree()
 print(expr.gen_code())
 # print_ugens("Ugen List", expr.get_ugen_list())
+
+print("test 3")
+print(simplify_expr(expr).gen_code())
@@ -0,0 +1,25 @@
+# ugtone.py -- a tone: an oscillator with a decaying amplitude
+#
+# Tone is made by composing osci() and decay(), so one class computes
+# what Mult_aa_a(Osci_ccc_a(...), Decay_cc_a(...)) computes, in one
+# loop, without the buffers and run() calls of the separate ugens.
+
+from Ugen import *
+from ugosc import osci
+from ugenv import decay
+
+
+def tone(phz, pphase, ptable, pamp, ptime):
+    return osci(phz, pphase, ptable) * decay(pamp, ptime)
+
+
+def ug_tone():
+    ugg_begin("Tone")
+    phz = Param("hz", "double")
+    pphase = Param("phase", "double")
+    ptable = Param("table", "Table_ptr")
+    pamp = Param("amp")
+    ptime = Param("time")
+    rates = ARGEN(AR+BR+CR, CR, CR, CR, CR)
+    ugg_generate(rates, [phz, pphase, ptable, pamp, ptime],
+                 tone(phz, pphase, ptable, pamp, ptime))
@@ -0,0 +1,155 @@
+# ugtune.py -- choose a block length and sample type for a patch
+#
+# Roger B. Dannenberg
+#
+# usage: python3 ugtune.py [--patch FILE] [--seconds S] [--repeat N]
+#                          [--max-latency MS] [--tolerance T]
+#                          [--profiles NAME,...] [--out FILE]
+#
+# Builds uggrender for each build profile (block length and sample
+# type, see profiles() in cmake.py) with the given patch (default
+# ../framework/patch.cpp, which must define patch_create, see patch.h),
+# renders S seconds (default 60) without writing samples, and reports
+# how many times faster than real time each profile runs (best of N
+# runs, default 3) and its latency (one block).
+#
+# Small blocks have less latency, large blocks usually have more
+# throughput. The chosen profile is the one with the least latency
+# whose throughput is within T (default 0.1, i.e. 10%) of the best
+# throughput of the profiles with at most --max-latency milliseconds
+# of latency. Use --tolerance 0 for the best throughput. Profiles that
+# no other profile beats in both latency and throughput are marked
+# with "*". Results are written as JSON to --out (default ugtune.json).
+#
+# ugg.py build must have been run first, so that ../code has the
+# generated CMakeLists.txt with the profiles.
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import tempfile
+from Ugen import CODE_PATH
+from cmake import profiles
+
+FRAMEWORK_PATH = "../framework/"
+SAMPLE_RATE = 44100.0  # AR in ugen.h: profiles do not change it
+
+RENDERED = re.compile(r"rendered ([0-9.e+-]+) s of audio .* in ([0-9.e+-]+) s")
+
+
+# configure the framework project in build_dir with patch
+#
+def configure(build_dir, patch):
+    subprocess.run(["cmake", "-S", FRAMEWORK_PATH, "-B", build_dir,
+                    "-DCMAKE_BUILD_TYPE=Release",
+                    "-DUGG_PATCH=" + os.path.abspath(patch)],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+# build uggrender for profile name, returning the path of the program
+#
+def build_renderer(build_dir, name):
+    target = "uggrender_" + name
+    subprocess.run(["cmake", "--build", build_dir, "--target", target],
+                   check=True, stdout=subprocess.DEVNULL)
+    return os.path.join(build_dir, target)
+
+
+# run program repeat times, returning the best real-time factor
+#
+def measure(program, seconds, repeat):
+    best = 0
+    for i in range(repeat):
+        output = subprocess.run([program, "-d", str(seconds), "-f", "none"],
+                                check=True, capture_output=True,
+                                text=True).stdout
+        match = RENDERED.search(output)
+        if not match:
+            raise RuntimeError("ugtune: unexpected output from " +
+                               program + ": " + output)
+        best = max(best, float(match.group(1)) / float(match.group(2)))
+    return best
+
+
+# mark results on the latency/throughput Pareto front and return the
+# chosen one (see the comments at the top)
+#
+def choose(results, max_latency, tolerance):
+    for r in results:
+        r["pareto"] = not any(
+                o["latency_ms"] <= r["latency_ms"] and
+                o["realtime"] > r["realtime"] for o in results)
+    candidates = [r for r in results
+                  if max_latency is None or r["latency_ms"] <= max_latency]
+    if not candidates:
+        return None
+    best = max(r["realtime"] for r in candidates)
+    good = [r for r in candidates if r["realtime"] >= (1 - tolerance) * best]
+    return min(good, key=lambda r: (r["latency_ms"], -r["realtime"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="ugtune",
+                                     description="choose a build profile")
+    parser.add_argument("--patch", default=FRAMEWORK_PATH + "patch.cpp",
+                        help="C++ file that defines patch_create")
+    parser.add_argument("--seconds", type=float, default=60,
+                        help="seconds of audio rendered by each profile")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of runs of each profile (best is used)")
+    parser.add_argument("--max-latency", type=float, metavar="MS",
+                        help="largest acceptable block latency in ms")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="throughput that can be given up for "
+                             "less latency (fraction of the best)")
+    parser.add_argument("--profiles", help="profiles to try (default: all)")
+    parser.add_argument("--out", default="ugtune.json",
+                        help="where to write the results")
+    args = parser.parse_args()
+
+    todo = profiles()
+    if args.profiles:
+        only = args.profiles.split(",")
+        todo = [p for p in todo if p[0] in only]
+        missing = set(only) - set(p[0] for p in todo)
+        if missing:
+            parser.error("no such profile: " + ", ".join(sorted(missing)))
+    if not os.path.exists(CODE_PATH + "CMakeLists.txt"):
+        parser.error("no CMakeLists.txt in " + CODE_PATH +
+                     " (run ugg.py build first)")
+
+    results = []
+    with tempfile.TemporaryDirectory() as build_dir:
+        configure(build_dir, args.patch)
+        for name, bl, sample in todo:
+            program = build_renderer(build_dir, name)
+            realtime = measure(program, args.seconds, args.repeat)
+            results.append({"profile": name, "BL": bl, "sample": sample,
+                            "latency_ms": bl / SAMPLE_RATE * 1000,
+                            "realtime": realtime})
+    chosen = choose(results, args.max_latency, args.tolerance)
+
+    print("{:<14}{:>6}{:>8}{:>12}{:>10}".format(
+              "profile", "BL", "sample", "latency ms", "x real"))
+    for r in results:
+        print("{:<14}{:>6}{:>8}{:>12.2f}{:>10.1f} {}".format(
+                  r["profile"], r["BL"], r["sample"], r["latency_ms"],
+                  r["realtime"], "*" if r["pareto"] else ""))
+    if chosen:
+        print("chosen:", chosen["profile"], "(make uggrender_" +
+              chosen["profile"] + ", or link ugens_" + chosen["profile"] +
+              ")")
+    else:
+        print("no profile has at most", args.max_latency, "ms of latency")
+    with open(args.out, "w") as f:
+        json.dump({"patch": args.patch, "seconds": args.seconds,
+                   "max_latency_ms": args.max_latency,
+                   "tolerance": args.tolerance,
+                   "chosen": chosen["profile"] if chosen else None,
+                   "results": results}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()